@@ -0,0 +1,141 @@
+"""
+Response rendering of a project task page: FastAPI default vs pydantic-core paths.
+
+Renders the page returned by 'ProjectTaskService.get_all' (ORM tasks with their
+project, assignee and creator) the way each route would, no database is needed.
+
+    PYTHONPATH=src python benchmarks/json_responses.py --items 100 --runs 2000
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import time
+from datetime import timedelta
+from typing import Awaitable, Callable
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import APIRoute, serialize_response
+
+from api.responses import PydanticJSONResponse, _adapter
+from common.schemas import BasePaginationMeta, BasePaginationResponse
+from enums.project_task import ProjectTaskType
+from enums.task import TaskPriority, TaskStatus
+from modules.project_tasks.model import ProjectTask
+from modules.project_tasks.schemas import ProjectTaskRead
+from modules.projects.model import Project
+from modules.users.model import User
+from utils import model_loader  # noqa: F401
+from utils.datetime import utc_now
+
+RESPONSE_MODEL = BasePaginationResponse[ProjectTaskRead]
+
+
+def build_page(items: int) -> BasePaginationResponse:
+    """Page as the service returns it, items are ORM objects"""
+    now = utc_now()
+    project = Project(id=1, title="Benchmark")
+    users = [
+        User(id=i, username=f"user_{i}", email=f"user_{i}@example.com")
+        for i in range(10)
+    ]
+
+    tasks = [
+        ProjectTask(
+            id=i,
+            type=ProjectTaskType.DEFAULT,
+            title=f"Task {i}",
+            description="Some description of the task " * 3,
+            deadline=now + timedelta(days=i),
+            priority=TaskPriority.HIGH,
+            status=TaskStatus.IN_PROGRESS,
+            assigned_at=now,
+            created_at=now,
+            updated_at=now,
+            project=project,
+            assignee=users[i % 10],
+            creator=users[(i + 1) % 10],
+        )
+        for i in range(items)
+    ]
+
+    return BasePaginationResponse(
+        items=tasks,
+        pagination=BasePaginationMeta(total=items, page=1, size=items),
+    )
+
+
+async def endpoint():
+    pass
+
+
+# Response field of a route, as FastAPI validates and dumps with it
+FIELD = APIRoute("/", endpoint, response_model=RESPONSE_MODEL).response_field
+
+
+async def default_route(page: BasePaginationResponse) -> bytes:
+    """Validate, dump to python objects, encode with json (FastAPI default)"""
+    content = await serialize_response(field=FIELD, response_content=page)
+    return JSONResponse(content).body
+
+
+async def fast_response_class(page: BasePaginationResponse) -> bytes:
+    """FastAPI validation and dump, encoded by pydantic-core"""
+    content = await serialize_response(field=FIELD, response_content=page)
+    return PydanticJSONResponse(content).body
+
+
+async def fast_route(page: BasePaginationResponse) -> bytes:
+    """Validate once and dump straight to JSON bytes (PydanticJSONRoute)"""
+    adapter = _adapter(RESPONSE_MODEL)
+    return adapter.dump_json(adapter.validate_python(page, from_attributes=True))
+
+
+async def measure(
+    fn: Callable[[BasePaginationResponse], Awaitable[bytes]],
+    page: BasePaginationResponse,
+    runs: int,
+) -> tuple[float, float]:
+    """Median and p95 latency (ms) of rendering the page"""
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        await fn(page)
+        timings.append((time.perf_counter() - start) * 1000)
+
+    timings.sort()
+    p95 = timings[max(int(len(timings) * 0.95) - 1, 0)]
+
+    return statistics.median(timings), p95
+
+
+async def main(args: argparse.Namespace) -> None:
+    page = build_page(args.items)
+    renders = (
+        ("default", default_route),
+        ("class", fast_response_class),
+        ("route", fast_route),
+    )
+
+    # Every path renders the same document
+    documents = {name: await fn(page) for name, fn in renders}
+    parsed = [json.loads(body) for body in documents.values()]
+    assert all(document == parsed[0] for document in parsed)
+
+    for name, fn in renders:
+        # Warm up schema and serializer caches
+        await measure(fn, page, 20)
+        median, p95 = await measure(fn, page, args.runs)
+        print(
+            f"{name:<8} items={args.items} bytes={len(documents[name])} "
+            f"median={median:.3f}ms p95={p95:.3f}ms"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--items", type=int, default=100)
+    parser.add_argument("--runs", type=int, default=2000)
+
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,220 @@
+"""
+Project task list: legacy (COUNT + page + selectinload) vs single statement.
+
+Seeds a project with tasks inside a transaction that is rolled back at the end,
+so the target database only needs to be migrated.
+--rtt-ms adds a simulated network round-trip to every statement.
+
+    PYTHONPATH=src python benchmarks/list_queries.py --tasks 5000 --runs 50
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from typing import Awaitable, Callable
+
+from sqlalchemy import event, func, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import selectinload
+
+from common.dto import PaginationDto, SortingDto
+from core.config import settings
+from enums.project import ProjectRole
+from enums.project_task import ProjectTaskType
+from enums.task import TaskPriority, TaskStatus
+from modules.project_members.model import ProjectMember
+from modules.project_tasks.dto import ProjectTaskFilterDto
+from modules.project_tasks.model import ProjectTask
+from modules.project_tasks.repository import ProjectTaskRepository
+from modules.projects.model import Project
+from modules.users.model import User
+from utils import model_loader  # noqa: F401
+from utils.datetime import utc_now
+
+
+async def legacy_get_all(
+    db: AsyncSession,
+    project_id: int,
+    sorting: SortingDto,
+    pagination: PaginationDto,
+):
+    """The list query as it was: separate COUNT and selectinload per relation"""
+    stmt = (
+        select(ProjectTask)
+        .where(ProjectTask.project_id == project_id)
+        .options(
+            selectinload(ProjectTask.project),
+            selectinload(ProjectTask.assignee),
+            selectinload(ProjectTask.creator),
+        )
+    )
+
+    count_stmt = select(func.count()).select_from(stmt.subquery())
+    total = await db.scalar(count_stmt)
+
+    stmt = stmt.order_by(getattr(ProjectTask, sorting.sort_by).desc())
+    stmt = stmt.limit(pagination.size).offset(pagination.offset)
+
+    result = await db.execute(stmt)
+
+    return result.scalars().all(), total
+
+
+async def current_get_all(
+    db: AsyncSession,
+    project_id: int,
+    sorting: SortingDto,
+    pagination: PaginationDto,
+):
+    # Measure uncached totals
+    ProjectTaskRepository.count_cache.clear()
+
+    return await ProjectTaskRepository(db).get_all(
+        project_id=project_id,
+        filters=ProjectTaskFilterDto(),
+        sorting=sorting,
+        pagination=pagination,
+    )
+
+
+async def seed(db: AsyncSession, users: int, tasks: int) -> int:
+    now = utc_now()
+
+    user_ids = (
+        await db.scalars(
+            insert(User).returning(User.id),
+            [
+                {
+                    "username": f"bench_user_{i}",
+                    "email": f"bench_user_{i}@example.com",
+                    "hashed_password": "x",
+                }
+                for i in range(users)
+            ],
+        )
+    ).all()
+
+    project_id = await db.scalar(
+        insert(Project)
+        .values(creator_id=user_ids[0], title="Benchmark")
+        .returning(Project.id)
+    )
+
+    await db.execute(
+        insert(ProjectMember),
+        [
+            {
+                "project_id": project_id,
+                "user_id": user_id,
+                "role": ProjectRole.OWNER if i == 0 else ProjectRole.MEMBER,
+            }
+            for i, user_id in enumerate(user_ids)
+        ],
+    )
+
+    priorities = list(TaskPriority)
+    statuses = list(TaskStatus)
+    await db.execute(
+        insert(ProjectTask),
+        [
+            {
+                "type": ProjectTaskType.DEFAULT,
+                "project_id": project_id,
+                "assignee_id": user_ids[i % users],
+                "created_by_id": user_ids[0],
+                "title": f"Task {i}",
+                "priority": priorities[i % len(priorities)],
+                "status": statuses[i % len(statuses)],
+                "assigned_at": now,
+            }
+            for i in range(tasks)
+        ],
+    )
+    await db.flush()
+
+    return project_id
+
+
+async def measure(
+    fn: Callable[..., Awaitable],
+    db: AsyncSession,
+    project_id: int,
+    offsets: list[int],
+    runs: int,
+    statements: list[str],
+) -> tuple[float, float, float]:
+    """Average round-trips, median and p95 latency (ms) of one list call"""
+    sorting = SortingDto(sort_by="created_at", order="desc")
+    timings = []
+    round_trips = []
+
+    for i in range(runs):
+        pagination = PaginationDto(size=20, offset=offsets[i % len(offsets)])
+
+        statements.clear()
+        start = time.perf_counter()
+        await fn(db, project_id, sorting, pagination)
+        timings.append((time.perf_counter() - start) * 1000)
+        round_trips.append(len(statements))
+
+        # Keep the identity map from serving the next run
+        db.expunge_all()
+
+    timings.sort()
+    p95 = timings[max(int(len(timings) * 0.95) - 1, 0)]
+
+    return statistics.mean(round_trips), statistics.median(timings), p95
+
+
+async def main(args: argparse.Namespace) -> None:
+    engine = create_async_engine(
+        args.url, echo=False, connect_args=settings.db.connect_args
+    )
+    statements: list[str] = []
+
+    def on_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+        if args.rtt_ms:
+            time.sleep(args.rtt_ms / 1000)
+
+    event.listen(engine.sync_engine, "before_cursor_execute", on_execute)
+
+    async with engine.connect() as conn:
+        transaction = await conn.begin()
+        db = AsyncSession(
+            bind=conn,
+            expire_on_commit=False,
+            join_transaction_mode="create_savepoint",
+        )
+        try:
+            project_id = await seed(db, users=args.users, tasks=args.tasks)
+            await conn.exec_driver_sql("ANALYZE project_tasks")
+
+            offsets = [0, args.tasks // 2, max(args.tasks - 20, 0)]
+            for name, fn in (("legacy", legacy_get_all), ("current", current_get_all)):
+                # Warm up connection and statement caches
+                await measure(fn, db, project_id, offsets, 3, statements)
+                round_trips, median, p95 = await measure(
+                    fn, db, project_id, offsets, args.runs, statements
+                )
+                print(
+                    f"{name:<8} round-trips={round_trips:.1f} "
+                    f"median={median:.2f}ms p95={p95:.2f}ms"
+                )
+        finally:
+            await db.close()
+            await transaction.rollback()
+
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--url", default=settings.db.url)
+    parser.add_argument("--users", type=int, default=20)
+    parser.add_argument("--tasks", type=int, default=5000)
+    parser.add_argument("--runs", type=int, default=50)
+    parser.add_argument("--rtt-ms", type=float, default=0)
+
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,177 @@
+"""
+Load test of the API: seeded data, scripted scenarios, p50/p95/p99 and
+statements per request.
+
+Seeds users, projects, members and tasks (committed, deleted after the run),
+runs every scenario with concurrent virtual users and prints a report that can
+be saved and compared with a run of another commit.
+
+    PYTHONPATH=src python -m benchmarks.load run --target asgi --output base.json
+    PYTHONPATH=src python -m benchmarks.load run --target uvicorn --output new.json
+    PYTHONPATH=src python -m benchmarks.load compare base.json new.json
+
+Launchers are compared with a run of each, as processes of their own:
+
+    PYTHONPATH=src python -m benchmarks.load run --target main --output main.json
+    PYTHONPATH=src python -m benchmarks.load run --target server --workers 4 \
+        --output server.json
+    PYTHONPATH=src python -m benchmarks.load clean
+"""
+
+import argparse
+import asyncio
+from pathlib import Path
+
+from core.config import settings
+from db.session import async_session_fabric, engine
+from utils.datetime import utc_now
+
+from .report import compare, format_table, git_revision, load, save
+from .runner import (
+    LAUNCHERS,
+    asgi_client,
+    process_client,
+    run_scenario,
+    url_client,
+    uvicorn_client,
+)
+from .scenarios import SCENARIOS
+from .seed import SeedConfig, clean, seed
+
+
+async def run(args: argparse.Namespace) -> None:
+    config = SeedConfig(
+        users=args.users,
+        projects=args.projects,
+        members=args.members,
+        tasks=args.tasks,
+        seed=args.seed,
+    )
+    async with async_session_fabric() as db:
+        # Leftovers of an interrupted or kept run
+        await clean(db)
+        dataset = await seed(db, config)
+
+    # Counted by the unit of work of every request of the in-process app
+    settings.debug.sql_statements_header = True
+    if args.target == "asgi":
+        target = asgi_client(args.concurrency)
+    elif args.target == "uvicorn":
+        target = uvicorn_client(args.concurrency)
+    elif args.target in LAUNCHERS:
+        target = process_client(
+            args.target,
+            args.concurrency,
+            [f"--workers={args.workers}"] if args.workers else [],
+        )
+    else:
+        target = url_client(args.target, args.concurrency)
+
+    rows = []
+    try:
+        async with target as client:
+            for name in args.scenarios:
+                scenario = SCENARIOS[name]
+                # Warm up connections, statement and application caches
+                await run_scenario(
+                    client, dataset, name, scenario, args.concurrency, args.warmup, 0
+                )
+                rows += await run_scenario(
+                    client,
+                    dataset,
+                    name,
+                    scenario,
+                    args.concurrency,
+                    args.iterations,
+                    args.seed,
+                )
+    finally:
+        if not args.keep_data:
+            async with async_session_fabric() as db:
+                await clean(db)
+        await engine.dispose()
+
+    print(format_table(rows))
+
+    if args.output:
+        meta = {
+            "revision": git_revision(),
+            "created_at": utc_now().isoformat(),
+            "target": args.target,
+            "workers": args.workers,
+            "concurrency": args.concurrency,
+            "iterations": args.iterations,
+            "seed": vars(config),
+        }
+        save(args.output, meta, rows)
+        print(f"Saved to {args.output}")
+
+
+async def clean_data(args: argparse.Namespace) -> None:
+    async with async_session_fabric() as db:
+        deleted = await clean(db)
+    await engine.dispose()
+
+    print(f"Deleted {deleted} seeded users with their projects")
+
+
+def compare_reports(args: argparse.Namespace) -> None:
+    base_meta, base = load(args.base)
+    new_meta, new = load(args.new)
+
+    print(
+        f"{base_meta['revision']} ({base_meta['target']}) -> "
+        f"{new_meta['revision']} ({new_meta['target']})"
+    )
+    print(compare(base, new))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="seed, run scenarios, report")
+    run_parser.add_argument(
+        "--target",
+        default="asgi",
+        help=(
+            "'asgi' (in-process), 'uvicorn' (local server), a launcher "
+            f"({', '.join(LAUNCHERS)}) started as a process or a server URL"
+        ),
+    )
+    run_parser.add_argument(
+        "--workers", type=int, default=None, help="of the 'server' launcher"
+    )
+    run_parser.add_argument(
+        "--scenarios",
+        type=lambda value: value.split(","),
+        default=list(SCENARIOS),
+        help=f"comma separated, of {', '.join(SCENARIOS)}",
+    )
+    run_parser.add_argument("--concurrency", type=int, default=20)
+    run_parser.add_argument("--iterations", type=int, default=500)
+    run_parser.add_argument("--warmup", type=int, default=50)
+    run_parser.add_argument("--users", type=int, default=SeedConfig.users)
+    run_parser.add_argument("--projects", type=int, default=SeedConfig.projects)
+    run_parser.add_argument("--members", type=int, default=SeedConfig.members)
+    run_parser.add_argument("--tasks", type=int, default=SeedConfig.tasks)
+    run_parser.add_argument("--seed", type=int, default=SeedConfig.seed)
+    run_parser.add_argument("--output", type=Path, default=None)
+    run_parser.add_argument("--keep-data", action="store_true")
+
+    commands.add_parser("clean", help="delete data kept by 'run --keep-data'")
+
+    compare_parser = commands.add_parser("compare", help="compare two saved runs")
+    compare_parser.add_argument("base", type=Path)
+    compare_parser.add_argument("new", type=Path)
+
+    args = parser.parse_args()
+    if args.command == "run":
+        unknown = set(args.scenarios) - set(SCENARIOS)
+        if unknown:
+            parser.error(f"unknown scenarios: {', '.join(sorted(unknown))}")
+        asyncio.run(run(args))
+    elif args.command == "clean":
+        asyncio.run(clean_data(args))
+    else:
+        compare_reports(args)
@@ -0,0 +1,146 @@
+"""Latency percentiles and statements per request, saved as JSON to compare"""
+
+import json
+import math
+import statistics
+import subprocess
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any
+
+
+@dataclass(frozen=True)
+class Sample:
+    latency: float
+    ok: bool
+    # From 'X-SQL-Statements', None when the server doesn't send it
+    statements: int | None
+
+
+@dataclass(frozen=True)
+class RequestStats:
+    scenario: str
+    request: str
+    requests: int
+    errors: int
+    rps: float
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    statements: float | None
+
+    @property
+    def key(self) -> tuple[str, str]:
+        return self.scenario, self.request
+
+
+def percentile(values: list[float], q: float) -> float:
+    """Nearest-rank percentile of sorted values"""
+    if not values:
+        return 0.0
+
+    return values[max(math.ceil(len(values) * q / 100) - 1, 0)]
+
+
+def summarize(
+    scenario: str, request: str, samples: list[Sample], elapsed: float
+) -> RequestStats:
+    latencies = sorted(sample.latency * 1000 for sample in samples)
+    statements = [
+        sample.statements for sample in samples if sample.statements is not None
+    ]
+
+    return RequestStats(
+        scenario=scenario,
+        request=request,
+        requests=len(samples),
+        errors=sum(not sample.ok for sample in samples),
+        rps=round(len(samples) / elapsed, 1) if elapsed else 0.0,
+        p50_ms=round(percentile(latencies, 50), 2),
+        p95_ms=round(percentile(latencies, 95), 2),
+        p99_ms=round(percentile(latencies, 99), 2),
+        statements=round(statistics.mean(statements), 2) if statements else None,
+    )
+
+
+def git_revision() -> str:
+    """Short commit of the working tree, '+dirty' with uncommitted changes"""
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+        dirty = subprocess.run(
+            ["git", "status", "--porcelain", "--untracked-files=no"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+    return f"{commit}+dirty" if dirty else commit
+
+
+def format_table(rows: list[RequestStats]) -> str:
+    lines = [
+        f"{'scenario':<14} {'request':<10} {'reqs':>6} {'err':>4} {'rps':>8} "
+        f"{'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'stmts':>6}"
+    ]
+    for row in rows:
+        statements = "-" if row.statements is None else f"{row.statements:.1f}"
+        lines.append(
+            f"{row.scenario:<14} {row.request:<10} {row.requests:>6} "
+            f"{row.errors:>4} {row.rps:>8.1f} {row.p50_ms:>8.2f} "
+            f"{row.p95_ms:>8.2f} {row.p99_ms:>8.2f} {statements:>6}"
+        )
+
+    return "\n".join(lines)
+
+
+def save(path: Path, meta: dict[str, Any], rows: list[RequestStats]) -> None:
+    report = {**meta, "results": [asdict(row) for row in rows]}
+    path.write_text(json.dumps(report, indent=2) + "\n")
+
+
+def load(path: Path) -> tuple[dict[str, Any], list[RequestStats]]:
+    report = json.loads(path.read_text())
+    rows = [RequestStats(**row) for row in report.pop("results")]
+
+    return report, rows
+
+
+def compare(base: list[RequestStats], new: list[RequestStats]) -> str:
+    """Change of the new run per request, in percent of the base run"""
+    base_by_key = {row.key: row for row in base}
+    lines = [
+        f"{'scenario':<14} {'request':<10} {'rps':>8} {'p50':>8} {'p95':>8} "
+        f"{'p99':>8} {'stmts':>12}"
+    ]
+    for row in new:
+        old = base_by_key.get(row.key)
+        if old is None:
+            continue
+
+        statements = (
+            "-"
+            if row.statements is None or old.statements is None
+            else f"{old.statements:g} -> {row.statements:g}"
+        )
+        lines.append(
+            f"{row.scenario:<14} {row.request:<10} {_change(old.rps, row.rps):>8} "
+            f"{_change(old.p50_ms, row.p50_ms):>8} "
+            f"{_change(old.p95_ms, row.p95_ms):>8} "
+            f"{_change(old.p99_ms, row.p99_ms):>8} {statements:>12}"
+        )
+
+    return "\n".join(lines)
+
+
+def _change(old: float, new: float) -> str:
+    if not old:
+        return "-"
+
+    return f"{(new - old) / old * 100:+.1f}%"
@@ -0,0 +1,216 @@
+"""Virtual users running a scenario against the in-process app or a server"""
+
+import asyncio
+import os
+import random
+import socket
+import sys
+import time
+from collections import defaultdict
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, AsyncIterator
+
+import httpx
+import uvicorn
+
+from core.config import settings
+from core.security.jwt_handler import JWTHandler
+from enums.token import TokenType
+from main import app
+
+from .report import RequestStats, Sample, summarize
+from .scenarios import Scenario
+from .seed import Dataset, SeededProject
+
+API_PREFIX = settings.prefix.api + settings.prefix.api_v1
+
+# Launchers started as processes by 'process_client'
+LAUNCHERS = {
+    "main": "main.py",
+    "server": "server.py",
+}
+SRC = Path(__file__).parents[2] / "src"
+
+
+class Recorder:
+    def __init__(self):
+        self.samples: dict[str, list[Sample]] = defaultdict(list)
+
+    def add(self, request: str, sample: Sample) -> None:
+        self.samples[request].append(sample)
+
+
+@dataclass
+class VirtualUser:
+    client: httpx.AsyncClient
+    username: str
+    token: str
+    project: SeededProject
+    rng: random.Random
+    recorder: Recorder
+
+    async def request(
+        self,
+        name: str,
+        method: str,
+        url: str,
+        expected: tuple[int, ...] = (200,),
+        authenticated: bool = True,
+        **kwargs: Any,
+    ) -> httpx.Response | None:
+        """Timed request, a status outside 'expected' counts as an error"""
+        headers = {"Authorization": f"Bearer {self.token}"} if authenticated else {}
+
+        start = time.perf_counter()
+        try:
+            response = await self.client.request(method, url, headers=headers, **kwargs)
+        except httpx.HTTPError:
+            self.recorder.add(name, Sample(time.perf_counter() - start, False, None))
+            return None
+
+        statements = response.headers.get("x-sql-statements")
+        self.recorder.add(
+            name,
+            Sample(
+                latency=time.perf_counter() - start,
+                ok=response.status_code in expected,
+                statements=int(statements) if statements is not None else None,
+            ),
+        )
+
+        return response
+
+
+async def run_scenario(
+    client: httpx.AsyncClient,
+    dataset: Dataset,
+    name: str,
+    scenario: Scenario,
+    concurrency: int,
+    iterations: int,
+    seed: int,
+) -> list[RequestStats]:
+    """Run 'iterations' of the scenario shared by 'concurrency' virtual users"""
+    recorder = Recorder()
+    memberships = dataset.memberships()
+    remaining = iterations
+
+    async def virtual_user(index: int) -> None:
+        nonlocal remaining
+        rng = random.Random(seed * 1000 + index)
+        user_id, project = rng.choice(memberships)
+        vu = VirtualUser(
+            client=client,
+            username=dataset.users[user_id],
+            token=JWTHandler.create(user_id=user_id, token_type=TokenType.ACCESS),
+            project=project,
+            rng=rng,
+            recorder=recorder,
+        )
+
+        while remaining > 0:
+            remaining -= 1
+            await scenario(vu)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(virtual_user(i) for i in range(concurrency)))
+    elapsed = time.perf_counter() - start
+
+    return [
+        summarize(name, request, samples, elapsed)
+        for request, samples in recorder.samples.items()
+    ]
+
+
+@asynccontextmanager
+async def asgi_client(concurrency: int) -> AsyncIterator[httpx.AsyncClient]:
+    """The app called in-process, without sockets and HTTP parsing"""
+    async with app.router.lifespan_context(app):
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app),
+            base_url=f"http://load{API_PREFIX}",
+        ) as client:
+            yield client
+
+
+@asynccontextmanager
+async def uvicorn_client(concurrency: int) -> AsyncIterator[httpx.AsyncClient]:
+    """
+    The app served by uvicorn on a free local port. The server shares the
+    event loop (and a CPU) with the client, compare runs of the same target.
+    """
+    server = uvicorn.Server(
+        uvicorn.Config(app, host="127.0.0.1", port=0, log_level="warning")
+    )
+    serving = asyncio.create_task(server.serve())
+    while not server.started:
+        if serving.done():
+            serving.result()
+        await asyncio.sleep(0.01)
+
+    port = server.servers[0].sockets[0].getsockname()[1]
+    try:
+        async with _http_client(f"http://127.0.0.1:{port}", concurrency) as client:
+            yield client
+    finally:
+        server.should_exit = True
+        await serving
+
+
+@asynccontextmanager
+async def process_client(
+    launcher: str, concurrency: int, args: list[str]
+) -> AsyncIterator[httpx.AsyncClient]:
+    """
+    The app served by one of the launchers (see LAUNCHERS) in its own
+    processes on a free local port, as it is run outside of the benchmark
+    """
+    host = "127.0.0.1"
+    with socket.socket() as sock:
+        sock.bind((host, 0))
+        port = sock.getsockname()[1]
+
+    env = os.environ | {
+        "APP_CONFIG__RUN__HOST": host,
+        "APP_CONFIG__RUN__PORT": str(port),
+        "APP_CONFIG__RUN__RELOAD": "false",
+        "APP_CONFIG__DEBUG__SQL_STATEMENTS_HEADER": "true",
+    }
+    process = await asyncio.create_subprocess_exec(
+        sys.executable, str(SRC / LAUNCHERS[launcher]), *args, env=env
+    )
+    try:
+        async with _http_client(f"http://{host}:{port}", concurrency) as client:
+            while True:
+                if process.returncode is not None:
+                    raise RuntimeError(f"{launcher} exited with {process.returncode}")
+                try:
+                    await client.get("/", timeout=1)
+                    break
+                except httpx.TransportError:
+                    await asyncio.sleep(0.1)
+
+            yield client
+    finally:
+        if process.returncode is None:
+            process.terminate()
+            await process.wait()
+
+
+@asynccontextmanager
+async def url_client(url: str, concurrency: int) -> AsyncIterator[httpx.AsyncClient]:
+    """A server started separately, it reports statements with its debug header"""
+    async with _http_client(url.rstrip("/"), concurrency) as client:
+        yield client
+
+
+def _http_client(url: str, concurrency: int) -> httpx.AsyncClient:
+    return httpx.AsyncClient(
+        base_url=f"{url}{API_PREFIX}",
+        limits=httpx.Limits(
+            max_connections=concurrency, max_keepalive_connections=concurrency
+        ),
+        timeout=30,
+    )
@@ -0,0 +1,78 @@
+"""
+Scripted scenarios. One call is an iteration of a virtual user, its requests
+are recorded under their names.
+"""
+
+from typing import TYPE_CHECKING, Awaitable, Callable
+
+from enums.task import TaskPriority, TaskStatus
+
+from .seed import PASSWORD, WORDS
+
+if TYPE_CHECKING:
+    from .runner import VirtualUser
+
+Scenario = Callable[["VirtualUser"], Awaitable[None]]
+
+SCENARIOS: dict[str, Scenario] = {}
+
+LIST_SORTS = ("created_at", "updated_at", "deadline", "priority", "status")
+
+
+def scenario(fn: Scenario) -> Scenario:
+    SCENARIOS[fn.__name__] = fn
+    return fn
+
+
+@scenario
+async def login_storm(vu: "VirtualUser") -> None:
+    """Password logins, bcrypt in the hashing pool dominates"""
+    await vu.request(
+        "login",
+        "POST",
+        "/auth/login",
+        data={"username": vu.username, "password": PASSWORD},
+        authenticated=False,
+    )
+
+
+@scenario
+async def task_list(vu: "VirtualUser") -> None:
+    """First pages of the task list with a random sort and an optional filter"""
+    params = {
+        "page": vu.rng.randint(1, 5),
+        "size": 20,
+        "sort_by": vu.rng.choice(LIST_SORTS),
+        "order": vu.rng.choice(("asc", "desc")),
+    }
+    match vu.rng.randrange(3):
+        case 1:
+            params["status"] = vu.rng.choice(list(TaskStatus)).value
+        case 2:
+            params["priority"] = vu.rng.choice(list(TaskPriority)).value
+
+    await vu.request(
+        "task_list", "GET", f"/projects/{vu.project.id}/tasks", params=params
+    )
+
+
+@scenario
+async def search(vu: "VirtualUser") -> None:
+    """Full-text search of the project tasks by relevance"""
+    await vu.request(
+        "search",
+        "GET",
+        f"/projects/{vu.project.id}/tasks",
+        params={"search": vu.rng.choice(WORDS), "sort_by": "relevance"},
+    )
+
+
+@scenario
+async def assign_churn(vu: "VirtualUser") -> None:
+    """Take an open task and give it back, other users may have taken it (400)"""
+    task_id = vu.rng.choice(vu.project.open_task_ids)
+    url = f"/projects/{vu.project.id}/tasks/{task_id}/assign"
+
+    response = await vu.request("assign", "POST", url, expected=(200, 400))
+    if response is not None and response.status_code == 200:
+        await vu.request("unassign", "DELETE", url)
@@ -0,0 +1,171 @@
+"""Users, projects, members and tasks of a load test, built by the test factories"""
+
+import random
+from dataclasses import dataclass
+
+from sqlalchemy import delete, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.security.password import PasswordHasher
+from enums.project import ProjectRole
+from enums.project_task import ProjectTaskType
+from enums.task import TaskPriority, TaskStatus
+from modules.project_members.model import ProjectMember
+from modules.project_task_stats.repository import ProjectTaskStatsRepository
+from modules.projects.model import Project
+from modules.users.model import User
+from utils.datetime import utc_now
+
+from tests.factories.models import (
+    BaseModelFactory,
+    ProjectModelFactory,
+    ProjectTaskModelFactory,
+    UserModelFactory,
+)
+
+# Seeded users are found (and deleted) by the prefix of their usernames
+USERNAME_PREFIX = "load_user_"
+PASSWORD = "LoadTest123!"
+# Words of the task titles, looked up by the search scenario
+WORDS = (
+    "release",
+    "invoice",
+    "migration",
+    "onboarding",
+    "dashboard",
+    "backup",
+    "report",
+    "billing",
+)
+
+
+@dataclass(frozen=True)
+class SeedConfig:
+    users: int = 50
+    projects: int = 5
+    # Per project, the creator included
+    members: int = 20
+    tasks: int = 2000
+    # Share of open (unassigned) tasks, the ones assign/unassign churns on
+    open_share: float = 0.2
+    seed: int = 42
+
+
+@dataclass(frozen=True)
+class SeededProject:
+    id: int
+    member_ids: list[int]
+    open_task_ids: list[int]
+
+
+@dataclass(frozen=True)
+class Dataset:
+    # id -> username
+    users: dict[int, str]
+    projects: list[SeededProject]
+
+    def memberships(self) -> list[tuple[int, SeededProject]]:
+        return [
+            (user_id, project)
+            for project in self.projects
+            for user_id in project.member_ids
+        ]
+
+
+async def seed(db: AsyncSession, config: SeedConfig) -> Dataset:
+    """Commit the data of 'config', the same seed builds the same data"""
+    rng = random.Random(config.seed)
+    BaseModelFactory.seed_random(config.seed)
+
+    # One hash for all, bcrypt of every user would take longer than the run
+    hashed_password = PasswordHasher.hash(PASSWORD)
+    users = [
+        UserModelFactory.build(
+            id=None,
+            username=f"{USERNAME_PREFIX}{i}",
+            email=f"{USERNAME_PREFIX}{i}@example.com",
+            hashed_password=hashed_password,
+        )
+        for i in range(config.users)
+    ]
+    db.add_all(users)
+    await db.flush()
+    user_ids = [user.id for user in users]
+
+    projects = []
+    for _ in range(config.projects):
+        member_ids = rng.sample(user_ids, min(config.members, len(user_ids)))
+        projects.append(await _seed_project(db, rng, config, member_ids))
+        # Tasks of a project are not needed any more
+        db.expunge_all()
+
+    await db.commit()
+
+    return Dataset(
+        users={user_id: f"{USERNAME_PREFIX}{i}" for i, user_id in enumerate(user_ids)},
+        projects=projects,
+    )
+
+
+async def _seed_project(
+    db: AsyncSession, rng: random.Random, config: SeedConfig, member_ids: list[int]
+) -> SeededProject:
+    creator_id = member_ids[0]
+    project = ProjectModelFactory.build(id=None, creator_id=creator_id)
+    project.members.extend(
+        ProjectMember(
+            user_id=user_id,
+            role=(
+                ProjectRole.OWNER
+                if user_id == creator_id
+                else rng.choice((ProjectRole.ADMIN, ProjectRole.MEMBER))
+            ),
+        )
+        for user_id in member_ids
+    )
+    db.add(project)
+    await db.flush()
+
+    now = utc_now()
+    tasks = []
+    for i in range(config.tasks):
+        is_open = rng.random() < config.open_share
+        assignee_id = None if is_open else rng.choice(member_ids)
+        tasks.append(
+            ProjectTaskModelFactory.build(
+                id=None,
+                type=ProjectTaskType.OPEN if is_open else ProjectTaskType.DEFAULT,
+                project_id=project.id,
+                assignee_id=assignee_id,
+                assigned_at=None if is_open else now,
+                created_by_id=creator_id,
+                title=f"{rng.choice(WORDS).capitalize()} {rng.choice(WORDS)} {i}",
+                priority=rng.choice(list(TaskPriority)),
+                status=rng.choice(list(TaskStatus)),
+            )
+        )
+    db.add_all(tasks)
+    await db.flush()
+
+    # Stats are kept by the task writes of the repository, not by bulk inserts
+    await ProjectTaskStatsRepository(db).rebuild(project_id=project.id)
+
+    return SeededProject(
+        id=project.id,
+        member_ids=member_ids,
+        open_task_ids=[task.id for task in tasks if task.type == ProjectTaskType.OPEN],
+    )
+
+
+async def clean(db: AsyncSession) -> int:
+    """Delete the seeded users with their projects, returns the number of users"""
+    seeded = select(User.id).where(User.username.startswith(USERNAME_PREFIX))
+
+    # Projects first, their tasks can't have the creator set to NULL
+    await db.execute(delete(Project).where(Project.creator_id.in_(seeded)))
+    result = await db.execute(
+        delete(User).where(User.username.startswith(USERNAME_PREFIX))
+    )
+    await db.commit()
+
+    return result.rowcount
@@ -0,0 +1,242 @@
+"""
+Project task search: legacy ILIKE scan vs generated tsvector with GIN index.
+
+Seeds a project with tasks inside a transaction that is rolled back at the end,
+so the target database only needs to be migrated. Rows are generated server-side
+with generate_series, a million tasks take about a minute to seed.
+--explain prints the plan of the current search query.
+
+    PYTHONPATH=src python benchmarks/search_queries.py --tasks 1000000 --runs 30
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from typing import Awaitable, Callable
+
+from sqlalchemy import event, func, insert, or_, select, text
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from common.dto import PaginationDto, SortingDto
+from core.config import settings
+from enums.project import ProjectRole
+from modules.project_members.model import ProjectMember
+from modules.project_tasks.dto import ProjectTaskFilterDto
+from modules.project_tasks.model import ProjectTask
+from modules.project_tasks.repository import ProjectTaskRepository
+from modules.projects.model import Project
+from modules.users.model import User
+from utils import model_loader  # noqa: F401
+
+WORDS = [
+    "backend", "frontend", "release", "migration", "invoice", "dashboard",
+    "onboarding", "payment", "report", "deploy", "cache", "search",
+    "profile", "billing", "export", "import", "review", "metrics",
+]  # fmt: skip
+
+# Rare and common terms, the rare one matches a handful of rows
+TERMS = ["zephyr", "release", "deploy cache"]
+
+
+async def legacy_search(
+    db: AsyncSession, project_id: int, term: str, pagination: PaginationDto
+):
+    """The search as it was: ILIKE over title and description, separate COUNT"""
+    pattern = f"%{term}%"
+    stmt = select(ProjectTask).where(
+        ProjectTask.project_id == project_id,
+        or_(ProjectTask.title.ilike(pattern), ProjectTask.description.ilike(pattern)),
+    )
+
+    total = await db.scalar(select(func.count()).select_from(stmt.subquery()))
+
+    stmt = stmt.order_by(ProjectTask.created_at.desc())
+    stmt = stmt.limit(pagination.size).offset(pagination.offset)
+
+    result = await db.execute(stmt)
+
+    return result.scalars().all(), total
+
+
+async def current_search(
+    db: AsyncSession, project_id: int, term: str, pagination: PaginationDto
+):
+    # Measure uncached totals
+    ProjectTaskRepository.count_cache.clear()
+
+    return await ProjectTaskRepository(db).get_all(
+        project_id=project_id,
+        filters=ProjectTaskFilterDto(search=term),
+        sorting=SortingDto(sort_by="created_at", order="desc"),
+        pagination=pagination,
+    )
+
+
+async def seed(db: AsyncSession, users: int, tasks: int) -> int:
+    user_ids = (
+        await db.scalars(
+            insert(User).returning(User.id),
+            [
+                {
+                    "username": f"bench_search_user_{i}",
+                    "email": f"bench_search_user_{i}@example.com",
+                    "hashed_password": "x",
+                }
+                for i in range(users)
+            ],
+        )
+    ).all()
+
+    project_id = await db.scalar(
+        insert(Project)
+        .values(creator_id=user_ids[0], title="Search benchmark")
+        .returning(Project.id)
+    )
+
+    await db.execute(
+        insert(ProjectMember),
+        [
+            {
+                "project_id": project_id,
+                "user_id": user_id,
+                "role": ProjectRole.OWNER if i == 0 else ProjectRole.MEMBER,
+            }
+            for i, user_id in enumerate(user_ids)
+        ],
+    )
+
+    # Two vocabulary words per title, three per description,
+    # every 100 000th task mentions the rare term
+    await db.execute(
+        text("""
+            INSERT INTO project_tasks (
+                type, project_id, assignee_id, created_by_id, title, description,
+                priority, status, assigned_at, created_at, updated_at
+            )
+            SELECT
+                'DEFAULT', :project_id,
+                u[1 + i % cardinality(u)], u[1 + (i / 7) % cardinality(u)],
+                initcap(w[1 + i % n]) || ' ' || w[1 + (i / n) % n] || ' ' || i,
+                w[1 + (i * 7) % n] || ' ' || w[1 + (i * 11) % n] || ' '
+                    || w[1 + (i * 13) % n]
+                    || CASE WHEN i % 100000 = 0 THEN ' zephyr' ELSE '' END,
+                'MEDIUM', 'TODO',
+                now(),
+                now() - make_interval(secs => i),
+                now() - make_interval(secs => i)
+            FROM generate_series(1, CAST(:tasks AS integer)) AS i,
+                 (
+                     SELECT
+                         CAST(:user_ids AS integer[]) AS u,
+                         CAST(:words AS text[]) AS w,
+                         CAST(:n AS integer) AS n
+                 ) AS vocab
+        """),
+        {
+            "project_id": project_id,
+            "user_ids": list(user_ids),
+            "tasks": tasks,
+            "words": WORDS,
+            "n": len(WORDS),
+        },
+    )
+
+    return project_id
+
+
+async def measure(
+    fn: Callable[..., Awaitable],
+    db: AsyncSession,
+    project_id: int,
+    term: str,
+    runs: int,
+) -> tuple[int, float, float]:
+    """Total of matches, median and p95 latency (ms) of one search call"""
+    pagination = PaginationDto(size=20, offset=0)
+    timings = []
+    total = 0
+
+    for _ in range(runs):
+        start = time.perf_counter()
+        _, total = await fn(db, project_id, term, pagination)
+        timings.append((time.perf_counter() - start) * 1000)
+
+        # Keep the identity map from serving the next run
+        db.expunge_all()
+
+    timings.sort()
+    p95 = timings[max(int(len(timings) * 0.95) - 1, 0)]
+
+    return total, statistics.median(timings), p95
+
+
+async def explain(db: AsyncSession, project_id: int, term: str) -> None:
+    captured = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        captured.append((statement, parameters))
+
+    connection = await db.connection()
+    sync_engine = connection.sync_connection.engine
+
+    event.listen(sync_engine, "before_cursor_execute", capture)
+    try:
+        await current_search(db, project_id, term, PaginationDto(size=20, offset=0))
+    finally:
+        event.remove(sync_engine, "before_cursor_execute", capture)
+
+    statement, parameters = captured[-1]
+    result = await connection.exec_driver_sql(f"EXPLAIN {statement}", parameters)
+    print("\n".join(row[0] for row in result))
+
+
+async def main(args: argparse.Namespace) -> None:
+    engine = create_async_engine(
+        args.url, echo=False, connect_args=settings.db.connect_args
+    )
+
+    async with engine.connect() as conn:
+        transaction = await conn.begin()
+        db = AsyncSession(
+            bind=conn,
+            expire_on_commit=False,
+            join_transaction_mode="create_savepoint",
+        )
+        try:
+            start = time.perf_counter()
+            project_id = await seed(db, users=args.users, tasks=args.tasks)
+            await conn.exec_driver_sql("ANALYZE project_tasks")
+            print(f"seeded {args.tasks} tasks in {time.perf_counter() - start:.1f}s")
+
+            searches = (("legacy", legacy_search), ("current", current_search))
+            for term in TERMS:
+                for name, fn in searches:
+                    # Warm up connection and statement caches
+                    await measure(fn, db, project_id, term, 2)
+                    total, median, p95 = await measure(
+                        fn, db, project_id, term, args.runs
+                    )
+                    print(
+                        f"{term!r:<14} {name:<8} total={total:<8} "
+                        f"median={median:.2f}ms p95={p95:.2f}ms"
+                    )
+
+            if args.explain:
+                await explain(db, project_id, TERMS[0])
+        finally:
+            await db.close()
+            await transaction.rollback()
+
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--url", default=settings.db.url)
+    parser.add_argument("--users", type=int, default=50)
+    parser.add_argument("--tasks", type=int, default=1_000_000)
+    parser.add_argument("--runs", type=int, default=30)
+    parser.add_argument("--explain", action="store_true")
+
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,125 @@
+"""
+Startup of a worker: interpreter, 'import main', lifespan and first OpenAPI schema.
+
+Every run is a new interpreter, timed from the parent (process until exit) and
+inside it (import, lifespan startup and shutdown, first 'app.openapi()'). With
+'--openapi-cache' the schema is written once and read by the runs. The import
+time of one run is broken down by top level package ('-X importtime').
+
+    PYTHONPATH=src python benchmarks/startup.py --runs 20
+    PYTHONPATH=src python benchmarks/startup.py --runs 20 --openapi-cache /tmp/openapi.json
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from collections import defaultdict
+
+# Run by every child, prints its timings in ms as json
+CHILD = """
+import asyncio, json, time
+
+start = time.perf_counter()
+from main import app
+imported = time.perf_counter()
+
+
+async def lifespan():
+    async with app.router.lifespan_context(app):
+        pass
+
+
+asyncio.run(lifespan())
+started = time.perf_counter()
+app.openapi()
+documented = time.perf_counter()
+
+print(json.dumps({
+    "import": (imported - start) * 1000,
+    "lifespan": (started - imported) * 1000,
+    "openapi": (documented - started) * 1000,
+}))
+"""
+
+
+def run_child(env: dict[str, str]) -> dict[str, float]:
+    start = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, "-c", CHILD],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    timings = json.loads(result.stdout.splitlines()[-1])
+    timings["process"] = (time.perf_counter() - start) * 1000
+
+    return timings
+
+
+def import_times(env: dict[str, str]) -> dict[str, float]:
+    """Self time of the imported modules in ms, summed by top level package"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import main"],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    packages = defaultdict(float)
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, _, name = line.removeprefix("import time:").split("|")
+        packages[name.strip().split(".")[0]] += int(self_us) / 1000
+
+    return dict(sorted(packages.items(), key=lambda item: -item[1]))
+
+
+def main(args: argparse.Namespace) -> None:
+    env = dict(os.environ)
+    # Imports of the runs are timed, not the writing of bytecode
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+
+    if args.openapi_cache:
+        env["APP_CONFIG__RUN__OPENAPI_CACHE"] = args.openapi_cache
+        subprocess.run(
+            [sys.executable, "-m", "api.openapi", args.openapi_cache],
+            env=env,
+            check=True,
+        )
+
+    # Bytecode compiled and files in the page cache
+    run_child(env)
+
+    runs = [run_child(env) for _ in range(args.runs)]
+
+    print(f"{'ms':<10} {'median':>8} {'min':>8} {'max':>8}")
+    for name in ("process", "import", "lifespan", "openapi"):
+        values = [run[name] for run in runs]
+        print(
+            f"{name:<10} {statistics.median(values):>8.1f} "
+            f"{min(values):>8.1f} {max(values):>8.1f}"
+        )
+
+    print(f"\nImport self time by package, top {args.top} (ms)")
+    for package, ms in list(import_times(env).items())[: args.top]:
+        print(f"{package:<24} {ms:>8.1f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--top", type=int, default=15)
+    parser.add_argument(
+        "--openapi-cache",
+        default=None,
+        help="write the schema to this file first and read it in the runs",
+    )
+    main(parser.parse_args())
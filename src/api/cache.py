@@ -0,0 +1,79 @@
+import hashlib
+from typing import Any
+
+from fastapi import Request, Response
+
+from api.conditional import check_not_modified
+from api.responses import render_json
+from utils.etag import content_etag
+from utils.response_cache import CachedResponse, CacheLookup, ResponseCache
+
+
+class CachedView:
+    """
+    Cached response of a GET request, looked up by a dependency after the
+    permission checks. On a hit the endpoint returns 'response()' and loads
+    nothing, on a miss it renders its content with 'store()'.
+    """
+
+    def __init__(self, request: Request, cache: ResponseCache, lookup: CacheLookup):
+        self.request = request
+        self.cache = cache
+        self.lookup = lookup
+
+    @classmethod
+    async def find(
+        cls, request: Request, cache: ResponseCache, scope: str, *parts: Any
+    ) -> "CachedView":
+        """Look up the request in 'scope', 'parts' (e.g. role) are keyed with it"""
+        return cls(request, cache, await cache.get(scope, _request_key(request, parts)))
+
+    @property
+    def hit(self) -> bool:
+        return self.lookup.entry is not None
+
+    def response(self) -> Response:
+        """The cached response, 304 when the client has its version"""
+        entry = self.lookup.entry
+        check_not_modified(self.request, entry.etag)
+
+        return _json_response(entry)
+
+    async def store(
+        self,
+        content: Any,
+        response_model: Any,
+        etag: str | None = None,
+        cache: bool = True,
+    ) -> Response:
+        """
+        Render the response and cache it, unless it was read from the replica:
+        a write invalidating the scope may not have been replayed there yet,
+        and the stale entry would outlive the invalidation. Without 'etag'
+        the body is tagged. 'cache=False' for content that changes without
+        a write (e.g. filtered by the current time). 304 when the client
+        has the version.
+        """
+        body = render_json(response_model, content)
+        entry = CachedResponse(etag=etag or content_etag(body), body=body)
+        if cache and not getattr(self.request.state, "read_replica", False):
+            await self.cache.set(self.lookup, entry)
+
+        check_not_modified(self.request, entry.etag)
+
+        return _json_response(entry)
+
+
+def _request_key(request: Request, parts: tuple) -> str:
+    # The same query in any order of its params
+    query = sorted(request.query_params.multi_items())
+
+    return hashlib.blake2b(
+        repr((request.url.path, parts, query)).encode(), digest_size=16
+    ).hexdigest()
+
+
+def _json_response(entry: CachedResponse) -> Response:
+    return Response(
+        entry.body, media_type="application/json", headers={"ETag": entry.etag}
+    )
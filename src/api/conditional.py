@@ -0,0 +1,46 @@
+from typing import Any
+
+from fastapi import HTTPException, Request, Response, status
+
+from api.responses import render_json
+from utils.etag import content_etag, etag_matches
+
+
+def check_not_modified(request: Request, etag: str) -> None:
+    """Respond 304 when If-None-Match of the request lists 'etag'"""
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        raise HTTPException(
+            status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag}
+        )
+
+
+def tagged_json(request: Request, content: Any, response_model: Any) -> Response:
+    """
+    'content' rendered as 'response_model' with the tag of its body,
+    304 when the client has that version
+    """
+    body = render_json(response_model, content)
+    etag = content_etag(body)
+    check_not_modified(request, etag)
+
+    return Response(body, media_type="application/json", headers={"ETag": etag})
+
+
+def check_precondition(request: Request, etag: str) -> bool:
+    """
+    Respond 412 when If-Match of the request doesn't list 'etag', a strong
+    tag of the resource. Returns whether the request is conditional, the write must then also
+    check that the row didn't change since it was read.
+    """
+    if_match = request.headers.get("if-match")
+    if if_match is None:
+        return False
+
+    if not etag_matches(if_match, etag, weak=False):
+        raise HTTPException(
+            status_code=status.HTTP_412_PRECONDITION_FAILED,
+            detail="Resource was modified, reload it and try again.",
+            headers={"ETag": etag},
+        )
+
+    return True
@@ -0,0 +1,220 @@
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Any
+
+from fastapi import APIRouter, HTTPException, status
+from fastapi.responses import PlainTextResponse
+
+from core.config import settings
+from core.security.password import hashing_pool
+from db.session import engine, pool_stats
+from db.unit_of_work import UnitOfWork
+from modules.auth.service import AuthService
+from modules.personal_tasks.repository import PersonalTaskRepository
+from modules.project_members.cache import membership_cache
+from modules.project_members.repository import ProjectMemberRepository
+from modules.project_tasks.repository import ProjectTaskRepository
+from modules.projects.cache import project_response_cache
+from modules.projects.repository import ProjectRepository
+
+DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# In-process caches reported by name, all of them have 'stats()' with the
+# counters they keep (a pluggable response cache backend may keep none)
+CACHES = {
+    "principal": AuthService.principal_cache,
+    "membership": membership_cache,
+    "project_response": project_response_cache,
+    "personal_task_count": PersonalTaskRepository.count_cache,
+    "project_count": ProjectRepository.count_cache,
+    "project_member_count": ProjectMemberRepository.count_cache,
+    "project_task_count": ProjectTaskRepository.count_cache,
+}
+
+
+@dataclass
+class RouteMetrics:
+    # Requests per duration bucket, each counted in its own bucket only
+    buckets: list[int] = field(default_factory=lambda: [0] * len(DURATION_BUCKETS))
+    count: int = 0
+    duration: float = 0.0
+    statements: int = 0
+    db_time: float = 0.0
+    pool_wait: float = 0.0
+    render_time: float = 0.0
+
+
+class RequestMetrics:
+    """
+    Requests of this process by method and route template (e.g.
+    '/api/v1/projects/{project_id}'), so ids don't multiply the series.
+    Every worker has its own, a scrape sees the worker that answered it.
+    """
+
+    def __init__(self):
+        self.responses: dict[tuple[str, str, int], int] = defaultdict(int)
+        self.routes: dict[tuple[str, str], RouteMetrics] = defaultdict(RouteMetrics)
+
+    def observe(
+        self,
+        method: str,
+        route: str,
+        status_code: int,
+        duration: float,
+        uow: UnitOfWork,
+    ) -> None:
+        self.responses[method, route, status_code] += 1
+
+        metrics = self.routes[method, route]
+        metrics.count += 1
+        metrics.duration += duration
+        metrics.statements += uow.statements
+        metrics.db_time += uow.db_time
+        metrics.pool_wait += uow.pool_wait
+        metrics.render_time += uow.render_time or 0.0
+
+        for i, bound in enumerate(DURATION_BUCKETS):
+            if duration <= bound:
+                metrics.buckets[i] += 1
+                break
+
+    def render(self) -> list[str]:
+        lines = _header(
+            "http_requests_total", "counter", "Responses by route and status"
+        )
+        for (method, route, status_code), count in self.responses.items():
+            labels = {"method": method, "route": route, "status": status_code}
+            lines.append(_sample("http_requests_total", labels, count))
+
+        lines += _header(
+            "http_request_duration_seconds",
+            "histogram",
+            "Time until the response started",
+        )
+        for (method, route), metrics in self.routes.items():
+            labels = {"method": method, "route": route}
+            cumulative = 0
+            for bound, count in zip(DURATION_BUCKETS, metrics.buckets):
+                cumulative += count
+                lines.append(
+                    _sample(
+                        "http_request_duration_seconds_bucket",
+                        {**labels, "le": bound},
+                        cumulative,
+                    )
+                )
+            lines += [
+                _sample(
+                    "http_request_duration_seconds_bucket",
+                    {**labels, "le": "+Inf"},
+                    metrics.count,
+                ),
+                _sample("http_request_duration_seconds_sum", labels, metrics.duration),
+                _sample("http_request_duration_seconds_count", labels, metrics.count),
+            ]
+
+        for name, attribute, help_text in (
+            ("db_statements_total", "statements", "SQL statements of requests"),
+            ("db_time_seconds_total", "db_time", "Time of requests in statements"),
+            (
+                "db_pool_wait_seconds_total",
+                "pool_wait",
+                "Time of requests waiting for a pooled connection",
+            ),
+            (
+                "http_render_seconds_total",
+                "render_time",
+                "Time of requests rendering the response",
+            ),
+        ):
+            lines += _header(name, "counter", help_text)
+            for (method, route), metrics in self.routes.items():
+                labels = {"method": method, "route": route}
+                lines.append(_sample(name, labels, getattr(metrics, attribute)))
+
+        return lines
+
+    def clear(self) -> None:
+        self.responses.clear()
+        self.routes.clear()
+
+
+request_metrics = RequestMetrics()
+
+router = APIRouter()
+
+
+@router.get(settings.metrics.path, include_in_schema=False)
+async def get_metrics() -> PlainTextResponse:
+    if not settings.metrics.enabled:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND)
+
+    lines = request_metrics.render()
+
+    pool = pool_stats(engine)
+    lines += _header("db_pool_connections", "gauge", "Connections by state")
+    for state in ("checked_in", "checked_out", "overflow"):
+        lines.append(_sample("db_pool_connections", {"state": state}, pool[state]))
+    lines += _values(
+        "db_pool",
+        {
+            "checkouts_total": pool.get("checkouts", 0),
+            "wait_seconds_total": pool.get("wait_time_total_ms", 0) / 1000,
+            "wait_seconds_max": pool.get("wait_time_max_ms", 0) / 1000,
+        },
+    )
+
+    hashing = hashing_pool.stats()
+    lines += _values(
+        "hashing_pool",
+        {
+            "in_flight": hashing["in_flight"],
+            "queued": hashing["queued"],
+            "completed_total": hashing["completed"],
+        },
+    )
+
+    stats = {cache_name: cache.stats() for cache_name, cache in CACHES.items()}
+    for stat in ("hits", "misses", "size"):
+        name = f"cache_{stat}" if stat == "size" else f"cache_{stat}_total"
+        lines += _header(name, _metric_type(name), f"In-process cache {stat}")
+        for cache_name, counters in stats.items():
+            if stat in counters:
+                lines.append(_sample(name, {"cache": cache_name}, counters[stat]))
+
+    return PlainTextResponse(
+        "\n".join(lines) + "\n", media_type="text/plain; version=0.0.4"
+    )
+
+
+def _values(prefix: str, values: dict[str, float]) -> list[str]:
+    lines = []
+    for name, value in values.items():
+        metric = f"{prefix}_{name}"
+        lines += _header(metric, _metric_type(metric), name.replace("_", " "))
+        lines.append(_sample(metric, {}, value))
+
+    return lines
+
+
+def _metric_type(name: str) -> str:
+    return "counter" if name.endswith("_total") else "gauge"
+
+
+def _header(name: str, metric_type: str, help_text: str) -> list[str]:
+    return [f"# HELP {name} {help_text}", f"# TYPE {name} {metric_type}"]
+
+
+def _sample(name: str, labels: dict[str, Any], value: float) -> str:
+    if not labels:
+        return f"{name} {value}"
+
+    rendered = ",".join(
+        f'{key}="{_escape(str(label))}"' for key, label in labels.items()
+    )
+
+    return f"{name}{{{rendered}}} {value}"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
@@ -0,0 +1,111 @@
+import time
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from api.metrics import request_metrics
+from api.profiling import track_request
+from core.config import settings
+from db import session as db_session
+from db.invalidation import cache_invalidations
+from db.session import WRITE_LSN_COOKIE
+from db.unit_of_work import UnitOfWork, unit_of_work
+
+
+class UnitOfWorkMiddleware:
+    """
+    Runs every http request inside its own unit of work.
+    Cache invalidations of the request reach the other workers before its
+    response starts. With a replica, a request that committed sends the
+    client the position of its writes (see 'get_read_session').
+    Optionally reports the number of sql statements in 'X-SQL-Statements',
+    where the time went in 'Server-Timing' and records the request metrics.
+    Requests are noted for the profiler, which labels samples by their route.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        track_request(scope)
+        start = time.perf_counter()
+        with unit_of_work() as uow:
+            status_code = 500
+            duration: float | None = None
+
+            async def send_wrapper(message: Message) -> None:
+                nonlocal status_code, duration
+                if message["type"] == "http.response.start":
+                    status_code = message["status"]
+                    await cache_invalidations.flush(uow)
+                    if uow.committed and db_session.replica_session_fabric:
+                        message = await _with_write_position(message)
+                    duration = time.perf_counter() - start
+                    message = _with_debug_headers(message, uow, duration)
+
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_wrapper)
+            finally:
+                # Published after the response started, or without one
+                await cache_invalidations.flush(uow)
+                if settings.metrics.enabled:
+                    # Template of the matched route, the path has ids in it
+                    route = getattr(scope.get("route"), "path", "unmatched")
+                    request_metrics.observe(
+                        method=scope["method"],
+                        route=route,
+                        status_code=status_code,
+                        duration=(
+                            duration
+                            if duration is not None
+                            else time.perf_counter() - start
+                        ),
+                        uow=uow,
+                    )
+
+
+async def _with_write_position(message: Message) -> Message:
+    """
+    Cookie with the WAL position after the writes of the request, the reads
+    of the client stay on the primary until the replica has replayed it
+    """
+    lsn = await db_session.current_wal_lsn()
+    cookie = f"{WRITE_LSN_COOKIE}={lsn}; Path=/; HttpOnly; SameSite=Lax"
+
+    return {
+        **message,
+        "headers": [*message.get("headers", []), (b"set-cookie", cookie.encode())],
+    }
+
+
+def _with_debug_headers(message: Message, uow: UnitOfWork, duration: float) -> Message:
+    headers = []
+    if settings.debug.sql_statements_header:
+        headers.append((b"x-sql-statements", str(uow.statements).encode("latin-1")))
+    if settings.debug.server_timing:
+        headers.append((b"server-timing", server_timing(uow, duration).encode()))
+
+    if not headers:
+        return message
+
+    return {**message, "headers": [*message.get("headers", []), *headers]}
+
+
+def server_timing(uow: UnitOfWork, duration: float) -> str:
+    """'Server-Timing' value, times of the request until its response started"""
+    metrics = [
+        f'db;dur={uow.db_time * 1000:.2f};desc="{uow.statements} statements"',
+        f"pool;dur={uow.pool_wait * 1000:.2f}",
+    ]
+    if uow.handler_time is not None:
+        metrics.append(f"handler;dur={uow.handler_time * 1000:.2f}")
+    if uow.render_time is not None:
+        metrics.append(f"render;dur={uow.render_time * 1000:.2f}")
+    metrics.append(f"app;dur={duration * 1000:.2f}")
+
+    return ", ".join(metrics)
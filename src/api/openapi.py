@@ -0,0 +1,52 @@
+"""
+OpenAPI schema prebuilt on build and read from disk by the workers.
+
+FastAPI builds the schema from the routes on the first docs request of every
+worker. With 'RUN__OPENAPI_CACHE' set the schema is read from that file, which
+is written with the code it describes, e.g. in the image:
+
+    PYTHONPATH=src python -m api.openapi /app/openapi.json
+"""
+
+import json
+import logging
+import sys
+from pathlib import Path
+from typing import Any
+
+from fastapi import FastAPI
+
+logger = logging.getLogger(__name__)
+
+
+def use_openapi_cache(app: FastAPI, path: str | None) -> None:
+    """Serve the schema of 'path', built as usual when there is no such file"""
+    if not path:
+        return
+
+    build = app.openapi
+
+    def openapi() -> dict[str, Any]:
+        if app.openapi_schema is None:
+            try:
+                app.openapi_schema = json.loads(Path(path).read_bytes())
+            except FileNotFoundError:
+                logger.warning("No OpenAPI schema at %s, building it", path)
+                return build()
+
+        return app.openapi_schema
+
+    app.openapi = openapi
+
+
+def write_openapi(app: FastAPI, path: str | Path) -> None:
+    # Built from the routes, not read from a previous file
+    app.openapi_schema = None
+    schema = FastAPI.openapi(app)
+    Path(path).write_text(json.dumps(schema, separators=(",", ":")))
+
+
+if __name__ == "__main__":
+    from main import app
+
+    write_openapi(app, sys.argv[1])
@@ -0,0 +1,154 @@
+import asyncio
+import logging
+import secrets
+import threading
+import weakref
+from types import FrameType
+from typing import Any
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, status
+from starlette.types import Scope
+
+from core.config import settings
+from core.security.password import THREAD_NAME_PREFIX
+from utils.profiler import SamplingProfiler
+
+logger = logging.getLogger(__name__)
+
+
+class RequestLabeler:
+    """
+    Labels samples of the event loop thread with the route of the request its
+    task runs, and samples of the bcrypt threads as 'bcrypt'. A running
+    coroutine shows no request frames inside SQLAlchemy greenlets, so requests
+    are found by the current task of the loop instead of by their stack.
+    """
+
+    def __init__(self):
+        self.loop: asyncio.AbstractEventLoop | None = None
+        self.thread_id: int | None = None
+        self.requests: weakref.WeakKeyDictionary[asyncio.Task, Scope] = (
+            weakref.WeakKeyDictionary()
+        )
+
+    def attach(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Label the thread running 'loop', called on it"""
+        self.loop = loop
+        self.thread_id = threading.get_ident()
+        self.requests.clear()
+
+    def track(self, scope: Scope) -> None:
+        task = asyncio.current_task()
+        if task is not None:
+            self.requests[task] = scope
+
+    def __call__(self, thread: threading.Thread, frame: FrameType) -> str | None:
+        if thread.ident == self.thread_id:
+            task = asyncio.current_task(self.loop)
+            scope = self.requests.get(task) if task is not None else None
+            if scope is None:
+                return "(event loop)"
+
+            # Template of the matched route, known once the request is routed
+            route = getattr(scope.get("route"), "path", "(unmatched)")
+            return f"{scope['method']} {route}"
+
+        if thread.name.startswith(THREAD_NAME_PREFIX):
+            return "bcrypt"
+
+        return None
+
+
+labeler = RequestLabeler()
+profiler = SamplingProfiler(label=labeler)
+
+
+def track_request(scope: Scope) -> None:
+    """Note the request of the current task, while the profiler is running"""
+    if profiler.running:
+        labeler.track(scope)
+
+
+def start_profiler(interval: float, duration: float) -> None:
+    labeler.attach(asyncio.get_running_loop())
+    profiler.start(
+        interval=interval, duration=duration, output_dir=settings.profiling.output_dir
+    )
+    logger.warning("Profiler started, writing to %s", profiler.path)
+
+
+async def stop_profiler() -> dict[str, Any]:
+    profiler.stop()
+    # Written by the sampling thread once it has ended
+    await asyncio.to_thread(profiler.join)
+    logger.warning("Profile written to %s", profiler.path)
+
+    return profiler.summary()
+
+
+def toggle_profiler() -> None:
+    """Signal handler, starts the profiler with the defaults or stops it"""
+    if profiler.running:
+        asyncio.ensure_future(stop_profiler())
+    else:
+        start_profiler(
+            interval=settings.profiling.interval,
+            duration=settings.profiling.max_duration,
+        )
+
+
+def check_admin_token(
+    x_admin_token: str | None = Header(default=None, include_in_schema=False),
+) -> None:
+    token = settings.profiling.admin_token
+    if not token:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND)
+
+    if x_admin_token is None or not secrets.compare_digest(
+        x_admin_token.encode(), token.encode()
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN, detail="Invalid admin token."
+        )
+
+
+router = APIRouter(
+    prefix=settings.profiling.path,
+    dependencies=[Depends(check_admin_token)],
+    include_in_schema=False,
+)
+
+
+@router.get("")
+async def get_profiler() -> dict[str, Any]:
+    """State of the profiler, samples of the running or the last profile"""
+    return profiler.summary()
+
+
+@router.post("")
+async def post_profiler(
+    interval: float | None = Query(default=None, gt=0, le=1),
+    duration: float | None = Query(default=None, gt=0),
+) -> dict[str, Any]:
+    """Start the profiler, 'duration' is capped by the configured maximum"""
+    config = settings.profiling
+    try:
+        start_profiler(
+            interval=interval or config.interval,
+            duration=min(duration or config.max_duration, config.max_duration),
+        )
+    except RuntimeError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+
+    return profiler.summary()
+
+
+@router.delete("")
+async def delete_profiler() -> dict[str, Any]:
+    """Stop the profiler, the profile is written before the response"""
+    if profiler.started_at is None:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT, detail="Profiler was not started."
+        )
+
+    return await stop_profiler()
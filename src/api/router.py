@@ -1,8 +1,17 @@
-from fastapi import APIRouter
+from fastapi import FastAPI
 
 from core.config import settings
-from api.v1.router import router as api_v1_router
+from api.v1.router import ROUTERS as API_V1_ROUTERS
 
-router = APIRouter()
+# Routers of the api versions by prefix. They are included straight into the
+# app: 'include_router' builds every route again, each router in between
+# would build all of its routes once more on startup
+API_VERSIONS = {settings.prefix.api_v1: API_V1_ROUTERS}
 
-router.include_router(api_v1_router, prefix=settings.prefix.api_v1)
+
+def include_api(app: FastAPI) -> None:
+    for version, routers in API_VERSIONS.items():
+        for router, prefix, tags in routers:
+            app.include_router(
+                router, prefix=settings.prefix.api + version + prefix, tags=tags
+            )
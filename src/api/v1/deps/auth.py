@@ -1,16 +1,28 @@
 from fastapi import Depends
 from fastapi.security import OAuth2PasswordBearer
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from api.v1.deps.services import get_auth_service
+from db.session import get_session
+from db.unit_of_work import current_unit_of_work
 from modules.auth import service as auth_service
-from modules.users import model as user_model
-from enums.token import TokenType
+from modules.users.dto import UserPrincipalDto
+from modules.users.repository import UserRepository
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/auth/login")
 
 
 async def get_current_user(
     token: str = Depends(oauth2_scheme),
-    auth_svc: auth_service.AuthService = Depends(get_auth_service),
-) -> user_model.User:
-    return await auth_svc.get_user_from_token(token=token, token_type=TokenType.ACCESS)
+    db: AsyncSession = Depends(get_session),
+) -> UserPrincipalDto:
+    # Service is built here, not taken from deps.services:
+    # repository dependencies depend on the current user (read session)
+    auth_svc = auth_service.AuthService(UserRepository(db))
+    user = await auth_svc.get_principal_from_token(token=token)
+
+    # Writes of this request are attributed to the user (read-your-writes)
+    uow = current_unit_of_work()
+    if uow is not None:
+        uow.user_id = user.id
+
+    return user
@@ -0,0 +1,32 @@
+from fastapi import Depends, Request
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from db import session as db_session
+from db.session import WRITE_LSN_COOKIE, get_session
+
+_READ_METHODS = {"GET", "HEAD"}
+
+
+async def get_read_session(
+    request: Request,
+    db: AsyncSession = Depends(get_session),
+):
+    """
+    Replica session for reads, the primary one ('get_session') otherwise.
+    Stays on the primary when no replica is configured, for non-read requests,
+    and while the replica hasn't replayed the last write of the client (the
+    position in its 'last_write_lsn' cookie).
+    """
+    if db_session.replica_session_fabric is None or request.method not in _READ_METHODS:
+        yield db
+        return
+
+    lsn = request.cookies.get(WRITE_LSN_COOKIE)
+    async with db_session.replica_session_fabric() as sess:
+        if lsn is None or await db_session.replayed(sess, lsn):
+            # Responses read here may be behind the primary, they aren't cached
+            request.state.read_replica = True
+            yield sess
+            return
+
+    yield db
@@ -1,14 +1,22 @@
-from fastapi import Depends, HTTPException, status
+from datetime import datetime
+from fastapi import Depends, HTTPException, Request, status
 
+from api.conditional import check_not_modified
 from api.v1.deps.auth import get_current_user
 from api.v1.deps.repositories import get_personal_task_repository
 from modules.personal_tasks.repository import PersonalTaskRepository
-from modules.users.model import User as UserModel
+from modules.users.dto import UserPrincipalDto
+from utils.etag import make_etag
+
+
+def personal_task_etag(task_id: int, updated_at: datetime) -> str:
+    # Strong, nothing but the task row is shown
+    return make_etag("personal_task", task_id, updated_at, weak=False)
 
 
 async def get_current_personal_task(
     task_id: int,
-    user: UserModel = Depends(get_current_user),
+    user: UserPrincipalDto = Depends(get_current_user),
     repo: PersonalTaskRepository = Depends(get_personal_task_repository),
 ):
     task = await repo.get_by_id_and_user(task_id=task_id, user_id=user.id)
@@ -20,3 +28,18 @@ async def get_current_personal_task(
         )
 
     return task
+
+
+async def check_personal_task_not_modified(
+    task_id: int,
+    request: Request,
+    user: UserPrincipalDto = Depends(get_current_user),
+    repo: PersonalTaskRepository = Depends(get_personal_task_repository),
+) -> None:
+    """Respond 304 to a conditional request before the task is loaded"""
+    if "if-none-match" not in request.headers:
+        return
+
+    updated_at = await repo.get_updated_at(task_id=task_id, user_id=user.id)
+    if updated_at is not None:
+        check_not_modified(request, personal_task_etag(task_id, updated_at))
@@ -6,19 +6,19 @@ from modules.project_members import (
     repository as member_repository,
     model as member_model,
 )
-from modules.users import model as user_model
+from modules.users.dto import UserPrincipalDto
 
 
 async def get_current_project_member(
     project_id: int,
-    user: user_model.User = Depends(get_current_user),
+    user: UserPrincipalDto = Depends(get_current_user),
     member_repo: member_repository.ProjectMemberRepository = Depends(
         get_project_member_repository
     ),
 ) -> member_model.ProjectMember:
     """Get current member in project."""
 
-    member = await member_repo.get_by_user_id_and_project_id(
+    member = await member_repo.get_cached_membership(
         user_id=user.id, project_id=project_id
     )
 
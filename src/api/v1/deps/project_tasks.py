@@ -1,11 +1,40 @@
-from fastapi import Depends, HTTPException, status
+from datetime import datetime
+from fastapi import Depends, HTTPException, Request, status
 
+from api.conditional import check_not_modified
 from api.v1.deps.repositories import get_project_task_repository
 from api.v1.deps.project_members import get_current_project_member
 from modules.project_tasks.repository import ProjectTaskRepository
 from modules.project_tasks.model import ProjectTask as ProjectTaskModel
 from modules.project_members.model import ProjectMember as ProjectMemberModel
 from enums.project_task import ProjectTaskType
+from utils.etag import make_etag
+
+
+def project_task_etag(
+    task_id: int,
+    updated_at: datetime,
+    assignee_updated_at: datetime | None,
+    creator_updated_at: datetime | None,
+) -> str:
+    """Strong tag of the task, it covers the assignee and creator shown in it"""
+    return make_etag(
+        "project_task",
+        task_id,
+        updated_at,
+        assignee_updated_at,
+        creator_updated_at,
+        weak=False,
+    )
+
+
+def loaded_task_etag(task: ProjectTaskModel) -> str:
+    return project_task_etag(
+        task.id,
+        task.updated_at,
+        task.assignee.updated_at if task.assignee else None,
+        task.creator.updated_at if task.creator else None,
+    )
 
 
 async def get_current_project_task(
@@ -33,3 +62,20 @@ async def get_current_project_open_task(
         )
 
     return task
+
+
+async def check_project_task_not_modified(
+    task_id: int,
+    request: Request,
+    member: ProjectMemberModel = Depends(get_current_project_member),
+    repo: ProjectTaskRepository = Depends(get_project_task_repository),
+) -> None:
+    """Respond 304 to a conditional request before the task is loaded"""
+    if "if-none-match" not in request.headers:
+        return
+
+    version = await repo.get_version_by_id(
+        task_id=task_id, project_id=member.project_id
+    )
+    if version is not None:
+        check_not_modified(request, project_task_etag(task_id, *version))
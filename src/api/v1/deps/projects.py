@@ -0,0 +1,90 @@
+from datetime import datetime
+from fastapi import Depends, Request
+
+from api.cache import CachedView
+from api.conditional import check_not_modified, check_precondition
+from api.v1.deps.project_members import get_current_project_member
+from api.v1.deps.repositories import get_project_repository
+from modules.project_members.model import ProjectMember as ProjectMemberModel
+from modules.projects.cache import (
+    PROJECT,
+    PROJECT_MEMBERS,
+    PROJECT_TASKS,
+    project_response_cache,
+)
+from modules.projects import model as project_model
+from modules.projects.repository import ProjectRepository
+from utils.etag import make_etag
+
+
+def project_etag(
+    project_id: int, updated_at: datetime, creator_updated_at: datetime
+) -> str:
+    """
+    Strong tag of the project, member writes move 'updated_at' of the project
+    too and the creator shown in it has a version of its own
+    """
+    return make_etag("project", project_id, updated_at, creator_updated_at, weak=False)
+
+
+def loaded_project_etag(project: project_model.Project) -> str:
+    return project_etag(project.id, project.updated_at, project.creator.updated_at)
+
+
+def _project_response_lookup(scope: str):
+    """Factory of a dependency looking up the cached response of a project GET"""
+
+    async def lookup(
+        request: Request,
+        member: ProjectMemberModel = Depends(get_current_project_member),
+    ) -> CachedView:
+        return await CachedView.find(
+            request,
+            project_response_cache,
+            f"{scope}:{member.project_id}",
+            member.role,
+        )
+
+    return lookup
+
+
+lookup_project_response = _project_response_lookup(PROJECT)
+lookup_project_tasks_response = _project_response_lookup(PROJECT_TASKS)
+lookup_project_members_response = _project_response_lookup(PROJECT_MEMBERS)
+
+
+async def check_project_not_modified(
+    project_id: int,
+    request: Request,
+    cached: CachedView = Depends(lookup_project_response),
+    repo: ProjectRepository = Depends(get_project_repository),
+) -> None:
+    """Respond 304 to a conditional request before the project is loaded"""
+    # A cached response is checked against its own ETag
+    if cached.hit or "if-none-match" not in request.headers:
+        return
+
+    version = await repo.get_version_by_id(project_id=project_id)
+    if version is not None:
+        check_not_modified(request, project_etag(project_id, *version))
+
+
+async def check_project_precondition(
+    project_id: int,
+    request: Request,
+    repo: ProjectRepository = Depends(get_project_repository),
+) -> datetime | None:
+    """
+    If-Match of a project write: 412 when the project changed since the client
+    read it, 'updated_at' the write must still find otherwise.
+    """
+    if "if-match" not in request.headers:
+        return None
+
+    version = await repo.get_version_by_id(project_id=project_id)
+    if version is None:
+        return None
+
+    check_precondition(request, project_etag(project_id, *version))
+
+    return version.updated_at
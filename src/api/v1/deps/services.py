@@ -6,6 +6,7 @@ from api.v1.deps.repositories import (
     get_personal_task_repository,
     get_project_member_repository,
     get_project_task_repository,
+    get_project_task_stats_repository,
 )
 from modules.auth.service import AuthService
 from modules.users.repository import UserRepository
@@ -18,6 +19,8 @@ from modules.project_members.repository import ProjectMemberRepository
 from modules.project_members.service import ProjectMemberService
 from modules.project_tasks.repository import ProjectTaskRepository
 from modules.project_tasks.service import ProjectTaskService
+from modules.project_task_stats.repository import ProjectTaskStatsRepository
+from modules.project_task_stats.service import ProjectTaskStatsService
 
 
 async def get_auth_service(repo: UserRepository = Depends(get_user_repository)):
@@ -52,3 +55,9 @@ async def get_project_tasks_service(
     member_repo: ProjectMemberRepository = Depends(get_project_member_repository),
 ):
     return ProjectTaskService(repo=repo, member_repo=member_repo)
+
+
+async def get_project_task_stats_service(
+    repo: ProjectTaskStatsRepository = Depends(get_project_task_stats_repository),
+):
+    return ProjectTaskStatsService(repo)
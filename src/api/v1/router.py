@@ -1,32 +1,46 @@
-from fastapi import APIRouter
-
 from core.config import settings
 from api.v1.routes.users import router as users_router
 from api.v1.routes.auth import router as auth_router
-from api.v1.routes.personal_tasks import router as personal_tasks_router
+from api.v1.routes.personal_tasks import (
+    router as personal_tasks_router,
+    export_router as personal_tasks_export_router,
+    import_router as personal_tasks_import_router,
+)
 from api.v1.routes.projects import router as projects_router
 from api.v1.routes.project_members import router as project_members_router
-from api.v1.routes.project_tasks import router as project_tasks_router
-
-router = APIRouter()
-
-router.include_router(users_router, prefix=settings.prefix.users, tags=["users"])
-router.include_router(auth_router, prefix=settings.prefix.auth, tags=["auth"])
-router.include_router(
-    personal_tasks_router,
-    prefix=settings.prefix.personal_tasks,
-    tags=["personal-tasks"],
+from api.v1.routes.project_tasks import (
+    router as project_tasks_router,
+    batch_router as project_tasks_batch_router,
+    export_router as project_tasks_export_router,
 )
-router.include_router(
-    projects_router, prefix=settings.prefix.projects, tags=["projects"]
-)
-router.include_router(
-    project_members_router,
-    prefix=settings.prefix.project_members,
-    tags=["project-members"],
-)
-router.include_router(
-    project_tasks_router,
-    prefix=settings.prefix.project_tasks,
-    tags=["project-tasks"],
+
+# Routers of the v1 endpoints with their prefixes and tags, included straight
+# into the app by 'api.router.include_api'
+ROUTERS = (
+    (users_router, settings.prefix.users, ["users"]),
+    (auth_router, settings.prefix.auth, ["auth"]),
+    (personal_tasks_router, settings.prefix.personal_tasks, ["personal-tasks"]),
+    (
+        personal_tasks_export_router,
+        settings.prefix.personal_tasks_export,
+        ["personal-tasks"],
+    ),
+    (
+        personal_tasks_import_router,
+        settings.prefix.personal_tasks_import,
+        ["personal-tasks"],
+    ),
+    (projects_router, settings.prefix.projects, ["projects"]),
+    (project_members_router, settings.prefix.project_members, ["project-members"]),
+    (project_tasks_router, settings.prefix.project_tasks, ["project-tasks"]),
+    (
+        project_tasks_batch_router,
+        settings.prefix.project_tasks_batch,
+        ["project-tasks"],
+    ),
+    (
+        project_tasks_export_router,
+        settings.prefix.project_tasks_export,
+        ["project-tasks"],
+    ),
 )
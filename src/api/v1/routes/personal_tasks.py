@@ -1,17 +1,30 @@
-from fastapi import APIRouter, Depends, Response, status
+from fastapi import APIRouter, Depends, Request, Response, status
+from fastapi.responses import StreamingResponse
 
+from api.conditional import check_precondition, tagged_json
+from api.responses import PydanticJSONRoute
 from api.v1.deps.auth import get_current_user
-from api.v1.deps.personal_tasks import get_current_personal_task
+from api.v1.deps.personal_tasks import (
+    check_personal_task_not_modified,
+    get_current_personal_task,
+    personal_task_etag,
+)
 from api.v1.deps.services import get_personal_tasks_service
-from modules.users.model import User as UserModel
+from modules.users.dto import UserPrincipalDto
 from modules.personal_tasks import (
     schemas as tasks_schema,
     service as tasks_service,
     model,
 )
 from common import schemas as common_schemas
+from utils.export import MEDIA_TYPES
+
+router = APIRouter(route_class=PydanticJSONRoute)
 
-router = APIRouter()
+# Mounted at '/personal_tasks:export' and '/personal_tasks:import',
+# paths that can't be declared on the router
+export_router = APIRouter()
+import_router = APIRouter()
 
 
 @router.get(
@@ -19,18 +32,25 @@ router = APIRouter()
     response_model=common_schemas.BasePaginationResponse[tasks_schema.PersonalTaskRead],
 )
 async def get_list_of_personal_tasks(
+    request: Request,
     # Query params
     filters: tasks_schema.PersonalTaskFilterParams = Depends(),
     sorting: tasks_schema.PersonalTaskSortingParams = Depends(),
     pagination: common_schemas.BasePaginationParams = Depends(),
     # Other
-    user: UserModel = Depends(get_current_user),
+    user: UserPrincipalDto = Depends(get_current_user),
     tasks_svc: tasks_service.PersonalTaskService = Depends(get_personal_tasks_service),
 ):
-    return await tasks_svc.get_list(
+    tasks = await tasks_svc.get_list(
         user_id=user.id, filters=filters, sorting=sorting, pagination=pagination
     )
 
+    return tagged_json(
+        request,
+        tasks,
+        common_schemas.BasePaginationResponse[tasks_schema.PersonalTaskRead],
+    )
+
 
 @router.post(
     "",
@@ -39,26 +59,48 @@ async def get_list_of_personal_tasks(
 )
 async def create_personal_task(
     task_data: tasks_schema.PersonalTaskCreate,
-    user: UserModel = Depends(get_current_user),
+    user: UserPrincipalDto = Depends(get_current_user),
     tasks_svc: tasks_service.PersonalTaskService = Depends(get_personal_tasks_service),
 ):
     return await tasks_svc.create(user_id=user.id, data=task_data)
 
 
-@router.get("/{task_id}", response_model=tasks_schema.PersonalTaskRead)
+@router.get(
+    "/{task_id}",
+    response_model=tasks_schema.PersonalTaskRead,
+    dependencies=[Depends(check_personal_task_not_modified)],
+)
 async def get_personal_task(
+    response: Response,
     task: model.PersonalTask = Depends(get_current_personal_task),
 ):
+    response.headers["ETag"] = personal_task_etag(task.id, task.updated_at)
     return task
 
 
 @router.patch("/{task_id}", response_model=tasks_schema.PersonalTaskRead)
 async def patch_personal_task(
+    request: Request,
+    response: Response,
     update_data: tasks_schema.PersonalTaskPatch,
     task: model.PersonalTask = Depends(get_current_personal_task),
     tasks_svc: tasks_service.PersonalTaskService = Depends(get_personal_tasks_service),
 ):
-    return await tasks_svc.update(task=task, data=update_data)
+    # If-Match: the task is written only if it is still the version of the client
+    conditional = check_precondition(
+        request, personal_task_etag(task.id, task.updated_at)
+    )
+
+    updated_task = await tasks_svc.update(
+        task=task,
+        data=update_data,
+        expected_updated_at=task.updated_at if conditional else None,
+    )
+    response.headers["ETag"] = personal_task_etag(
+        updated_task.id, updated_task.updated_at
+    )
+
+    return updated_task
 
 
 @router.delete("/{task_id}")
@@ -69,3 +111,53 @@ async def delete_personal_task(
     await tasks_svc.delete(task=task)
 
     return Response(status_code=status.HTTP_204_NO_CONTENT)
+
+
+@export_router.get("", response_class=StreamingResponse)
+async def export_personal_tasks(
+    # Query params
+    filters: tasks_schema.PersonalTaskFilterParams = Depends(),
+    sorting: tasks_schema.PersonalTaskSortingParams = Depends(),
+    params: common_schemas.ExportParams = Depends(),
+    # Other
+    user: UserPrincipalDto = Depends(get_current_user),
+    tasks_svc: tasks_service.PersonalTaskService = Depends(get_personal_tasks_service),
+):
+    return StreamingResponse(
+        tasks_svc.export(
+            user_id=user.id,
+            filters=filters,
+            sorting=sorting,
+            export_format=params.format,
+        ),
+        media_type=MEDIA_TYPES[params.format],
+        headers={
+            "Content-Disposition": f'attachment; filename="tasks.{params.format}"'
+        },
+    )
+
+
+@import_router.post(
+    "",
+    response_model=tasks_schema.PersonalTaskImportResult,
+    openapi_extra={
+        "requestBody": {
+            "content": {
+                "application/x-ndjson": {"schema": {"type": "string"}},
+                "text/csv": {"schema": {"type": "string"}},
+            }
+        }
+    },
+)
+async def import_personal_tasks(
+    # Streamed body, not parsed by FastAPI
+    request: Request,
+    # Query params
+    params: common_schemas.ImportParams = Depends(),
+    # Other
+    user: UserPrincipalDto = Depends(get_current_user),
+    tasks_svc: tasks_service.PersonalTaskService = Depends(get_personal_tasks_service),
+):
+    return await tasks_svc.import_tasks(
+        user_id=user.id, chunks=request.stream(), import_format=params.format
+    )
@@ -1,9 +1,12 @@
 from fastapi import APIRouter, Depends, Response, status
 
+from api.cache import CachedView
+from api.responses import PydanticJSONRoute
 from api.v1.deps.permissions import (
     require_project_permission,
 )
 from api.v1.deps.project_members import get_current_project_member
+from api.v1.deps.projects import lookup_project_members_response
 from api.v1.deps.services import get_project_member_service
 from modules.project_members import (
     service,
@@ -13,7 +16,7 @@ from modules.project_members import (
 from common import schemas as common_schemas
 from enums.project import ProjectPermission
 
-router = APIRouter()
+router = APIRouter(route_class=PydanticJSONRoute)
 
 
 @router.get(
@@ -21,24 +24,35 @@ router = APIRouter()
     response_model=common_schemas.BasePaginationResponse[
         member_schemas.ProjectMemberRead
     ],
-    dependencies=[Depends(require_project_permission(ProjectPermission.VIEW_MEMBERS))],
+    dependencies=[
+        Depends(require_project_permission(ProjectPermission.VIEW_MEMBERS)),
+    ],
 )
 async def get_all_project_members(
     # Other
     project_id: int,
+    cached: CachedView = Depends(lookup_project_members_response),
     members_svc: service.ProjectMemberService = Depends(get_project_member_service),
     # Query params
     filters: member_schemas.ProjectMemberFilterParams = Depends(),
     sorting: member_schemas.ProjectMemberSortingParams = Depends(),
     pagination: common_schemas.BasePaginationParams = Depends(),
 ):
-    return await members_svc.get_all(
+    if cached.hit:
+        return cached.response()
+
+    members = await members_svc.get_all(
         project_id=project_id,
         filters=filters,
         sorting=sorting,
         pagination=pagination,
     )
 
+    return await cached.store(
+        members,
+        common_schemas.BasePaginationResponse[member_schemas.ProjectMemberRead],
+    )
+
 
 @router.post(
     "",
@@ -1,43 +1,81 @@
-from fastapi import APIRouter, Depends, Response, status
+from fastapi import APIRouter, Depends, Request, Response, status
+from fastapi.responses import StreamingResponse
 
+from api.cache import CachedView
+from api.conditional import check_precondition
+from api.responses import PydanticJSONRoute
 from api.v1.deps.services import get_project_tasks_service
 from api.v1.deps.permissions import (
     require_project_permission,
     get_current_project_member,
 )
 from api.v1.deps.project_tasks import (
+    check_project_task_not_modified,
     get_current_project_task,
     get_current_project_open_task,
+    loaded_task_etag,
 )
+from api.v1.deps.projects import lookup_project_tasks_response
 from modules.project_tasks import schemas
 from modules.project_tasks.service import ProjectTaskService
 from modules.project_tasks.model import ProjectTask as ProjectTaskModel
 from modules.project_members.model import ProjectMember as ProjectMemberModel
-from common.schemas import BasePaginationResponse, BasePaginationParams
+from common.schemas import (
+    BasePaginationResponse,
+    CursorPaginationParams,
+    ExportParams,
+)
 from enums.project import ProjectPermission
+from utils.export import MEDIA_TYPES
+
+router = APIRouter(route_class=PydanticJSONRoute)
 
-router = APIRouter()
+# Mounted at '/tasks:batch' and '/tasks:export',
+# paths that can't be declared on the tasks router
+batch_router = APIRouter(route_class=PydanticJSONRoute)
+export_router = APIRouter()
 
 
 @router.get(
     "",
     response_model=BasePaginationResponse[schemas.ProjectTaskRead],
-    dependencies=[Depends(require_project_permission(ProjectPermission.VIEW_TASKS))],
+    dependencies=[
+        Depends(require_project_permission(ProjectPermission.VIEW_TASKS)),
+    ],
 )
 async def get_all_project_tasks(
     # Other
     project_id: int,
+    cached: CachedView = Depends(lookup_project_tasks_response),
     service: ProjectTaskService = Depends(get_project_tasks_service),
     # Query params
     filters: schemas.ProjectTasksFiltersParams = Depends(),
     sorting: schemas.ProjectTasksSortingParams = Depends(),
-    pagination: BasePaginationParams = Depends(),
+    pagination: CursorPaginationParams = Depends(),
 ):
-    return await service.get_all(
-        project_id=project_id,
-        filters=filters,
-        sorting=sorting,
-        pagination=pagination,
+    if cached.hit:
+        return cached.response()
+
+    if pagination.is_cursor_mode:
+        content = await service.get_all_by_cursor(
+            project_id=project_id,
+            filters=filters,
+            sorting=sorting,
+            pagination=pagination,
+        )
+    else:
+        content = await service.get_all(
+            project_id=project_id,
+            filters=filters,
+            sorting=sorting,
+            pagination=pagination,
+        )
+
+    return await cached.store(
+        content,
+        BasePaginationResponse[schemas.ProjectTaskRead],
+        # Tasks become overdue without a write invalidating the list
+        cache=filters.overdue is None,
     )
 
 
@@ -60,9 +98,16 @@ async def create_project_task(
 @router.get(
     "/{task_id}",
     response_model=schemas.ProjectTaskRead,
-    dependencies=[Depends(require_project_permission(ProjectPermission.VIEW_TASKS))],
+    dependencies=[
+        Depends(require_project_permission(ProjectPermission.VIEW_TASKS)),
+        Depends(check_project_task_not_modified),
+    ],
 )
-async def get_project_task(task: ProjectTaskModel = Depends(get_current_project_task)):
+async def get_project_task(
+    response: Response,
+    task: ProjectTaskModel = Depends(get_current_project_task),
+):
+    response.headers["ETag"] = loaded_task_etag(task)
     return task
 
 
@@ -71,18 +116,27 @@ async def get_project_task(task: ProjectTaskModel = Depends(get_current_project_
     response_model=schemas.ProjectTaskRead,
 )
 async def update_project_task(
+    request: Request,
+    response: Response,
     project_id: int,
     update_data: schemas.ProjectTaskPatch,
     task: ProjectTaskModel = Depends(get_current_project_task),
     actor: ProjectMemberModel = Depends(get_current_project_member),
     service: ProjectTaskService = Depends(get_project_tasks_service),
 ):
-    return await service.update(
+    # If-Match: the task is written only if it is still the version of the client
+    conditional = check_precondition(request, loaded_task_etag(task))
+
+    updated_task = await service.update(
         project_id=project_id,
         task=task,
         actor=actor,
         update_data=update_data,
+        expected_updated_at=task.updated_at if conditional else None,
     )
+    response.headers["ETag"] = loaded_task_etag(updated_task)
+
+    return updated_task
 
 
 @router.delete(
@@ -117,3 +171,72 @@ async def unassign_project_task(
     service: ProjectTaskService = Depends(get_project_tasks_service),
 ):
     return await service.unassign(task=task, actor=actor)
+
+
+@batch_router.post("", response_model=schemas.ProjectTaskBatchResponse)
+async def create_project_tasks_batch(
+    project_id: int,
+    batch_data: schemas.ProjectTaskBatchCreate,
+    actor: ProjectMemberModel = Depends(
+        require_project_permission(ProjectPermission.ADD_TASKS)
+    ),
+    service: ProjectTaskService = Depends(get_project_tasks_service),
+):
+    return await service.create_batch(
+        project_id=project_id, actor=actor, batch_data=batch_data
+    )
+
+
+@batch_router.patch("", response_model=schemas.ProjectTaskBatchResponse)
+async def update_project_tasks_batch(
+    project_id: int,
+    batch_data: schemas.ProjectTaskBatchPatch,
+    actor: ProjectMemberModel = Depends(get_current_project_member),
+    service: ProjectTaskService = Depends(get_project_tasks_service),
+):
+    return await service.update_batch(
+        project_id=project_id, actor=actor, batch_data=batch_data
+    )
+
+
+@batch_router.delete(
+    "",
+    response_model=schemas.ProjectTaskBatchResponse,
+    dependencies=[Depends(require_project_permission(ProjectPermission.REMOVE_TASKS))],
+)
+async def remove_project_tasks_batch(
+    project_id: int,
+    batch_data: schemas.ProjectTaskBatchDelete,
+    service: ProjectTaskService = Depends(get_project_tasks_service),
+):
+    return await service.delete_batch(project_id=project_id, batch_data=batch_data)
+
+
+@export_router.get(
+    "",
+    response_class=StreamingResponse,
+    dependencies=[Depends(require_project_permission(ProjectPermission.VIEW_TASKS))],
+)
+async def export_project_tasks(
+    # Other
+    project_id: int,
+    service: ProjectTaskService = Depends(get_project_tasks_service),
+    # Query params
+    filters: schemas.ProjectTasksFiltersParams = Depends(),
+    sorting: schemas.ProjectTasksSortingParams = Depends(),
+    params: ExportParams = Depends(),
+):
+    return StreamingResponse(
+        service.export(
+            project_id=project_id,
+            filters=filters,
+            sorting=sorting,
+            export_format=params.format,
+        ),
+        media_type=MEDIA_TYPES[params.format],
+        headers={
+            "Content-Disposition": (
+                f'attachment; filename="project_{project_id}_tasks.{params.format}"'
+            )
+        },
+    )
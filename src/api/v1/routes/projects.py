@@ -1,14 +1,28 @@
-from fastapi import APIRouter, Depends, Response, status
+from datetime import datetime
+from fastapi import APIRouter, Depends, Request, Response, status
 
+from api.cache import CachedView
+from api.conditional import tagged_json
+from api.responses import PydanticJSONRoute
 from api.v1.deps.auth import get_current_user
 from api.v1.deps.permissions import require_project_permission
-from api.v1.deps.services import get_projects_service
+from api.v1.deps.projects import (
+    check_project_not_modified,
+    check_project_precondition,
+    lookup_project_response,
+    loaded_project_etag,
+)
+from api.v1.deps.services import get_projects_service, get_project_task_stats_service
 from modules.projects import schemas as project_schemas, service
-from modules.users import model as user_model
+from modules.project_task_stats import (
+    schemas as stats_schemas,
+    service as stats_service,
+)
+from modules.users.dto import UserPrincipalDto
 from common import schemas as common_schemas
 from enums.project import ProjectPermission
 
-router = APIRouter()
+router = APIRouter(route_class=PydanticJSONRoute)
 
 
 @router.get(
@@ -16,28 +30,35 @@ router = APIRouter()
     response_model=common_schemas.BasePaginationResponse[project_schemas.ProjectRead],
 )
 async def get_user_projects(
+    request: Request,
     # Query params
     filters: project_schemas.ProjectFilterParams = Depends(),
     sorting: project_schemas.ProjectSortingParams = Depends(),
     pagination: common_schemas.BasePaginationParams = Depends(),
     # Other
-    user: user_model.User = Depends(get_current_user),
+    user: UserPrincipalDto = Depends(get_current_user),
     project_svc: service.ProjectService = Depends(get_projects_service),
 ):
-    return await project_svc.get_all(
+    projects = await project_svc.get_all(
         user_id=user.id,
         filters=filters,
         sorting=sorting,
         pagination=pagination,
     )
 
+    return tagged_json(
+        request,
+        projects,
+        common_schemas.BasePaginationResponse[project_schemas.ProjectRead],
+    )
+
 
 @router.post(
     "", response_model=project_schemas.ProjectRead, status_code=status.HTTP_201_CREATED
 )
 async def create_project(
     project_data: project_schemas.ProjectCreate,
-    user: user_model.User = Depends(get_current_user),
+    user: UserPrincipalDto = Depends(get_current_user),
     project_svc: service.ProjectService = Depends(get_projects_service),
 ):
     return await project_svc.create(user_id=user.id, project_data=project_data)
@@ -46,13 +67,40 @@ async def create_project(
 @router.get(
     "/{project_id}",
     response_model=project_schemas.ProjectRead,
-    dependencies=[Depends(require_project_permission(ProjectPermission.VIEW_PROJECT))],
+    dependencies=[
+        Depends(require_project_permission(ProjectPermission.VIEW_PROJECT)),
+        Depends(check_project_not_modified),
+    ],
 )
 async def get_project(
     project_id: int,
+    cached: CachedView = Depends(lookup_project_response),
     project_svc: service.ProjectService = Depends(get_projects_service),
 ):
-    return await project_svc.get_one(project_id=project_id)
+    if cached.hit:
+        return cached.response()
+
+    project = await project_svc.get_one(project_id=project_id)
+
+    return await cached.store(
+        project,
+        project_schemas.ProjectRead,
+        etag=loaded_project_etag(project),
+    )
+
+
+@router.get(
+    "/{project_id}/stats",
+    response_model=stats_schemas.ProjectTaskStatsRead,
+    dependencies=[Depends(require_project_permission(ProjectPermission.VIEW_TASKS))],
+)
+async def get_project_task_stats(
+    project_id: int,
+    stats_svc: stats_service.ProjectTaskStatsService = Depends(
+        get_project_task_stats_service
+    ),
+):
+    return await stats_svc.get_one(project_id=project_id)
 
 
 @router.patch(
@@ -63,14 +111,20 @@ async def get_project(
     ],
 )
 async def update_project(
+    response: Response,
     project_id: int,
     update_data: project_schemas.ProjectPatch,
+    expected_updated_at: datetime | None = Depends(check_project_precondition),
     project_svc: service.ProjectService = Depends(get_projects_service),
 ):
-    return await project_svc.update(
+    updated_project = await project_svc.update(
         project_id=project_id,
         update_data=update_data,
+        expected_updated_at=expected_updated_at,
     )
+    response.headers["ETag"] = loaded_project_etag(updated_project)
+
+    return updated_project
 
 
 @router.delete(
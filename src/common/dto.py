@@ -1,11 +1,26 @@
 from dataclasses import dataclass
-from typing import Literal
+from typing import Literal, Any
 
 
 @dataclass
 class PaginationDto:
     size: int
     offset: int
+    include_total: Literal["exact", "estimated", "none"] = "exact"
+
+
+@dataclass
+class CursorDto:
+    """Position of the last seen row: its sort key value and id"""
+
+    value: Any
+    id: int
+
+
+@dataclass
+class CursorPaginationDto:
+    size: int
+    cursor: CursorDto | None = None
 
 
 @dataclass
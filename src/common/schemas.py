@@ -1,28 +1,77 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, model_validator
 from typing import Generic, TypeVar, Literal, Any, Sequence
 
+from utils.export import ExportFormat
+
 
 class BasePaginationParams(BaseModel):
     """Base query parameters for pagination"""
 
     page: int = Field(1, ge=1, description="Page number")
     size: int = Field(20, ge=1, le=100, description="Number of elements on page")
+    include_total: Literal["exact", "estimated", "none"] = Field(
+        "exact",
+        description="How to compute 'total': exact count, planner estimate or skip",
+    )
 
     @property
     def offset(self) -> int:
         return (self.page - 1) * self.size
 
 
+class CursorPaginationParams(BasePaginationParams):
+    """Query parameters for pagination with an opt-in keyset (cursor) mode"""
+
+    mode: Literal["offset", "cursor"] = Field(
+        "offset", description="Pagination mode. 'cursor' skips the total count"
+    )
+    cursor: str | None = Field(
+        None,
+        min_length=1,
+        description="Opaque cursor from 'next_cursor' of the previous page",
+    )
+
+    @property
+    def is_cursor_mode(self) -> bool:
+        return self.mode == "cursor" or self.cursor is not None
+
+
+class ExportParams(BaseModel):
+    """Query parameters of export endpoints"""
+
+    format: ExportFormat = Field(
+        "ndjson", description="'ndjson' (a JSON object per line) or 'csv'"
+    )
+
+
+class ImportParams(BaseModel):
+    """Query parameters of import endpoints"""
+
+    format: ExportFormat = Field(
+        "ndjson", description="Format of the request body, 'ndjson' or 'csv'"
+    )
+
+
 class BasePaginationMeta(BaseModel):
     """Base pagination metadata in response"""
 
-    total: int = Field(description="Total number of elements")
+    total: int | None = Field(
+        description="Total number of elements (null if not computed)"
+    )
+    include_total: Literal["exact", "estimated", "none"] = Field(
+        "exact", description="How 'total' was computed"
+    )
     page: int = Field(description="Current page number (1-based)")
     size: int = Field(description="Elements per page")
+    next_cursor: str | None = Field(
+        None, description="Cursor of the next page (cursor mode only)"
+    )
 
     @property
-    def pages(self) -> int:
+    def pages(self) -> int | None:
         """Number of pages"""
+        if self.total is None:
+            return None
         if self.total == 0:
             return 1
         return (self.total + self.size - 1) // self.size
@@ -30,6 +79,8 @@ class BasePaginationMeta(BaseModel):
     @property
     def has_next(self) -> bool:
         """Is there a next page"""
+        if self.total is None:
+            return self.next_cursor is not None
         return self.page < self.pages
 
     @property
@@ -52,4 +103,13 @@ class BaseSortingParams(BaseModel):
     """Base query parameters for sorting"""
 
     sort_by: Any
-    order: Literal["asc", "desc"] = Field("asc", description="Sort order")
+    order: Literal["asc", "desc"] | None = Field(
+        None, description="Sort order, asc by default and desc for 'relevance'"
+    )
+
+    @model_validator(mode="after")
+    def default_order(self):
+        # Most relevant rows first unless another order is asked for
+        if self.order is None:
+            self.order = "desc" if self.sort_by == "relevance" else "asc"
+        return self
@@ -1,3 +1,5 @@
+from typing import Literal
+
 from pydantic import BaseModel
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -6,6 +8,18 @@ class RunConfig(BaseModel):
     host: str = "0.0.0.0"
     port: int = 8000
     reload: bool = True
+    # OpenAPI schema written by 'python -m api.openapi' on build, read on the
+    # first docs request instead of being built from the routes by every worker
+    openapi_cache: str | None = None
+
+    # Production server ('src/server.py'), pre-forked workers
+    workers: int | None = None  # none is one per CPU
+    # Connections to a database all workers may open together, pool_size and
+    # max_overflow of every worker are lowered to stay under it
+    db_connections: int | None = None
+    # Seconds a worker waits for open requests on SIGTERM before it is killed
+    graceful_timeout: float = 30
+    backlog: int = 2048
 
 
 class PrefixConfig(BaseModel):
@@ -14,24 +28,126 @@ class PrefixConfig(BaseModel):
     auth: str = "/auth"
     users: str = "/users"
     personal_tasks: str = "/personal_tasks"
+    personal_tasks_export: str = "/personal_tasks:export"
+    personal_tasks_import: str = "/personal_tasks:import"
     projects: str = "/projects"
     project_members: str = "/projects/{project_id}/members"
     project_tasks: str = "/projects/{project_id}/tasks"
+    project_tasks_batch: str = "/projects/{project_id}/tasks:batch"
+    project_tasks_export: str = "/projects/{project_id}/tasks:export"
 
 
 class DatabaseConfig(BaseModel):
     url: str
     test_db_url: str
-    echo: bool = True
-    echo_pool: bool = True
+    echo: bool = False
+    echo_pool: bool = False
     connect_args: dict = {"server_settings": {"timezone": "UTC"}}
 
+    # Connection pool
+    pool_size: int = 5
+    max_overflow: int = 10
+    pool_timeout: float = 30  # seconds to wait for a free connection
+    pool_recycle: int = 60 * 30  # seconds, -1 keeps connections forever
+    pool_pre_ping: bool = True
+    # Connections opened on startup, at most pool_size
+    pool_warmup: int = 0
+
+    # asyncpg prepared statements; 0 disables the cache (e.g. behind pgbouncer)
+    statement_cache_size: int = 100
+    max_cached_statement_lifetime: int = 300  # seconds
+    max_cacheable_statement_size: int = 1024 * 15  # bytes
+
+    # Streaming replica for GET requests, none routes everything to the primary.
+    # Reads of a client stay on the primary until the replica has replayed
+    # the client's last write.
+    replica_url: str | None = None
+
 
 class AuthJWTConfig(BaseModel):
     secret_key: str
     algorithm: str = "HS256"
     access_token_expire: int = 60 * 15  # seconds * minutes
     refresh_token_expire: int = 60 * 60 * 24 * 14  # seconds * minutes * hours * days
+    # Build the current user from access token claims, without a database lookup.
+    # Deleted or renamed users keep their old identity until the token expires
+    trust_token_claims: bool = False
+
+
+class PasswordHashingConfig(BaseModel):
+    # bcrypt cost factor; hashes with another cost are upgraded on login
+    rounds: int = 12
+    # Pool that runs bcrypt off the event loop
+    executor: Literal["thread", "process"] = "thread"
+    max_workers: int = 4
+    # Calls submitted to the pool at once, the rest wait in queue
+    max_concurrency: int = 4
+
+
+class CacheConfig(BaseModel):
+    # In-process caches; ttl in seconds, ttl <= 0 disables a cache
+    count_ttl: float = 5
+    count_maxsize: int = 4096
+    principal_ttl: float = 60
+    principal_maxsize: int = 10000
+    membership_ttl: float = 30
+    membership_maxsize: int = 10000
+    # Rendered project, project task and member responses
+    response_ttl: float = 30
+    response_maxsize: int = 2048
+    # Invalidations reach the principal, membership and response caches of the
+    # other workers over postgres LISTEN/NOTIFY, on a connection per worker.
+    # Without it 'src/server.py' runs several workers only with them disabled.
+    shared_invalidation: bool = True
+
+
+class ProjectConfig(BaseModel):
+    # Members returned with a project, the full list is paginated by its endpoint
+    members_preview_size: int = 5
+    # Items accepted by one request of the project tasks batch endpoints
+    tasks_batch_max_size: int = 2000
+
+
+class ExportConfig(BaseModel):
+    # Rows fetched per round trip of the export cursor and encoded per chunk
+    yield_per: int = 1000
+
+
+class ImportConfig(BaseModel):
+    # Valid rows written per COPY, every chunk is committed on its own
+    chunk_size: int = 1000
+    # Longer rows are rejected without being buffered
+    max_row_size: int = 64 * 1024
+    # Row errors listed in the response, the rest are only counted
+    max_errors: int = 100
+
+
+class DebugConfig(BaseModel):
+    # Add 'X-SQL-Statements' response header with statements issued by the request
+    sql_statements_header: bool = False
+    # Add 'Server-Timing' response header: database, pool wait, handler and render
+    server_timing: bool = False
+
+
+class MetricsConfig(BaseModel):
+    # Prometheus text of this process at 'path', 404 when disabled
+    enabled: bool = False
+    path: str = "/metrics"
+    # Slowest statements kept with their parameter shapes, logged on shutdown
+    slow_statements: int = 0
+
+
+class ProfilingConfig(BaseModel):
+    # Sampling profiler of this process, started and stopped at 'path' with the
+    # 'X-Admin-Token' header; without a token the endpoint is 404
+    admin_token: str | None = None
+    path: str = "/admin/profiler"
+    # Signal toggling the profiler (e.g. 'SIGUSR2'), for a worker of choice
+    signal: str | None = None
+    interval: float = 0.005  # seconds between samples
+    max_duration: float = 300  # seconds, a forgotten profiler stops by itself
+    # Folded stacks '<start>-<pid>.folded' and their '.json' summary
+    output_dir: str = "profiles"
 
 
 class Settings(BaseSettings):
@@ -46,6 +162,14 @@ class Settings(BaseSettings):
     prefix: PrefixConfig = PrefixConfig()
     db: DatabaseConfig
     jwt: AuthJWTConfig
+    password: PasswordHashingConfig = PasswordHashingConfig()
+    cache: CacheConfig = CacheConfig()
+    project: ProjectConfig = ProjectConfig()
+    export: ExportConfig = ExportConfig()
+    importing: ImportConfig = ImportConfig()
+    debug: DebugConfig = DebugConfig()
+    metrics: MetricsConfig = MetricsConfig()
+    profiling: ProfilingConfig = ProfilingConfig()
 
 
 settings = Settings()
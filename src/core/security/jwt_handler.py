@@ -8,7 +8,7 @@ from enums.token import TokenType
 
 class JWTHandler:
     @staticmethod
-    def create(user_id: int, token_type: TokenType) -> str:
+    def create(user_id: int, token_type: TokenType, claims: dict | None = None) -> str:
         if token_type == TokenType.ACCESS:
             expire_seconds = settings.jwt.access_token_expire
         elif token_type == TokenType.REFRESH:
@@ -19,7 +19,9 @@ class JWTHandler:
         now = datetime.now(timezone.utc)
         expire = now + timedelta(seconds=expire_seconds)
 
+        # Registered claims can't be overridden by extra ones
         payload = {
+            **(claims or {}),
             "type": token_type.value,
             "sub": str(user_id),
             "iat": now.timestamp(),
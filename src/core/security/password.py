@@ -1,15 +1,138 @@
+import asyncio
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Callable, Literal, TypeVar
+
 import bcrypt
 
+from core.config import settings
+
+T = TypeVar("T")
+
+# Names of the threads of the thread pool, e.g. 'bcrypt_0'
+THREAD_NAME_PREFIX = "bcrypt"
+
+
+def _hash(password: str, rounds: int) -> str:
+    hashed_bytes = bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt(rounds))
+    return hashed_bytes.decode("utf-8")
+
+
+def _verify(password: str, hashed: str) -> bool:
+    try:
+        return bcrypt.checkpw(password.encode("utf-8"), hashed.encode("utf-8"))
+    except ValueError:
+        return False
+
+
+class HashingPool:
+    """
+    Runs bcrypt calls in a thread or process pool, off the event loop.
+    At most 'max_concurrency' calls are submitted at once, the rest wait in queue.
+    """
+
+    def __init__(
+        self,
+        executor: Literal["thread", "process"],
+        max_workers: int,
+        max_concurrency: int,
+    ):
+        self.executor_type = executor
+        self.max_workers = max_workers
+        self.max_concurrency = max_concurrency
+
+        self.in_flight = 0
+        self.queued = 0
+        self.completed = 0
+
+        self._executor: Executor | None = None
+        self._semaphore: asyncio.Semaphore | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    @property
+    def executor(self) -> Executor:
+        if self._executor is None:
+            if self.executor_type == "process":
+                self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+            else:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix=THREAD_NAME_PREFIX
+                )
+        return self._executor
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        # Semaphore is bound to the loop it first waits in
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._loop is not loop:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._loop = loop
+        return self._semaphore
+
+    async def run(self, fn: Callable[..., T], *args) -> T:
+        semaphore = self._get_semaphore()
+
+        self.queued += 1
+        try:
+            await semaphore.acquire()
+        finally:
+            self.queued -= 1
+
+        self.in_flight += 1
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self.executor, fn, *args)
+        finally:
+            self.in_flight -= 1
+            self.completed += 1
+            semaphore.release()
+
+    def stats(self) -> dict[str, int | str]:
+        return {
+            "executor": self.executor_type,
+            "max_workers": self.max_workers,
+            "max_concurrency": self.max_concurrency,
+            "in_flight": self.in_flight,
+            "queued": self.queued,
+            "completed": self.completed,
+        }
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+hashing_pool = HashingPool(
+    executor=settings.password.executor,
+    max_workers=settings.password.max_workers,
+    max_concurrency=settings.password.max_concurrency,
+)
+
 
 class PasswordHasher:
     @staticmethod
     def hash(password: str) -> str:
-        hashed_bytes = bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt())
-        return hashed_bytes.decode("utf-8")
+        return _hash(password, settings.password.rounds)
 
     @staticmethod
     def verify(password: str, hashed: str) -> bool:
-        try:
-            return bcrypt.checkpw(password.encode("utf-8"), hashed.encode("utf-8"))
-        except ValueError:
+        return _verify(password, hashed)
+
+    @staticmethod
+    async def ahash(password: str) -> str:
+        """Non-blocking 'hash', runs in the hashing pool."""
+        return await hashing_pool.run(_hash, password, settings.password.rounds)
+
+    @staticmethod
+    async def averify(password: str, hashed: str) -> bool:
+        """Non-blocking 'verify', runs in the hashing pool."""
+        return await hashing_pool.run(_verify, password, hashed)
+
+    @staticmethod
+    def needs_rehash(hashed: str) -> bool:
+        """True if the hash was made with another cost factor than configured."""
+        # $2b$12$<salt and hash>
+        parts = hashed.split("$")
+        if len(parts) != 4 or not parts[2].isdigit():
             return False
+
+        return int(parts[2]) != settings.password.rounds
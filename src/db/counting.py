@@ -0,0 +1,101 @@
+from dataclasses import asdict
+from typing import Any, Hashable, Literal
+
+from sqlalchemy import Select, select, func
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.expression import ClauseElement, Executable
+
+from utils.cache import TTLCache
+
+TotalMode = Literal["exact", "estimated", "none"]
+
+
+class Explain(Executable, ClauseElement):
+    """EXPLAIN (FORMAT JSON) of a statement, executed with its bound params."""
+
+    inherit_cache = False
+
+    def __init__(self, stmt: Select):
+        self.stmt = stmt
+
+
+@compiles(Explain, "postgresql")
+def _compile_explain(element: Explain, compiler, **kw) -> str:
+    return "EXPLAIN (FORMAT JSON) " + compiler.process(element.stmt, **kw)
+
+
+class CountCache:
+    """
+    Short-TTL cache of exact totals keyed by (scope id, normalized filters).
+    Scope is the owner of the list: user id for personal tasks/projects,
+    project id for project tasks/members.
+    Repositories invalidate the scope on writes.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self._cache: TTLCache[tuple, int] = TTLCache(maxsize=maxsize, ttl=ttl)
+
+    @staticmethod
+    def _key(scope_id: int, filters: Any) -> tuple[int, Hashable]:
+        normalized = tuple(
+            sorted((k, v) for k, v in asdict(filters).items() if v is not None)
+        )
+        return scope_id, normalized
+
+    def get(self, scope_id: int, filters: Any) -> int | None:
+        return self._cache.get(self._key(scope_id, filters))
+
+    def set(self, scope_id: int, filters: Any, total: int) -> None:
+        self._cache.set(self._key(scope_id, filters), total)
+
+    def invalidate(self, scope_id: int) -> None:
+        self._cache.invalidate_where(lambda key, _: key[0] == scope_id)
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+    def stats(self) -> dict[str, int]:
+        return self._cache.stats()
+
+
+async def estimate_count(db: AsyncSession, stmt: Select) -> int:
+    """Planner row estimate of the statement (no rows are read)."""
+    result = await db.execute(Explain(stmt))
+    plan = result.scalar_one()
+
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+async def count_total(
+    db: AsyncSession,
+    stmt: Select,
+    mode: TotalMode,
+    cache: CountCache | None = None,
+    scope_id: int | None = None,
+    filters: Any = None,
+) -> int | None:
+    """
+    Total number of rows of the filtered (unsorted, unpaginated) statement:
+    - exact: COUNT query, served from the cache when possible
+    - estimated: planner estimate from EXPLAIN
+    - none: skip counting
+    """
+    if mode == "none":
+        return None
+
+    if mode == "estimated":
+        return await estimate_count(db, stmt)
+
+    if cache is not None:
+        cached = cache.get(scope_id, filters)
+        if cached is not None:
+            return cached
+
+    count_stmt = select(func.count()).select_from(stmt.subquery())
+    total = await db.scalar(count_stmt) or 0
+
+    if cache is not None:
+        cache.set(scope_id, filters, total)
+
+    return total
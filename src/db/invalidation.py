@@ -0,0 +1,212 @@
+"""
+Cache invalidations shared by the workers of the server.
+
+A write drops the keys it changes from the caches of its own worker right
+away. The keys are also sent on a postgres channel (NOTIFY) before the
+response of the request starts, and the other workers listening on the
+channel drop them from their caches too.
+"""
+
+import asyncio
+import inspect
+import logging
+import secrets
+from contextlib import suppress
+from typing import Awaitable, Callable
+
+import asyncpg
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from db.unit_of_work import UnitOfWork, current_unit_of_work
+
+logger = logging.getLogger(__name__)
+
+CHANNEL = "cache_invalidation"
+
+# Drops a key from the local caches of its kind
+Handler = Callable[[str], Awaitable[None] | None]
+
+_CONNECTION_ERRORS = (
+    OSError,
+    TimeoutError,
+    asyncpg.PostgresError,
+    asyncpg.InterfaceError,
+)
+
+
+class InvalidationBus:
+    """
+    Kinds of cached data (e.g. 'principal') with the handler dropping a key of
+    the kind locally. 'publish' sends a key to the other workers, their
+    listener runs the handler. Not started, nothing is sent (one process).
+
+    Notifications sent while the listener is disconnected are lost, so the
+    local caches are cleared when the connection is lost and again when it
+    is back.
+    """
+
+    def __init__(
+        self,
+        channel: str = CHANNEL,
+        reconnect_delay: float = 1.0,
+        ping_interval: float = 10.0,
+    ):
+        self.channel = channel
+        self.reconnect_delay = reconnect_delay
+        # Seconds between checks of an idle listener connection
+        self.ping_interval = ping_interval
+        self._handlers: dict[str, Handler] = {}
+        self._clears: list[Callable[[], None]] = []
+        self._engine: AsyncEngine | None = None
+        self._connect_args: dict = {}
+        # Sender of this process, notifications of its own are skipped
+        self._sender: str | None = None
+        self._listener: asyncio.Task | None = None
+        self._tasks: set[asyncio.Task] = set()
+
+    @property
+    def listening(self) -> bool:
+        return self._listener is not None
+
+    def subscribe(self, kind: str, handler: Handler, clear: Callable[[], None]) -> None:
+        """'clear' empties the caches of the kind when notifications were missed"""
+        self._handlers[kind] = handler
+        self._clears.append(clear)
+
+    def publish(self, kind: str, key: str) -> None:
+        """
+        Send 'key' to the other workers, with the invalidations of the current
+        request before its response starts (right away outside of a request).
+        The caller drops it from the caches of its own worker.
+        """
+        if not self.listening or kind not in self._handlers:
+            return
+
+        message = f"{self._sender} {kind} {key}"
+        uow = current_unit_of_work()
+        if uow is not None:
+            uow.invalidations.append(message)
+            return
+
+        self._spawn(self._notify([message]))
+
+    async def flush(self, uow: UnitOfWork) -> None:
+        """Send the invalidations of the request published so far"""
+        messages, uow.invalidations = uow.invalidations, []
+        if messages and self.listening:
+            await self._notify(messages)
+
+    async def start(self, engine: AsyncEngine, connect_args: dict) -> None:
+        """Listen on a connection of its own, until 'stop'"""
+        self._engine = engine
+        self._connect_args = connect_args
+        self._sender = secrets.token_hex(8)
+
+        conn = await self._connect()
+        self._listener = asyncio.create_task(self._listen(conn))
+
+    async def stop(self) -> None:
+        if self._listener is None:
+            return
+
+        self._listener.cancel()
+        with suppress(asyncio.CancelledError):
+            await self._listener
+        self._listener = None
+
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    async def _notify(self, messages: list[str]) -> None:
+        stmt = text(
+            "SELECT pg_notify(:channel, message)"
+            " FROM unnest(CAST(:messages AS text[])) AS message"
+        )
+
+        async with self._engine.connect() as conn:
+            await conn.execute(
+                stmt,
+                {"channel": self.channel, "messages": list(dict.fromkeys(messages))},
+            )
+            await conn.commit()
+
+    async def _connect(self) -> asyncpg.Connection:
+        url = self._engine.url.set(drivername="postgresql")
+        conn = await asyncpg.connect(
+            url.render_as_string(hide_password=False), **self._connect_args
+        )
+        await conn.add_listener(self.channel, self._receive)
+
+        return conn
+
+    async def _listen(self, conn: asyncpg.Connection | None) -> None:
+        while True:
+            if conn is None:
+                await asyncio.sleep(self.reconnect_delay)
+                try:
+                    conn = await self._connect()
+                except _CONNECTION_ERRORS as e:
+                    logger.warning("Cache invalidations can't reconnect: %s", e)
+                    continue
+
+                logger.info("Cache invalidations reconnected")
+                self._clear()
+
+            try:
+                await self._watch(conn)
+            except _CONNECTION_ERRORS as e:
+                logger.warning("Cache invalidations disconnected: %s", e)
+            finally:
+                conn.terminate()
+
+            conn = None
+            self._clear()
+
+    async def _watch(self, conn: asyncpg.Connection) -> None:
+        """Returns when the connection is lost"""
+        lost = asyncio.Event()
+        conn.add_termination_listener(lambda _: lost.set())
+
+        while not lost.is_set():
+            try:
+                await asyncio.wait_for(lost.wait(), self.ping_interval)
+            except TimeoutError:
+                await conn.execute("SELECT 1", timeout=self.ping_interval)
+
+        logger.warning("Cache invalidations disconnected")
+
+    def _receive(
+        self, conn: asyncpg.Connection, pid: int, channel: str, payload: str
+    ) -> None:
+        sender, kind, key = payload.split(" ", 2)
+        handler = self._handlers.get(kind)
+        # Dropped by the sender itself
+        if sender == self._sender or handler is None:
+            return
+
+        try:
+            result = handler(key)
+        except Exception:
+            logger.exception("Invalidation of %s %s failed", kind, key)
+            return
+
+        if inspect.isawaitable(result):
+            self._spawn(result)
+
+    def _clear(self) -> None:
+        for clear in self._clears:
+            clear()
+
+    def _spawn(self, coro: Awaitable[None]) -> None:
+        task = asyncio.ensure_future(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._done)
+
+    def _done(self, task: asyncio.Task) -> None:
+        self._tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.error("Cache invalidation failed", exc_info=task.exception())
+
+
+# Invalidations of the in-process caches, started with the app when enabled
+cache_invalidations = InvalidationBus()
@@ -26,6 +26,16 @@ from db.base import Base
 from core.config import settings
 
 target_metadata = Base.metadata
+
+# Created by migrations only where the server has the extension they need,
+# autogenerate must not drop them for missing in the models
+OPTIONAL_INDEXES = {"ix_users_username_trgm"}
+
+
+def include_object(object, name, type_, reflected, compare_to) -> bool:
+    return not (type_ == "index" and name in OPTIONAL_INDEXES)
+
+
 config.set_main_option("sqlalchemy.url", settings.db.url)
 
 # other values from the config, defined by the needs of env.py,
@@ -50,6 +60,7 @@ def run_migrations_offline() -> None:
     context.configure(
         url=url,
         target_metadata=target_metadata,
+        include_object=include_object,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
     )
@@ -59,7 +70,11 @@ def run_migrations_offline() -> None:
 
 
 def do_run_migrations(connection: Connection) -> None:
-    context.configure(connection=connection, target_metadata=target_metadata)
+    context.configure(
+        connection=connection,
+        target_metadata=target_metadata,
+        include_object=include_object,
+    )
 
     with context.begin_transaction():
         context.run_migrations()
@@ -0,0 +1,55 @@
+"""Add project tasks keyset indexes
+
+Revision ID: 5eb78edd5a7e
+Revises: acfd5181a915
+Create Date: 2026-10-17 06:09:25.856092
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "5eb78edd5a7e"
+down_revision: Union[str, Sequence[str], None] = "acfd5181a915"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "ix_project_tasks_project_assigned_at",
+        "project_tasks",
+        ["project_id", "assigned_at", "id"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_project_tasks_project_created_at",
+        "project_tasks",
+        ["project_id", "created_at", "id"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_project_tasks_project_updated_at",
+        "project_tasks",
+        ["project_id", "updated_at", "id"],
+        unique=False,
+    )
+    # ### end Alembic commands ###
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(
+        "ix_project_tasks_project_updated_at", table_name="project_tasks"
+    )
+    op.drop_index(
+        "ix_project_tasks_project_created_at", table_name="project_tasks"
+    )
+    op.drop_index(
+        "ix_project_tasks_project_assigned_at", table_name="project_tasks"
+    )
+    # ### end Alembic commands ###
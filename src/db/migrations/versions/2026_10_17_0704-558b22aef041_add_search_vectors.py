@@ -0,0 +1,60 @@
+"""Add search vectors
+
+Revision ID: 558b22aef041
+Revises: 5eb78edd5a7e
+Create Date: 2026-10-17 07:04:39.347142
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "558b22aef041"
+down_revision: Union[str, Sequence[str], None] = "5eb78edd5a7e"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+SEARCH_VECTOR_SQL = (
+    "setweight(to_tsvector('simple', coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('simple', coalesce(description, '')), 'B')"
+)
+TABLES = ("personal_tasks", "project_tasks", "projects")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Stored generated column: adding it rewrites each table once
+    for table in TABLES:
+        op.add_column(
+            table,
+            sa.Column(
+                "search_vector",
+                postgresql.TSVECTOR(),
+                sa.Computed(SEARCH_VECTOR_SQL, persisted=True),
+                nullable=False,
+            ),
+        )
+        op.create_index(
+            f"ix_{table}_search_vector",
+            table,
+            ["search_vector"],
+            unique=False,
+            postgresql_using="gin",
+        )
+    # ### end Alembic commands ###
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in reversed(TABLES):
+        op.drop_index(
+            f"ix_{table}_search_vector",
+            table_name=table,
+            postgresql_using="gin",
+        )
+        op.drop_column(table, "search_vector")
+    # ### end Alembic commands ###
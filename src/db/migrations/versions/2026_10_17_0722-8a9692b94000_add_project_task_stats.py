@@ -0,0 +1,71 @@
+"""Add project task stats
+
+Revision ID: 8a9692b94000
+Revises: 558b22aef041
+Create Date: 2026-10-17 07:22:33.312809
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "8a9692b94000"
+down_revision: Union[str, Sequence[str], None] = "558b22aef041"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "project_task_stats",
+        sa.Column("project_id", sa.Integer(), nullable=False),
+        sa.Column(
+            "status",
+            postgresql.ENUM(
+                "TODO",
+                "IN_PROGRESS",
+                "DONE",
+                "CANCELLED",
+                name="taskstatus",
+                create_type=False,
+            ),
+            nullable=False,
+        ),
+        sa.Column(
+            "priority",
+            postgresql.ENUM(
+                "LOW",
+                "MEDIUM",
+                "HIGH",
+                "CRITICAL",
+                name="taskpriority",
+                create_type=False,
+            ),
+            nullable=False,
+        ),
+        sa.Column("assigned", sa.Boolean(), nullable=False),
+        sa.Column("task_count", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(["project_id"], ["projects.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("project_id", "status", "priority", "assigned"),
+    )
+    # Count existing tasks
+    op.execute(
+        """
+        INSERT INTO project_task_stats (
+            project_id, status, priority, assigned, task_count
+        )
+        SELECT project_id, status, priority, assignee_id IS NOT NULL, count(*)
+        FROM project_tasks
+        GROUP BY project_id, status, priority, assignee_id IS NOT NULL
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("project_task_stats")
@@ -0,0 +1,51 @@
+"""Add users username trigram index
+
+Revision ID: 3f1c2d9e7a41
+Revises: 8a9692b94000
+Create Date: 2026-10-17 10:00:12.418305
+
+"""
+
+import logging
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "3f1c2d9e7a41"
+down_revision: Union[str, Sequence[str], None] = "8a9692b94000"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+logger = logging.getLogger("alembic.runtime.migration")
+
+INDEX = "ix_users_username_trgm"
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Searches match 'username ILIKE %term%' into creator and assignee ids,
+    # a trigram index serves it instead of a scan of users. pg_trgm is a
+    # contrib extension, a server without it keeps the scan.
+    available = op.get_bind().scalar(
+        sa.text("SELECT 1 FROM pg_available_extensions WHERE name = 'pg_trgm'")
+    )
+    if not available:
+        logger.warning("pg_trgm is not available, %s is not created", INDEX)
+        return
+
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.create_index(
+        INDEX,
+        "users",
+        ["username"],
+        unique=False,
+        postgresql_using="gin",
+        postgresql_ops={"username": "gin_trgm_ops"},
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute(f"DROP INDEX IF EXISTS {INDEX}")
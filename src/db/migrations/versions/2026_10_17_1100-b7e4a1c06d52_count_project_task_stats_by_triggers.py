@@ -0,0 +1,97 @@
+"""Count project task stats by triggers
+
+Revision ID: b7e4a1c06d52
+Revises: 3f1c2d9e7a41
+Create Date: 2026-10-17 11:00:12.514203
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b7e4a1c06d52"
+down_revision: Union[str, Sequence[str], None] = "3f1c2d9e7a41"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _count_changes(changes: str) -> str:
+    return f"""
+        INSERT INTO project_task_stats AS stats (
+            project_id, status, priority, assigned, task_count
+        )
+        SELECT project_id, status, priority, assigned, sum(delta)::int
+        FROM ({changes}) AS changes
+        WHERE project_id IN (SELECT id FROM projects)
+        GROUP BY project_id, status, priority, assigned
+        HAVING sum(delta) <> 0
+        ORDER BY project_id, status, priority, assigned
+        ON CONFLICT (project_id, status, priority, assigned)
+        DO UPDATE SET task_count = stats.task_count + excluded.task_count;"""
+
+
+_NEW_GROUPS = """
+            SELECT project_id, status, priority,
+                assignee_id IS NOT NULL AS assigned, 1 AS delta
+            FROM new_tasks"""
+_OLD_GROUPS = """
+            SELECT project_id, status, priority,
+                assignee_id IS NOT NULL AS assigned, -1 AS delta
+            FROM old_tasks"""
+
+TRIGGERS = {
+    "insert": "AFTER INSERT ON project_tasks REFERENCING NEW TABLE AS new_tasks",
+    "update": (
+        "AFTER UPDATE ON project_tasks "
+        "REFERENCING OLD TABLE AS old_tasks NEW TABLE AS new_tasks"
+    ),
+    "delete": "AFTER DELETE ON project_tasks REFERENCING OLD TABLE AS old_tasks",
+}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute(
+        f"""
+        CREATE OR REPLACE FUNCTION count_project_tasks() RETURNS trigger
+        LANGUAGE plpgsql AS $$
+        BEGIN
+            IF TG_OP = 'INSERT' THEN{_count_changes(_NEW_GROUPS)}
+            ELSIF TG_OP = 'DELETE' THEN{_count_changes(_OLD_GROUPS)}
+            ELSE{_count_changes(_NEW_GROUPS + " UNION ALL" + _OLD_GROUPS)}
+            END IF;
+
+            RETURN NULL;
+        END
+        $$
+        """
+    )
+
+    # Task writes wait until the stats are recounted, the counts kept by the
+    # application before may have drifted
+    op.execute("LOCK TABLE project_tasks IN SHARE ROW EXCLUSIVE MODE")
+    for name, event in TRIGGERS.items():
+        op.execute(
+            f"CREATE TRIGGER project_tasks_stats_{name} {event} "
+            "FOR EACH STATEMENT EXECUTE FUNCTION count_project_tasks()"
+        )
+    op.execute("DELETE FROM project_task_stats")
+    op.execute(
+        """
+        INSERT INTO project_task_stats (
+            project_id, status, priority, assigned, task_count
+        )
+        SELECT project_id, status, priority, assignee_id IS NOT NULL, count(*)
+        FROM project_tasks
+        GROUP BY project_id, status, priority, assignee_id IS NOT NULL
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for name in TRIGGERS:
+        op.execute(f"DROP TRIGGER project_tasks_stats_{name} ON project_tasks")
+    op.execute("DROP FUNCTION count_project_tasks()")
@@ -1,7 +1,9 @@
 from datetime import datetime
-from sqlalchemy import DateTime
+from sqlalchemy import Computed, DateTime
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.orm import Mapped, mapped_column
 
+from db.search import SEARCH_VECTOR_SQL
 from utils.datetime import utc_now
 
 
@@ -22,3 +24,13 @@ class JoinedAtMixin:
         DateTime(timezone=True),
         default=utc_now,
     )
+
+
+class SearchVectorMixin:
+    """Full-text search vector of 'title' and 'description', kept by postgres"""
+
+    search_vector: Mapped[str] = mapped_column(
+        TSVECTOR,
+        Computed(SEARCH_VECTOR_SQL, persisted=True),
+        deferred=True,
+    )
@@ -0,0 +1,82 @@
+from typing import Any, Callable, Sequence
+
+from sqlalchemy import Select, func, inspect, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm.interfaces import ORMOption
+
+from common.dto import PaginationDto
+from db.counting import CountCache, count_total
+
+
+async def fetch_page(
+    db: AsyncSession,
+    stmt: Select,
+    pagination: PaginationDto,
+    sort: Callable[[Select], Select],
+    options: Sequence[ORMOption] = (),
+    cache: CountCache | None = None,
+    scope_id: int | None = None,
+    filters: Any = None,
+) -> tuple[Sequence[Any], int | None]:
+    """
+    Page of the filtered single-entity statement with its total.
+    'sort' applies the ORDER BY, 'options' are loader options of the page rows.
+
+    An exact total is computed by count(*) OVER () in the same statement,
+    so a page costs one round-trip unless the total is already cached.
+    A separate COUNT is needed only when the offset is past the last row.
+    """
+    if pagination.include_total != "exact":
+        total = await count_total(db, stmt, pagination.include_total)
+        return await _fetch_items(db, stmt, pagination, sort, options), total
+
+    if cache is not None:
+        total = cache.get(scope_id, filters)
+        if total is not None:
+            return await _fetch_items(db, stmt, pagination, sort, options), total
+
+    # Window runs over narrow (id, total) rows of the whole filtered set,
+    # entity columns and joined relations are read only for the page rows
+    entity = stmt.column_descriptions[0]["entity"]
+    pk = inspect(entity).primary_key[0]
+
+    page = (
+        sort(stmt.with_only_columns(pk, func.count().over().label("total")))
+        .limit(pagination.size)
+        .offset(pagination.offset)
+        .subquery()
+    )
+    page_stmt = sort(
+        select(entity, page.c.total).join(page, pk == page.c[pk.name]).options(*options)
+    )
+
+    result = await db.execute(page_stmt)
+    rows = result.all()
+    items = [row[0] for row in rows]
+
+    if rows:
+        total = rows[0][1]
+    elif pagination.offset == 0:
+        total = 0
+    else:
+        total = await count_total(db, stmt, "exact")
+
+    if cache is not None:
+        cache.set(scope_id, filters, total)
+
+    return items, total
+
+
+async def _fetch_items(
+    db: AsyncSession,
+    stmt: Select,
+    pagination: PaginationDto,
+    sort: Callable[[Select], Select],
+    options: Sequence[ORMOption],
+) -> Sequence[Any]:
+    stmt = sort(stmt.options(*options))
+    stmt = stmt.limit(pagination.size).offset(pagination.offset)
+
+    result = await db.execute(stmt)
+
+    return result.scalars().all()
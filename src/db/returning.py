@@ -0,0 +1,72 @@
+from typing import Any, Callable, Sequence
+
+from sqlalchemy import CTE, Delete, Insert, Select, Update, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased, joinedload
+from sqlalchemy.orm.interfaces import ORMOption
+
+
+async def fetch_written(
+    db: AsyncSession,
+    stmt: Insert | Update,
+    joined: Sequence[str] = (),
+    options: Callable[[Any], Sequence[ORMOption]] | None = None,
+    effects: Callable[[CTE], Sequence[Insert | Update | Delete]] | None = None,
+) -> Any | None:
+    """
+    Write a single row and read it back in the same statement.
+    'joined' are names of the relations loaded with the row,
+    'options' builds other loader options for the written row entity,
+    'effects' builds writes that depend on the row (e.g. counters), they run
+    as data-modifying CTEs of the same statement and can select the written row.
+
+    INSERT/UPDATE ... RETURNING runs as a CTE that is selected as the entity,
+    so the response needs no reload after the write. Objects of the row
+    already in the session are refreshed with the written values.
+    Relations are read as of the statement start, rows written in the same
+    request are visible, rows written by the CTE itself are not.
+    """
+    result = await db.execute(_select_written(stmt, joined, options, effects))
+
+    return result.unique().scalar_one_or_none()
+
+
+async def fetch_all_written(
+    db: AsyncSession,
+    stmt: Insert | Update,
+    joined: Sequence[str] = (),
+    options: Callable[[Any], Sequence[ORMOption]] | None = None,
+    effects: Callable[[CTE], Sequence[Insert | Update | Delete]] | None = None,
+) -> Sequence[Any]:
+    """
+    'fetch_written' of a multi-row write, rows are returned by primary key.
+    Rows of a multi-row INSERT get their keys in the order of the values.
+    """
+    result = await db.execute(_select_written(stmt, joined, options, effects))
+
+    return result.unique().scalars().all()
+
+
+def _select_written(
+    stmt: Insert | Update,
+    joined: Sequence[str],
+    options: Callable[[Any], Sequence[ORMOption]] | None,
+    effects: Callable[[CTE], Sequence[Insert | Update | Delete]] | None,
+) -> Select:
+    entity = stmt.entity_description["entity"]
+    written = stmt.returning(*entity.__table__.c).cte()
+    row = aliased(entity, written)
+
+    select_stmt = (
+        select(row)
+        .options(*(joinedload(getattr(row, name)) for name in joined))
+        .options(*(options(row) if options else ()))
+        .order_by(*(getattr(row, pk.key) for pk in entity.__table__.primary_key))
+        .execution_options(populate_existing=True)
+    )
+    if effects is not None:
+        select_stmt = select_stmt.add_cte(
+            *(effect.cte(f"effect_{i}") for i, effect in enumerate(effects(written)))
+        )
+
+    return select_stmt
@@ -0,0 +1,65 @@
+import re
+
+from sqlalchemy import ColumnElement, Integer, Select, any_, cast, false, func
+from sqlalchemy.dialects.postgresql import ARRAY
+
+# Text search configuration of the generated search vectors.
+# 'simple' doesn't stem, so prefix matching works on any language.
+SEARCH_CONFIG = "simple"
+
+# Generated tsvector of title (weight A) and description (weight B)
+SEARCH_VECTOR_SQL = (
+    f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(title, '')), 'A') || "
+    f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(description, '')), 'B')"
+)
+
+_WORD = re.compile(r"\w+")
+
+
+def to_search_query(term: str) -> ColumnElement | None:
+    """
+    Prefix tsquery matching every word of the term: 'java back' -> java:* & back:*
+    Returns None if the term has no words.
+    """
+    words = _WORD.findall(term.lower())
+    if not words:
+        return None
+
+    query = " & ".join(f"{word}:*" for word in words)
+
+    return func.to_tsquery(SEARCH_CONFIG, query)
+
+
+def matches(vector: ColumnElement, term: str) -> ColumnElement[bool]:
+    """Search vector condition, served by its GIN index"""
+    query = to_search_query(term)
+    if query is None:
+        return false()
+
+    return vector.op("@@")(query)
+
+
+def any_of(ids: Select) -> ColumnElement:
+    """
+    '= ANY(...)' operand of ids selected by a one-column subquery.
+    The ids are aggregated into an array once (InitPlan), so unlike
+    'IN (subquery)' the comparison can use an index inside OR.
+    """
+    column = ids.selected_columns[0]
+    ids_array = ids.with_only_columns(func.array_agg(column)).scalar_subquery()
+
+    return any_(cast(ids_array, ARRAY(Integer)))
+
+
+def relevance(
+    vector: ColumnElement, term: str | None, fallback: ColumnElement
+) -> ColumnElement:
+    """
+    Sort key of 'relevance' sorting: rank of the row for the search term.
+    Without a term every row is equally relevant, 'fallback' is used instead.
+    """
+    query = to_search_query(term) if term else None
+    if query is None:
+        return fallback
+
+    return func.ts_rank(vector, query)
@@ -1,13 +1,99 @@
-from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
+import re
+import time
+from contextlib import AsyncExitStack
 
-from core.config import settings
-
-engine = create_async_engine(
-    url=settings.db.url,
-    echo=settings.db.echo,
-    echo_pool=settings.db.echo_pool,
-    connect_args=settings.db.connect_args,
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    create_async_engine,
+    async_sessionmaker,
+    AsyncSession,
 )
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from core.config import settings, DatabaseConfig
+from db.unit_of_work import current_unit_of_work
+
+
+class InstrumentedPool(AsyncAdaptedQueuePool):
+    """Queue pool that records how long checkouts take (waiting or connecting)."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.checkouts = 0
+        self.wait_time_total = 0.0
+        self.wait_time_max = 0.0
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            elapsed = time.perf_counter() - start
+            self.checkouts += 1
+            self.wait_time_total += elapsed
+            self.wait_time_max = max(self.wait_time_max, elapsed)
+
+            uow = current_unit_of_work()
+            if uow is not None:
+                uow.pool_wait += elapsed
+
+
+def build_engine(config: DatabaseConfig, url: str | None = None) -> AsyncEngine:
+    connect_args = {
+        "statement_cache_size": config.statement_cache_size,
+        "max_cached_statement_lifetime": config.max_cached_statement_lifetime,
+        "max_cacheable_statement_size": config.max_cacheable_statement_size,
+        **config.connect_args,
+    }
+
+    return create_async_engine(
+        url=url or config.url,
+        echo=config.echo,
+        echo_pool=config.echo_pool,
+        connect_args=connect_args,
+        poolclass=InstrumentedPool,
+        pool_size=config.pool_size,
+        max_overflow=config.max_overflow,
+        pool_timeout=config.pool_timeout,
+        pool_recycle=config.pool_recycle,
+        pool_pre_ping=config.pool_pre_ping,
+    )
+
+
+def pool_stats(engine: AsyncEngine) -> dict[str, int | float]:
+    """Pool usage: connections by state and time spent waiting for checkout."""
+    pool = engine.pool
+    stats = {
+        "size": pool.size(),
+        "checked_in": pool.checkedin(),
+        "checked_out": pool.checkedout(),
+        "overflow": pool.overflow(),
+    }
+
+    if isinstance(pool, InstrumentedPool):
+        stats["checkouts"] = pool.checkouts
+        stats["wait_time_total_ms"] = round(pool.wait_time_total * 1000, 3)
+        stats["wait_time_max_ms"] = round(pool.wait_time_max * 1000, 3)
+
+    return stats
+
+
+async def warm_up(engine: AsyncEngine, connections: int) -> None:
+    """Open connections up front, so first requests don't pay for connecting."""
+    connections = min(connections, engine.pool.size())
+    if connections <= 0:
+        return
+
+    # Hold every connection until all are open, so the pool keeps N distinct ones
+    async with AsyncExitStack() as stack:
+        for _ in range(connections):
+            conn = await stack.enter_async_context(engine.connect())
+            await conn.execute(text("SELECT 1"))
+
+
+engine = build_engine(settings.db)
 
 async_session_fabric = async_sessionmaker(
     bind=engine,
@@ -17,6 +103,65 @@ async_session_fabric = async_sessionmaker(
     expire_on_commit=False,
 )
 
+# Optional streaming replica for reads
+replica_engine = (
+    build_engine(settings.db, url=settings.db.replica_url)
+    if settings.db.replica_url
+    else None
+)
+
+replica_session_fabric = (
+    async_sessionmaker(
+        bind=replica_engine,
+        class_=AsyncSession,
+        autocommit=False,
+        autoflush=False,
+        expire_on_commit=False,
+        info={"replica": True},
+    )
+    if replica_engine is not None
+    else None
+)
+
+# WAL position of the client's last write, carried by the client itself so
+# every worker routes its reads the same way
+WRITE_LSN_COOKIE = "last_write_lsn"
+_LSN = re.compile(r"[0-9A-F]{1,8}/[0-9A-F]{1,8}", re.IGNORECASE)
+
+
+@event.listens_for(Session, "after_commit")
+def _note_commit(session: Session) -> None:
+    uow = current_unit_of_work()
+    if uow is not None:
+        uow.committed = True
+
+
+def is_replica(sess: AsyncSession) -> bool:
+    """Whether 'sess' reads from the replica, its rows may be behind the primary"""
+    return sess.info.get("replica", False)
+
+
+async def current_wal_lsn() -> str:
+    """WAL position of the primary, past every transaction committed so far"""
+    async with engine.connect() as conn:
+        return await conn.scalar(text("SELECT pg_current_wal_lsn()::text"))
+
+
+async def replayed(sess: AsyncSession, lsn: str) -> bool:
+    """
+    Whether the server of 'sess' has replayed the WAL up to 'lsn'.
+    A server that isn't a standby has all of its own WAL.
+    """
+    if not _LSN.fullmatch(lsn):
+        return False
+
+    stmt = text(
+        "SELECT coalesce(pg_last_wal_replay_lsn(), pg_current_wal_lsn())"
+        " >= CAST(CAST(:lsn AS text) AS pg_lsn)"
+    )
+
+    return await sess.scalar(stmt, {"lsn": lsn})
+
 
 async def get_session():
     async with async_session_fabric() as sess:
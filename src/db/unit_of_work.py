@@ -0,0 +1,112 @@
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Awaitable, Callable, Hashable, Iterator, TypeVar
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from core.config import settings
+from utils.slow_statements import SlowStatementLog
+
+T = TypeVar("T")
+
+_MISSING = object()
+
+
+class UnitOfWork:
+    """
+    Request-scoped state shared by all repositories:
+    - memo of rows looked up by primary/natural key, so each is fetched once
+    - number of sql statements issued and where the time of the request went
+    """
+
+    def __init__(self):
+        self.statements = 0
+        # Seconds spent in statements and waiting for a pooled connection
+        self.db_time = 0.0
+        self.pool_wait = 0.0
+        # Seconds in the endpoint and rendering its response, if the route reports
+        self.handler_time: float | None = None
+        self.render_time: float | None = None
+        # Authenticated user of the request, if any
+        self.user_id: int | None = None
+        # A session committed, the client is sent the position of its write
+        self.committed = False
+        # Cache invalidations for the other workers, sent before the response
+        self.invalidations: list[str] = []
+        self._memo: dict[Hashable, Any] = {}
+
+    async def memoized(self, key: Hashable, loader: Callable[[], Awaitable[T]]) -> T:
+        value = self._memo.get(key, _MISSING)
+
+        if value is _MISSING:
+            value = await loader()
+            self._memo[key] = value
+
+        return value
+
+    def forget(self, key: Hashable) -> None:
+        self._memo.pop(key, None)
+
+
+_current: ContextVar[UnitOfWork | None] = ContextVar("unit_of_work", default=None)
+
+
+def current_unit_of_work() -> UnitOfWork | None:
+    return _current.get()
+
+
+@contextmanager
+def unit_of_work() -> Iterator[UnitOfWork]:
+    """Bind a new unit of work to the current context (one per request)."""
+    uow = UnitOfWork()
+    token = _current.set(uow)
+    try:
+        yield uow
+    finally:
+        _current.reset(token)
+
+
+async def memoized(key: Hashable, loader: Callable[[], Awaitable[T]]) -> T:
+    """Lookup through the current unit of work, or directly outside of a request."""
+    uow = _current.get()
+    if uow is None:
+        return await loader()
+
+    return await uow.memoized(key, loader)
+
+
+def forget(key: Hashable) -> None:
+    """Drop the memoized lookup, call after the row changes."""
+    uow = _current.get()
+    if uow is not None:
+        uow.forget(key)
+
+
+# Slowest statements of the process, any request or not
+slow_statements = SlowStatementLog(size=settings.metrics.slow_statements)
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _count_statement(conn, cursor, statement, parameters, context, executemany):
+    uow = _current.get()
+    if uow is not None:
+        uow.statements += 1
+
+    if context is not None:
+        context.started_at = time.perf_counter()
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _time_statement(conn, cursor, statement, parameters, context, executemany):
+    started_at = getattr(context, "started_at", None)
+    if started_at is None:
+        return
+
+    duration = time.perf_counter() - started_at
+    uow = _current.get()
+    if uow is not None:
+        uow.db_time += duration
+
+    slow_statements.record(duration, statement, parameters, executemany)
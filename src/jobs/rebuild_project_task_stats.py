@@ -0,0 +1,33 @@
+"""
+Rebuild project task stats from the tasks.
+
+The stats are kept by triggers of the task table, the rebuild reconciles them
+after restores or when the triggers were disabled. Task writes wait while
+the stats table is rebuilt.
+
+    PYTHONPATH=src python -m jobs.rebuild_project_task_stats [--project-id ID]
+"""
+
+import argparse
+import asyncio
+
+from db.session import async_session_fabric, engine
+from modules.project_task_stats.repository import ProjectTaskStatsRepository
+from utils import model_loader  # noqa: F401
+
+
+async def main(args: argparse.Namespace) -> None:
+    async with async_session_fabric() as db:
+        await ProjectTaskStatsRepository(db).rebuild(project_id=args.project_id)
+
+    await engine.dispose()
+
+    scope = f"project {args.project_id}" if args.project_id else "all projects"
+    print(f"Rebuilt task stats of {scope}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--project-id", type=int, default=None)
+
+    asyncio.run(main(parser.parse_args()))
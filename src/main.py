@@ -1,14 +1,60 @@
+import asyncio
+import logging
+import signal
+
 import uvicorn
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 
 from core.config import settings
-from api.router import router as api_router
+from core.security.password import hashing_pool
+from db.invalidation import cache_invalidations
+from db.session import engine, warm_up
+from db.unit_of_work import slow_statements
+from api.openapi import use_openapi_cache
+from api.router import include_api
+from api.metrics import router as metrics_router
+from api.profiling import profiler, stop_profiler, toggle_profiler
+from api.profiling import router as profiling_router
+from api.middleware import UnitOfWorkMiddleware
 
 from utils import model_loader  # noqa: F401
 
-app = FastAPI()
+logger = logging.getLogger(__name__)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    await warm_up(engine, settings.db.pool_warmup)
+    if settings.cache.shared_invalidation:
+        await cache_invalidations.start(engine, settings.db.connect_args)
+    if settings.profiling.signal:
+        asyncio.get_running_loop().add_signal_handler(
+            getattr(signal, settings.profiling.signal), toggle_profiler
+        )
+    yield
+    if profiler.running:
+        await stop_profiler()
+    await cache_invalidations.stop()
+    hashing_pool.shutdown()
+    await engine.dispose()
+
+    for entry in slow_statements.slowest():
+        logger.warning(
+            "Slow statement %.2f ms, parameters %s: %s",
+            entry.duration * 1000,
+            entry.parameters,
+            entry.statement,
+        )
+
+
+app = FastAPI(lifespan=lifespan)
+app.add_middleware(UnitOfWorkMiddleware)
 
-app.include_router(api_router, prefix=settings.prefix.api)
+include_api(app)
+app.include_router(metrics_router)
+app.include_router(profiling_router)
+use_openapi_cache(app, settings.run.openapi_cache)
 
 if __name__ == "__main__":
     uvicorn.run(
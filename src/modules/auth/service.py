@@ -1,45 +1,94 @@
+import time
 from fastapi import HTTPException, status
 from fastapi.security import OAuth2PasswordRequestForm
 from jwt import InvalidTokenError
 
 from core.security.password import PasswordHasher
 from core.security.jwt_handler import JWTHandler
+from core.config import settings
+from db.invalidation import cache_invalidations
 from . import schemas as auth_schemas
 from modules.users import (
     repository as user_repository,
     model as user_model,
 )
+from modules.users.dto import UserPrincipalDto
+from utils.cache import TTLCache
 from enums.token import TokenType
 
+# Kind of the principal invalidations sent to the other workers
+PRINCIPAL = "principal"
+
 
 class AuthService:
+    # Access token -> principal, shared by all instances
+    principal_cache: TTLCache[str, UserPrincipalDto] = TTLCache(
+        maxsize=settings.cache.principal_maxsize, ttl=settings.cache.principal_ttl
+    )
+
     def __init__(self, user_repo: user_repository.UserRepository):
         self.user_repo = user_repo
 
     async def get_user_from_token(
         self, token: str, token_type: TokenType
     ) -> user_model.User:
-        inv_token_exc = HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid token.",
-        )
-        try:
-            payload = JWTHandler.decode(token=token)
-        except InvalidTokenError:
-            raise inv_token_exc
-
-        if payload is None:
-            raise inv_token_exc
-        if payload.get("type") != token_type.value:
-            raise inv_token_exc
+        payload = self._decode_token(token=token, token_type=token_type)
 
         user_id = int(payload.get("sub"))
         db_user = await self.user_repo.get_by_id(user_id=user_id)
 
         if not db_user:
-            raise inv_token_exc
+            raise self._invalid_token_exc()
         return db_user
 
+    async def get_principal_from_token(self, token: str) -> UserPrincipalDto:
+        """
+        Identity of the access token owner.
+        Served from the cache until the token expires or the user changes,
+        the user is read from the database only on a miss
+        (or never, if token claims are trusted).
+        """
+        principal = self.principal_cache.get(token)
+        if principal is not None:
+            return principal
+
+        payload = self._decode_token(token=token, token_type=TokenType.ACCESS)
+
+        if (
+            settings.jwt.trust_token_claims
+            and "username" in payload
+            and "email" in payload
+        ):
+            principal = UserPrincipalDto(
+                id=int(payload["sub"]),
+                username=payload["username"],
+                email=payload["email"],
+            )
+        else:
+            db_user = await self.get_user_from_token(
+                token=token, token_type=TokenType.ACCESS
+            )
+            principal = UserPrincipalDto(
+                id=db_user.id, username=db_user.username, email=db_user.email
+            )
+
+        # Never outlive the token
+        self.principal_cache.set(token, principal, ttl=payload["exp"] - time.time())
+
+        return principal
+
+    @classmethod
+    def invalidate_principal(cls, user_id: int) -> None:
+        """Drop cached principals of the user in every worker, after it changes."""
+        cls._drop_principals(user_id)
+        cache_invalidations.publish(PRINCIPAL, str(user_id))
+
+    @classmethod
+    def _drop_principals(cls, user_id: int) -> None:
+        cls.principal_cache.invalidate_where(
+            lambda _, principal: principal.id == user_id
+        )
+
     async def register(
         self, register_data: auth_schemas.UserRegister
     ) -> user_model.User:
@@ -58,7 +107,7 @@ class AuthService:
                 status_code=status.HTTP_409_CONFLICT,
                 detail="Email already registered.",
             )
-        hashed_password = PasswordHasher.hash(register_data.password)
+        hashed_password = await PasswordHasher.ahash(register_data.password)
 
         create_data = register_data.model_dump(exclude={"password"})
         create_data["hashed_password"] = hashed_password
@@ -95,17 +144,56 @@ class AuthService:
 
         if not db_user:
             raise wrong_auth_exc
-        if not PasswordHasher.verify(
+        if not await PasswordHasher.averify(
             password=login_data.password, hashed=db_user.hashed_password
         ):
             raise wrong_auth_exc
+
+        # Upgrade hash to the configured cost while the password is known
+        if PasswordHasher.needs_rehash(db_user.hashed_password):
+            db_user = await self.user_repo.update_by_id(
+                user_id=db_user.id,
+                update_data={
+                    "hashed_password": await PasswordHasher.ahash(login_data.password)
+                },
+            )
         return db_user
 
+    @staticmethod
+    def _invalid_token_exc() -> HTTPException:
+        return HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid token.",
+        )
+
+    def _decode_token(self, token: str, token_type: TokenType) -> dict:
+        try:
+            payload = JWTHandler.decode(token=token)
+        except InvalidTokenError:
+            raise self._invalid_token_exc()
+
+        if payload is None:
+            raise self._invalid_token_exc()
+        if payload.get("type") != token_type.value:
+            raise self._invalid_token_exc()
+        return payload
+
     @staticmethod
     def _create_tokens(user: user_model.User) -> auth_schemas.TokenResponse:
-        access_token = JWTHandler.create(user_id=user.id, token_type=TokenType.ACCESS)
+        access_token = JWTHandler.create(
+            user_id=user.id,
+            token_type=TokenType.ACCESS,
+            claims={"username": user.username, "email": user.email},
+        )
         refresh_token = JWTHandler.create(user_id=user.id, token_type=TokenType.REFRESH)
 
         return auth_schemas.TokenResponse(
             access_token=access_token, refresh_token=refresh_token
         )
+
+
+cache_invalidations.subscribe(
+    PRINCIPAL,
+    lambda key: AuthService._drop_principals(int(key)),
+    AuthService.principal_cache.clear,
+)
@@ -4,14 +4,14 @@ from sqlalchemy import ForeignKey, DateTime, Enum as SQLEnum, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from db.base import Base
-from db.mixins import TimestampMixin
+from db.mixins import TimestampMixin, SearchVectorMixin
 from enums.task import TaskStatus, TaskPriority
 
 if TYPE_CHECKING:
     from modules.users.model import User
 
 
-class PersonalTask(Base, TimestampMixin):
+class PersonalTask(Base, TimestampMixin, SearchVectorMixin):
     __tablename__ = "personal_tasks"
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
@@ -39,4 +39,7 @@ class PersonalTask(Base, TimestampMixin):
         Index("ix_personal_tasks_user_deadline", "user_id", "deadline"),
         Index("ix_personal_tasks_user_priority", "user_id", "priority"),
         Index("ix_personal_tasks_user_status", "user_id", "status"),
+        Index(
+            "ix_personal_tasks_search_vector", "search_vector", postgresql_using="gin"
+        ),
     )
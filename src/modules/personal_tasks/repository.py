@@ -1,14 +1,35 @@
-from sqlalchemy import select, update, delete, or_, and_, func, asc, desc, Select, case
+from datetime import datetime
+from sqlalchemy import (
+    select,
+    insert,
+    update,
+    delete,
+    or_,
+    and_,
+    asc,
+    desc,
+    Select,
+    case,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import Sequence
+from typing import AsyncIterator, Sequence
 
 from . import model, dto as tasks_dto
 from common import dto as common_dto
+from core.config import settings
+from db.counting import CountCache
+from db.pagination import fetch_page
+from db.search import matches, relevance
 from enums.task import TaskStatus, TaskPriority
 from utils.datetime import utc_now
 
 
 class PersonalTaskRepository:
+    # Exact totals per user, shared by all instances
+    count_cache = CountCache(
+        maxsize=settings.cache.count_maxsize, ttl=settings.cache.count_ttl
+    )
+
     def __init__(self, db: AsyncSession):
         self.db = db
 
@@ -18,27 +39,44 @@ class PersonalTaskRepository:
         filters: tasks_dto.PersonalTaskFilterDto,
         sorting: common_dto.SortingDto,
         pagination: common_dto.PaginationDto,
-    ) -> tuple[Sequence[model.PersonalTask], int]:
+    ) -> tuple[Sequence[model.PersonalTask], int | None]:
         # Basic stmt
         stmt = select(model.PersonalTask).where(model.PersonalTask.user_id == user_id)
 
         # Apply filters
         stmt = self._apply_filters(stmt, filters)
 
-        # Calculate the total count
-        count_query = select(func.count()).select_from(stmt.subquery())
-        total = await self.db.scalar(count_query) or 0
-
-        # Apply sorting
-        stmt = self._apply_sorting(stmt, sorting)
+        # Fetch the sorted page with its total in one statement
+        items, total = await fetch_page(
+            self.db,
+            stmt,
+            pagination,
+            sort=lambda s: self._apply_sorting(s, sorting, filters.search),
+            cache=self.count_cache,
+            scope_id=user_id,
+            filters=filters,
+        )
 
-        # Apply pagination
-        stmt = stmt.limit(pagination.size).offset(pagination.offset)
+        return items, total
 
-        result = await self.db.execute(stmt)
-        items = result.scalars().all()
+    async def stream_list(
+        self,
+        user_id: int,
+        filters: tasks_dto.PersonalTaskFilterDto,
+        sorting: common_dto.SortingDto,
+    ) -> AsyncIterator[model.PersonalTask]:
+        """
+        All matching tasks, read from a server-side cursor in batches of
+        'settings.export.yield_per' rows, nothing is counted.
+        """
+        stmt = select(model.PersonalTask).where(model.PersonalTask.user_id == user_id)
+        stmt = self._apply_filters(stmt, filters)
+        stmt = self._apply_sorting(stmt, sorting, filters.search)
+        stmt = stmt.execution_options(yield_per=settings.export.yield_per)
 
-        return items, total
+        result = await self.db.stream(stmt)
+        async for task in result.scalars():
+            yield task
 
     async def get_by_id_and_user(
         self, task_id: int, user_id: int
@@ -52,35 +90,111 @@ class PersonalTaskRepository:
 
         return result.scalar_one_or_none()
 
+    async def get_updated_at(self, task_id: int, user_id: int) -> datetime | None:
+        stmt = select(model.PersonalTask.updated_at).where(
+            model.PersonalTask.id == task_id, model.PersonalTask.user_id == user_id
+        )
+
+        return await self.db.scalar(stmt)
+
     async def create(self, user_id: int, data: dict) -> model.PersonalTask:
-        obj = model.PersonalTask(
-            user_id=user_id,
-            **data,
+        stmt = (
+            insert(model.PersonalTask)
+            .values(user_id=user_id, **data)
+            .returning(model.PersonalTask)
         )
-        self.db.add(obj)
+        obj = await self.db.scalar(stmt)
         await self.db.commit()
-        await self.db.refresh(obj)
+        self.count_cache.invalidate(user_id)
 
         return obj
 
-    async def update_by_id(self, task_id: int, data: dict) -> model.PersonalTask:
+    async def copy_many(self, user_id: int, items: Sequence[dict]) -> None:
+        """
+        Write tasks with one binary COPY and commit them, nothing is returned.
+        Items have the fields of 'PersonalTaskCreate'.
+        """
+        table = model.PersonalTask.__table__
+        now = utc_now()
+        records = [
+            (
+                user_id,
+                item["title"],
+                item["description"],
+                item["deadline"],
+                # Enum columns store names
+                item["priority"].name,
+                item["status"].name,
+                now,
+                now,
+            )
+            for item in items
+        ]
+
+        connection = await self.db.connection()
+        raw_connection = await connection.get_raw_connection()
+        driver_connection = raw_connection.driver_connection
+
+        # A savepoint inside the session transaction, or a transaction of its own
+        # when the session hasn't sent any statement yet
+        async with driver_connection.transaction():
+            await driver_connection.copy_records_to_table(
+                table.name,
+                records=records,
+                columns=[
+                    "user_id",
+                    "title",
+                    "description",
+                    "deadline",
+                    "priority",
+                    "status",
+                    "created_at",
+                    "updated_at",
+                ],
+            )
+        await self.db.commit()
+        self.count_cache.invalidate(user_id)
+
+    async def update_by_id(
+        self, task_id: int, data: dict, expected_updated_at: datetime | None = None
+    ) -> model.PersonalTask | None:
+        """
+        With 'expected_updated_at' the task is written only if it wasn't
+        updated since, None is returned otherwise.
+        """
         stmt = (
             update(model.PersonalTask)
             .where(model.PersonalTask.id == task_id)
             .values(**data)
             .returning(model.PersonalTask)
         )
+        if expected_updated_at is not None:
+            stmt = stmt.where(model.PersonalTask.updated_at == expected_updated_at)
+
         result = await self.db.execute(stmt)
         await self.db.commit()
 
-        return result.scalar_one()
+        task = result.scalar_one_or_none()
+        if task is None:
+            return None
+        self.count_cache.invalidate(task.user_id)
+
+        return task
 
     async def delete_by_id(self, task_id: int) -> None:
-        stmt = delete(model.PersonalTask).where(model.PersonalTask.id == task_id)
+        stmt = (
+            delete(model.PersonalTask)
+            .where(model.PersonalTask.id == task_id)
+            .returning(model.PersonalTask.user_id)
+        )
 
-        await self.db.execute(stmt)
+        result = await self.db.execute(stmt)
         await self.db.commit()
 
+        user_id = result.scalar_one_or_none()
+        if user_id is not None:
+            self.count_cache.invalidate(user_id)
+
     def _apply_filters(
         self, stmt: Select, filters: tasks_dto.PersonalTaskFilterDto
     ) -> Select:
@@ -115,19 +229,22 @@ class PersonalTaskRepository:
                 )
 
         if filters.search:
-            search_term = f"%{filters.search}%"
-            stmt = stmt.where(
-                or_(
-                    model.PersonalTask.title.ilike(search_term),
-                    model.PersonalTask.description.ilike(search_term),
-                )
-            )
+            stmt = stmt.where(matches(model.PersonalTask.search_vector, filters.search))
 
         return stmt
 
-    def _apply_sorting(self, stmt: Select, sorting: common_dto.SortingDto):
+    def _apply_sorting(
+        self,
+        stmt: Select,
+        sorting: common_dto.SortingDto,
+        search: str | None = None,
+    ):
         # Sort by
-        if sorting.sort_by == "priority":
+        if sorting.sort_by == "relevance":
+            sort_by = relevance(
+                model.PersonalTask.search_vector, search, model.PersonalTask.created_at
+            )
+        elif sorting.sort_by == "priority":
             sort_by = self._get_priority_order_case()
         elif sorting.sort_by == "status":
             sort_by = self._get_status_order_case()
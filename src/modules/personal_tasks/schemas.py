@@ -35,6 +35,19 @@ class PersonalTaskCreate(BaseModel):
         return v
 
 
+class PersonalTaskImportError(BaseModel):
+    row: int = Field(description="Number of the data row (1-based, header excluded)")
+    detail: str
+
+
+class PersonalTaskImportResult(BaseModel):
+    imported: int
+    rejected: int
+    errors: list[PersonalTaskImportError] = Field(
+        description="First rejected rows, all of them are counted in 'rejected'"
+    )
+
+
 class PersonalTaskPatch(BaseModel):
     title: Annotated[str | None, Field(min_length=1, max_length=200)] = None
     description: Annotated[str | None, Field(min_length=1, max_length=1000)] = None
@@ -65,6 +78,9 @@ class PersonalTaskFilterParams(BaseModel):
 class PersonalTaskSortingParams(BaseSortingParams):
     """Query parameters for personal tasks sorting"""
 
-    sort_by: Literal["deadline", "status", "priority", "created_at", "updated_at"] = (
-        Field("created_at", description="Fields to sort by")
+    sort_by: Literal[
+        "deadline", "status", "priority", "created_at", "updated_at", "relevance"
+    ] = Field(
+        "created_at",
+        description="Fields to sort by. 'relevance' ranks by the search term",
     )
@@ -1,7 +1,14 @@
+from datetime import datetime
+from typing import AsyncIterable, AsyncIterator
+
 from fastapi import HTTPException, status
+from pydantic import ValidationError
 
 from . import model, repository, schemas as tasks_schemas, dto as tasks_dto
 from common import schemas as common_schemas, dto as common_dto
+from core.config import settings
+from utils.export import ExportFormat, encode_rows
+from utils.importing import decode_rows
 
 
 class PersonalTaskService:
@@ -21,7 +28,9 @@ class PersonalTaskService:
         )
         sorting_dto = common_dto.SortingDto(**sorting.model_dump(exclude_unset=True))
         pagination_dto = common_dto.PaginationDto(
-            size=pagination.size, offset=pagination.offset
+            size=pagination.size,
+            offset=pagination.offset,
+            include_total=pagination.include_total,
         )
 
         items, total = await self.repo.get_list(
@@ -37,9 +46,95 @@ class PersonalTaskService:
                 total=total,
                 page=pagination.page,
                 size=pagination.size,
+                include_total=pagination.include_total,
             ),
         )
 
+    def export(
+        self,
+        user_id: int,
+        filters: tasks_schemas.PersonalTaskFilterParams,
+        sorting: tasks_schemas.PersonalTaskSortingParams,
+        export_format: ExportFormat,
+    ) -> AsyncIterator[bytes]:
+        """All matching tasks encoded as they are read, without paging or counting"""
+        filter_dto = tasks_dto.PersonalTaskFilterDto(
+            **filters.model_dump(exclude_unset=True)
+        )
+        sorting_dto = common_dto.SortingDto(**sorting.model_dump(exclude_unset=True))
+
+        tasks = self.repo.stream_list(
+            user_id=user_id, filters=filter_dto, sorting=sorting_dto
+        )
+
+        return encode_rows(
+            tasks,
+            tasks_schemas.PersonalTaskRead,
+            export_format,
+            chunk_size=settings.export.yield_per,
+        )
+
+    async def import_tasks(
+        self, user_id: int, chunks: AsyncIterable[bytes], import_format: ExportFormat
+    ) -> tasks_schemas.PersonalTaskImportResult:
+        """
+        Validate rows of the body as they arrive and COPY the valid ones
+        in chunks, every chunk is committed once written.
+        """
+        config = settings.importing
+        imported = 0
+        rejected = 0
+        errors = []
+        batch = []
+
+        def reject(row: int, detail: str) -> None:
+            nonlocal rejected
+            rejected += 1
+            if len(errors) < config.max_errors:
+                errors.append(
+                    tasks_schemas.PersonalTaskImportError(row=row, detail=detail)
+                )
+
+        rows = aiter(
+            decode_rows(chunks, import_format, max_row_size=config.max_row_size)
+        )
+        while True:
+            # Only errors of the decoding itself, e.g. asyncpg's DataError of
+            # a COPY below is a ValueError too
+            try:
+                row, data = await anext(rows)
+            except StopAsyncIteration:
+                break
+            except ValueError as e:
+                # The body can't be read at all, e.g. a broken CSV header
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)
+                )
+
+            if isinstance(data, ValueError):
+                reject(row, str(data))
+                continue
+
+            try:
+                task = tasks_schemas.PersonalTaskCreate.model_validate(data)
+            except ValidationError as e:
+                reject(row, _format_errors(e))
+                continue
+
+            batch.append(task.model_dump())
+            if len(batch) >= config.chunk_size:
+                await self.repo.copy_many(user_id=user_id, items=batch)
+                imported += len(batch)
+                batch = []
+
+        if batch:
+            await self.repo.copy_many(user_id=user_id, items=batch)
+            imported += len(batch)
+
+        return tasks_schemas.PersonalTaskImportResult(
+            imported=imported, rejected=rejected, errors=errors
+        )
+
     async def create(
         self, user_id: int, data: tasks_schemas.PersonalTaskCreate
     ) -> model.PersonalTask:
@@ -50,8 +145,12 @@ class PersonalTaskService:
         return task
 
     async def update(
-        self, task: model.PersonalTask, data: tasks_schemas.PersonalTaskPatch
+        self,
+        task: model.PersonalTask,
+        data: tasks_schemas.PersonalTaskPatch,
+        expected_updated_at: datetime | None = None,
     ) -> model.PersonalTask:
+        """With 'expected_updated_at' a task changed since reading isn't written"""
         task_dict = data.model_dump(exclude_unset=True)
 
         if not task_dict:
@@ -59,9 +158,22 @@ class PersonalTaskService:
                 status_code=status.HTTP_400_BAD_REQUEST, detail="No data to update"
             )
 
-        updated_task = await self.repo.update_by_id(task_id=task.id, data=task_dict)
+        updated_task = await self.repo.update_by_id(
+            task_id=task.id, data=task_dict, expected_updated_at=expected_updated_at
+        )
+        if updated_task is None:
+            raise HTTPException(
+                status_code=status.HTTP_412_PRECONDITION_FAILED,
+                detail="Task was modified by another request.",
+            )
 
         return updated_task
 
     async def delete(self, task: model.PersonalTask) -> None:
         await self.repo.delete_by_id(task.id)
+
+
+def _format_errors(error: ValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(map(str, e['loc'])) or 'row'}: {e['msg']}" for e in error.errors()
+    )
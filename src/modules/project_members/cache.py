@@ -0,0 +1,89 @@
+from datetime import datetime
+
+from core.config import settings
+from db.invalidation import cache_invalidations
+from enums.project import ProjectRole
+from utils.cache import TTLCache
+from .model import ProjectMember
+
+# Cached snapshot of a membership: (id, role, joined_at), None for non-members
+_Snapshot = tuple[int, ProjectRole, datetime] | None
+
+_MISSING = object()
+
+# Kind of the membership invalidations sent to the other workers
+MEMBERSHIP = "membership"
+
+
+class MembershipCache:
+    """
+    (user_id, project_id) -> membership snapshot used by permission checks.
+    Non-members are cached too, so probing foreign projects stays cheap.
+    Member and project writes invalidate the affected keys, in the cache of
+    every worker.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self._cache: TTLCache[tuple[int, int], _Snapshot] = TTLCache(
+            maxsize=maxsize, ttl=ttl
+        )
+
+    def get(self, user_id: int, project_id: int) -> tuple[bool, ProjectMember | None]:
+        """Returns (found in cache, transient membership or None for non-member)"""
+        snapshot = self._cache.get((user_id, project_id), _MISSING)
+
+        if snapshot is _MISSING:
+            return False, None
+        if snapshot is None:
+            return True, None
+
+        member_id, role, joined_at = snapshot
+        membership = ProjectMember(
+            id=member_id,
+            project_id=project_id,
+            user_id=user_id,
+            role=role,
+            joined_at=joined_at,
+        )
+        return True, membership
+
+    def set(
+        self, user_id: int, project_id: int, membership: ProjectMember | None
+    ) -> None:
+        snapshot = None
+        if membership is not None:
+            snapshot = (membership.id, membership.role, membership.joined_at)
+
+        self._cache.set((user_id, project_id), snapshot)
+
+    def invalidate(self, user_id: int, project_id: int) -> None:
+        self._invalidate(f"{user_id}:{project_id}")
+
+    def invalidate_project(self, project_id: int) -> None:
+        self._invalidate(f"*:{project_id}")
+
+    def drop(self, key: str) -> None:
+        """Drop '<user_id>:<project_id>' locally, '*' user for the whole project"""
+        user_id, project_id = key.split(":")
+        project_id = int(project_id)
+        if user_id == "*":
+            self._cache.invalidate_where(lambda cached, _: cached[1] == project_id)
+        else:
+            self._cache.pop((int(user_id), project_id))
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+    def stats(self) -> dict[str, int]:
+        return self._cache.stats()
+
+    def _invalidate(self, key: str) -> None:
+        self.drop(key)
+        cache_invalidations.publish(MEMBERSHIP, key)
+
+
+membership_cache = MembershipCache(
+    maxsize=settings.cache.membership_maxsize, ttl=settings.cache.membership_ttl
+)
+
+cache_invalidations.subscribe(MEMBERSHIP, membership_cache.drop, membership_cache.clear)
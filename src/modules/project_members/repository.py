@@ -1,28 +1,48 @@
 from typing import Sequence
-from sqlalchemy import select, Select, ColumnElement, case, asc, desc, func
-from sqlalchemy.orm import selectinload
+from sqlalchemy import select, insert, update, Select, ColumnElement, case, asc, desc
+from sqlalchemy.orm import joinedload
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from . import model, dto as member_dto
+from .cache import membership_cache
 from common import dto as common_dto
+from core.config import settings
+from db.counting import CountCache
+from db.pagination import fetch_page
+from db.returning import fetch_written
+from db.session import is_replica
+from db.unit_of_work import memoized, forget
+from modules.projects.repository import ProjectRepository, touch_project
 from enums.project import ProjectRole
 
 
 class ProjectMemberRepository:
+    # Exact totals per project, shared by all instances
+    count_cache = CountCache(
+        maxsize=settings.cache.count_maxsize, ttl=settings.cache.count_ttl
+    )
+
     def __init__(self, db: AsyncSession):
         self.db = db
 
     async def create(
         self, project_id: int, user_id: int, role: ProjectRole
     ) -> model.ProjectMember:
-        membership = model.ProjectMember(
+        stmt = insert(model.ProjectMember).values(
             project_id=project_id,
             user_id=user_id,
             role=role,
         )
 
-        self.db.add(membership)
+        # The project version covers its members
+        membership = await fetch_written(
+            self.db,
+            stmt,
+            joined=["user"],
+            effects=lambda written: [touch_project(project_id)],
+        )
         await self.db.commit()
+        self._invalidate_caches(membership)
 
         return membership
 
@@ -32,29 +52,26 @@ class ProjectMemberRepository:
         filters: member_dto.ProjectMemberFilterDto,
         sorting: common_dto.SortingDto,
         pagination: common_dto.PaginationDto,
-    ) -> tuple[Sequence[model.ProjectMember], int]:
+    ) -> tuple[Sequence[model.ProjectMember], int | None]:
         # Basic stmt
-        stmt = (
-            select(model.ProjectMember)
-            .where(model.ProjectMember.project_id == project_id)
-            .options(selectinload(model.ProjectMember.user))
+        stmt = select(model.ProjectMember).where(
+            model.ProjectMember.project_id == project_id
         )
 
         # Apply filters
         stmt = self._apply_filters(stmt, filters)
 
-        # Calculate the total count
-        count_query = select(func.count()).select_from(stmt.subquery())
-        total = await self.db.scalar(count_query) or 0
-
-        # Apply sorting
-        stmt = self._apply_sorting(stmt, sorting)
-
-        # Apply pagination
-        stmt = stmt.limit(pagination.size).offset(pagination.offset)
-
-        result = await self.db.execute(stmt)
-        items = result.scalars().all()
+        # Fetch the sorted page with its total in one statement
+        items, total = await fetch_page(
+            self.db,
+            stmt,
+            pagination,
+            sort=lambda s: self._apply_sorting(s, sorting),
+            options=[joinedload(model.ProjectMember.user)],
+            cache=self.count_cache,
+            scope_id=project_id,
+            filters=filters,
+        )
 
         return items, total
 
@@ -65,24 +82,88 @@ class ProjectMemberRepository:
             model.ProjectMember.user_id == user_id,
             model.ProjectMember.project_id == project_id,
         )
+
+        async def load() -> model.ProjectMember | None:
+            result = await self.db.execute(stmt)
+            return result.scalar_one_or_none()
+
+        return await memoized(("project_member", user_id, project_id), load)
+
+    async def get_user_ids_in_project(
+        self, project_id: int, user_ids: Sequence[int]
+    ) -> set[int]:
+        """Ids of the users that are members of the project, read with one IN query"""
+        if not user_ids:
+            return set()
+
+        stmt = select(model.ProjectMember.user_id).where(
+            model.ProjectMember.project_id == project_id,
+            model.ProjectMember.user_id.in_(set(user_ids)),
+        )
+
         result = await self.db.execute(stmt)
 
-        return result.scalar_one_or_none()
+        return set(result.scalars())
+
+    async def get_cached_membership(
+        self, user_id: int, project_id: int
+    ) -> model.ProjectMember | None:
+        """
+        Membership for permission checks, served from the membership cache.
+        On a hit the returned object is a transient snapshot, use it read-only.
+        Only primary reads fill the cache, a replica may not have replayed
+        a revocation yet.
+        """
+        found, membership = membership_cache.get(user_id, project_id)
+        if found:
+            return membership
+
+        membership = await self.get_by_user_id_and_project_id(
+            user_id=user_id, project_id=project_id
+        )
+        if not is_replica(self.db):
+            membership_cache.set(user_id, project_id, membership)
+
+        return membership
 
     async def update_by_membership(
         self, membership: model.ProjectMember, data: dict
-    ) -> model.ProjectMember:
-        for key, value in data.items():
-            setattr(membership, key, value)
+    ) -> model.ProjectMember | None:
+        """None if the membership was deleted since it was read"""
+        stmt = (
+            update(model.ProjectMember)
+            .where(model.ProjectMember.id == membership.id)
+            .values(**data)
+        )
+
+        updated_membership = await fetch_written(
+            self.db,
+            stmt,
+            joined=["user"],
+            effects=lambda written: [touch_project(membership.project_id)],
+        )
+        if updated_membership is None:
+            # The project was touched by the effect all the same
+            await self.db.rollback()
+            return None
 
         await self.db.commit()
-        await self.db.refresh(membership)
+        self._invalidate_caches(updated_membership)
 
-        return membership
+        return updated_membership
 
     async def delete_by_membership(self, membership: model.ProjectMember) -> None:
         await self.db.delete(membership)
+        await self.db.execute(touch_project(membership.project_id))
         await self.db.commit()
+        self._invalidate_caches(membership)
+
+    def _invalidate_caches(self, membership: model.ProjectMember) -> None:
+        """Membership changes both member list of project and project list of user"""
+        self.count_cache.invalidate(membership.project_id)
+        ProjectRepository.count_cache.invalidate(membership.user_id)
+        membership_cache.invalidate(membership.user_id, membership.project_id)
+        forget(("project_member", membership.user_id, membership.project_id))
 
     def _apply_filters(
         self, stmt: Select, filters: member_dto.ProjectMemberFilterDto
@@ -7,6 +7,11 @@ from . import (
     schemas as member_schemas,
     dto as member_dto,
 )
+from modules.projects.cache import (
+    PROJECT,
+    PROJECT_MEMBERS,
+    invalidate_project_responses,
+)
 from modules.users import repository as user_repository
 from common import schemas as common_schemas, dto as common_dto
 from enums.project import ProjectRole, ProjectPermission
@@ -33,7 +38,9 @@ class ProjectMemberService:
         )
         sorting_dto = common_dto.SortingDto(**sorting.model_dump(exclude_unset=True))
         pagination_dto = common_dto.PaginationDto(
-            offset=pagination.offset, size=pagination.size
+            offset=pagination.offset,
+            size=pagination.size,
+            include_total=pagination.include_total,
         )
 
         items, total = await self.member_repo.get_all(
@@ -49,6 +56,7 @@ class ProjectMemberService:
                 total=total,
                 page=pagination.page,
                 size=pagination.size,
+                include_total=pagination.include_total,
             ),
         )
 
@@ -83,6 +91,7 @@ class ProjectMemberService:
             user_id=data.user_id,
             role=data.role,
         )
+        await invalidate_project_responses(project_id, PROJECT, PROJECT_MEMBERS)
 
         return created_member
 
@@ -115,9 +124,16 @@ class ProjectMemberService:
         PermissionChecker.validate_role_assignment(
             actor_role=actor.role, new_role=update_dict["role"]
         )
-        return await self.member_repo.update_by_membership(
+        updated_member = await self.member_repo.update_by_membership(
             membership=membership, data=update_dict
         )
+        if updated_member is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, detail="Member not found."
+            )
+        await invalidate_project_responses(project_id, PROJECT, PROJECT_MEMBERS)
+
+        return updated_member
 
     async def delete(
         self, project_id: int, user_id: int, actor: model.ProjectMember
@@ -140,6 +156,7 @@ class ProjectMemberService:
         # If user delete themselves, it is allowed (except for owner)
         if actor.user_id == user_id:
             await self.member_repo.delete_by_membership(membership)
+            await invalidate_project_responses(project_id, PROJECT, PROJECT_MEMBERS)
             return
 
         # If user delete someone else, check the permission
@@ -153,3 +170,4 @@ class ProjectMemberService:
         )
 
         await self.member_repo.delete_by_membership(membership=membership)
+        await invalidate_project_responses(project_id, PROJECT, PROJECT_MEMBERS)
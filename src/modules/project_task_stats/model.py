@@ -0,0 +1,98 @@
+from sqlalchemy import DDL, ForeignKey, Enum as SQLEnum, event
+from sqlalchemy.orm import Mapped, mapped_column
+
+from db.base import Base
+from enums.task import TaskStatus, TaskPriority
+
+
+class ProjectTaskStats(Base):
+    """
+    Number of project tasks per (status, priority, assigned) group.
+    Kept by statement triggers of project_tasks (see COUNT_TASKS_FUNCTION),
+    rebuilt from the tasks by 'jobs.rebuild_project_task_stats'.
+    """
+
+    __tablename__ = "project_task_stats"
+
+    project_id: Mapped[int] = mapped_column(
+        ForeignKey("projects.id", ondelete="CASCADE"), primary_key=True
+    )
+    status: Mapped[TaskStatus] = mapped_column(SQLEnum(TaskStatus), primary_key=True)
+    priority: Mapped[TaskPriority] = mapped_column(
+        SQLEnum(TaskPriority), primary_key=True
+    )
+    assigned: Mapped[bool] = mapped_column(primary_key=True)
+    task_count: Mapped[int] = mapped_column(default=0)
+
+
+# Counts the rows a statement wrote to project_tasks, from the transition
+# tables of its trigger. The groups are derived from the row versions the
+# statement actually replaced, so concurrent updates of a task, cascades
+# (assignee SET NULL on user delete) and writes outside the repositories are
+# counted too. Groups are upserted in key order, so concurrent writes lock
+# them in the same order. Tasks deleted with their project are not counted,
+# the project's stats are deleted by the same cascade.
+_NEW_GROUPS = """
+    SELECT project_id, status, priority, assignee_id IS NOT NULL AS assigned,
+        1 AS delta
+    FROM new_tasks"""
+_OLD_GROUPS = """
+    SELECT project_id, status, priority, assignee_id IS NOT NULL AS assigned,
+        -1 AS delta
+    FROM old_tasks"""
+
+
+def _count_changes(changes: str) -> str:
+    return f"""
+        INSERT INTO project_task_stats AS stats (
+            project_id, status, priority, assigned, task_count
+        )
+        SELECT project_id, status, priority, assigned, sum(delta)::int
+        FROM ({changes}) AS changes
+        WHERE project_id IN (SELECT id FROM projects)
+        GROUP BY project_id, status, priority, assigned
+        HAVING sum(delta) <> 0
+        ORDER BY project_id, status, priority, assigned
+        ON CONFLICT (project_id, status, priority, assigned)
+        DO UPDATE SET task_count = stats.task_count + excluded.task_count;"""
+
+
+COUNT_TASKS_FUNCTION = f"""
+CREATE OR REPLACE FUNCTION count_project_tasks() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    -- A statement can only name the transition tables of its trigger
+    IF TG_OP = 'INSERT' THEN{_count_changes(_NEW_GROUPS)}
+    ELSIF TG_OP = 'DELETE' THEN{_count_changes(_OLD_GROUPS)}
+    ELSE{_count_changes(_NEW_GROUPS + " UNION ALL" + _OLD_GROUPS)}
+    END IF;
+
+    RETURN NULL;
+END
+$$
+"""
+
+# Transition tables can't be shared by the events of one trigger
+COUNT_TASKS_TRIGGERS = {
+    "INSERT": "REFERENCING NEW TABLE AS new_tasks",
+    "UPDATE": "REFERENCING OLD TABLE AS old_tasks NEW TABLE AS new_tasks",
+    "DELETE": "REFERENCING OLD TABLE AS old_tasks",
+}
+
+
+def count_tasks_trigger(operation: str) -> str:
+    return (
+        f"CREATE TRIGGER project_tasks_stats_{operation.lower()} "
+        f"AFTER {operation} ON project_tasks "
+        f"{COUNT_TASKS_TRIGGERS[operation]} "
+        "FOR EACH STATEMENT EXECUTE FUNCTION count_project_tasks()"
+    )
+
+
+# Created with the tables (tests, create_all), migrations create their own
+event.listen(Base.metadata, "after_create", DDL(COUNT_TASKS_FUNCTION))
+for _operation in COUNT_TASKS_TRIGGERS:
+    event.listen(Base.metadata, "after_create", DDL(count_tasks_trigger(_operation)))
+event.listen(
+    Base.metadata, "after_drop", DDL("DROP FUNCTION IF EXISTS count_project_tasks()")
+)
@@ -0,0 +1,116 @@
+from typing import Sequence
+
+from sqlalchemy import (
+    Insert,
+    Row,
+    Select,
+    delete,
+    func,
+    literal,
+    select,
+    text,
+    true,
+)
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from . import model
+from modules.project_tasks.model import ProjectTask
+from enums.task import TaskStatus
+from utils.datetime import utc_now
+
+_KEY = ("project_id", "status", "priority", "assigned")
+
+
+def count_tasks(changes: Select) -> Insert:
+    """
+    Upsert adding 'task_count' of every (project_id, status, priority, assigned)
+    group selected by 'changes', a group must appear once
+    """
+    stats = model.ProjectTaskStats
+    stmt = insert(stats).from_select([*_KEY, "task_count"], changes)
+
+    return stmt.on_conflict_do_update(
+        index_elements=_KEY,
+        set_={"task_count": stats.task_count + stmt.excluded.task_count},
+    )
+
+
+class ProjectTaskStatsRepository:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def get_by_project_id(self, project_id: int) -> tuple[Sequence[Row], int]:
+        """
+        Non-empty groups of the project and the number of overdue tasks.
+        Overdue depends on the time of the request, it is counted on the
+        (project_id, deadline) index instead of being stored.
+        """
+        overdue = (
+            select(func.count())
+            .where(
+                ProjectTask.project_id == project_id,
+                ProjectTask.deadline < utc_now(),
+                ProjectTask.status.notin_([TaskStatus.DONE, TaskStatus.CANCELLED]),
+            )
+            .scalar_subquery()
+        )
+        groups = (
+            select(
+                model.ProjectTaskStats.status,
+                model.ProjectTaskStats.priority,
+                model.ProjectTaskStats.assigned,
+                model.ProjectTaskStats.task_count,
+            )
+            .where(
+                model.ProjectTaskStats.project_id == project_id,
+                model.ProjectTaskStats.task_count != 0,
+            )
+            .subquery()
+        )
+
+        # Joined to a single row, so the overdue count is read without groups too
+        single = select(literal(1)).subquery()
+        stmt = (
+            select(overdue.label("overdue"), groups)
+            .select_from(single)
+            .outerjoin(groups, true())
+        )
+
+        result = await self.db.execute(stmt)
+        rows = result.all()
+
+        return [row for row in rows if row.status is not None], rows[0].overdue
+
+    async def rebuild(self, project_id: int | None = None) -> None:
+        """
+        Recount the stats of one or all projects from their tasks.
+        The triggers of task writes wait for the rebuild, so none are lost
+        or counted twice.
+        """
+        stats = model.ProjectTaskStats
+
+        await self.db.execute(
+            text("LOCK TABLE project_task_stats IN SHARE ROW EXCLUSIVE MODE")
+        )
+
+        delete_stmt = delete(stats)
+        tasks_stmt = select(
+            ProjectTask.project_id,
+            ProjectTask.status,
+            ProjectTask.priority,
+            ProjectTask.assignee_id.is_not(None),
+            func.count(),
+        ).group_by(
+            ProjectTask.project_id,
+            ProjectTask.status,
+            ProjectTask.priority,
+            ProjectTask.assignee_id.is_not(None),
+        )
+        if project_id is not None:
+            delete_stmt = delete_stmt.where(stats.project_id == project_id)
+            tasks_stmt = tasks_stmt.where(ProjectTask.project_id == project_id)
+
+        await self.db.execute(delete_stmt)
+        await self.db.execute(count_tasks(tasks_stmt))
+        await self.db.commit()
@@ -0,0 +1,12 @@
+from pydantic import BaseModel
+
+from enums.task import TaskStatus, TaskPriority
+
+
+class ProjectTaskStatsRead(BaseModel):
+    project_id: int
+    total: int
+    unassigned: int
+    overdue: int
+    by_status: dict[TaskStatus, int]
+    by_priority: dict[TaskPriority, int]
@@ -0,0 +1,28 @@
+from . import repository, schemas
+from enums.task import TaskStatus, TaskPriority
+
+
+class ProjectTaskStatsService:
+    def __init__(self, repo: repository.ProjectTaskStatsRepository):
+        self.repo = repo
+
+    async def get_one(self, project_id: int) -> schemas.ProjectTaskStatsRead:
+        groups, overdue = await self.repo.get_by_project_id(project_id=project_id)
+
+        by_status = dict.fromkeys(TaskStatus, 0)
+        by_priority = dict.fromkeys(TaskPriority, 0)
+        unassigned = 0
+        for group in groups:
+            by_status[group.status] += group.task_count
+            by_priority[group.priority] += group.task_count
+            if not group.assigned:
+                unassigned += group.task_count
+
+        return schemas.ProjectTaskStatsRead(
+            project_id=project_id,
+            total=sum(by_status.values()),
+            unassigned=unassigned,
+            overdue=overdue,
+            by_status=by_status,
+            by_priority=by_priority,
+        )
@@ -4,7 +4,7 @@ from sqlalchemy import ForeignKey, DateTime, Enum as SQLEnum, Index, CheckConstr
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from db.base import Base
-from db.mixins import TimestampMixin
+from db.mixins import TimestampMixin, SearchVectorMixin
 from enums.task import TaskStatus, TaskPriority
 from enums.project_task import ProjectTaskType
 
@@ -13,7 +13,7 @@ if TYPE_CHECKING:
     from modules.projects.model import Project
 
 
-class ProjectTask(Base, TimestampMixin):
+class ProjectTask(Base, TimestampMixin, SearchVectorMixin):
     __tablename__ = "project_tasks"
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
@@ -69,4 +69,13 @@ class ProjectTask(Base, TimestampMixin):
         Index("ix_project_tasks_project_deadline", "project_id", "deadline"),
         Index("ix_project_tasks_project_status", "project_id", "status"),
         Index("ix_project_tasks_project_priority", "project_id", "priority"),
+        # Keyset pagination: (project_id, sort key, id)
+        Index("ix_project_tasks_project_created_at", "project_id", "created_at", "id"),
+        Index("ix_project_tasks_project_updated_at", "project_id", "updated_at", "id"),
+        Index(
+            "ix_project_tasks_project_assigned_at", "project_id", "assigned_at", "id"
+        ),
+        Index(
+            "ix_project_tasks_search_vector", "search_vector", postgresql_using="gin"
+        ),
     )
@@ -1,34 +1,83 @@
-from typing import Sequence
-from sqlalchemy import select, func, Select, asc, desc, and_, or_, case
-from sqlalchemy.orm import selectinload, aliased
+from datetime import datetime
+from typing import AsyncIterator, Sequence
+from sqlalchemy import (
+    Row,
+    select,
+    insert,
+    update,
+    delete,
+    Select,
+    ColumnElement,
+    asc,
+    desc,
+    and_,
+    or_,
+    case,
+    tuple_,
+)
+from sqlalchemy.orm import aliased, joinedload
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from . import model, dto
-from common.dto import PaginationDto, SortingDto
+from common.dto import PaginationDto, SortingDto, CursorDto, CursorPaginationDto
+from core.config import settings
+from db.counting import CountCache
+from db.pagination import fetch_page
+from db.returning import fetch_written, fetch_all_written
+from db.search import any_of, matches, relevance
+from db.unit_of_work import memoized, forget
 from modules.users.model import User as UserModel
 from enums.task import TaskStatus, TaskPriority
 from utils.datetime import utc_now
 
 
 class ProjectTaskRepository:
+    _NULLABLE_SORT_FIELDS = {"deadline", "assigned_at"}
+    _RELATIONS = ("project", "assignee", "creator")
+
+    # Exact totals per project, shared by all instances
+    count_cache = CountCache(
+        maxsize=settings.cache.count_maxsize, ttl=settings.cache.count_ttl
+    )
+
     def __init__(self, db: AsyncSession):
         self.db = db
 
     async def create(
         self, project_id: int, created_by_id: int, data: dict
     ) -> model.ProjectTask:
-        task = model.ProjectTask(
+        stmt = insert(model.ProjectTask).values(
             project_id=project_id,
             created_by_id=created_by_id,
             **data,
         )
 
-        self.db.add(task)
+        # Task is returned with its relations by the insert itself
+        task = await fetch_written(self.db, stmt, joined=self._RELATIONS)
         await self.db.commit()
+        self.count_cache.invalidate(project_id)
 
-        full_task = await self.get_by_id(task.id)
+        return task
 
-        return full_task
+    async def create_many(
+        self, project_id: int, created_by_id: int, items: list[dict]
+    ) -> Sequence[model.ProjectTask]:
+        """
+        Insert all tasks with one multi-row INSERT, tasks are returned in order.
+        Every item must have the same keys.
+        """
+        stmt = insert(model.ProjectTask).values(
+            [
+                {"project_id": project_id, "created_by_id": created_by_id, **item}
+                for item in items
+            ]
+        )
+
+        tasks = await fetch_all_written(self.db, stmt, joined=self._RELATIONS)
+        await self.db.commit()
+        self.count_cache.invalidate(project_id)
+
+        return tasks
 
     async def get_all(
         self,
@@ -36,64 +85,261 @@ class ProjectTaskRepository:
         filters: dto.ProjectTaskFilterDto,
         sorting: SortingDto,
         pagination: PaginationDto,
-    ) -> tuple[Sequence[model.ProjectTask], int]:
+    ) -> tuple[Sequence[model.ProjectTask], int | None]:
+        # Basic stmt
+        stmt = select(model.ProjectTask).where(
+            model.ProjectTask.project_id == project_id
+        )
+
+        # Apply filters
+        stmt = self._apply_filters(stmt, filters)
+
+        # Fetch the sorted page with its total in one statement
+        items, total = await fetch_page(
+            self.db,
+            stmt,
+            pagination,
+            sort=lambda s: self._apply_sorting(s, sorting, filters.search),
+            options=[
+                joinedload(model.ProjectTask.project),
+                joinedload(model.ProjectTask.assignee),
+                joinedload(model.ProjectTask.creator),
+            ],
+            cache=self.count_cache,
+            scope_id=project_id,
+            filters=filters,
+        )
+
+        return items, total
+
+    async def get_all_by_cursor(
+        self,
+        project_id: int,
+        filters: dto.ProjectTaskFilterDto,
+        sorting: SortingDto,
+        pagination: CursorPaginationDto,
+    ) -> tuple[Sequence[model.ProjectTask], CursorDto | None]:
+        """
+        Keyset pagination: seek after the cursor instead of OFFSET, skip the count.
+        Returns page items and the cursor of the next page (None on the last page).
+        """
         # Basic stmt
         stmt = (
             select(model.ProjectTask)
             .where(model.ProjectTask.project_id == project_id)
             .options(
-                selectinload(model.ProjectTask.project),
-                selectinload(model.ProjectTask.assignee),
-                selectinload(model.ProjectTask.creator),
+                joinedload(model.ProjectTask.project),
+                joinedload(model.ProjectTask.assignee),
+                joinedload(model.ProjectTask.creator),
             )
         )
 
         # Apply filters
         stmt = self._apply_filters(stmt, filters)
 
-        # Calculate the total count
-        count_stmt = select(func.count()).select_from(stmt.subquery())
-        total = await self.db.scalar(count_stmt) or 0
+        # Apply keyset sorting and seek
+        stmt = self._apply_keyset(stmt, sorting, pagination.cursor)
 
-        # Apply sorting
-        stmt = self._apply_sorting(stmt, sorting)
-
-        # Apply pagination
-        stmt = stmt.limit(pagination.size).offset(pagination.offset)
+        # Fetch one extra row to know if there is a next page
+        stmt = stmt.limit(pagination.size + 1)
 
         result = await self.db.execute(stmt)
         items = result.scalars().all()
 
-        return items, total
+        if len(items) <= pagination.size:
+            return items, None
+
+        items = items[: pagination.size]
+        last = items[-1]
+        next_cursor = CursorDto(
+            value=self._get_sort_value(last, sorting.sort_by), id=last.id
+        )
+
+        return items, next_cursor
+
+    async def stream_all(
+        self,
+        project_id: int,
+        filters: dto.ProjectTaskFilterDto,
+        sorting: SortingDto,
+    ) -> AsyncIterator[model.ProjectTask]:
+        """
+        All matching tasks, read from a server-side cursor in batches of
+        'settings.export.yield_per' rows, nothing is counted.
+        """
+        stmt = select(model.ProjectTask).where(
+            model.ProjectTask.project_id == project_id
+        )
+        stmt = self._apply_filters(stmt, filters)
+        stmt = self._apply_sorting(stmt, sorting, filters.search)
+        stmt = stmt.options(
+            joinedload(model.ProjectTask.project),
+            joinedload(model.ProjectTask.assignee),
+            joinedload(model.ProjectTask.creator),
+        ).execution_options(yield_per=settings.export.yield_per)
+
+        result = await self.db.stream(stmt)
+        async for task in result.scalars():
+            yield task
 
     async def get_by_id(self, task_id: int) -> model.ProjectTask:
         stmt = (
             select(model.ProjectTask)
             .where(model.ProjectTask.id == task_id)
             .options(
-                selectinload(model.ProjectTask.project),
-                selectinload(model.ProjectTask.assignee),
-                selectinload(model.ProjectTask.creator),
+                joinedload(model.ProjectTask.project),
+                joinedload(model.ProjectTask.assignee),
+                joinedload(model.ProjectTask.creator),
+            )
+        )
+
+        async def load() -> model.ProjectTask | None:
+            result = await self.db.execute(stmt)
+            return result.scalar_one_or_none()
+
+        return await memoized(("project_task", task_id), load)
+
+    async def get_version_by_id(self, task_id: int, project_id: int) -> Row | None:
+        """
+        (updated_at, assignee's updated_at, creator's updated_at) of the task,
+        None when it's not a task of the project
+        """
+        assignee = aliased(UserModel)
+        creator = aliased(UserModel)
+        stmt = (
+            select(
+                model.ProjectTask.updated_at,
+                assignee.updated_at,
+                creator.updated_at,
+            )
+            .outerjoin(assignee, assignee.id == model.ProjectTask.assignee_id)
+            .outerjoin(creator, creator.id == model.ProjectTask.created_by_id)
+            .where(
+                model.ProjectTask.id == task_id,
+                model.ProjectTask.project_id == project_id,
             )
         )
         result = await self.db.execute(stmt)
 
-        return result.scalar_one_or_none()
+        return result.one_or_none()
+
+    async def get_many(
+        self, project_id: int, task_ids: Sequence[int], for_update: bool = False
+    ) -> dict[int, model.ProjectTask]:
+        """
+        Tasks of the project by id, ids of other projects are left out.
+        With 'for_update' the tasks stay locked until the transaction ends,
+        so they can't be changed or deleted before they are written back.
+        """
+        stmt = (
+            select(model.ProjectTask)
+            .where(
+                model.ProjectTask.project_id == project_id,
+                model.ProjectTask.id.in_(task_ids),
+            )
+            .options(
+                joinedload(model.ProjectTask.project),
+                joinedload(model.ProjectTask.assignee),
+                joinedload(model.ProjectTask.creator),
+            )
+        )
+        if for_update:
+            # The joined relations may be NULL, only the task rows are locked
+            stmt = stmt.with_for_update(of=model.ProjectTask)
+
+        result = await self.db.execute(stmt)
+
+        return {task.id: task for task in result.scalars()}
 
     async def update_by_task(
-        self, task: model.ProjectTask, data: dict
-    ) -> model.ProjectTask:
-        for key, value in data.items():
-            setattr(task, key, value)
+        self,
+        task: model.ProjectTask,
+        data: dict,
+        expected_updated_at: datetime | None = None,
+    ) -> model.ProjectTask | None:
+        """
+        With 'expected_updated_at' the task is written only if it wasn't
+        updated since, None is returned and nothing is written otherwise.
+        """
+        stmt = (
+            update(model.ProjectTask)
+            .where(model.ProjectTask.id == task.id)
+            .values(**data)
+        )
+        if expected_updated_at is not None:
+            stmt = stmt.where(model.ProjectTask.updated_at == expected_updated_at)
+
+        # Refreshes 'task' in place, a new assignee is joined by the update
+        updated_task = await fetch_written(self.db, stmt, joined=self._RELATIONS)
+        if updated_task is None:
+            return None
 
         await self.db.commit()
-        await self.db.refresh(task)
+        self.count_cache.invalidate(task.project_id)
+        forget(("project_task", task.id))
 
-        return task
+        return updated_task
+
+    async def update_many(
+        self, project_id: int, updates: list[tuple[model.ProjectTask, dict]]
+    ) -> Sequence[model.ProjectTask]:
+        """
+        Write (task, data) updates in one transaction, tasks are returned by id.
+        Updates are sent as executemany batches grouped by their keys,
+        the updated tasks are read back with one statement.
+        """
+        await self.db.execute(
+            update(model.ProjectTask),
+            [{"id": task.id, **data} for task, data in updates],
+        )
+
+        stmt = (
+            select(model.ProjectTask)
+            .where(model.ProjectTask.id.in_([task.id for task, _ in updates]))
+            .options(
+                joinedload(model.ProjectTask.project),
+                joinedload(model.ProjectTask.assignee),
+                joinedload(model.ProjectTask.creator),
+            )
+            .order_by(model.ProjectTask.id)
+            .execution_options(populate_existing=True)
+        )
+        result = await self.db.execute(stmt)
+        tasks = result.scalars().all()
+
+        await self.db.commit()
+        self.count_cache.invalidate(project_id)
+        for task in tasks:
+            forget(("project_task", task.id))
+
+        return tasks
 
     async def delete_by_task(self, task: model.ProjectTask) -> None:
         await self.db.delete(task)
         await self.db.commit()
+        self.count_cache.invalidate(task.project_id)
+        forget(("project_task", task.id))
+
+    async def delete_many(self, project_id: int, task_ids: Sequence[int]) -> set[int]:
+        """Delete tasks of the project in one statement, returns the deleted ids"""
+        stmt = (
+            delete(model.ProjectTask)
+            .where(
+                model.ProjectTask.project_id == project_id,
+                model.ProjectTask.id.in_(task_ids),
+            )
+            .returning(model.ProjectTask.id)
+        )
+
+        result = await self.db.execute(stmt)
+        deleted_ids = set(result.scalars())
+
+        await self.db.commit()
+        self.count_cache.invalidate(project_id)
+        for task_id in deleted_ids:
+            forget(("project_task", task_id))
+
+        return deleted_ids
 
     def _apply_filters(self, stmt: Select, filters: dto.ProjectTaskFilterDto) -> Select:
         if filters.type:
@@ -136,32 +382,29 @@ class ProjectTaskRepository:
                 )
 
         if filters.search:
-            assignee_alias = aliased(UserModel)
-            creator_alias = aliased(UserModel)
-
-            stmt = stmt.outerjoin(assignee_alias, model.ProjectTask.assignee)
-            stmt = stmt.outerjoin(creator_alias, model.ProjectTask.creator)
-
-            search_term = f"%{filters.search}%"
+            # Usernames are matched into ids first (trigram index of users),
+            # without joins, so each branch can use an index (GIN, assignee,
+            # creator)
+            user_ids = any_of(
+                select(UserModel.id).where(
+                    UserModel.username.ilike(f"%{filters.search}%")
+                )
+            )
             search_filters = [
-                model.ProjectTask.title.ilike(search_term),
-                model.ProjectTask.description.ilike(search_term),
-                assignee_alias.username.ilike(search_term),
-                creator_alias.username.ilike(search_term),
+                matches(model.ProjectTask.search_vector, filters.search),
+                model.ProjectTask.assignee_id == user_ids,
+                model.ProjectTask.created_by_id == user_ids,
             ]
 
             stmt = stmt.where(or_(*search_filters))
 
         return stmt
 
-    def _apply_sorting(self, stmt: Select, sorting: SortingDto):
+    def _apply_sorting(
+        self, stmt: Select, sorting: SortingDto, search: str | None = None
+    ):
         # Sort by
-        if sorting.sort_by == "priority":
-            sort_by = self._get_priority_order_case()
-        elif sorting.sort_by == "status":
-            sort_by = self._get_status_order_case()
-        else:
-            sort_by = getattr(model.ProjectTask, sorting.sort_by)
+        sort_by = self._get_sort_key(sorting.sort_by, search)
 
         # Sort order
         if sorting.order == "asc":
@@ -171,6 +414,90 @@ class ProjectTaskRepository:
 
         return stmt
 
+    def _get_sort_key(self, sort_by: str, search: str | None = None) -> ColumnElement:
+        if sort_by == "relevance":
+            return relevance(
+                model.ProjectTask.search_vector, search, model.ProjectTask.created_at
+            )
+        if sort_by == "priority":
+            return self._get_priority_order_case()
+        if sort_by == "status":
+            return self._get_status_order_case()
+        return getattr(model.ProjectTask, sort_by)
+
+    @staticmethod
+    def sort_key_type(sort_by: str) -> type[int] | type[datetime]:
+        """Python type of the values of the sort key, as stored in cursors"""
+        if sort_by in ("priority", "status"):
+            return int
+        return datetime
+
+    def _apply_keyset(
+        self, stmt: Select, sorting: SortingDto, cursor: CursorDto | None
+    ) -> Select:
+        """
+        Order by (sort key, id) and seek after the cursor.
+        PostgreSQL puts NULLs last for asc and first for desc,
+        so the nullable keys (deadline, assigned_at) need explicit branches.
+        """
+        sort_key = self._get_sort_key(sorting.sort_by)
+        task_id = model.ProjectTask.id
+        is_asc = sorting.order == "asc"
+
+        if is_asc:
+            stmt = stmt.order_by(asc(sort_key), asc(task_id))
+        else:
+            stmt = stmt.order_by(desc(sort_key), desc(task_id))
+
+        if cursor is None:
+            return stmt
+
+        is_nullable = sorting.sort_by in self._NULLABLE_SORT_FIELDS
+
+        if cursor.value is None:
+            if is_asc:
+                # NULLs are the tail of asc order
+                return stmt.where(sort_key.is_(None), task_id > cursor.id)
+            # NULLs are the head of desc order
+            return stmt.where(
+                or_(
+                    and_(sort_key.is_(None), task_id < cursor.id),
+                    sort_key.is_not(None),
+                )
+            )
+
+        if not is_nullable:
+            # Row comparison lets postgres seek via (project_id, key, id) indexes
+            if is_asc:
+                return stmt.where(
+                    tuple_(sort_key, task_id) > tuple_(cursor.value, cursor.id)
+                )
+            return stmt.where(
+                tuple_(sort_key, task_id) < tuple_(cursor.value, cursor.id)
+            )
+
+        if is_asc:
+            return stmt.where(
+                or_(
+                    sort_key > cursor.value,
+                    and_(sort_key == cursor.value, task_id > cursor.id),
+                    sort_key.is_(None),
+                )
+            )
+        return stmt.where(
+            or_(
+                sort_key < cursor.value,
+                and_(sort_key == cursor.value, task_id < cursor.id),
+            )
+        )
+
+    @staticmethod
+    def _get_sort_value(task: model.ProjectTask, sort_by: str):
+        """Value of the sort key for the task, the same as sql expression returns"""
+        if sort_by in ("priority", "status"):
+            return getattr(task, sort_by).sort_order
+        return getattr(task, sort_by)
+
     def _get_priority_order_case(self):
         """
         Returns sql case for sorting by priority
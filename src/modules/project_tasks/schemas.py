@@ -3,6 +3,7 @@ from datetime import datetime
 from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
 
 from common.schemas import BaseSortingParams
+from core.config import settings
 from enums.project_task import ProjectTaskType
 from enums.task import TaskStatus, TaskPriority
 
@@ -84,6 +85,41 @@ class ProjectTaskPatch(BaseModel):
         return v
 
 
+class ProjectTaskBatchPatchItem(ProjectTaskPatch):
+    id: int
+
+
+BATCH_MAX_SIZE = settings.project.tasks_batch_max_size
+
+
+class ProjectTaskBatchCreate(BaseModel):
+    items: list[ProjectTaskCreate] = Field(min_length=1, max_length=BATCH_MAX_SIZE)
+
+
+class ProjectTaskBatchPatch(BaseModel):
+    items: list[ProjectTaskBatchPatchItem] = Field(
+        min_length=1, max_length=BATCH_MAX_SIZE
+    )
+
+
+class ProjectTaskBatchDelete(BaseModel):
+    ids: list[int] = Field(min_length=1, max_length=BATCH_MAX_SIZE)
+
+
+class ProjectTaskBatchResult(BaseModel):
+    """Outcome of one batch item, 'status' is the code of the single-item endpoint"""
+
+    index: int = Field(description="Position of the item in the request")
+    id: int | None = Field(None, description="Task id (null if it wasn't created)")
+    status: int
+    task: ProjectTaskRead | None = None
+    detail: str | None = Field(None, description="Error of a rejected item")
+
+
+class ProjectTaskBatchResponse(BaseModel):
+    results: list[ProjectTaskBatchResult]
+
+
 class ProjectTasksFiltersParams(BaseModel):
     """Query parameters for project tasks filtering"""
 
@@ -104,5 +140,14 @@ class ProjectTasksSortingParams(BaseSortingParams):
     """Query parameters for project tasks sorting"""
 
     sort_by: Literal[
-        "deadline", "status", "priority", "assigned_at", "created_at", "updated_at"
-    ] = Field("created_at", description="Fields to sort by")
+        "deadline",
+        "status",
+        "priority",
+        "assigned_at",
+        "created_at",
+        "updated_at",
+        "relevance",
+    ] = Field(
+        "created_at",
+        description="Fields to sort by. 'relevance' ranks by the search term",
+    )
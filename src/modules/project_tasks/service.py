@@ -1,13 +1,20 @@
+from datetime import datetime
+from typing import AsyncIterator
+
 from fastapi import HTTPException, status
 
 from . import repository, schemas, model, dto
 from modules.project_members.model import ProjectMember as ProjectMemberModel
 from modules.project_members.repository import ProjectMemberRepository
+from modules.projects.cache import PROJECT_TASKS, invalidate_project_responses
 from common import schemas as common_schemas, dto as common_dto
+from core.config import settings
 from core.security.permissions import PermissionChecker
 from enums.project_task import ProjectTaskType
 from enums.project import ProjectPermission
+from utils.cursor import encode_cursor, decode_cursor
 from utils.datetime import utc_now
+from utils.export import ExportFormat, encode_rows
 
 
 class ProjectTaskService:
@@ -29,7 +36,9 @@ class ProjectTaskService:
         filters_dto = dto.ProjectTaskFilterDto(**filters.model_dump(exclude_unset=True))
         sorting_dto = common_dto.SortingDto(**sorting.model_dump(exclude_unset=True))
         pagination_dto = common_dto.PaginationDto(
-            size=pagination.size, offset=pagination.offset
+            size=pagination.size,
+            offset=pagination.offset,
+            include_total=pagination.include_total,
         )
 
         items, total = await self.repo.get_all(
@@ -45,9 +54,85 @@ class ProjectTaskService:
                 total=total,
                 page=pagination.page,
                 size=pagination.size,
+                include_total=pagination.include_total,
             ),
         )
 
+    async def get_all_by_cursor(
+        self,
+        project_id: int,
+        filters: schemas.ProjectTasksFiltersParams,
+        sorting: schemas.ProjectTasksSortingParams,
+        pagination: common_schemas.CursorPaginationParams,
+    ) -> common_schemas.BasePaginationResponse[schemas.ProjectTaskRead]:
+        filters_dto = dto.ProjectTaskFilterDto(**filters.model_dump(exclude_unset=True))
+        sorting_dto = common_dto.SortingDto(**sorting.model_dump(exclude_unset=True))
+
+        if sorting_dto.sort_by == "relevance":
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Relevance sorting is not supported in cursor mode.",
+            )
+
+        cursor_dto = None
+        if pagination.cursor is not None:
+            try:
+                cursor_dto = decode_cursor(
+                    pagination.cursor,
+                    sorting=sorting_dto,
+                    value_type=self.repo.sort_key_type(sorting_dto.sort_by),
+                )
+            except ValueError:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor."
+                )
+
+        items, next_cursor = await self.repo.get_all_by_cursor(
+            project_id=project_id,
+            filters=filters_dto,
+            sorting=sorting_dto,
+            pagination=common_dto.CursorPaginationDto(
+                size=pagination.size, cursor=cursor_dto
+            ),
+        )
+
+        return common_schemas.BasePaginationResponse(
+            items=items,
+            pagination=common_schemas.BasePaginationMeta(
+                total=None,
+                page=pagination.page,
+                size=pagination.size,
+                include_total="none",
+                next_cursor=(
+                    encode_cursor(next_cursor, sorting=sorting_dto)
+                    if next_cursor
+                    else None
+                ),
+            ),
+        )
+
+    def export(
+        self,
+        project_id: int,
+        filters: schemas.ProjectTasksFiltersParams,
+        sorting: schemas.ProjectTasksSortingParams,
+        export_format: ExportFormat,
+    ) -> AsyncIterator[bytes]:
+        """All matching tasks encoded as they are read, without paging or counting"""
+        filters_dto = dto.ProjectTaskFilterDto(**filters.model_dump(exclude_unset=True))
+        sorting_dto = common_dto.SortingDto(**sorting.model_dump(exclude_unset=True))
+
+        tasks = self.repo.stream_all(
+            project_id=project_id, filters=filters_dto, sorting=sorting_dto
+        )
+
+        return encode_rows(
+            tasks,
+            schemas.ProjectTaskRead,
+            export_format,
+            chunk_size=settings.export.yield_per,
+        )
+
     async def create(
         self,
         project_id: int,
@@ -70,6 +155,7 @@ class ProjectTaskService:
         task = await self.repo.create(
             project_id=project_id, created_by_id=actor.user_id, data=task_dict
         )
+        await invalidate_project_responses(project_id, PROJECT_TASKS)
 
         return task
 
@@ -79,25 +165,12 @@ class ProjectTaskService:
         task: model.ProjectTask,
         actor: ProjectMemberModel,
         update_data: schemas.ProjectTaskPatch,
+        expected_updated_at: datetime | None = None,
     ) -> model.ProjectTask:
+        """With 'expected_updated_at' a task changed since reading isn't written"""
         update_dict = update_data.model_dump(exclude_unset=True)
 
-        if not update_dict:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST, detail="No data to update."
-            )
-
-        is_own_task = actor.user_id == task.assignee_id
-        update_fields = list(update_dict.keys())
-
-        if is_own_task and update_fields == ["status"]:
-            PermissionChecker.require_permission(
-                role=actor.role, permission=ProjectPermission.UPDATE_OWN_TASK_STATUS
-            )
-        else:
-            PermissionChecker.require_permission(
-                role=actor.role, permission=ProjectPermission.UPDATE_TASKS
-            )
+        self._check_update(task=task, actor=actor, update_dict=update_dict)
 
         if task.type == ProjectTaskType.DEFAULT and "assignee_id" in update_dict:
             is_user = await self.member_repo.get_by_user_id_and_project_id(
@@ -109,18 +182,174 @@ class ProjectTaskService:
                     detail="User not found.",
                 )
 
-        if task.type == ProjectTaskType.OPEN and "assignee_id" in update_dict:
+        updated_task = await self.repo.update_by_task(
+            task=task, data=update_dict, expected_updated_at=expected_updated_at
+        )
+        if updated_task is None:
             raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="You cannot add assignee to open task.",
+                status_code=status.HTTP_412_PRECONDITION_FAILED,
+                detail="Task was modified by another request.",
             )
 
-        updated_task = await self.repo.update_by_task(task=task, data=update_dict)
+        await invalidate_project_responses(project_id, PROJECT_TASKS)
 
         return updated_task
 
+    async def create_batch(
+        self,
+        project_id: int,
+        actor: ProjectMemberModel,
+        batch_data: schemas.ProjectTaskBatchCreate,
+    ) -> schemas.ProjectTaskBatchResponse:
+        """Create the valid items in one transaction, invalid ones are reported"""
+        member_ids = await self.member_repo.get_user_ids_in_project(
+            project_id=project_id,
+            user_ids=[
+                item.assignee_id
+                for item in batch_data.items
+                if item.assignee_id is not None
+            ],
+        )
+
+        results: dict[int, schemas.ProjectTaskBatchResult] = {}
+        valid: dict[int, dict] = {}
+        now = utc_now()
+        for index, item in enumerate(batch_data.items):
+            is_default = item.type == ProjectTaskType.DEFAULT
+            if is_default and item.assignee_id not in member_ids:
+                results[index] = _rejected(
+                    index, None, status.HTTP_404_NOT_FOUND, "User not found."
+                )
+                continue
+
+            # Every row of a multi-row insert has the same keys
+            valid[index] = {
+                **item.model_dump(),
+                "assigned_at": now if is_default else None,
+            }
+
+        if valid:
+            tasks = await self.repo.create_many(
+                project_id=project_id,
+                created_by_id=actor.user_id,
+                items=list(valid.values()),
+            )
+            for index, task in zip(valid, tasks):
+                results[index] = schemas.ProjectTaskBatchResult(
+                    index=index, id=task.id, status=status.HTTP_201_CREATED, task=task
+                )
+            await invalidate_project_responses(project_id, PROJECT_TASKS)
+
+        return _batch_response(results)
+
+    async def update_batch(
+        self,
+        project_id: int,
+        actor: ProjectMemberModel,
+        batch_data: schemas.ProjectTaskBatchPatch,
+    ) -> schemas.ProjectTaskBatchResponse:
+        """Apply the valid patches in one transaction, invalid ones are reported"""
+        items = batch_data.items
+        # Locked until the updates are committed
+        tasks = await self.repo.get_many(
+            project_id=project_id,
+            task_ids=[item.id for item in items],
+            for_update=True,
+        )
+        member_ids = await self.member_repo.get_user_ids_in_project(
+            project_id=project_id,
+            user_ids=[
+                item.assignee_id for item in items if item.assignee_id is not None
+            ],
+        )
+
+        results: dict[int, schemas.ProjectTaskBatchResult] = {}
+        valid: dict[int, tuple[model.ProjectTask, dict]] = {}
+        duplicates = _duplicates([item.id for item in items])
+        for index, item in enumerate(items):
+            update_dict = item.model_dump(exclude_unset=True, exclude={"id"})
+            task = tasks.get(item.id)
+            try:
+                if index in duplicates:
+                    raise _duplicate_error()
+                if task is None:
+                    raise _task_not_found_error()
+
+                self._check_update(task=task, actor=actor, update_dict=update_dict)
+
+                if (
+                    task.type == ProjectTaskType.DEFAULT
+                    and "assignee_id" in update_dict
+                    and update_dict["assignee_id"] not in member_ids
+                ):
+                    raise HTTPException(
+                        status_code=status.HTTP_404_NOT_FOUND,
+                        detail="User not found.",
+                    )
+            except HTTPException as e:
+                results[index] = _rejected(index, item.id, e.status_code, e.detail)
+                continue
+
+            valid[index] = (task, update_dict)
+
+        if valid:
+            updated_tasks = await self.repo.update_many(
+                project_id=project_id, updates=list(valid.values())
+            )
+            updated_by_id = {task.id: task for task in updated_tasks}
+            for index, (task, _) in valid.items():
+                task_id = task.id
+                updated_task = updated_by_id.get(task_id)
+                if updated_task is None:
+                    # Not written by the update, reported instead of failing the batch
+                    error = _task_not_found_error()
+                    results[index] = _rejected(
+                        index, task_id, error.status_code, error.detail
+                    )
+                    continue
+
+                results[index] = schemas.ProjectTaskBatchResult(
+                    index=index,
+                    id=task_id,
+                    status=status.HTTP_200_OK,
+                    task=updated_task,
+                )
+            await invalidate_project_responses(project_id, PROJECT_TASKS)
+
+        return _batch_response(results)
+
+    async def delete_batch(
+        self, project_id: int, batch_data: schemas.ProjectTaskBatchDelete
+    ) -> schemas.ProjectTaskBatchResponse:
+        """Delete the listed tasks of the project in one statement"""
+        ids = batch_data.ids
+        duplicates = _duplicates(ids)
+        deleted_ids = await self.repo.delete_many(
+            project_id=project_id, task_ids=list(set(ids))
+        )
+        if deleted_ids:
+            await invalidate_project_responses(project_id, PROJECT_TASKS)
+
+        results: dict[int, schemas.ProjectTaskBatchResult] = {}
+        for index, task_id in enumerate(ids):
+            if index in duplicates:
+                error = _duplicate_error()
+            elif task_id not in deleted_ids:
+                error = _task_not_found_error()
+            else:
+                results[index] = schemas.ProjectTaskBatchResult(
+                    index=index, id=task_id, status=status.HTTP_204_NO_CONTENT
+                )
+                continue
+
+            results[index] = _rejected(index, task_id, error.status_code, error.detail)
+
+        return _batch_response(results)
+
     async def delete(self, task: model.ProjectTask) -> None:
+        project_id = task.project_id
         await self.repo.delete_by_task(task)
+        await invalidate_project_responses(project_id, PROJECT_TASKS)
 
     async def assign(
         self, task: model.ProjectTask, actor: ProjectMemberModel
@@ -136,6 +365,7 @@ class ProjectTaskService:
         }
 
         assigned_task = await self.repo.update_by_task(task=task, data=data)
+        await invalidate_project_responses(task.project_id, PROJECT_TASKS)
 
         return assigned_task
 
@@ -162,5 +392,75 @@ class ProjectTaskService:
         }
 
         unassigned_task = await self.repo.update_by_task(task=task, data=data)
+        await invalidate_project_responses(task.project_id, PROJECT_TASKS)
 
         return unassigned_task
+
+    @staticmethod
+    def _check_update(
+        task: model.ProjectTask, actor: ProjectMemberModel, update_dict: dict
+    ) -> None:
+        """Checks of a task update that need no queries"""
+        if not update_dict:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST, detail="No data to update."
+            )
+
+        is_own_task = actor.user_id == task.assignee_id
+        update_fields = list(update_dict.keys())
+
+        if is_own_task and update_fields == ["status"]:
+            PermissionChecker.require_permission(
+                role=actor.role, permission=ProjectPermission.UPDATE_OWN_TASK_STATUS
+            )
+        else:
+            PermissionChecker.require_permission(
+                role=actor.role, permission=ProjectPermission.UPDATE_TASKS
+            )
+
+        if task.type == ProjectTaskType.OPEN and "assignee_id" in update_dict:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="You cannot add assignee to open task.",
+            )
+
+
+def _rejected(
+    index: int, task_id: int | None, status_code: int, detail: str
+) -> schemas.ProjectTaskBatchResult:
+    return schemas.ProjectTaskBatchResult(
+        index=index, id=task_id, status=status_code, detail=detail
+    )
+
+
+def _batch_response(
+    results: dict[int, schemas.ProjectTaskBatchResult],
+) -> schemas.ProjectTaskBatchResponse:
+    return schemas.ProjectTaskBatchResponse(
+        results=[results[index] for index in sorted(results)]
+    )
+
+
+def _duplicates(ids: list[int]) -> set[int]:
+    """Indexes of the ids that are listed earlier in the batch"""
+    seen = set()
+    duplicates = set()
+    for index, task_id in enumerate(ids):
+        if task_id in seen:
+            duplicates.add(index)
+        seen.add(task_id)
+
+    return duplicates
+
+
+def _duplicate_error() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail="Task is listed more than once.",
+    )
+
+
+def _task_not_found_error() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_404_NOT_FOUND, detail="Project task not found"
+    )
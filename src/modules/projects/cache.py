@@ -0,0 +1,36 @@
+from core.config import settings
+from db.invalidation import cache_invalidations
+from utils.response_cache import MemoryCacheBackend, ResponseCache
+
+# Scopes of the cached project responses, suffixed with the project id
+PROJECT = "project"
+PROJECT_TASKS = "project_tasks"
+PROJECT_MEMBERS = "project_members"
+
+# Kind of the response invalidations sent to the other workers
+RESPONSES = "project_responses"
+
+# Project details and the task and member lists. Service writes invalidate
+# the scopes they change, in the backend of every worker.
+project_response_cache = ResponseCache(
+    backend=MemoryCacheBackend(
+        maxsize=settings.cache.response_maxsize, ttl=settings.cache.response_ttl
+    ),
+    ttl=settings.cache.response_ttl,
+)
+
+
+async def invalidate_project_responses(project_id: int, *scopes: str) -> None:
+    """Drop cached responses of the project, all of them without 'scopes'"""
+    scopes = scopes or (PROJECT, PROJECT_TASKS, PROJECT_MEMBERS)
+    scopes = [f"{scope}:{project_id}" for scope in scopes]
+
+    await project_response_cache.invalidate(*scopes)
+    for scope in scopes:
+        cache_invalidations.publish(RESPONSES, scope)
+
+
+# A shared backend would see the invalidations without them
+cache_invalidations.subscribe(
+    RESPONSES, project_response_cache.invalidate, project_response_cache.clear
+)
@@ -1,19 +1,58 @@
+from functools import cache
 from typing import TYPE_CHECKING
 from datetime import datetime
-from sqlalchemy import ForeignKey, DateTime, Enum as SQLEnum
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy import (
+    ForeignKey,
+    DateTime,
+    Enum as SQLEnum,
+    Index,
+    and_,
+    case,
+    func,
+    select,
+)
+from sqlalchemy.orm import (
+    Mapped,
+    aliased,
+    column_property,
+    mapped_column,
+    relationship,
+)
 
+from core.config import settings
 from db.base import Base
-from db.mixins import TimestampMixin
-from enums.project import ProjectStatus
+from db.mixins import TimestampMixin, SearchVectorMixin
+from enums.project import ProjectRole, ProjectStatus
+from modules.project_members.model import ProjectMember
 
 if TYPE_CHECKING:
     from modules.users.model import User
-    from modules.project_members.model import ProjectMember
     from modules.project_tasks.model import ProjectTask
 
 
-class Project(Base, TimestampMixin):
+@cache
+def _ranked_members():
+    """
+    Members numbered within their project: highest role first, then join order.
+    Filtering by project_id is pushed down into the window subquery.
+    Built on first use, aliasing needs configured mappers.
+    """
+    role_order = case(
+        *[(ProjectMember.role == role.name, role.sort_order) for role in ProjectRole],
+        else_=0,
+    )
+    position = func.row_number().over(
+        partition_by=ProjectMember.project_id,
+        order_by=(role_order.desc(), ProjectMember.joined_at, ProjectMember.id),
+    )
+    ranked = select(ProjectMember, position.label("position")).subquery(
+        "ranked_members"
+    )
+
+    return aliased(ProjectMember, ranked), ranked.c.position
+
+
+class Project(Base, TimestampMixin, SearchVectorMixin):
     __tablename__ = "projects"
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
@@ -38,3 +77,27 @@ class Project(Base, TimestampMixin):
     tasks: Mapped[list["ProjectTask"]] = relationship(
         back_populates="project", cascade="all, delete-orphan", lazy="raise_on_sql"
     )
+
+    # First members by role, read instead of the whole member list
+    members_preview: Mapped[list["ProjectMember"]] = relationship(
+        lambda: _ranked_members()[0],
+        primaryjoin=lambda: and_(
+            _ranked_members()[0].project_id == Project.id,
+            _ranked_members()[1] <= settings.project.members_preview_size,
+        ),
+        order_by=lambda: _ranked_members()[1],
+        viewonly=True,
+        lazy="raise_on_sql",
+    )
+    member_count: Mapped[int] = column_property(
+        select(func.count())
+        .where(ProjectMember.project_id == id)
+        .correlate_except(ProjectMember)
+        .scalar_subquery(),
+        deferred=True,
+        raiseload=True,
+    )
+
+    __table_args__ = (
+        Index("ix_projects_search_vector", "search_vector", postgresql_using="gin"),
+    )
@@ -1,9 +1,12 @@
+from datetime import datetime
 from typing import Sequence
 from sqlalchemy import (
+    Row,
+    Update,
     select,
+    insert,
     update,
     delete,
-    func,
     Select,
     asc,
     desc,
@@ -12,40 +15,65 @@ from sqlalchemy import (
     or_,
     and_,
 )
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import joinedload, selectinload, undefer
+from sqlalchemy.orm.attributes import set_committed_value
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from . import model as project_model, dto as project_dto
 from modules.project_members import model as member_model
+from modules.project_members.cache import membership_cache
 from modules.users import model as user_model
 from common import dto as common_dto
+from core.config import settings
+from db.counting import CountCache
+from db.pagination import fetch_page
+from db.returning import fetch_written
+from db.search import any_of, matches, relevance
+from db.unit_of_work import memoized, forget
 from enums.project import ProjectRole, ProjectStatus
 from utils.datetime import utc_now
 
 
+def touch_project(project_id: int) -> Update:
+    """
+    Move 'updated_at' of the project, members are a part of the project
+    representation, so membership writes change its version too.
+    """
+    return (
+        update(project_model.Project)
+        .where(project_model.Project.id == project_id)
+        .values(updated_at=utc_now())
+    )
+
+
 class ProjectRepository:
+    # Exact totals per user, shared by all instances
+    count_cache = CountCache(
+        maxsize=settings.cache.count_maxsize, ttl=settings.cache.count_ttl
+    )
+
     def __init__(self, db: AsyncSession):
         self.db = db
 
     async def create(self, user_id: int, data: dict) -> project_model.Project:
-        project = project_model.Project(
-            creator_id=user_id,
-            **data,
-        )
+        stmt = insert(project_model.Project).values(creator_id=user_id, **data)
+        project = await fetch_written(self.db, stmt, joined=["creator"])
 
-        project.members.append(
-            member_model.ProjectMember(
-                user_id=user_id,
-                role=ProjectRole.OWNER,
-            )
+        owner = member_model.ProjectMember(
+            project_id=project.id,
+            user_id=user_id,
+            role=ProjectRole.OWNER,
         )
-
-        self.db.add(project)
+        self.db.add(owner)
         await self.db.commit()
+        self.count_cache.invalidate(user_id)
+        membership_cache.invalidate(user_id, project.id)
 
-        full_project = await self.get_by_id(project.id)
+        # The owner is the only member, no need to load them back
+        set_committed_value(project, "members_preview", [owner])
+        set_committed_value(project, "member_count", 1)
 
-        return full_project
+        return project
 
     async def get_all(
         self,
@@ -53,33 +81,28 @@ class ProjectRepository:
         filters: project_dto.ProjectFilterDto,
         sorting: common_dto.SortingDto,
         pagination: common_dto.PaginationDto,
-    ) -> tuple[Sequence[project_model.Project], int]:
+    ) -> tuple[Sequence[project_model.Project], int | None]:
         # Basic stmt
         stmt = (
             select(project_model.Project)
             .join(project_model.Project.members)
             .where(member_model.ProjectMember.user_id == user_id)
-            .options(
-                selectinload(project_model.Project.creator),
-                selectinload(project_model.Project.members),
-            )
         )
 
         # Apply filters
         stmt = self._apply_filters(stmt, filters)
 
-        # Calculate the total count
-        count_query = select(func.count()).select_from(stmt.subquery())
-        total = await self.db.scalar(count_query) or 0
-
-        # Apply sorting
-        stmt = self._apply_sorting(stmt, sorting)
-
-        # Apply pagination
-        stmt = stmt.limit(pagination.size).offset(pagination.offset)
-
-        result = await self.db.execute(stmt)
-        items = result.scalars().all()
+        # Fetch the sorted page with its total in one statement
+        items, total = await fetch_page(
+            self.db,
+            stmt,
+            pagination,
+            sort=lambda s: self._apply_sorting(s, sorting, filters.search),
+            options=self._load_options(project_model.Project),
+            cache=self.count_cache,
+            scope_id=user_id,
+            filters=filters,
+        )
 
         return items, total
 
@@ -87,35 +110,51 @@ class ProjectRepository:
         stmt = (
             select(project_model.Project)
             .where(project_model.Project.id == project_id)
-            .options(
-                selectinload(project_model.Project.creator),
-                selectinload(project_model.Project.members),
-            )
+            .options(*self._load_options(project_model.Project))
+        )
+
+        async def load() -> project_model.Project | None:
+            result = await self.db.execute(stmt)
+            return result.scalar_one_or_none()
+
+        return await memoized(("project", project_id), load)
+
+    async def get_version_by_id(self, project_id: int) -> Row | None:
+        """(updated_at, creator's updated_at) of the project, None when it's gone"""
+        stmt = (
+            select(project_model.Project.updated_at, user_model.User.updated_at)
+            .join(project_model.Project.creator)
+            .where(project_model.Project.id == project_id)
         )
         result = await self.db.execute(stmt)
 
-        return result.scalar_one_or_none()
+        return result.one_or_none()
 
     async def update_by_id(
-        self, project_id: int, data: dict
+        self, project_id: int, data: dict, expected_updated_at: datetime | None = None
     ) -> project_model.Project | None:
+        """
+        With 'expected_updated_at' the project is written only if it wasn't
+        updated since, None is returned otherwise.
+        """
         stmt = (
             update(project_model.Project)
             .where(project_model.Project.id == project_id)
             .values(**data)
-            .returning(project_model.Project.id)
         )
+        if expected_updated_at is not None:
+            stmt = stmt.where(project_model.Project.updated_at == expected_updated_at)
 
-        result = await self.db.execute(stmt)
-        project_id = result.scalar_one_or_none()
+        project = await fetch_written(self.db, stmt, options=self._load_options)
 
-        if project_id is None:
+        if project is None:
             return None
         await self.db.commit()
+        # Filtered totals of every member may change
+        self.count_cache.clear()
+        forget(("project", project_id))
 
-        full_project = await self.get_by_id(project_id)
-
-        return full_project
+        return project
 
     async def delete_by_id(self, project_id: int) -> None:
         stmt = delete(project_model.Project).where(
@@ -124,6 +163,21 @@ class ProjectRepository:
 
         await self.db.execute(stmt)
         await self.db.commit()
+        self.count_cache.clear()
+        membership_cache.invalidate_project(project_id)
+        forget(("project", project_id))
+
+    @staticmethod
+    def _load_options(entity) -> list:
+        """
+        Relations of a project response. Only a preview of the members is read,
+        a separate statement per page keeps the window limited to its projects.
+        """
+        return [
+            joinedload(entity.creator),
+            selectinload(entity.members_preview),
+            undefer(entity.member_count),
+        ]
 
     def _apply_filters(
         self, stmt: Select, filters: project_dto.ProjectFilterDto
@@ -162,22 +216,36 @@ class ProjectRepository:
                 )
 
         if filters.search:
-            stmt = stmt.join(project_model.Project.creator)
-
-            search_term = f"%{filters.search}%"
+            # Creator names are matched into ids first (trigram index of users),
+            # so no join is needed
+            creator_ids = any_of(
+                select(user_model.User.id).where(
+                    user_model.User.username.ilike(f"%{filters.search}%")
+                )
+            )
             search_filters = [
-                project_model.Project.title.ilike(search_term),
-                project_model.Project.description.ilike(search_term),
-                user_model.User.username.ilike(search_term),
+                matches(project_model.Project.search_vector, filters.search),
+                project_model.Project.creator_id == creator_ids,
             ]
 
             stmt = stmt.where(or_(*search_filters))
 
         return stmt
 
-    def _apply_sorting(self, stmt: Select, sorting: common_dto.SortingDto) -> Select:
+    def _apply_sorting(
+        self,
+        stmt: Select,
+        sorting: common_dto.SortingDto,
+        search: str | None = None,
+    ) -> Select:
         # Sort by
-        if sorting.sort_by == "status":
+        if sorting.sort_by == "relevance":
+            sort_by = relevance(
+                project_model.Project.search_vector,
+                search,
+                project_model.Project.created_at,
+            )
+        elif sorting.sort_by == "status":
             sort_by = self._get_status_order_case()
         else:
             sort_by = getattr(project_model.Project, sorting.sort_by)
@@ -30,7 +30,9 @@ class ProjectRead(BaseModel):
     deadline: datetime | None
     status: ProjectStatus
     creator: ProjectCreatorRead
-    members: list[ProjectMemberBrief]
+    # Highest roles first, all members are listed by the members endpoint
+    members_preview: list[ProjectMemberBrief]
+    member_count: int
 
     model_config = ConfigDict(from_attributes=True)
 
@@ -80,6 +82,9 @@ class ProjectFilterParams(BaseModel):
 class ProjectSortingParams(BaseSortingParams):
     """Query parameters for project sorting"""
 
-    sort_by: Literal["deadline", "status", "created_at", "updated_at"] = Field(
-        "created_at", description="Fields to sort by"
+    sort_by: Literal["deadline", "status", "created_at", "updated_at", "relevance"] = (
+        Field(
+            "created_at",
+            description="Fields to sort by. 'relevance' ranks by the search term",
+        )
     )
@@ -1,6 +1,9 @@
+from datetime import datetime
+
 from fastapi import HTTPException, status
 
 from . import model, repository, schemas as project_schemas, dto as project_dto
+from .cache import PROJECT, invalidate_project_responses
 from common import schemas as common_schema, dto as common_dto
 
 
@@ -30,7 +33,9 @@ class ProjectService:
         )
         sorting_dto = common_dto.SortingDto(**sorting.model_dump(exclude_unset=True))
         pagination_dto = common_dto.PaginationDto(
-            size=pagination.size, offset=pagination.offset
+            size=pagination.size,
+            offset=pagination.offset,
+            include_total=pagination.include_total,
         )
 
         items, total = await self.repo.get_all(
@@ -46,6 +51,7 @@ class ProjectService:
                 total=total,
                 page=pagination.page,
                 size=pagination.size,
+                include_total=pagination.include_total,
             ),
         )
 
@@ -53,8 +59,12 @@ class ProjectService:
         return await self.repo.get_by_id(project_id=project_id)
 
     async def update(
-        self, project_id: int, update_data: project_schemas.ProjectPatch
+        self,
+        project_id: int,
+        update_data: project_schemas.ProjectPatch,
+        expected_updated_at: datetime | None = None,
     ) -> model.Project:
+        """With 'expected_updated_at' a project changed since reading isn't written"""
         update_dict = update_data.model_dump(exclude_unset=True)
 
         if not update_dict:
@@ -63,10 +73,20 @@ class ProjectService:
             )
 
         updated_project = await self.repo.update_by_id(
-            project_id=project_id, data=update_dict
+            project_id=project_id,
+            data=update_dict,
+            expected_updated_at=expected_updated_at,
         )
+        if updated_project is None and expected_updated_at is not None:
+            raise HTTPException(
+                status_code=status.HTTP_412_PRECONDITION_FAILED,
+                detail="Project was modified by another request.",
+            )
+
+        await invalidate_project_responses(project_id, PROJECT)
 
         return updated_project
 
     async def delete(self, project_id: int) -> None:
         await self.repo.delete_by_id(project_id=project_id)
+        await invalidate_project_responses(project_id)
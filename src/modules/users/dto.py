@@ -0,0 +1,10 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class UserPrincipalDto:
+    """Identity of the authenticated user, without a database row behind it"""
+
+    id: int
+    username: str
+    email: str
@@ -1,8 +1,12 @@
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, update, delete, or_
+from sqlalchemy import select, update, delete, or_, union
 from pydantic import EmailStr
 
 from .model import User
+from db.unit_of_work import memoized, forget
+from modules.projects.model import Project
+from modules.project_members.model import ProjectMember
+from modules.project_tasks.model import ProjectTask
 
 
 class UserRepository:
@@ -23,6 +27,7 @@ class UserRepository:
         )
         result = await self.db.execute(query)
         await self.db.commit()
+        forget(("user", user_id))
 
         return result.scalar_one()
 
@@ -34,9 +39,10 @@ class UserRepository:
 
         await self.db.execute(query)
         await self.db.commit()
+        forget(("user", user_id))
 
     async def get_by_id(self, user_id: int) -> User | None:
-        return await self.db.get(User, user_id)
+        return await memoized(("user", user_id), lambda: self.db.get(User, user_id))
 
     async def get_by_username(self, username: str) -> User | None:
         query = select(User).where(User.username == username)
@@ -62,3 +68,18 @@ class UserRepository:
         result = await self.db.execute(query)
 
         return result.scalar_one_or_none()
+
+    async def get_shown_project_ids(self, user_id: int) -> list[int]:
+        """
+        Projects whose responses show the user: as their creator, a member,
+        or the assignee or creator of one of their tasks
+        """
+        query = union(
+            select(Project.id).where(Project.creator_id == user_id),
+            select(ProjectMember.project_id).where(ProjectMember.user_id == user_id),
+            select(ProjectTask.project_id).where(ProjectTask.assignee_id == user_id),
+            select(ProjectTask.project_id).where(ProjectTask.created_by_id == user_id),
+        )
+        result = await self.db.execute(query)
+
+        return list(result.scalars())
@@ -4,8 +4,11 @@ from . import (
     repository as user_repository,
     model as user_model,
     schemas as user_schemas,
+    dto as user_dto,
 )
 from core.security.password import PasswordHasher
+from modules.auth.service import AuthService
+from modules.projects.cache import invalidate_project_responses
 
 
 class UserService:
@@ -15,8 +18,18 @@ class UserService:
     ):
         self.user_repo = user_repo
 
+    async def get_me(self, user: user_dto.UserPrincipalDto) -> user_model.User:
+        db_user = await self.user_repo.get_by_id(user_id=user.id)
+
+        if not db_user:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, detail="User not found"
+            )
+
+        return db_user
+
     async def update_me(
-        self, update_data: user_schemas.UserPatch, user: user_model.User
+        self, update_data: user_schemas.UserPatch, user: user_dto.UserPrincipalDto
     ) -> user_model.User:
         update_dict = update_data.model_dump(exclude_unset=True)
 
@@ -40,7 +53,7 @@ class UserService:
                 )
 
         if "password" in update_dict:
-            update_dict["hashed_password"] = PasswordHasher.hash(
+            update_dict["hashed_password"] = await PasswordHasher.ahash(
                 update_dict["password"]
             )
             update_dict.pop("password")
@@ -49,8 +62,23 @@ class UserService:
             user_id=user.id,
             update_data=update_dict,
         )
+        AuthService.invalidate_principal(user.id)
+        if "username" in update_dict or "email" in update_dict:
+            await self._invalidate_shown_in(
+                await self.user_repo.get_shown_project_ids(user.id)
+            )
 
         return updated_user
 
-    async def delete_me(self, user: user_model.User):
+    async def delete_me(self, user: user_dto.UserPrincipalDto):
+        # Taken before the memberships and projects are deleted with the user
+        project_ids = await self.user_repo.get_shown_project_ids(user.id)
         await self.user_repo.delete_by_id(user_id=user.id)
+        AuthService.invalidate_principal(user.id)
+        await self._invalidate_shown_in(project_ids)
+
+    @staticmethod
+    async def _invalidate_shown_in(project_ids: list[int]) -> None:
+        """Cached project responses show the user's username and email"""
+        for project_id in project_ids:
+            await invalidate_project_responses(project_id)
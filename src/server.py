@@ -0,0 +1,246 @@
+"""
+Production server: pre-forked uvicorn workers sharing one listening socket.
+
+The app is imported once by the master and forked into the workers (their
+pages are shared until written). Every worker runs its own event loop, with
+uvloop and httptools when they are installed, and its own connection pool,
+sized so that all workers together stay under '--db-connections' (with the
+connection listening for cache invalidations of the others). On SIGTERM
+or SIGINT the workers stop accepting, finish their open requests and are
+killed after '--graceful-timeout'. A worker that dies is started again.
+
+    PYTHONPATH=src python src/server.py --workers 4 --db-connections 40
+
+'src/main.py' stays the development launcher (one process, reload).
+"""
+
+import argparse
+import logging
+import math
+import os
+import signal
+import socket
+import sys
+import threading
+import time
+
+import uvicorn
+
+from core.config import DatabaseConfig, settings
+
+logger = logging.getLogger("uvicorn.error")
+
+# A worker dying sooner is restarted after this delay, not in a tight loop
+MIN_WORKER_UPTIME = 1.0
+# Seconds the master waits for the workers after the graceful timeout
+KILL_GRACE = 5
+
+
+def worker_pool_sizes(
+    config: DatabaseConfig, workers: int, budget: int | None, reserved: int = 0
+) -> tuple[int, int]:
+    """
+    pool_size and max_overflow of every worker, the configured ones lowered
+    until 'workers' pools open at most 'budget' connections to a database,
+    together with 'reserved' connections of every worker outside its pool
+    """
+    if budget is None:
+        return config.pool_size, config.max_overflow
+
+    per_worker = budget // workers - reserved
+    if per_worker < 1:
+        raise ValueError(
+            f"{budget} database connections can't be shared by {workers} workers"
+        )
+
+    pool_size = min(config.pool_size, per_worker)
+    max_overflow = min(config.max_overflow, per_worker - pool_size)
+
+    return pool_size, max_overflow
+
+
+def unshared_state() -> list[str]:
+    """
+    Enabled settings keeping state that every worker would have its own of:
+    caches invalidated by the writes of their own worker only, and request
+    metrics a scrape would read from one worker
+    """
+    state = []
+    if not settings.cache.shared_invalidation:
+        for name in ("principal_ttl", "membership_ttl", "response_ttl"):
+            if getattr(settings.cache, name) > 0:
+                state.append(f"CACHE__{name.upper()}")
+    if settings.metrics.enabled:
+        state.append("METRICS__ENABLED")
+
+    return state
+
+
+class Master:
+    """Forks the workers, restarts the ones that die and drains them on exit"""
+
+    def __init__(self, config: uvicorn.Config, workers: int, graceful_timeout: float):
+        self.config = config
+        self.workers = workers
+        self.graceful_timeout = graceful_timeout
+        self.pid = os.getpid()
+        # pid of every worker with the time it was started
+        self.children: dict[int, float] = {}
+        self.stopping = False
+
+    def run(self) -> None:
+        sock = self.config.bind_socket()
+        signal.signal(signal.SIGTERM, self.stop)
+        signal.signal(signal.SIGINT, self.stop)
+
+        for _ in range(self.workers):
+            self.spawn(sock)
+
+        while self.children:
+            try:
+                pid, status = os.wait()
+            except ChildProcessError:
+                break
+
+            started = self.children.pop(pid, None)
+            if started is None or self.stopping:
+                continue
+
+            logger.error(
+                "Worker %d exited with %d, starting another",
+                pid,
+                os.waitstatus_to_exitcode(status),
+            )
+            if time.monotonic() - started < MIN_WORKER_UPTIME:
+                time.sleep(MIN_WORKER_UPTIME)
+            # A signal while sleeping may have started the shutdown
+            if not self.stopping:
+                self.spawn(sock)
+
+        sock.close()
+        logger.info("Stopped %d workers", self.workers)
+
+    def spawn(self, sock: socket.socket) -> None:
+        pid = os.fork()
+        if pid:
+            self.children[pid] = time.monotonic()
+            return
+
+        code = 0
+        try:
+            self.serve(sock)
+        except BaseException:
+            logger.exception("Worker %d failed", os.getpid())
+            code = 1
+        finally:
+            sys.stdout.flush()
+            sys.stderr.flush()
+            # Never return into the master's loop
+            os._exit(code)
+
+    def serve(self, sock: socket.socket) -> None:
+        # Own process group, a Ctrl+C of the terminal reaches only the master,
+        # which drains the workers with a single SIGTERM each
+        os.setpgid(0, 0)
+        signal.signal(signal.SIGTERM, signal.SIG_DFL)
+        signal.signal(signal.SIGINT, signal.SIG_DFL)
+
+        server = uvicorn.Server(self.config)
+        threading.Thread(
+            target=self._watch_master, args=(server,), name="master", daemon=True
+        ).start()
+        logger.info("Started worker %d", os.getpid())
+        server.run(sockets=[sock])
+
+    def _watch_master(self, server: uvicorn.Server) -> None:
+        """Drain the worker when the master is gone (e.g. killed with SIGKILL)"""
+        while os.getppid() == self.pid:
+            time.sleep(1)
+        server.should_exit = True
+
+    def stop(self, signum: int, frame: object) -> None:
+        if self.stopping:
+            return
+        self.stopping = True
+
+        logger.info("Draining %d workers", len(self.children))
+        for pid in self.children:
+            os.kill(pid, signal.SIGTERM)
+
+        signal.signal(signal.SIGALRM, self.kill)
+        signal.alarm(math.ceil(self.graceful_timeout) + KILL_GRACE)
+
+    def kill(self, signum: int, frame: object) -> None:
+        for pid in self.children:
+            logger.warning("Killing worker %d", pid)
+            os.kill(pid, signal.SIGKILL)
+
+
+def main(args: argparse.Namespace) -> None:
+    workers = args.workers or os.process_cpu_count() or 1
+    if workers > 1 and (state := unshared_state()):
+        sys.exit(
+            f"{workers} workers would keep their own {', '.join(state)}, "
+            "run one worker or disable them"
+        )
+
+    try:
+        pool_size, max_overflow = worker_pool_sizes(
+            settings.db,
+            workers,
+            args.db_connections,
+            # The listener of cache invalidations
+            reserved=int(settings.cache.shared_invalidation),
+        )
+    except ValueError as e:
+        sys.exit(str(e))
+
+    # Read by the engines built when the app is imported
+    settings.db.pool_size = pool_size
+    settings.db.max_overflow = max_overflow
+    settings.db.pool_warmup = min(settings.db.pool_warmup, pool_size)
+
+    from main import app
+
+    config = uvicorn.Config(
+        app,
+        host=args.host,
+        port=args.port,
+        backlog=args.backlog,
+        # uvloop and httptools when installed, asyncio and h11 otherwise
+        loop="auto",
+        http="auto",
+        timeout_graceful_shutdown=args.graceful_timeout,
+        # Ports are bound by the master
+        reload=False,
+        workers=1,
+    )
+    # Loop, protocol and middleware of the workers, loaded before forking
+    config.load()
+
+    logger.info(
+        "Starting %d workers, pool_size %d and max_overflow %d each",
+        workers,
+        pool_size,
+        max_overflow,
+    )
+    Master(config, workers, args.graceful_timeout).run()
+
+
+if __name__ == "__main__":
+    run = settings.run
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--host", default=run.host)
+    parser.add_argument("--port", type=int, default=run.port)
+    parser.add_argument(
+        "--workers", type=int, default=run.workers, help="default: one per CPU"
+    )
+    parser.add_argument(
+        "--db-connections",
+        type=int,
+        default=run.db_connections,
+        help="connections to a database of all workers together",
+    )
+    parser.add_argument("--graceful-timeout", type=float, default=run.graceful_timeout)
+    parser.add_argument("--backlog", type=int, default=run.backlog)
+    main(parser.parse_args())
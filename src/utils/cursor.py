@@ -0,0 +1,78 @@
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import Any
+
+from common.dto import CursorDto, SortingDto
+
+# Ids and integer sort keys are int4 columns or expressions
+_INT_MIN, _INT_MAX = -(2**31), 2**31 - 1
+
+
+def encode_cursor(cursor: CursorDto, sorting: SortingDto) -> str:
+    """
+    Encode cursor into an opaque url-safe token.
+    The sorting is stored too, so the token cannot be reused with another order.
+    """
+    value = cursor.value
+    is_datetime = isinstance(value, datetime)
+
+    payload = {
+        "s": sorting.sort_by,
+        "o": sorting.order,
+        "v": value.isoformat() if is_datetime else value,
+        "d": is_datetime,
+        "i": cursor.id,
+    }
+    raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(
+    token: str, sorting: SortingDto, value_type: type[int] | type[datetime]
+) -> CursorDto:
+    """
+    Decode token created by 'encode_cursor'.
+    'value_type' is the type of the sort key, a value of another type is refused.
+    Raise ValueError if token is malformed or was issued for another sorting.
+    """
+    try:
+        raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+        payload = json.loads(raw)
+
+        if payload["s"] != sorting.sort_by or payload["o"] != sorting.order:
+            raise ValueError("Cursor does not match the requested sorting")
+
+        value = payload["v"]
+        if value is not None:
+            value = _decode_value(value, payload["d"], value_type)
+
+        return CursorDto(value=value, id=_decode_int(payload["i"]))
+    except (binascii.Error, UnicodeDecodeError, TypeError, KeyError) as e:
+        raise ValueError("Malformed cursor") from e
+
+
+def _decode_value(
+    value: Any, is_datetime: Any, value_type: type[int] | type[datetime]
+) -> int | datetime:
+    if value_type is datetime:
+        if is_datetime is not True or not isinstance(value, str):
+            raise ValueError("Cursor value is not a datetime")
+        value = datetime.fromisoformat(value)
+        # Keys are timestamptz columns
+        if value.tzinfo is None:
+            raise ValueError("Cursor datetime has no timezone")
+        return value
+
+    if is_datetime is not False:
+        raise ValueError("Cursor value is not an integer")
+    return _decode_int(value)
+
+
+def _decode_int(value: Any) -> int:
+    # bool is an int subclass, json floats and strings are refused too
+    if type(value) is not int or not _INT_MIN <= value <= _INT_MAX:
+        raise ValueError("Cursor value is not an integer")
+    return value
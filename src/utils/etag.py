@@ -0,0 +1,59 @@
+import hashlib
+from datetime import datetime, timezone
+from typing import Any
+
+
+def make_etag(*parts: Any, weak: bool = True) -> str:
+    """
+    Entity tag of a representation version, e.g. ('project_task', id,
+    updated_at). Parts must have a stable repr (ints, strings, None), datetimes
+    are compared as UTC instants. A strong tag must change with every byte of
+    the representation, so its parts cover everything shown in it.
+    """
+    version = tuple(
+        (
+            part.astimezone(timezone.utc).isoformat()
+            if isinstance(part, datetime)
+            else part
+        )
+        for part in parts
+    )
+    digest = hashlib.blake2b(repr(version).encode(), digest_size=12).hexdigest()
+
+    return f'W/"{digest}"' if weak else f'"{digest}"'
+
+
+def content_etag(body: bytes) -> str:
+    """
+    Weak tag of a rendered representation, for lists: hashing what was sent
+    costs no version query and follows everything that changes the content,
+    also what no row write does (e.g. tasks becoming overdue)
+    """
+    digest = hashlib.blake2b(body, digest_size=12).hexdigest()
+
+    return f'W/"{digest}"'
+
+
+def etag_matches(header: str | None, etag: str, weak: bool = True) -> bool:
+    """
+    Whether an If-None-Match / If-Match value lists 'etag' or is '*'.
+    If-None-Match compares weakly (the 'W/' prefix is ignored), If-Match
+    strongly with 'weak=False': a weak tag never matches (RFC 9110 8.8.3.2).
+    """
+    if header is None:
+        return False
+
+    if header.strip() == "*":
+        return True
+
+    tags = [tag.strip() for tag in header.split(",")]
+    if not weak:
+        return not etag.startswith("W/") and etag in tags
+
+    opaque = _opaque(etag)
+
+    return any(_opaque(tag) == opaque for tag in tags)
+
+
+def _opaque(tag: str) -> str:
+    return tag[2:] if tag.startswith("W/") else tag
@@ -0,0 +1,108 @@
+import csv
+import io
+from types import UnionType
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Iterable,
+    Literal,
+    Union,
+    get_args,
+    get_origin,
+)
+
+from pydantic import BaseModel
+
+ExportFormat = Literal["ndjson", "csv"]
+
+MEDIA_TYPES: dict[str, str] = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv; charset=utf-8",
+}
+
+
+def csv_columns(schema: type[BaseModel], prefix: str = "") -> list[str]:
+    """
+    Header of 'schema' rows, nested models are flattened into dotted columns
+    (e.g. 'assignee.username'), so the header doesn't depend on the first row.
+    """
+    columns = []
+    for name, field in schema.model_fields.items():
+        nested = _nested_model(field.annotation)
+        if nested is None:
+            columns.append(f"{prefix}{name}")
+        else:
+            columns.extend(csv_columns(nested, prefix=f"{prefix}{name}."))
+
+    return columns
+
+
+async def encode_rows(
+    rows: AsyncIterable[Any],
+    schema: type[BaseModel],
+    export_format: ExportFormat,
+    chunk_size: int,
+) -> AsyncIterator[bytes]:
+    """
+    Serialize ORM rows as 'schema' into NDJSON lines or CSV records.
+    Rows are encoded 'chunk_size' at a time, one chunk is held in memory.
+    """
+    if export_format == "csv":
+        columns = csv_columns(schema)
+        yield _encode_csv([columns])
+
+        async for chunk in _chunked(rows, chunk_size):
+            yield _encode_csv(
+                _csv_values(schema.model_validate(row).model_dump(mode="json"), columns)
+                for row in chunk
+            )
+    else:
+        async for chunk in _chunked(rows, chunk_size):
+            yield b"".join(
+                schema.model_validate(row).model_dump_json().encode() + b"\n"
+                for row in chunk
+            )
+
+
+async def _chunked(rows: AsyncIterable[Any], size: int) -> AsyncIterator[list[Any]]:
+    chunk = []
+    async for row in rows:
+        chunk.append(row)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+
+    if chunk:
+        yield chunk
+
+
+def _encode_csv(records: Iterable[list[Any]]) -> bytes:
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows(records)
+
+    return buffer.getvalue().encode()
+
+
+def _csv_values(data: dict, columns: list[str]) -> list[Any]:
+    values = []
+    for column in columns:
+        value = data
+        for key in column.split("."):
+            # A missing nested object (e.g. no assignee) leaves its columns empty
+            value = value.get(key) if value is not None else None
+        values.append(value)
+
+    return values
+
+
+def _nested_model(annotation: Any) -> type[BaseModel] | None:
+    """Model type of a 'Model' or 'Model | None' annotation"""
+    if get_origin(annotation) in (Union, UnionType):
+        args = [arg for arg in get_args(annotation) if arg is not type(None)]
+        annotation = args[0] if len(args) == 1 else None
+
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return annotation
+
+    return None
@@ -0,0 +1,118 @@
+import csv
+import json
+from typing import AsyncIterable, AsyncIterator
+
+from utils.export import ExportFormat
+
+
+async def decode_rows(
+    chunks: AsyncIterable[bytes], import_format: ExportFormat, max_row_size: int
+) -> AsyncIterator[tuple[int, dict | ValueError]]:
+    """
+    Rows of an NDJSON or CSV body as (row number, data) pairs, decoded as the
+    chunks arrive. A row that can't be decoded or is longer than 'max_row_size'
+    bytes comes as ValueError, the following rows are still read.
+    Empty CSV values are left out, so the defaults of the schema apply.
+    """
+    is_csv = import_format == "csv"
+    header = None
+    number = 0
+
+    async for record in _records(chunks, max_row_size, quoted=is_csv):
+        if record is not None and not record.strip():
+            continue
+
+        if is_csv and header is None:
+            if record is None:
+                raise ValueError("CSV header is too long")
+            try:
+                header = _parse_csv(record)
+            except csv.Error as e:
+                raise ValueError(f"CSV header can't be read: {e}")
+            continue
+
+        number += 1
+        if record is None:
+            yield number, ValueError(f"Row is longer than {max_row_size} bytes")
+            continue
+
+        try:
+            if is_csv:
+                values = _parse_csv(record)
+                if len(values) > len(header):
+                    raise ValueError("Row has more values than the header")
+                data = {key: value for key, value in zip(header, values) if value}
+            else:
+                data = json.loads(record)
+                if not isinstance(data, dict):
+                    raise ValueError("Row is not a JSON object")
+        except (ValueError, csv.Error) as e:
+            yield number, ValueError(str(e))
+            continue
+
+        yield number, data
+
+
+async def _records(
+    chunks: AsyncIterable[bytes], max_size: int, quoted: bool
+) -> AsyncIterator[bytes | None]:
+    """
+    Newline separated records, None for a record longer than 'max_size'.
+    With 'quoted' a newline inside a double-quoted value doesn't end the
+    record (CSV), an oversized record is skipped up to the newline after
+    its closing quote. At most one record and one chunk are held in memory.
+    """
+    buffer = b""
+    record = b""
+    started = False
+    # Skipping the rest of an oversized record, 'open_quote' is set while
+    # the skipped bytes end inside a quoted value
+    oversized = False
+    open_quote = False
+
+    def odd_quotes(data: bytes) -> bool:
+        return quoted and data.count(b'"') % 2 == 1
+
+    async for chunk in chunks:
+        *lines, buffer = (buffer + chunk).split(b"\n")
+
+        for line in lines:
+            if oversized:
+                # Rest of the oversized record, it ends outside of quotes
+                open_quote ^= odd_quotes(line)
+                if not open_quote:
+                    yield None
+                    oversized = False
+                continue
+
+            record = record + b"\n" + line if started else line
+            started = True
+            if len(record) > max_size:
+                open_quote = odd_quotes(record)
+                record, started, oversized = b"", False, open_quote
+                if not oversized:
+                    yield None
+                continue
+            if odd_quotes(record):
+                # Newline inside a quoted value, the record goes on
+                continue
+
+            yield record
+            record, started = b"", False
+
+        if oversized:
+            open_quote ^= odd_quotes(buffer)
+            buffer = b""
+        elif len(record) + len(buffer) > max_size:
+            open_quote = odd_quotes(record) ^ odd_quotes(buffer)
+            buffer, record, started, oversized = b"", b"", False, True
+
+    if oversized:
+        yield None
+    elif started or buffer:
+        record = record + b"\n" + buffer if started else buffer
+        yield record if len(record) <= max_size else None
+
+
+def _parse_csv(record: bytes) -> list[str]:
+    return next(csv.reader([record.decode("utf-8-sig")]), [])
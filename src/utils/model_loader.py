@@ -1,10 +1,21 @@
-import importlib
-import pkgutil
+"""
+Every model, imported so their mappers are configured together and their tables
+are in 'Base.metadata' (alembic, tests). Listed explicitly instead of scanning
+'modules' on import; a new model module is added here.
+"""
 
-import modules
+from modules.personal_tasks.model import PersonalTask
+from modules.project_members.model import ProjectMember
+from modules.project_task_stats.model import ProjectTaskStats
+from modules.project_tasks.model import ProjectTask
+from modules.projects.model import Project
+from modules.users.model import User
 
-for _, module_name, _ in pkgutil.iter_modules(modules.__path__):
-    try:
-        importlib.import_module(f"modules.{module_name}.model")
-    except ModuleNotFoundError:
-        pass
+MODELS = (
+    PersonalTask,
+    ProjectMember,
+    ProjectTaskStats,
+    ProjectTask,
+    Project,
+    User,
+)
@@ -0,0 +1,189 @@
+import json
+import os
+import sys
+import threading
+import time
+from collections import Counter, defaultdict
+from datetime import datetime, timezone
+from pathlib import Path
+from types import CodeType, FrameType
+from typing import Any, Callable
+
+# Innermost frames of threads waiting for work, such samples are only counted
+IDLE_FRAMES = frozenset(
+    {
+        ("selectors.py", "select"),
+        ("threading.py", "wait"),
+        ("thread.py", "_worker"),
+        ("runners.py", "run"),
+    }
+)
+
+# Where the time of a sample went, by the innermost frame of a known library.
+# bcrypt and pydantic-core are compiled, their time shows in the python caller
+CATEGORIES = (
+    ("bcrypt", ("/bcrypt/", "/core/security/password.py")),
+    ("pydantic", ("/pydantic/", "/pydantic_core/")),
+    ("sqlalchemy_orm", ("/sqlalchemy/orm/",)),
+    ("sqlalchemy", ("/sqlalchemy/",)),
+    ("asyncpg", ("/asyncpg/",)),
+    ("fastapi", ("/fastapi/", "/starlette/")),
+)
+
+# Labels a sample of a thread, None leaves the thread out
+Labeler = Callable[[threading.Thread, FrameType], str | None]
+
+
+class SamplingProfiler:
+    """
+    Samples the stacks of the threads of this process from a daemon thread,
+    in-process and without a dependency. Samples are labeled (e.g. by the
+    route of the running request) and kept as folded stacks, written for
+    flamegraph tools when sampling ends, with counts per label and category.
+    """
+
+    def __init__(self, label: Labeler):
+        self.label = label
+        self._thread: threading.Thread | None = None
+        self._stop = threading.Event()
+        # Held while a sample is counted, summaries are read from other threads
+        self._lock = threading.Lock()
+        self._names: dict[CodeType, str] = {}
+        self._reset()
+
+    def _reset(self) -> None:
+        self.stacks: Counter[str] = Counter()
+        self.categories: dict[str, Counter[str]] = defaultdict(Counter)
+        self.samples = 0
+        self.idle = 0
+        self.interval = 0.0
+        self.started_at: datetime | None = None
+        self.stopped_at: datetime | None = None
+        self.path: Path | None = None
+
+    @property
+    def running(self) -> bool:
+        return self.started_at is not None and self.stopped_at is None
+
+    def start(self, interval: float, duration: float, output_dir: str | Path) -> None:
+        """Sample every 'interval' seconds for 'duration' seconds at most"""
+        # Still sampling or writing the last profile
+        if self._thread is not None and self._thread.is_alive():
+            raise RuntimeError("Profiler is already running")
+
+        self._reset()
+        self.interval = interval
+        self.started_at = datetime.now(timezone.utc)
+        self.path = Path(output_dir) / (
+            f"{self.started_at:%Y%m%dT%H%M%S}-{os.getpid()}.folded"
+        )
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, args=(duration,), name="profiler", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Ask the sampling to end, the profile is written once it has"""
+        self._stop.set()
+
+    def join(self) -> None:
+        if self._thread is not None:
+            self._thread.join()
+
+    def _run(self, duration: float) -> None:
+        deadline = time.monotonic() + duration
+        try:
+            while not self._stop.wait(self.interval) and time.monotonic() < deadline:
+                with self._lock:
+                    self.sample()
+        finally:
+            self.stopped_at = datetime.now(timezone.utc)
+
+        self.write()
+
+    def sample(self) -> None:
+        threads = {thread.ident: thread for thread in threading.enumerate()}
+        for thread_id, frame in sys._current_frames().items():
+            thread = threads.get(thread_id)
+            if thread is None or thread is self._thread:
+                continue
+
+            label = self.label(thread, frame)
+            if label is None:
+                continue
+
+            code = frame.f_code
+            if (os.path.basename(code.co_filename), code.co_name) in IDLE_FRAMES:
+                self.idle += 1
+                continue
+
+            self.samples += 1
+            self.categories[label][_category(frame)] += 1
+
+            names = []
+            while frame is not None:
+                names.append(self._name(frame.f_code))
+                frame = frame.f_back
+            names.append(label)
+            self.stacks[";".join(reversed(names))] += 1
+
+    def _name(self, code: CodeType) -> str:
+        name = self._names.get(code)
+        if name is None:
+            filename = code.co_filename
+            for marker in ("site-packages/", "/src/"):
+                if marker in filename:
+                    filename = filename.split(marker, 1)[1]
+                    break
+            # ';' separates frames of folded stacks, ' ' the count
+            name = f"{code.co_qualname} ({filename}:{code.co_firstlineno})"
+            name = name.replace(";", ":").replace(" ", "_")
+            self._names[code] = name
+
+        return name
+
+    def summary(self) -> dict[str, Any]:
+        """Samples per label, most sampled first, with their categories"""
+        with self._lock:
+            routes = {
+                label: {
+                    "samples": sum(categories.values()),
+                    "categories": dict(categories.most_common()),
+                }
+                for label, categories in self.categories.items()
+            }
+
+        return {
+            "running": self.running,
+            "started_at": self.started_at and self.started_at.isoformat(),
+            "stopped_at": self.stopped_at and self.stopped_at.isoformat(),
+            "interval": self.interval,
+            "samples": self.samples,
+            "idle": self.idle,
+            "path": self.path and str(self.path),
+            "routes": dict(
+                sorted(routes.items(), key=lambda item: -item[1]["samples"])
+            ),
+        }
+
+    def write(self) -> None:
+        """Stacks in folded format to 'path', the summary next to it as json"""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._lock:
+            folded = "".join(
+                f"{stack} {count}\n" for stack, count in self.stacks.items()
+            )
+        self.path.write_text(folded)
+        self.path.with_suffix(".json").write_text(json.dumps(self.summary(), indent=2))
+
+
+def _category(frame: FrameType | None) -> str:
+    while frame is not None:
+        filename = frame.f_code.co_filename
+        for category, markers in CATEGORIES:
+            if any(marker in filename for marker in markers):
+                return category
+        frame = frame.f_back
+
+    return "app"
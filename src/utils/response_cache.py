@@ -0,0 +1,128 @@
+import secrets
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+
+from utils.cache import TTLCache
+
+
+class CacheBackend(ABC):
+    """
+    Byte store of the response cache. Entries expire after 'ttl' seconds and
+    may be evicted earlier. A shared store (e.g. a Redis client wrapped in
+    the three abstract calls) lets every worker see the invalidations of the
+    others, it needs nothing else.
+    """
+
+    @abstractmethod
+    async def get(self, key: str) -> bytes | None: ...
+
+    @abstractmethod
+    async def set(self, key: str, value: bytes, ttl: float) -> None: ...
+
+    @abstractmethod
+    async def delete(self, key: str) -> None: ...
+
+    def clear(self) -> None:
+        """
+        Drop the entries of this process, after it may have missed
+        invalidations of other workers. A shared store misses none.
+        """
+
+    def stats(self) -> dict[str, int]:
+        """Counters of the store ('hits', 'misses', 'size'), those it keeps"""
+        return {}
+
+
+class MemoryCacheBackend(CacheBackend):
+    """In-process LRU backend, invalidations are seen by its own worker only"""
+
+    def __init__(self, maxsize: int, ttl: float):
+        self._cache: TTLCache[str, bytes] = TTLCache(maxsize=maxsize, ttl=ttl)
+
+    async def get(self, key: str) -> bytes | None:
+        return self._cache.get(key)
+
+    async def set(self, key: str, value: bytes, ttl: float) -> None:
+        self._cache.set(key, value, ttl=ttl)
+
+    async def delete(self, key: str) -> None:
+        self._cache.pop(key)
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+    def stats(self) -> dict[str, int]:
+        return self._cache.stats()
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    etag: str
+    body: bytes
+
+
+@dataclass(frozen=True)
+class CacheLookup:
+    """Result of a lookup, a miss is stored under the generation it was read at"""
+
+    scope: str
+    key: str
+    generation: str
+    entry: CachedResponse | None
+
+
+class ResponseCache:
+    """
+    Rendered responses grouped in scopes (e.g. 'project_tasks:12').
+
+    Every scope has a generation token that is a part of its entry keys.
+    Invalidating a scope drops the token, so all its entries become
+    unreachable at once, with a single delete that works on any backend.
+    A lookup creates the token before the response is loaded, so a response
+    read before a write can't be stored under the token created after it.
+    """
+
+    def __init__(self, backend: CacheBackend, ttl: float):
+        self.backend = backend
+        self.ttl = ttl
+
+    async def get(self, scope: str, key: str) -> CacheLookup:
+        generation_key = self._generation_key(scope)
+        generation = await self.backend.get(generation_key)
+        if generation is None:
+            generation = secrets.token_hex(8).encode()
+            await self.backend.set(generation_key, generation, self.ttl)
+            return CacheLookup(scope, key, generation.decode(), None)
+
+        lookup = CacheLookup(scope, key, generation.decode(), None)
+        value = await self.backend.get(self._entry_key(lookup))
+        if value is None:
+            return lookup
+
+        etag, body = value.split(b"\n", 1)
+
+        return CacheLookup(
+            scope, key, lookup.generation, CachedResponse(etag.decode(), body)
+        )
+
+    async def set(self, lookup: CacheLookup, entry: CachedResponse) -> None:
+        value = entry.etag.encode() + b"\n" + entry.body
+        await self.backend.set(self._entry_key(lookup), value, self.ttl)
+
+    async def invalidate(self, *scopes: str) -> None:
+        for scope in scopes:
+            await self.backend.delete(self._generation_key(scope))
+
+    def clear(self) -> None:
+        self.backend.clear()
+
+    def stats(self) -> dict[str, int]:
+        return self.backend.stats()
+
+    @staticmethod
+    def _generation_key(scope: str) -> str:
+        return f"generation:{scope}"
+
+    @staticmethod
+    def _entry_key(lookup: CacheLookup) -> str:
+        return f"response:{lookup.scope}:{lookup.generation}:{lookup.key}"
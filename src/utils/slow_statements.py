@@ -0,0 +1,88 @@
+import heapq
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass(frozen=True, order=True)
+class SlowStatement:
+    duration: float
+    statement: str
+    # Types of the bound parameters, never their values
+    parameters: str
+
+
+class SlowStatementLog:
+    """
+    The 'size' slowest statements with the shapes of their parameters.
+    A statement is kept once, with the slowest of its runs.
+    """
+
+    def __init__(self, size: int):
+        self.size = size
+        self._heap: list[SlowStatement] = []
+        self._by_statement: dict[str, SlowStatement] = {}
+
+    @property
+    def enabled(self) -> bool:
+        return self.size > 0
+
+    def record(
+        self, duration: float, statement: str, parameters: Any, executemany: bool
+    ) -> None:
+        if not self.enabled:
+            return
+
+        if len(self._heap) >= self.size and duration <= self._heap[0].duration:
+            return
+
+        kept = self._by_statement.get(statement)
+        if kept is not None and kept.duration >= duration:
+            return
+
+        entry = SlowStatement(
+            duration, statement, parameter_shape(parameters, executemany)
+        )
+        if kept is not None:
+            self._heap.remove(kept)
+            heapq.heapify(self._heap)
+        elif len(self._heap) >= self.size:
+            del self._by_statement[heapq.heappop(self._heap).statement]
+
+        heapq.heappush(self._heap, entry)
+        self._by_statement[statement] = entry
+
+    def slowest(self) -> list[SlowStatement]:
+        return sorted(self._heap, reverse=True)
+
+    def clear(self) -> None:
+        self._heap.clear()
+        self._by_statement.clear()
+
+
+def parameter_shape(parameters: Any, executemany: bool = False) -> str:
+    """'(int, str, list[3])', rows of executemany as '100 x (int, str)'"""
+    if executemany and parameters:
+        return f"{len(parameters)} x {parameter_shape(parameters[0])}"
+
+    if isinstance(parameters, dict):
+        return (
+            "{"
+            + ", ".join(f"{key}: {_value_shape(v)}" for key, v in parameters.items())
+            + "}"
+        )
+
+    if isinstance(parameters, (list, tuple)):
+        return "(" + ", ".join(_value_shape(value) for value in parameters) + ")"
+
+    return _value_shape(parameters)
+
+
+def _value_shape(value: Any) -> str:
+    if value is None:
+        return "None"
+
+    name = type(value).__name__
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return f"{name}[{len(value)}]"
+
+    return name
@@ -6,6 +6,8 @@ pytest_plugins = [
     "tests.fixtures.users",
     "tests.fixtures.projects",
     "tests.fixtures.project_tasks",
+    "tests.fixtures.caches",
+    "tests.fixtures.query_budget",
 ]
 
 
@@ -1,3 +1,5 @@
+from typing import Any, TypeVar
+
 from polyfactory.factories.sqlalchemy_factory import SQLAlchemyFactory
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -8,21 +10,32 @@ from modules.project_members.model import ProjectMember as ProjectMemberModel
 from modules.project_tasks.model import ProjectTask as ProjectTaskModel
 from enums.project import ProjectRole
 
+T = TypeVar("T")
+
+
+class BaseModelFactory(SQLAlchemyFactory[T]):
+    __is_base_factory__ = True
+
+    @classmethod
+    def should_column_be_set(cls, column: Any) -> bool:
+        # Generated columns (search vectors) are computed by postgres
+        return super().should_column_be_set(column) and column.computed is None
+
 
-class UserModelFactory(SQLAlchemyFactory[UserModel]):
+class UserModelFactory(BaseModelFactory[UserModel]):
     __model__ = UserModel
 
     __set_relationships__ = False
 
 
-class PersonalTaskModelFactory(SQLAlchemyFactory[PersonalTaskModel]):
+class PersonalTaskModelFactory(BaseModelFactory[PersonalTaskModel]):
     __model__ = PersonalTaskModel
 
     __set_relationships__ = False
     __set_foreign_keys__ = False
 
 
-class ProjectModelFactory(SQLAlchemyFactory[ProjectModel]):
+class ProjectModelFactory(BaseModelFactory[ProjectModel]):
     __model__ = ProjectModel
 
     __set_relationships__ = False
@@ -50,14 +63,14 @@ class ProjectModelFactory(SQLAlchemyFactory[ProjectModel]):
         return project
 
 
-class ProjectMemberModelFactory(SQLAlchemyFactory[ProjectMemberModel]):
+class ProjectMemberModelFactory(BaseModelFactory[ProjectMemberModel]):
     __model__ = ProjectMemberModel
 
     __set_relationships__ = False
     __set_foreign_keys__ = False
 
 
-class ProjectTaskModelFactory(SQLAlchemyFactory[ProjectTaskModel]):
+class ProjectTaskModelFactory(BaseModelFactory[ProjectTaskModel]):
     __model__ = ProjectTaskModel
 
     __set_relationships__ = False
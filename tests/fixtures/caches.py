@@ -0,0 +1,35 @@
+import pytest
+
+from modules.auth.service import AuthService
+from modules.project_members.cache import membership_cache
+from modules.projects.cache import project_response_cache
+from modules.personal_tasks.repository import PersonalTaskRepository
+from modules.projects.repository import ProjectRepository
+from modules.project_members.repository import ProjectMemberRepository
+from modules.project_tasks.repository import ProjectTaskRepository
+
+
+@pytest.fixture(autouse=True)
+def clear_caches():
+    """
+    In-process caches outlive the rolled back test transactions,
+    so every test starts with empty ones. Yields the function emptying them,
+    for tests wanting cold caches again.
+    """
+    caches = [
+        PersonalTaskRepository.count_cache,
+        ProjectRepository.count_cache,
+        ProjectMemberRepository.count_cache,
+        ProjectTaskRepository.count_cache,
+        AuthService.principal_cache,
+        membership_cache,
+        project_response_cache,
+    ]
+
+    def clear() -> None:
+        for cache in caches:
+            cache.clear()
+
+    clear()
+    yield clear
+    clear()
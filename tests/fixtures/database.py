@@ -1,5 +1,7 @@
 import pytest
-from typing import AsyncGenerator
+from contextlib import contextmanager
+from typing import AsyncGenerator, Iterator
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import (
     create_async_engine,
     AsyncEngine,
@@ -58,3 +60,33 @@ async def db_session(test_engine: AsyncEngine) -> AsyncGenerator[AsyncSession, N
                     await session.rollback()
                     if transaction.is_active:
                         await transaction.rollback()
+
+
+@pytest.fixture
+def record_statements(db_session: AsyncSession):
+    """
+    Context manager recording statements executed on the test connection.
+
+    Savepoints of the test transaction are not recorded. The identity map is
+    emptied on enter, so like in a fresh request session nothing is served
+    from objects loaded by fixtures.
+    """
+
+    @contextmanager
+    def record() -> Iterator[list[str]]:
+        executed = []
+
+        def on_execute(conn, cursor, statement, parameters, context, executemany):
+            if not statement.startswith(("SAVEPOINT", "RELEASE")):
+                executed.append(statement)
+
+        db_session.expunge_all()
+
+        engine = db_session.bind.sync_engine
+        event.listen(engine, "before_cursor_execute", on_execute)
+        try:
+            yield executed
+        finally:
+            event.remove(engine, "before_cursor_execute", on_execute)
+
+    return record
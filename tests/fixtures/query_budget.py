@@ -0,0 +1,28 @@
+import pytest
+from contextlib import contextmanager
+from typing import Iterator
+
+
+@pytest.fixture
+def query_budget(record_statements):
+    """
+    Context manager failing the test when the API calls inside it issue more
+    than 'limit' statements. Like 'record_statements' it yields the recorded
+    statements, they are listed in the failure.
+    """
+
+    @contextmanager
+    def budget(limit: int) -> Iterator[list[str]]:
+        with record_statements() as statements:
+            yield statements
+
+        if len(statements) > limit:
+            listed = "\n\n".join(
+                f"{i}. {statement}" for i, statement in enumerate(statements, 1)
+            )
+            pytest.fail(
+                f"{len(statements)} statements, the budget is {limit}:\n\n{listed}",
+                pytrace=False,
+            )
+
+    return budget
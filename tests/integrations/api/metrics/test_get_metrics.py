@@ -0,0 +1,79 @@
+import pytest
+from httpx import AsyncClient
+
+from api.metrics import request_metrics
+from core.config import settings
+from modules.projects.cache import project_response_cache
+from utils.response_cache import CacheBackend
+
+
+class DictBackend(CacheBackend):
+    """Store with only the calls of the interface, it keeps no counters"""
+
+    def __init__(self):
+        self.values: dict[str, bytes] = {}
+
+    async def get(self, key: str) -> bytes | None:
+        return self.values.get(key)
+
+    async def set(self, key: str, value: bytes, ttl: float) -> None:
+        self.values[key] = value
+
+    async def delete(self, key: str) -> None:
+        self.values.pop(key, None)
+
+
+@pytest.fixture(autouse=True)
+def clear_request_metrics():
+    request_metrics.clear()
+    yield
+    request_metrics.clear()
+
+
+@pytest.mark.integration
+class TestGetMetrics:
+    """Tests for GET /metrics endpoint"""
+
+    async def test_disabled(self, client: AsyncClient):
+        response = await client.get("/metrics")
+
+        assert response.status_code == 404
+
+    async def test_requests_by_route(
+        self, authenticated_client: AsyncClient, test_project, monkeypatch
+    ):
+        monkeypatch.setattr(settings.metrics, "enabled", True)
+
+        await authenticated_client.get(f"/api/v1/projects/{test_project.id}")
+        await authenticated_client.get("/api/v1/projects/0")
+        response = await authenticated_client.get("/metrics")
+        lines = response.text.splitlines()
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain")
+        # Grouped by the route template, not by the requested path
+        route = 'method="GET",route="/api/v1/projects/{project_id}"'
+        assert f'http_requests_total{{{route},status="200"}} 1' in lines
+        assert f'http_requests_total{{{route},status="403"}} 1' in lines
+        assert f"http_request_duration_seconds_count{{{route}}} 2" in lines
+        assert any(line.startswith(f"db_statements_total{{{route}}}") for line in lines)
+        assert any(line.startswith('cache_size{cache="membership"}') for line in lines)
+        assert "hashing_pool_queued 0" in lines
+
+    async def test_backend_without_counters(
+        self, authenticated_client: AsyncClient, test_project, monkeypatch
+    ):
+        monkeypatch.setattr(settings.metrics, "enabled", True)
+        monkeypatch.setattr(project_response_cache, "backend", DictBackend())
+
+        await authenticated_client.get(f"/api/v1/projects/{test_project.id}")
+        response = await authenticated_client.get("/metrics")
+
+        assert response.status_code == 200
+        assert 'cache="project_response"' not in response.text
+        assert 'cache_size{cache="membership"}' in response.text
+
+    async def test_not_recorded_when_disabled(self, authenticated_client: AsyncClient):
+        await authenticated_client.get("/api/v1/projects")
+
+        assert request_metrics.routes == {}
@@ -89,3 +89,16 @@ class TestCreatePersonalTask:
         )
 
         assert response.status_code == 401
+
+    async def test_statement_count(
+        self, authenticated_client: AsyncClient, test_user, record_statements
+    ):
+        with record_statements() as statements:
+            response = await authenticated_client.post(
+                "/api/v1/personal_tasks", json={"title": "Test title"}
+            )
+
+        assert response.status_code == 201
+        # User, insert returning the task
+        assert len(statements) == 2
+        assert response.json()["title"] == "Test title"
@@ -0,0 +1,72 @@
+import csv
+import io
+import json
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.config import settings
+from enums.task import TaskPriority
+
+from tests.factories.models import PersonalTaskModelFactory
+
+
+@pytest.mark.integration
+class TestExportPersonalTasks:
+    """Tests for GET /personal_tasks:export endpoint"""
+
+    async def test_ndjson(
+        self,
+        authenticated_client: AsyncClient,
+        db_session: AsyncSession,
+        test_user,
+        other_user,
+        monkeypatch,
+    ):
+        monkeypatch.setattr(settings.export, "yield_per", 2)
+        db_session.add_all(
+            [
+                PersonalTaskModelFactory.build(user_id=test_user.id, title=f"Task {i}")
+                for i in range(5)
+            ]
+            + [PersonalTaskModelFactory.build(user_id=other_user.id, title="Other")]
+        )
+        await db_session.commit()
+
+        response = await authenticated_client.get("/api/v1/personal_tasks:export")
+        rows = [json.loads(line) for line in response.text.splitlines()]
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/x-ndjson"
+        assert sorted(row["title"] for row in rows) == [f"Task {i}" for i in range(5)]
+
+    async def test_csv_with_filters(
+        self, authenticated_client: AsyncClient, db_session: AsyncSession, test_user
+    ):
+        db_session.add_all(
+            [
+                PersonalTaskModelFactory.build(
+                    user_id=test_user.id, title="High", priority=TaskPriority.HIGH
+                ),
+                PersonalTaskModelFactory.build(
+                    user_id=test_user.id, title="Low", priority=TaskPriority.LOW
+                ),
+            ]
+        )
+        await db_session.commit()
+
+        response = await authenticated_client.get(
+            "/api/v1/personal_tasks:export",
+            params={"format": "csv", "priority": TaskPriority.HIGH.value},
+        )
+        rows = list(csv.DictReader(io.StringIO(response.text)))
+
+        assert response.status_code == 200
+        assert [row["title"] for row in rows] == ["High"]
+        assert rows[0]["priority"] == TaskPriority.HIGH.value
+
+    async def test_unauthorized(self, client: AsyncClient):
+        response = await client.get("/api/v1/personal_tasks:export")
+
+        assert response.status_code == 401
@@ -1,8 +1,11 @@
 import pytest
+import time_machine
+from datetime import timedelta
 from httpx import AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from enums.task import TaskStatus, TaskPriority
+from utils.datetime import utc_now
 
 from tests.factories.models import PersonalTaskModelFactory
 
@@ -137,7 +140,95 @@ class TestGetListOfPersonalTasks:
         assert resp_data["pagination"]["total"] == 5
         assert resp_data["pagination"]["page"] == 3
 
+    @pytest.mark.parametrize(
+        "include_total, expected_total",
+        [("exact", 5), ("none", None)],
+    )
+    async def test_include_total(
+        self,
+        authenticated_client: AsyncClient,
+        db_session: AsyncSession,
+        test_user,
+        include_total,
+        expected_total,
+    ):
+        tasks = [PersonalTaskModelFactory.build(user_id=test_user.id) for _ in range(5)]
+
+        db_session.add_all(tasks)
+        await db_session.commit()
+
+        response = await authenticated_client.get(
+            "/api/v1/personal_tasks",
+            params={"size": 2, "include_total": include_total},
+        )
+        resp_data = response.json()
+
+        assert response.status_code == 200
+        assert len(resp_data["items"]) == 2
+        assert resp_data["pagination"]["total"] == expected_total
+        assert resp_data["pagination"]["include_total"] == include_total
+
+    async def test_include_total_estimated(
+        self, authenticated_client: AsyncClient, test_user
+    ):
+        response = await authenticated_client.get(
+            "/api/v1/personal_tasks", params={"include_total": "estimated"}
+        )
+        resp_data = response.json()
+
+        assert response.status_code == 200
+        assert isinstance(resp_data["pagination"]["total"], int)
+        assert resp_data["pagination"]["include_total"] == "estimated"
+
     async def test_without_token(self, client: AsyncClient):
         response = await client.get("/api/v1/personal_tasks")
 
         assert response.status_code == 401
+
+
+@pytest.mark.integration
+class TestGetListOfPersonalTasksConditional:
+    """Tests for ETag / If-None-Match of GET /personal_tasks"""
+
+    async def test_overdue_changes_with_time(
+        self, authenticated_client: AsyncClient, db_session: AsyncSession, test_user
+    ):
+        task = PersonalTaskModelFactory.build(
+            user_id=test_user.id,
+            status=TaskStatus.TODO,
+            deadline=utc_now() + timedelta(minutes=1),
+        )
+        db_session.add(task)
+        await db_session.commit()
+        url = "/api/v1/personal_tasks?overdue=true"
+        first = await authenticated_client.get(url)
+
+        # No task is written when the deadline passes
+        with time_machine.travel(utc_now() + timedelta(minutes=5)):
+            response = await authenticated_client.get(
+                url, headers={"If-None-Match": first.headers["etag"]}
+            )
+
+        assert first.json()["items"] == []
+        assert response.status_code == 200
+        assert [item["id"] for item in response.json()["items"]] == [task.id]
+
+    async def test_not_modified_until_changed(
+        self, authenticated_client: AsyncClient, db_session: AsyncSession, test_user
+    ):
+        task = PersonalTaskModelFactory.build(user_id=test_user.id)
+        db_session.add(task)
+        await db_session.commit()
+        url = "/api/v1/personal_tasks"
+        etag = (await authenticated_client.get(url)).headers["etag"]
+
+        not_modified = await authenticated_client.get(
+            url, headers={"If-None-Match": etag}
+        )
+        await authenticated_client.delete(f"{url}/{task.id}")
+        modified = await authenticated_client.get(url, headers={"If-None-Match": etag})
+
+        assert not_modified.status_code == 304
+        assert modified.status_code == 200
+        assert modified.json()["items"] == []
+        assert modified.headers["etag"] != etag
@@ -61,3 +61,45 @@ class TestGetPersonalTask:
         response = await client.get(f"/api/v1/personal_tasks/{task.id}")
 
         assert response.status_code == 401
+
+
+@pytest.mark.integration
+class TestGetPersonalTaskConditional:
+    """Tests for ETag / If-None-Match of GET /personal_tasks/{task_id}"""
+
+    async def test_not_modified_until_updated(
+        self, authenticated_client: AsyncClient, db_session: AsyncSession, test_user
+    ):
+        task = PersonalTaskModelFactory.build(user_id=test_user.id)
+        db_session.add(task)
+        await db_session.commit()
+        url = f"/api/v1/personal_tasks/{task.id}"
+        etag = (await authenticated_client.get(url)).headers["etag"]
+
+        not_modified = await authenticated_client.get(
+            url, headers={"If-None-Match": etag}
+        )
+        await authenticated_client.patch(url, json={"title": "New title"})
+        modified = await authenticated_client.get(url, headers={"If-None-Match": etag})
+
+        assert not_modified.status_code == 304
+        assert not_modified.headers["etag"] == etag
+        assert modified.status_code == 200
+        assert modified.json()["title"] == "New title"
+        assert modified.headers["etag"] != etag
+
+    async def test_other_user_task(
+        self,
+        authenticated_client: AsyncClient,
+        db_session: AsyncSession,
+        other_user,
+    ):
+        task = PersonalTaskModelFactory.build(user_id=other_user.id)
+        db_session.add(task)
+        await db_session.commit()
+
+        response = await authenticated_client.get(
+            f"/api/v1/personal_tasks/{task.id}", headers={"If-None-Match": "*"}
+        )
+
+        assert response.status_code == 404
@@ -0,0 +1,171 @@
+import json
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.config import settings
+from modules.personal_tasks.model import PersonalTask as PersonalTaskModel
+from modules.personal_tasks.repository import PersonalTaskRepository
+from enums.task import TaskStatus, TaskPriority
+
+from tests.factories.models import PersonalTaskModelFactory
+
+
+async def user_tasks(db_session: AsyncSession, user_id: int):
+    result = await db_session.scalars(
+        select(PersonalTaskModel)
+        .where(PersonalTaskModel.user_id == user_id)
+        .order_by(PersonalTaskModel.id)
+        .execution_options(populate_existing=True)
+    )
+
+    return result.all()
+
+
+@pytest.mark.integration
+class TestImportPersonalTasks:
+    """Tests for POST /personal_tasks:import endpoint"""
+
+    async def test_ndjson(
+        self,
+        authenticated_client: AsyncClient,
+        db_session: AsyncSession,
+        test_user,
+        monkeypatch,
+    ):
+        # Several COPY chunks, counted here as the statement recorder of the
+        # query budgets doesn't see COPY on the raw connection
+        monkeypatch.setattr(settings.importing, "chunk_size", 2)
+        copies = []
+        copy_many = PersonalTaskRepository.copy_many
+
+        async def count_copies(repo, user_id, items):
+            copies.append(len(items))
+            await copy_many(repo, user_id=user_id, items=items)
+
+        monkeypatch.setattr(PersonalTaskRepository, "copy_many", count_copies)
+        rows = [
+            {"title": f"Task {i}", "priority": TaskPriority.HIGH.value}
+            for i in range(5)
+        ]
+        rows[1] = {"title": "Done", "status": "done", "deadline": "2030-01-01T10:00Z"}
+        body = "\n".join(json.dumps(row) for row in rows) + "\n"
+
+        # Streamed in small pieces
+        async def content():
+            encoded = body.encode()
+            for start in range(0, len(encoded), 7):
+                yield encoded[start : start + 7]
+
+        response = await authenticated_client.post(
+            "/api/v1/personal_tasks:import",
+            content=content(),
+            headers={"Content-Type": "application/x-ndjson"},
+        )
+
+        assert response.status_code == 200
+        assert response.json() == {"imported": 5, "rejected": 0, "errors": []}
+        assert copies == [2, 2, 1]
+
+        tasks = await user_tasks(db_session, test_user.id)
+        assert [task.title for task in tasks] == [
+            "Task 0",
+            "Done",
+            "Task 2",
+            "Task 3",
+            "Task 4",
+        ]
+        assert tasks[0].priority == TaskPriority.HIGH
+        assert tasks[1].status == TaskStatus.DONE
+        assert tasks[1].priority == TaskPriority.MEDIUM
+        assert tasks[1].deadline.year == 2030
+        assert tasks[0].created_at is not None
+
+        # Imported tasks are searchable and counted
+        response = await authenticated_client.get(
+            "/api/v1/personal_tasks", params={"search": "done"}
+        )
+        assert response.json()["pagination"]["total"] == 1
+
+    async def test_csv_with_invalid_rows(
+        self, authenticated_client: AsyncClient, db_session: AsyncSession, test_user
+    ):
+        body = (
+            "title,description,priority,status\n"
+            "Valid,Some description,low,\n"
+            ",No title,,\n"
+            "Bad priority,,urgent,\n"
+            "Also valid,,,in_progress\n"
+        )
+
+        response = await authenticated_client.post(
+            "/api/v1/personal_tasks:import",
+            params={"format": "csv"},
+            content=body,
+            headers={"Content-Type": "text/csv"},
+        )
+        resp_data = response.json()
+
+        assert response.status_code == 200
+        assert resp_data["imported"] == 2
+        assert resp_data["rejected"] == 2
+        assert [error["row"] for error in resp_data["errors"]] == [2, 3]
+        assert resp_data["errors"][0]["detail"].startswith("title:")
+        assert resp_data["errors"][1]["detail"].startswith("priority:")
+
+        tasks = await user_tasks(db_session, test_user.id)
+        assert [(task.title, task.priority, task.status) for task in tasks] == [
+            ("Valid", TaskPriority.LOW, TaskStatus.TODO),
+            ("Also valid", TaskPriority.MEDIUM, TaskStatus.IN_PROGRESS),
+        ]
+
+    async def test_errors_listed_up_to_limit(
+        self, authenticated_client: AsyncClient, monkeypatch
+    ):
+        monkeypatch.setattr(settings.importing, "max_errors", 2)
+
+        response = await authenticated_client.post(
+            "/api/v1/personal_tasks:import", content="{}\n" * 5
+        )
+
+        assert response.json()["rejected"] == 5
+        assert len(response.json()["errors"]) == 2
+
+    async def test_export_round_trip(
+        self, authenticated_client: AsyncClient, db_session: AsyncSession, test_user
+    ):
+        db_session.add_all(
+            [
+                PersonalTaskModelFactory.build(user_id=test_user.id, title=f"Task {i}")
+                for i in range(3)
+            ]
+        )
+        await db_session.commit()
+
+        exported = await authenticated_client.get(
+            "/api/v1/personal_tasks:export", params={"format": "csv"}
+        )
+        response = await authenticated_client.post(
+            "/api/v1/personal_tasks:import",
+            params={"format": "csv"},
+            content=exported.content,
+        )
+
+        assert response.json()["imported"] == 3
+        assert len(await user_tasks(db_session, test_user.id)) == 6
+
+    async def test_broken_csv_header(self, authenticated_client: AsyncClient):
+        response = await authenticated_client.post(
+            "/api/v1/personal_tasks:import",
+            params={"format": "csv"},
+            content="x" * (settings.importing.max_row_size + 1),
+        )
+
+        assert response.status_code == 400
+
+    async def test_unauthorized(self, client: AsyncClient):
+        response = await client.post("/api/v1/personal_tasks:import", content="{}")
+
+        assert response.status_code == 401
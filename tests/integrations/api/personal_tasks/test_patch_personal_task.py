@@ -185,3 +185,65 @@ class TestPatchPersonalTask:
         await db_session.refresh(task)
 
         assert task.title != "Some other title"
+
+    async def test_statement_count(
+        self,
+        authenticated_client: AsyncClient,
+        db_session: AsyncSession,
+        test_user,
+        record_statements,
+    ):
+        task = PersonalTaskModelFactory.build(user_id=test_user.id)
+
+        db_session.add(task)
+        await db_session.commit()
+
+        with record_statements() as statements:
+            response = await authenticated_client.patch(
+                f"/api/v1/personal_tasks/{task.id}", json={"title": "New title"}
+            )
+
+        assert response.status_code == 200
+        # User, task, update returning the task
+        assert len(statements) == 3
+        assert response.json()["title"] == "New title"
+
+
+@pytest.mark.integration
+class TestPatchPersonalTaskConditional:
+    """Tests for If-Match of PATCH /personal_tasks/{task_id}"""
+
+    async def test_matching_version(
+        self, authenticated_client: AsyncClient, db_session: AsyncSession, test_user
+    ):
+        task = PersonalTaskModelFactory.build(user_id=test_user.id)
+        db_session.add(task)
+        await db_session.commit()
+        url = f"/api/v1/personal_tasks/{task.id}"
+        etag = (await authenticated_client.get(url)).headers["etag"]
+
+        response = await authenticated_client.patch(
+            url, json={"title": "New title"}, headers={"If-Match": etag}
+        )
+
+        assert response.status_code == 200
+        assert response.json()["title"] == "New title"
+        assert response.headers["etag"] != etag
+
+    async def test_stale_version(
+        self, authenticated_client: AsyncClient, db_session: AsyncSession, test_user
+    ):
+        task = PersonalTaskModelFactory.build(user_id=test_user.id)
+        db_session.add(task)
+        await db_session.commit()
+        url = f"/api/v1/personal_tasks/{task.id}"
+        etag = (await authenticated_client.get(url)).headers["etag"]
+        await authenticated_client.patch(url, json={"title": "First write"})
+
+        response = await authenticated_client.patch(
+            url, json={"title": "Second write"}, headers={"If-Match": etag}
+        )
+
+        assert response.status_code == 412
+        await db_session.refresh(task)
+        assert task.title == "First write"
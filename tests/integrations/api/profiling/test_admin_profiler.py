@@ -0,0 +1,90 @@
+import asyncio
+import pytest
+import sys
+import threading
+from types import SimpleNamespace
+from httpx import AsyncClient
+
+from api.profiling import RequestLabeler, profiler
+from core.config import settings
+
+TOKEN = "admin-token"
+
+
+@pytest.fixture
+def enabled(monkeypatch, tmp_path):
+    monkeypatch.setattr(settings.profiling, "admin_token", TOKEN)
+    monkeypatch.setattr(settings.profiling, "output_dir", str(tmp_path))
+    yield
+    profiler.stop()
+    profiler.join()
+
+
+@pytest.mark.integration
+class TestProfiler:
+    """Tests for the /admin/profiler endpoints"""
+
+    async def test_disabled(self, client: AsyncClient):
+        response = await client.post(
+            "/admin/profiler", headers={"X-Admin-Token": TOKEN}
+        )
+
+        assert response.status_code == 404
+
+    async def test_invalid_token(self, client: AsyncClient, enabled):
+        response = await client.post(
+            "/admin/profiler", headers={"X-Admin-Token": "wrong"}
+        )
+        no_token = await client.post("/admin/profiler")
+
+        assert response.status_code == 403
+        assert no_token.status_code == 403
+        assert not profiler.running
+
+    async def test_start_and_stop(
+        self, authenticated_client: AsyncClient, test_project, enabled
+    ):
+        headers = {"X-Admin-Token": TOKEN}
+
+        started = await authenticated_client.post(
+            "/admin/profiler", params={"interval": 0.001}, headers=headers
+        )
+        running = await authenticated_client.post("/admin/profiler", headers=headers)
+        for _ in range(10):
+            await authenticated_client.get(f"/api/v1/projects/{test_project.id}")
+        state = await authenticated_client.get("/admin/profiler", headers=headers)
+        stopped = await authenticated_client.delete("/admin/profiler", headers=headers)
+
+        assert started.status_code == 200
+        assert started.json()["running"] is True
+        assert running.status_code == 409
+        assert state.json()["running"] is True
+
+        result = stopped.json()
+        assert stopped.status_code == 200
+        assert result["running"] is False
+        assert result["samples"] + result["idle"] > 0
+        with open(result["path"]) as folded:
+            assert sum(int(line.rsplit(" ", 1)[1]) for line in folded) == (
+                result["samples"]
+            )
+
+
+@pytest.mark.integration
+class TestRequestLabeler:
+    async def test_labels(self):
+        labeler = RequestLabeler()
+        labeler.attach(asyncio.get_running_loop())
+        frame = sys._getframe()
+
+        unrouted = labeler(threading.current_thread(), frame)
+        labeler.track({"method": "GET"})
+        unmatched = labeler(threading.current_thread(), frame)
+        labeler.track({"method": "GET", "route": SimpleNamespace(path="/projects")})
+        routed = labeler(threading.current_thread(), frame)
+
+        assert unrouted == "(event loop)"
+        assert unmatched == "GET (unmatched)"
+        assert routed == "GET /projects"
+        assert labeler(threading.Thread(name="bcrypt_0"), frame) == "bcrypt"
+        assert labeler(threading.Thread(name="other"), frame) is None
@@ -201,3 +201,26 @@ class TestAddProjectMember:
         )
 
         assert response.status_code == 401
+
+    async def test_statement_count(
+        self,
+        authenticated_client: AsyncClient,
+        test_project,
+        other_user,
+        record_statements,
+    ):
+        data_to_add = {
+            "user_id": other_user.id,
+            "role": ProjectRole.MEMBER.value,
+        }
+
+        with record_statements() as statements:
+            response = await authenticated_client.post(
+                f"api/v1/projects/{test_project.id}/members", json=data_to_add
+            )
+        resp_data = response.json()
+
+        assert response.status_code == 201
+        # User, membership, added user, existing membership, insert with user
+        assert len(statements) == 5
+        assert resp_data["user"]["username"] == other_user.username
@@ -150,3 +150,66 @@ class TestGetAllProjectMembers:
         response = await client.get(f"api/v1/projects/{test_project.id}/members")
 
         assert response.status_code == 401
+
+
+@pytest.mark.integration
+class TestGetAllProjectMembersConditional:
+    """Tests for ETag / If-None-Match of GET /projects/{project_id}/members"""
+
+    async def test_not_modified_until_changed(
+        self, authenticated_client: AsyncClient, test_project, other_user
+    ):
+        url = f"/api/v1/projects/{test_project.id}/members"
+        etag = (await authenticated_client.get(url)).headers["etag"]
+
+        not_modified = await authenticated_client.get(
+            url, headers={"If-None-Match": etag}
+        )
+        await authenticated_client.post(
+            url, json={"user_id": other_user.id, "role": ProjectRole.ADMIN.value}
+        )
+        added = await authenticated_client.get(url, headers={"If-None-Match": etag})
+        await authenticated_client.patch(
+            f"{url}/{other_user.id}", json={"role": ProjectRole.MEMBER.value}
+        )
+        updated = await authenticated_client.get(
+            url, headers={"If-None-Match": added.headers["etag"]}
+        )
+        await authenticated_client.delete(f"{url}/{other_user.id}")
+        removed = await authenticated_client.get(
+            url, headers={"If-None-Match": updated.headers["etag"]}
+        )
+
+        assert not_modified.status_code == 304
+        assert [added.status_code, updated.status_code, removed.status_code] == [
+            200,
+            200,
+            200,
+        ]
+        assert len(removed.json()["items"]) == 1
+
+
+@pytest.mark.integration
+class TestGetAllProjectMembersCache:
+    """Tests for the response cache of GET /projects/{project_id}/members"""
+
+    async def test_cached_until_changed(
+        self,
+        authenticated_client: AsyncClient,
+        test_project,
+        other_user,
+        record_statements,
+    ):
+        url = f"/api/v1/projects/{test_project.id}/members"
+        first = await authenticated_client.get(url)
+
+        with record_statements() as statements:
+            cached = await authenticated_client.get(url)
+        await authenticated_client.post(
+            url, json={"user_id": other_user.id, "role": ProjectRole.ADMIN.value}
+        )
+        added = await authenticated_client.get(url)
+
+        assert cached.json() == first.json()
+        assert len(statements) == 0
+        assert len(added.json()["items"]) == 2
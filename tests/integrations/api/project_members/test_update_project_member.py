@@ -199,3 +199,33 @@ class TestUpdateProjectMember:
         )
 
         assert response.status_code == 401
+
+    async def test_statement_count(
+        self,
+        authenticated_client: AsyncClient,
+        db_session: AsyncSession,
+        test_user,
+        other_user,
+        record_statements,
+    ):
+        project = await ProjectModelFactory.create(
+            session=db_session,
+            creator_id=test_user.id,
+            members=[
+                model.ProjectMember(user_id=other_user.id, role=ProjectRole.MEMBER)
+            ],
+        )
+        update_data = {"role": ProjectRole.ADMIN.value}
+
+        with record_statements() as statements:
+            response = await authenticated_client.patch(
+                f"api/v1/projects/{project.id}/members/{other_user.id}",
+                json=update_data,
+            )
+        resp_data = response.json()
+
+        assert response.status_code == 200
+        # User, actor membership, target membership, update with user
+        assert len(statements) == 4
+        assert resp_data["role"] == ProjectRole.ADMIN.value
+        assert resp_data["user"]["username"] == other_user.username
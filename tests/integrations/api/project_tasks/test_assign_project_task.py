@@ -251,3 +251,25 @@ class TestAssignOpenTask:
 
         await db_session.refresh(task)
         assert task.assignee_id is None
+
+    async def test_statement_count(
+        self,
+        authenticated_client: AsyncClient,
+        test_user,
+        test_project,
+        test_project_open_task,
+        record_statements,
+    ):
+        task_id = test_project_open_task.id
+
+        with record_statements() as statements:
+            response = await authenticated_client.post(
+                f"/api/v1/projects/{test_project.id}/tasks/{task_id}/assign"
+            )
+        resp_data = response.json()
+
+        assert response.status_code == 200
+        # User, membership, task, update with relations
+        assert len(statements) == 4
+        assert resp_data["assignee"]["id"] == test_user.id
+        assert resp_data["assignee"]["username"] == test_user.username
@@ -0,0 +1,366 @@
+import pytest
+from datetime import datetime, timezone
+from httpx import AsyncClient
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from modules.project_tasks.model import ProjectTask as ProjectTaskModel
+from modules.project_members.model import ProjectMember as ProjectMemberModel
+from enums.project_task import ProjectTaskType
+from enums.task import TaskStatus, TaskPriority
+from enums.project import ProjectRole
+
+from tests.factories.models import ProjectModelFactory, ProjectTaskModelFactory
+
+
+async def create_tasks(
+    client: AsyncClient, project_id: int, items: list[dict]
+) -> list[int]:
+    response = await client.post(
+        f"/api/v1/projects/{project_id}/tasks:batch", json={"items": items}
+    )
+
+    return [result["id"] for result in response.json()["results"]]
+
+
+@pytest.mark.integration
+class TestCreateProjectTasksBatch:
+    """Tests for POST /projects/{project_id}/tasks:batch endpoint"""
+
+    async def test_create(
+        self,
+        authenticated_client: AsyncClient,
+        db_session: AsyncSession,
+        test_user,
+        other_user,
+        test_project,
+        record_statements,
+    ):
+        items = [
+            {
+                "type": ProjectTaskType.DEFAULT.value,
+                "assignee_id": test_user.id,
+                "title": f"Task {i}",
+                "priority": TaskPriority.HIGH.value,
+            }
+            for i in range(50)
+        ]
+        items[10] = {"type": ProjectTaskType.OPEN.value, "title": "Open"}
+        # Not a member of the project
+        items[20] = {
+            "type": ProjectTaskType.DEFAULT.value,
+            "assignee_id": other_user.id,
+            "title": "Rejected",
+        }
+
+        with record_statements() as statements:
+            response = await authenticated_client.post(
+                f"/api/v1/projects/{test_project.id}/tasks:batch",
+                json={"items": items},
+            )
+        results = response.json()["results"]
+
+        assert response.status_code == 200
+        # User, membership, assignees, insert with relations and stats
+        assert len(statements) == 4
+        assert [result["index"] for result in results] == list(range(50))
+        assert results[20] == {
+            "index": 20,
+            "id": None,
+            "status": 404,
+            "task": None,
+            "detail": "User not found.",
+        }
+
+        created = [result for result in results if result["status"] == 201]
+        assert len(created) == 49
+        assert created[0]["task"]["title"] == "Task 0"
+        assert created[0]["task"]["assignee"]["id"] == test_user.id
+        assert created[0]["task"]["creator"]["id"] == test_user.id
+        assert results[10]["task"]["type"] == ProjectTaskType.OPEN.value
+        assert results[10]["task"]["assignee"] is None
+
+        db_tasks = (
+            await db_session.scalars(
+                select(ProjectTaskModel).where(
+                    ProjectTaskModel.project_id == test_project.id
+                )
+            )
+        ).all()
+        assert {task.id for task in db_tasks} == {task["id"] for task in created}
+        assert all(
+            task.assigned_at is not None
+            for task in db_tasks
+            if task.type == ProjectTaskType.DEFAULT
+        )
+
+        response = await authenticated_client.get(
+            f"/api/v1/projects/{test_project.id}/stats"
+        )
+        assert response.json()["total"] == 49
+        assert response.json()["unassigned"] == 1
+        assert response.json()["by_priority"]["high"] == 48
+
+    async def test_limits(self, authenticated_client: AsyncClient, test_project):
+        url = f"/api/v1/projects/{test_project.id}/tasks:batch"
+        item = {"type": ProjectTaskType.OPEN.value, "title": "Open"}
+
+        empty = await authenticated_client.post(url, json={"items": []})
+        too_many = await authenticated_client.post(url, json={"items": [item] * 2001})
+
+        assert empty.status_code == 422
+        assert too_many.status_code == 422
+
+    async def test_without_permission(
+        self,
+        authenticated_client: AsyncClient,
+        db_session: AsyncSession,
+        test_user,
+        other_user,
+    ):
+        project = await ProjectModelFactory.create(
+            session=db_session,
+            creator_id=other_user.id,
+            members=[ProjectMemberModel(user_id=test_user.id, role=ProjectRole.MEMBER)],
+        )
+
+        response = await authenticated_client.post(
+            f"/api/v1/projects/{project.id}/tasks:batch",
+            json={"items": [{"type": ProjectTaskType.OPEN.value, "title": "Open"}]},
+        )
+
+        assert response.status_code == 403
+
+
+@pytest.mark.integration
+class TestUpdateProjectTasksBatch:
+    """Tests for PATCH /projects/{project_id}/tasks:batch endpoint"""
+
+    async def test_update(
+        self,
+        authenticated_client: AsyncClient,
+        db_session: AsyncSession,
+        test_user,
+        other_user,
+        test_project,
+        record_statements,
+    ):
+        other_project = await ProjectModelFactory.create(
+            session=db_session, creator_id=test_user.id
+        )
+        default = {
+            "type": ProjectTaskType.DEFAULT.value,
+            "assignee_id": test_user.id,
+            "title": "Default",
+        }
+        open_ = {"type": ProjectTaskType.OPEN.value, "title": "Open"}
+        done_id, renamed_id, empty_id, open_id, default_id = await create_tasks(
+            authenticated_client,
+            test_project.id,
+            [default, open_, default, open_, default],
+        )
+        (foreign_id,) = await create_tasks(
+            authenticated_client,
+            other_project.id,
+            [{"type": ProjectTaskType.OPEN.value, "title": "Foreign"}],
+        )
+        url = f"/api/v1/projects/{test_project.id}"
+
+        items = [
+            {"id": done_id, "status": TaskStatus.DONE.value},
+            {"id": renamed_id, "title": "Renamed", "priority": "critical"},
+            {"id": renamed_id, "title": "Listed twice"},
+            {"id": foreign_id, "title": "Other project"},
+            {"id": empty_id},
+            {"id": open_id, "assignee_id": test_user.id},
+            {"id": default_id, "assignee_id": other_user.id},
+        ]
+        with record_statements() as statements:
+            response = await authenticated_client.patch(
+                f"{url}/tasks:batch", json={"items": items}
+            )
+        results = response.json()["results"]
+
+        assert response.status_code == 200
+        # Tasks, assignees, update per set of patched fields, updated tasks
+        # (the stats are kept by triggers)
+        assert len(statements) == 5
+        assert [result["status"] for result in results] == [
+            200,
+            200,
+            400,
+            404,
+            400,
+            400,
+            404,
+        ]
+        assert results[0]["task"]["status"] == TaskStatus.DONE.value
+        assert results[0]["task"]["updated_at"] > results[0]["task"]["created_at"]
+        assert results[0]["task"]["assignee"]["id"] == test_user.id
+        assert results[1]["task"]["title"] == "Renamed"
+        assert results[1]["task"]["priority"] == TaskPriority.CRITICAL.value
+        assert results[2]["detail"] == "Task is listed more than once."
+        assert results[4]["detail"] == "No data to update."
+        assert results[5]["detail"] == "You cannot add assignee to open task."
+
+        assert results[6]["detail"] == "User not found."
+
+        db_task = await db_session.get(ProjectTaskModel, done_id)
+        assert db_task.status == TaskStatus.DONE
+
+        response = await authenticated_client.get(f"{url}/stats")
+        assert response.json()["by_status"]["done"] == 1
+        assert response.json()["by_status"]["todo"] == 4
+        assert response.json()["by_priority"]["critical"] == 1
+
+    async def test_assignee_not_member(
+        self,
+        authenticated_client: AsyncClient,
+        db_session: AsyncSession,
+        test_user,
+        other_user,
+        test_project,
+    ):
+        (task_id,) = await create_tasks(
+            authenticated_client,
+            test_project.id,
+            [
+                {
+                    "type": ProjectTaskType.DEFAULT.value,
+                    "assignee_id": test_user.id,
+                    "title": "Default",
+                }
+            ],
+        )
+
+        response = await authenticated_client.patch(
+            f"/api/v1/projects/{test_project.id}/tasks:batch",
+            json={"items": [{"id": task_id, "assignee_id": other_user.id}]},
+        )
+
+        assert response.status_code == 200
+        assert response.json()["results"][0]["status"] == 404
+        assert response.json()["results"][0]["detail"] == "User not found."
+
+    async def test_member_updates_own_task_status(
+        self,
+        authenticated_client: AsyncClient,
+        db_session: AsyncSession,
+        test_user,
+        other_user,
+    ):
+        project = await ProjectModelFactory.create(
+            session=db_session,
+            creator_id=other_user.id,
+            members=[ProjectMemberModel(user_id=test_user.id, role=ProjectRole.MEMBER)],
+        )
+        own_task = await ProjectTaskModelFactory.create(
+            session=db_session,
+            project_id=project.id,
+            type=ProjectTaskType.DEFAULT,
+            assignee_id=test_user.id,
+            created_by_id=other_user.id,
+            assigned_at=datetime.now(timezone.utc),
+        )
+        other_task = await ProjectTaskModelFactory.create(
+            session=db_session,
+            project_id=project.id,
+            type=ProjectTaskType.DEFAULT,
+            assignee_id=other_user.id,
+            created_by_id=other_user.id,
+            assigned_at=datetime.now(timezone.utc),
+        )
+
+        response = await authenticated_client.patch(
+            f"/api/v1/projects/{project.id}/tasks:batch",
+            json={
+                "items": [
+                    {"id": own_task.id, "status": TaskStatus.DONE.value},
+                    {"id": other_task.id, "status": TaskStatus.DONE.value},
+                ]
+            },
+        )
+        results = response.json()["results"]
+
+        assert response.status_code == 200
+        assert results[0]["status"] == 200
+        assert results[1]["status"] == 403
+
+
+@pytest.mark.integration
+class TestDeleteProjectTasksBatch:
+    """Tests for DELETE /projects/{project_id}/tasks:batch endpoint"""
+
+    async def test_delete(
+        self,
+        authenticated_client: AsyncClient,
+        db_session: AsyncSession,
+        test_user,
+        test_project,
+        record_statements,
+    ):
+        other_project = await ProjectModelFactory.create(
+            session=db_session, creator_id=test_user.id
+        )
+        task_ids = await create_tasks(
+            authenticated_client,
+            test_project.id,
+            [{"type": ProjectTaskType.OPEN.value, "title": f"Task {i}"} for i in range(3)],
+        )
+        (foreign_id,) = await create_tasks(
+            authenticated_client,
+            other_project.id,
+            [{"type": ProjectTaskType.OPEN.value, "title": "Foreign"}],
+        )
+        url = f"/api/v1/projects/{test_project.id}"
+
+        ids = [task_ids[0], task_ids[1], task_ids[0], foreign_id]
+        with record_statements() as statements:
+            response = await authenticated_client.request(
+                "DELETE", f"{url}/tasks:batch", json={"ids": ids}
+            )
+        results = response.json()["results"]
+
+        assert response.status_code == 200
+        # Delete with stats
+        assert len(statements) == 1
+        assert [result["status"] for result in results] == [204, 204, 400, 404]
+
+        remaining = (
+            await db_session.scalars(
+                select(ProjectTaskModel.id).where(
+                    ProjectTaskModel.project_id.in_([test_project.id, other_project.id])
+                )
+            )
+        ).all()
+        assert set(remaining) == {task_ids[2], foreign_id}
+
+        response = await authenticated_client.get(f"{url}/stats")
+        assert response.json()["total"] == 1
+
+    async def test_without_permission(
+        self,
+        authenticated_client: AsyncClient,
+        db_session: AsyncSession,
+        test_user,
+        other_user,
+    ):
+        project = await ProjectModelFactory.create(
+            session=db_session,
+            creator_id=other_user.id,
+            members=[ProjectMemberModel(user_id=test_user.id, role=ProjectRole.MEMBER)],
+        )
+        task = await ProjectTaskModelFactory.create(
+            session=db_session,
+            type=ProjectTaskType.OPEN,
+            project_id=project.id,
+            created_by_id=other_user.id,
+        )
+
+        response = await authenticated_client.request(
+            "DELETE",
+            f"/api/v1/projects/{project.id}/tasks:batch",
+            json={"ids": [task.id]},
+        )
+
+        assert response.status_code == 403
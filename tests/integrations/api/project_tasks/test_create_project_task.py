@@ -1,6 +1,7 @@
 import pytest
 from httpx import AsyncClient
 from datetime import datetime, timezone, timedelta
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from modules.project_tasks.model import ProjectTask as ProjectTaskModel
@@ -56,6 +57,37 @@ class TestCreateProjectTask:
         assert resp_data["creator"]["id"] == test_user.id
         assert db_task.assigned_at is not None
 
+    async def test_self_assignee_membership_fetched_once(
+        self,
+        authenticated_client: AsyncClient,
+        db_session: AsyncSession,
+        test_user,
+        test_project,
+    ):
+        member_selects = []
+
+        def on_execute(conn, cursor, statement, parameters, context, executemany):
+            if statement.startswith("SELECT") and "FROM project_members" in statement:
+                member_selects.append(statement)
+
+        engine = db_session.bind.sync_engine
+        event.listen(engine, "before_cursor_execute", on_execute)
+        try:
+            response = await authenticated_client.post(
+                f"/api/v1/projects/{test_project.id}/tasks",
+                json={
+                    "type": ProjectTaskType.DEFAULT.value,
+                    "assignee_id": test_user.id,
+                    "title": "Test Task",
+                },
+            )
+        finally:
+            event.remove(engine, "before_cursor_execute", on_execute)
+
+        assert response.status_code == 201
+        # Actor check and assignee check share one lookup within the request
+        assert len(member_selects) == 1
+
     async def test_with_minimal_data(
         self,
         authenticated_client: AsyncClient,
@@ -271,3 +303,28 @@ class TestCreateProjectTask:
         )
 
         assert response.status_code == 401
+
+    async def test_statement_count(
+        self,
+        authenticated_client: AsyncClient,
+        test_user,
+        test_project,
+        record_statements,
+    ):
+        with record_statements() as statements:
+            response = await authenticated_client.post(
+                f"/api/v1/projects/{test_project.id}/tasks",
+                json={
+                    "type": ProjectTaskType.DEFAULT.value,
+                    "assignee_id": test_user.id,
+                    "title": "Test Task",
+                },
+            )
+        resp_data = response.json()
+
+        assert response.status_code == 201
+        # User, membership (shared with the assignee check), insert with relations
+        assert len(statements) == 3
+        assert resp_data["project"]["id"] == test_project.id
+        assert resp_data["assignee"]["username"] == test_user.username
+        assert resp_data["creator"]["username"] == test_user.username
@@ -0,0 +1,145 @@
+import csv
+import io
+import json
+
+import pytest
+from datetime import datetime, timezone
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.config import settings
+from modules.project_members.model import ProjectMember as ProjectMemberModel
+from enums.project_task import ProjectTaskType
+from enums.task import TaskStatus
+from enums.project import ProjectRole
+
+from tests.factories.models import ProjectModelFactory, ProjectTaskModelFactory
+
+
+@pytest.mark.integration
+class TestExportProjectTasks:
+    """Tests for GET /projects/{project_id}/tasks:export endpoint"""
+
+    @pytest.fixture
+    async def tasks(self, db_session: AsyncSession, test_user, test_project):
+        tasks = [
+            ProjectTaskModelFactory.build(
+                project_id=test_project.id,
+                created_by_id=test_user.id,
+                type=ProjectTaskType.OPEN,
+                assignee_id=None,
+                assigned_at=None,
+                title=f"Task {i}",
+                status=TaskStatus.DONE if i % 2 else TaskStatus.TODO,
+                created_at=datetime(2026, 1, 1 + i, tzinfo=timezone.utc),
+            )
+            for i in range(5)
+        ]
+        tasks[0].type = ProjectTaskType.DEFAULT
+        tasks[0].assignee_id = test_user.id
+        tasks[0].assigned_at = datetime.now(timezone.utc)
+
+        db_session.add_all(tasks)
+        await db_session.commit()
+
+        return tasks
+
+    async def test_ndjson(
+        self,
+        authenticated_client: AsyncClient,
+        test_user,
+        test_project,
+        tasks,
+        monkeypatch,
+    ):
+        # Several cursor batches and chunks
+        monkeypatch.setattr(settings.export, "yield_per", 2)
+
+        response = await authenticated_client.get(
+            f"/api/v1/projects/{test_project.id}/tasks:export",
+            params={"sort_by": "created_at", "order": "asc"},
+        )
+        rows = [json.loads(line) for line in response.text.splitlines()]
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/x-ndjson"
+        assert "attachment" in response.headers["content-disposition"]
+        assert [row["title"] for row in rows] == [f"Task {i}" for i in range(5)]
+        assert rows[0]["assignee"]["id"] == test_user.id
+        assert rows[0]["project"] == {"id": test_project.id}
+        assert rows[1]["assignee"] is None
+
+    async def test_csv_with_filters(
+        self, authenticated_client: AsyncClient, test_user, test_project, tasks
+    ):
+        response = await authenticated_client.get(
+            f"/api/v1/projects/{test_project.id}/tasks:export",
+            params={
+                "format": "csv",
+                "status": TaskStatus.TODO.value,
+                "sort_by": "created_at",
+                "order": "desc",
+            },
+        )
+        rows = list(csv.DictReader(io.StringIO(response.text)))
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "text/csv; charset=utf-8"
+        assert [row["title"] for row in rows] == ["Task 4", "Task 2", "Task 0"]
+        assert rows[2]["assignee.username"] == test_user.username
+        assert rows[0]["assignee.username"] == ""
+        assert rows[0]["project.id"] == str(test_project.id)
+
+    async def test_without_tasks(
+        self, authenticated_client: AsyncClient, test_project
+    ):
+        url = f"/api/v1/projects/{test_project.id}/tasks:export"
+
+        ndjson = await authenticated_client.get(url)
+        csv_response = await authenticated_client.get(url, params={"format": "csv"})
+
+        assert ndjson.status_code == 200
+        assert ndjson.text == ""
+        assert csv_response.text.splitlines()[0].startswith("id,type,title")
+
+    async def test_not_member(
+        self, authenticated_client: AsyncClient, db_session: AsyncSession, other_user
+    ):
+        project = await ProjectModelFactory.create(
+            session=db_session, creator_id=other_user.id
+        )
+
+        response = await authenticated_client.get(
+            f"/api/v1/projects/{project.id}/tasks:export"
+        )
+
+        assert response.status_code == 403
+
+    async def test_member(
+        self,
+        authenticated_client: AsyncClient,
+        db_session: AsyncSession,
+        test_user,
+        other_user,
+    ):
+        project = await ProjectModelFactory.create(
+            session=db_session,
+            creator_id=other_user.id,
+            members=[ProjectMemberModel(user_id=test_user.id, role=ProjectRole.MEMBER)],
+        )
+
+        response = await authenticated_client.get(
+            f"/api/v1/projects/{project.id}/tasks:export"
+        )
+
+        assert response.status_code == 200
+
+    async def test_invalid_format(
+        self, authenticated_client: AsyncClient, test_project
+    ):
+        response = await authenticated_client.get(
+            f"/api/v1/projects/{test_project.id}/tasks:export",
+            params={"format": "xml"},
+        )
+
+        assert response.status_code == 422
@@ -1,9 +1,17 @@
+import base64
+import json
 import pytest
+import time_machine
+from datetime import timedelta
 from httpx import AsyncClient
+from sqlalchemy import delete
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from enums.project_task import ProjectTaskType
+from modules.projects.cache import project_response_cache
+from modules.users.model import User as UserModel
 from enums.task import TaskStatus, TaskPriority
+from utils.datetime import utc_now
 
 from tests.factories.models import ProjectModelFactory, ProjectTaskModelFactory
 
@@ -130,6 +138,135 @@ class TestGetAllProjectTasks:
         assert resp_data["pagination"]["page"] == 2
         assert resp_data["pagination"]["size"] == 2
 
+    async def test_cursor_mode(
+        self,
+        authenticated_client: AsyncClient,
+        test_project,
+        test_multiple_project_tasks,
+    ):
+        url = f"/api/v1/projects/{test_project.id}/tasks"
+        params = {"mode": "cursor", "size": 2, "sort_by": "priority", "order": "desc"}
+
+        ids = []
+        pages = 0
+        while True:
+            response = await authenticated_client.get(url, params=params)
+            resp_data = response.json()
+
+            assert response.status_code == 200
+            assert resp_data["pagination"]["total"] is None
+
+            ids.extend(item["id"] for item in resp_data["items"])
+            pages += 1
+
+            next_cursor = resp_data["pagination"]["next_cursor"]
+            if next_cursor is None:
+                break
+            params["cursor"] = next_cursor
+
+        assert pages == 3
+        assert len(ids) == 5
+        assert ids[0] == test_multiple_project_tasks[3].id  # task4: CRITICAL
+        assert ids[1] == test_multiple_project_tasks[0].id  # task1: HIGH
+        assert ids[4] == test_multiple_project_tasks[2].id  # task3: LOW
+
+    async def test_offset_mode_has_no_cursor(
+        self,
+        authenticated_client: AsyncClient,
+        test_project,
+        test_multiple_project_tasks,
+    ):
+        response = await authenticated_client.get(
+            f"/api/v1/projects/{test_project.id}/tasks", params={"size": 2}
+        )
+        resp_data = response.json()
+
+        assert response.status_code == 200
+        assert resp_data["pagination"]["total"] == 5
+        assert resp_data["pagination"]["next_cursor"] is None
+
+    async def test_cursor_for_other_sorting(
+        self,
+        authenticated_client: AsyncClient,
+        test_project,
+        test_multiple_project_tasks,
+    ):
+        url = f"/api/v1/projects/{test_project.id}/tasks"
+
+        first = await authenticated_client.get(
+            url, params={"mode": "cursor", "size": 2, "sort_by": "deadline"}
+        )
+        cursor = first.json()["pagination"]["next_cursor"]
+
+        response = await authenticated_client.get(
+            url, params={"cursor": cursor, "size": 2, "sort_by": "priority"}
+        )
+
+        assert response.status_code == 400
+        assert response.json()["detail"] == "Invalid cursor."
+
+    async def test_relevance_most_relevant_first(
+        self,
+        authenticated_client: AsyncClient,
+        db_session: AsyncSession,
+        test_user,
+        test_project,
+    ):
+        in_description = await ProjectTaskModelFactory.create(
+            session=db_session,
+            type=ProjectTaskType.OPEN,
+            project_id=test_project.id,
+            title="Release",
+            description="Update the changelog",
+            created_by_id=test_user.id,
+        )
+        in_title = await ProjectTaskModelFactory.create(
+            session=db_session,
+            type=ProjectTaskType.OPEN,
+            project_id=test_project.id,
+            title="Changelog for the next version",
+            description=None,
+            created_by_id=test_user.id,
+        )
+
+        response = await authenticated_client.get(
+            f"/api/v1/projects/{test_project.id}/tasks",
+            params={"search": "changelog", "sort_by": "relevance"},
+        )
+
+        assert response.status_code == 200
+        assert [item["id"] for item in response.json()["items"]] == [
+            in_title.id,
+            in_description.id,
+        ]
+
+    @pytest.mark.parametrize(
+        "sort_by, value",
+        [
+            ("priority", "high"),
+            ("priority", {"a": 1}),
+            ("deadline", 3),
+            ("created_at", "not-a-date"),
+        ],
+    )
+    async def test_tampered_cursor(
+        self,
+        authenticated_client: AsyncClient,
+        test_project,
+        sort_by,
+        value,
+    ):
+        payload = {"s": sort_by, "o": "asc", "v": value, "d": False, "i": 1}
+        cursor = base64.urlsafe_b64encode(json.dumps(payload).encode()).decode()
+
+        response = await authenticated_client.get(
+            f"/api/v1/projects/{test_project.id}/tasks",
+            params={"mode": "cursor", "cursor": cursor, "sort_by": sort_by},
+        )
+
+        assert response.status_code == 400
+        assert response.json()["detail"] == "Invalid cursor."
+
     async def test_not_member_of_project(
         self,
         authenticated_client: AsyncClient,
@@ -150,3 +287,184 @@ class TestGetAllProjectTasks:
         response = await client.get(f"/api/v1/projects/{test_project.id}/tasks")
 
         assert response.status_code == 401
+
+
+@pytest.mark.integration
+class TestGetAllProjectTasksConditional:
+    """Tests for ETag / If-None-Match of GET /projects/{project_id}/tasks"""
+
+    async def test_not_modified(
+        self,
+        authenticated_client: AsyncClient,
+        db_session: AsyncSession,
+        test_project,
+        test_project_task,
+        record_statements,
+    ):
+        url = f"/api/v1/projects/{test_project.id}/tasks"
+        # Both responses render rows read from the database, not fixture objects
+        db_session.expunge_all()
+        etag = (await authenticated_client.get(url)).headers["etag"]
+        project_response_cache.clear()
+
+        with record_statements() as statements:
+            response = await authenticated_client.get(
+                url, headers={"If-None-Match": etag}
+            )
+
+        assert response.status_code == 304
+        assert response.headers["etag"] == etag
+        # Tagged by the body, no list version is read besides the page
+        assert not any("max(" in statement for statement in statements)
+
+    async def test_overdue_changes_with_time(
+        self,
+        authenticated_client: AsyncClient,
+        db_session: AsyncSession,
+        test_project,
+        test_project_task,
+    ):
+        test_project_task.deadline = utc_now() + timedelta(minutes=1)
+        await db_session.commit()
+        url = f"/api/v1/projects/{test_project.id}/tasks?overdue=true"
+        first = await authenticated_client.get(url)
+
+        # No task is written when the deadline passes
+        with time_machine.travel(utc_now() + timedelta(minutes=5)):
+            response = await authenticated_client.get(
+                url, headers={"If-None-Match": first.headers["etag"]}
+            )
+
+        assert first.json()["items"] == []
+        assert response.status_code == 200
+        assert [item["id"] for item in response.json()["items"]] == [
+            test_project_task.id
+        ]
+
+    async def test_changes_with_tasks(
+        self, authenticated_client: AsyncClient, test_project, test_project_task
+    ):
+        url = f"/api/v1/projects/{test_project.id}/tasks"
+        task_url = f"{url}/{test_project_task.id}"
+        etags = [(await authenticated_client.get(url)).headers["etag"]]
+
+        await authenticated_client.patch(task_url, json={"title": "New title"})
+        etags.append((await authenticated_client.get(url)).headers["etag"])
+        await authenticated_client.delete(task_url)
+        response = await authenticated_client.get(
+            url, headers={"If-None-Match": ", ".join(etags)}
+        )
+
+        assert response.status_code == 200
+        assert response.json()["items"] == []
+        assert len({*etags, response.headers["etag"]}) == 3
+
+    async def test_changes_with_shown_users(
+        self, authenticated_client: AsyncClient, test_project, test_project_task
+    ):
+        url = f"/api/v1/projects/{test_project.id}/tasks"
+        etag = (await authenticated_client.get(url)).headers["etag"]
+
+        # The assignee and creator of the task is renamed, the task isn't written
+        await authenticated_client.patch(
+            "/api/v1/users/me", json={"username": "renamed_user"}
+        )
+        response = await authenticated_client.get(url, headers={"If-None-Match": etag})
+
+        assert response.status_code == 200
+        assert response.json()["items"][0]["assignee"]["username"] == "renamed_user"
+        assert response.headers["etag"] != etag
+
+    async def test_changes_with_deleted_assignee(
+        self,
+        authenticated_client: AsyncClient,
+        db_session: AsyncSession,
+        test_user,
+        test_project,
+        other_user,
+    ):
+        await ProjectTaskModelFactory.create(
+            session=db_session,
+            # Default tasks can't lose their assignee
+            type=ProjectTaskType.OPEN,
+            project_id=test_project.id,
+            created_by_id=test_user.id,
+            assignee_id=other_user.id,
+        )
+        url = f"/api/v1/projects/{test_project.id}/tasks"
+        etag = (await authenticated_client.get(url)).headers["etag"]
+
+        # The foreign key unassigns the task without moving its updated_at
+        await db_session.execute(delete(UserModel).where(UserModel.id == other_user.id))
+        await db_session.commit()
+        project_response_cache.clear()
+        response = await authenticated_client.get(url, headers={"If-None-Match": etag})
+
+        assert response.status_code == 200
+        assert response.json()["items"][0]["assignee"] is None
+
+    async def test_depends_on_query(
+        self, authenticated_client: AsyncClient, test_project, test_project_task
+    ):
+        url = f"/api/v1/projects/{test_project.id}/tasks"
+        etag = (await authenticated_client.get(url)).headers["etag"]
+
+        response = await authenticated_client.get(
+            url,
+            params={"status": TaskStatus.DONE.value},
+            headers={"If-None-Match": etag},
+        )
+
+        assert response.status_code == 200
+        assert response.headers["etag"] != etag
+
+
+@pytest.mark.integration
+class TestGetAllProjectTasksCache:
+    """Tests for the response cache of GET /projects/{project_id}/tasks"""
+
+    async def test_cached(
+        self,
+        authenticated_client: AsyncClient,
+        test_project,
+        test_project_task,
+        record_statements,
+    ):
+        url = f"/api/v1/projects/{test_project.id}/tasks"
+        first = await authenticated_client.get(url, params={"page": 1, "size": 20})
+
+        with record_statements() as statements:
+            response = await authenticated_client.get(
+                url, params={"size": 20, "page": 1}
+            )
+
+        assert response.json() == first.json()
+        assert response.headers["etag"] == first.headers["etag"]
+        assert len(statements) == 0
+
+    async def test_keyed_by_query(
+        self, authenticated_client: AsyncClient, test_project, test_project_task
+    ):
+        url = f"/api/v1/projects/{test_project.id}/tasks"
+        await authenticated_client.get(url)
+
+        response = await authenticated_client.get(
+            url, params={"status": TaskStatus.DONE.value}
+        )
+
+        assert response.json()["items"] == []
+
+    async def test_invalidated_by_task_writes(
+        self, authenticated_client: AsyncClient, test_project, test_project_task
+    ):
+        url = f"/api/v1/projects/{test_project.id}/tasks"
+        task_url = f"{url}/{test_project_task.id}"
+        await authenticated_client.get(url)
+
+        await authenticated_client.patch(task_url, json={"title": "New title"})
+        updated = await authenticated_client.get(url)
+        await authenticated_client.delete(task_url)
+        deleted = await authenticated_client.get(url)
+
+        assert updated.json()["items"][0]["title"] == "New title"
+        assert deleted.json()["items"] == []
@@ -121,3 +121,58 @@ class TestGetProjectTask:
         )
 
         assert response.status_code == 401
+
+
+@pytest.mark.integration
+class TestGetProjectTaskConditional:
+    """Tests for ETag / If-None-Match of GET /projects/{project_id}/tasks/{task_id}"""
+
+    async def test_not_modified(
+        self,
+        authenticated_client: AsyncClient,
+        test_project,
+        test_project_task,
+        record_statements,
+    ):
+        url = f"/api/v1/projects/{test_project.id}/tasks/{test_project_task.id}"
+        etag = (await authenticated_client.get(url)).headers["etag"]
+
+        with record_statements() as statements:
+            response = await authenticated_client.get(
+                url, headers={"If-None-Match": etag}
+            )
+
+        assert response.status_code == 304
+        assert response.headers["etag"] == etag
+        assert response.content == b""
+        # Only the task version, the membership is cached by the first request
+        assert len(statements) == 1
+
+    async def test_modified(
+        self, authenticated_client: AsyncClient, test_project, test_project_task
+    ):
+        url = f"/api/v1/projects/{test_project.id}/tasks/{test_project_task.id}"
+        etag = (await authenticated_client.get(url)).headers["etag"]
+
+        await authenticated_client.patch(url, json={"title": "New title"})
+        response = await authenticated_client.get(url, headers={"If-None-Match": etag})
+
+        assert response.status_code == 200
+        assert response.json()["title"] == "New title"
+        assert response.headers["etag"] != etag
+
+    async def test_modified_with_shown_users(
+        self, authenticated_client: AsyncClient, test_project, test_project_task
+    ):
+        url = f"/api/v1/projects/{test_project.id}/tasks/{test_project_task.id}"
+        etag = (await authenticated_client.get(url)).headers["etag"]
+
+        # The assignee and creator of the task is renamed, the task isn't written
+        await authenticated_client.patch(
+            "/api/v1/users/me", json={"username": "renamed_user"}
+        )
+        response = await authenticated_client.get(url, headers={"If-None-Match": etag})
+
+        assert response.status_code == 200
+        assert response.json()["assignee"]["username"] == "renamed_user"
+        assert response.headers["etag"] != etag
@@ -349,3 +349,32 @@ class TestUnassignOpenTask:
 
         await db_session.refresh(task)
         assert task.assignee_id == test_user.id
+
+    async def test_statement_count(
+        self,
+        authenticated_client: AsyncClient,
+        db_session: AsyncSession,
+        test_project,
+        test_user,
+        record_statements,
+    ):
+        task = await ProjectTaskModelFactory.create(
+            session=db_session,
+            project_id=test_project.id,
+            type=ProjectTaskType.OPEN,
+            assignee_id=test_user.id,
+            assigned_at=datetime.now(timezone.utc),
+            created_by_id=test_user.id,
+        )
+
+        with record_statements() as statements:
+            response = await authenticated_client.delete(
+                f"/api/v1/projects/{test_project.id}/tasks/{task.id}/assign"
+            )
+        resp_data = response.json()
+
+        assert response.status_code == 200
+        # User, membership, task, update with relations
+        assert len(statements) == 4
+        assert resp_data["assignee"] is None
+        assert resp_data["assigned_at"] is None
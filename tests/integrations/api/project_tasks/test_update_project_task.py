@@ -378,3 +378,91 @@ class TestUpdateProjectTask:
 
         await db_session.refresh(test_project_task)
         assert test_project_task.title != update_data["title"]
+
+    async def test_statement_count(
+        self,
+        authenticated_client: AsyncClient,
+        db_session: AsyncSession,
+        test_project,
+        test_project_task,
+        other_user,
+        record_statements,
+    ):
+        db_session.add(
+            ProjectMemberModel(
+                user_id=other_user.id,
+                project_id=test_project.id,
+                role=ProjectRole.MEMBER,
+            )
+        )
+        await db_session.commit()
+
+        with record_statements() as statements:
+            response = await authenticated_client.patch(
+                f"/api/v1/projects/{test_project.id}/tasks/{test_project_task.id}",
+                json={"title": "New title", "assignee_id": other_user.id},
+            )
+        resp_data = response.json()
+
+        assert response.status_code == 200
+        # User, membership, task, new assignee membership, update with relations
+        assert len(statements) == 5
+        assert resp_data["title"] == "New title"
+        assert resp_data["assignee"]["id"] == other_user.id
+        assert resp_data["assignee"]["username"] == other_user.username
+        assert resp_data["creator"]["id"] == test_project_task.created_by_id
+
+
+@pytest.mark.integration
+class TestUpdateProjectTaskConditional:
+    """Tests for If-Match of PATCH /projects/{project_id}/tasks/{task_id}"""
+
+    async def test_matching_version(
+        self, authenticated_client: AsyncClient, test_project, test_project_task
+    ):
+        url = f"/api/v1/projects/{test_project.id}/tasks/{test_project_task.id}"
+        etag = (await authenticated_client.get(url)).headers["etag"]
+
+        response = await authenticated_client.patch(
+            url, json={"title": "New title"}, headers={"If-Match": etag}
+        )
+
+        assert response.status_code == 200
+        assert response.json()["title"] == "New title"
+        assert response.headers["etag"] != etag
+        assert (await authenticated_client.get(url)).headers["etag"] == (
+            response.headers["etag"]
+        )
+
+    async def test_stale_version(
+        self,
+        authenticated_client: AsyncClient,
+        db_session: AsyncSession,
+        test_project,
+        test_project_task,
+    ):
+        url = f"/api/v1/projects/{test_project.id}/tasks/{test_project_task.id}"
+        etag = (await authenticated_client.get(url)).headers["etag"]
+        await authenticated_client.patch(url, json={"title": "First write"})
+
+        response = await authenticated_client.patch(
+            url, json={"title": "Second write"}, headers={"If-Match": etag}
+        )
+
+        assert response.status_code == 412
+        await db_session.refresh(test_project_task)
+        assert test_project_task.title == "First write"
+
+    async def test_weak_version(
+        self, authenticated_client: AsyncClient, test_project, test_project_task
+    ):
+        url = f"/api/v1/projects/{test_project.id}/tasks/{test_project_task.id}"
+        etag = (await authenticated_client.get(url)).headers["etag"]
+
+        # If-Match compares strongly, a weak tag never matches
+        response = await authenticated_client.patch(
+            url, json={"title": "New title"}, headers={"If-Match": f"W/{etag}"}
+        )
+
+        assert not etag.startswith("W/")
+        assert response.status_code == 412
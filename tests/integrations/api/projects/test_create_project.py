@@ -102,3 +102,21 @@ class TestCreateProject:
         response = await client.post("api/v1/projects")
 
         assert response.status_code == 401
+
+    async def test_statement_count(
+        self, authenticated_client: AsyncClient, test_user, record_statements
+    ):
+        with record_statements() as statements:
+            response = await authenticated_client.post(
+                "api/v1/projects", json={"title": "Test"}
+            )
+        resp_data = response.json()
+
+        assert response.status_code == 201
+        # User, project insert with creator, owner membership insert
+        assert len(statements) == 3
+        assert resp_data["creator"]["username"] == test_user.username
+        assert resp_data["member_count"] == 1
+        assert len(resp_data["members_preview"]) == 1
+        assert resp_data["members_preview"][0]["user_id"] == test_user.id
+        assert resp_data["members_preview"][0]["role"] == ProjectRole.OWNER.value
@@ -1,8 +1,10 @@
 import pytest
 from httpx import AsyncClient
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
+from db import session as db_session_module
 from modules.project_members.model import ProjectMember as ProjectMemberModel
+from modules.projects.cache import project_response_cache
 from enums.project import ProjectRole
 
 from tests.factories.models import ProjectModelFactory
@@ -63,3 +65,125 @@ class TestCreateProject:
         response = await client.get(f"/api/v1/projects/{test_project.id}")
 
         assert response.status_code == 401
+
+
+@pytest.mark.integration
+class TestGetProjectConditional:
+    """Tests for ETag / If-None-Match of GET /projects/{project_id}"""
+
+    async def test_not_modified(
+        self, authenticated_client: AsyncClient, test_project, record_statements
+    ):
+        url = f"/api/v1/projects/{test_project.id}"
+        etag = (await authenticated_client.get(url)).headers["etag"]
+        project_response_cache.clear()
+
+        with record_statements() as statements:
+            response = await authenticated_client.get(
+                url, headers={"If-None-Match": etag}
+            )
+
+        assert response.status_code == 304
+        assert response.headers["etag"] == etag
+        # Only the project version, no creator or members are read
+        assert len(statements) == 1
+
+    async def test_modified_by_member_changes(
+        self,
+        authenticated_client: AsyncClient,
+        db_session: AsyncSession,
+        test_project,
+        other_user,
+    ):
+        url = f"/api/v1/projects/{test_project.id}"
+        etag = (await authenticated_client.get(url)).headers["etag"]
+
+        await authenticated_client.post(
+            f"{url}/members",
+            json={"user_id": other_user.id, "role": ProjectRole.MEMBER.value},
+        )
+        # Requests share the test session, read the project like a fresh one
+        db_session.expunge_all()
+        response = await authenticated_client.get(url, headers={"If-None-Match": etag})
+
+        assert response.status_code == 200
+        assert response.json()["member_count"] == 2
+        assert response.headers["etag"] != etag
+
+
+@pytest.mark.integration
+class TestGetProjectCache:
+    """Tests for the response cache of GET /projects/{project_id}"""
+
+    async def test_cached(
+        self, authenticated_client: AsyncClient, test_project, record_statements
+    ):
+        url = f"/api/v1/projects/{test_project.id}"
+        first = await authenticated_client.get(url)
+
+        with record_statements() as statements:
+            response = await authenticated_client.get(url)
+            not_modified = await authenticated_client.get(
+                url, headers={"If-None-Match": first.headers["etag"]}
+            )
+
+        assert response.status_code == 200
+        assert response.json() == first.json()
+        assert response.headers["etag"] == first.headers["etag"]
+        assert not_modified.status_code == 304
+        assert len(statements) == 0
+
+    async def test_not_cached_from_replica(
+        self,
+        authenticated_client: AsyncClient,
+        db_session: AsyncSession,
+        test_project,
+        record_statements,
+        monkeypatch,
+    ):
+        # A "replica" seeing the test transaction
+        fabric = async_sessionmaker(
+            bind=db_session.bind,
+            class_=AsyncSession,
+            join_transaction_mode="create_savepoint",
+        )
+        monkeypatch.setattr(db_session_module, "replica_session_fabric", fabric)
+        url = f"/api/v1/projects/{test_project.id}"
+        first = await authenticated_client.get(url)
+
+        with record_statements() as statements:
+            response = await authenticated_client.get(url)
+
+        assert response.status_code == 200
+        assert response.json() == first.json()
+        assert len(statements) > 0
+
+    async def test_invalidated_by_update(
+        self, authenticated_client: AsyncClient, test_project
+    ):
+        url = f"/api/v1/projects/{test_project.id}"
+        await authenticated_client.get(url)
+
+        await authenticated_client.patch(url, json={"title": "New title"})
+        response = await authenticated_client.get(url)
+
+        assert response.json()["title"] == "New title"
+
+    async def test_invalidated_by_member_changes(
+        self,
+        authenticated_client: AsyncClient,
+        db_session: AsyncSession,
+        test_project,
+        other_user,
+    ):
+        url = f"/api/v1/projects/{test_project.id}"
+        await authenticated_client.get(url)
+
+        await authenticated_client.post(
+            f"{url}/members",
+            json={"user_id": other_user.id, "role": ProjectRole.MEMBER.value},
+        )
+        db_session.expunge_all()
+        response = await authenticated_client.get(url)
+
+        assert response.json()["member_count"] == 2
@@ -0,0 +1,92 @@
+import pytest
+from datetime import datetime, timedelta, timezone
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from enums.project_task import ProjectTaskType
+from enums.task import TaskStatus, TaskPriority
+
+from tests.factories.models import ProjectModelFactory
+
+
+@pytest.mark.integration
+class TestGetProjectTaskStats:
+    """Tests for GET /projects/{project_id}/stats endpoint"""
+
+    async def test_kept_by_task_endpoints(
+        self,
+        authenticated_client: AsyncClient,
+        test_user,
+        test_project,
+        record_statements,
+    ):
+        url = f"/api/v1/projects/{test_project.id}/tasks"
+        past = (datetime.now(timezone.utc) - timedelta(days=1)).isoformat()
+        tasks = [
+            {"type": ProjectTaskType.OPEN.value, "title": "Open", "deadline": past},
+            {
+                "type": ProjectTaskType.DEFAULT.value,
+                "assignee_id": test_user.id,
+                "title": "Assigned",
+                "priority": TaskPriority.HIGH.value,
+            },
+            {"type": ProjectTaskType.OPEN.value, "title": "Removed"},
+        ]
+        task_ids = []
+        for task in tasks:
+            response = await authenticated_client.post(url, json=task)
+            task_ids.append(response.json()["id"])
+
+        await authenticated_client.patch(
+            f"{url}/{task_ids[1]}", json={"status": TaskStatus.DONE.value}
+        )
+        await authenticated_client.delete(f"{url}/{task_ids[2]}")
+
+        with record_statements() as statements:
+            response = await authenticated_client.get(
+                f"/api/v1/projects/{test_project.id}/stats"
+            )
+        resp_data = response.json()
+
+        assert response.status_code == 200
+        # Stats with overdue count, user and membership are cached by now
+        assert len(statements) == 1
+        assert resp_data == {
+            "project_id": test_project.id,
+            "total": 2,
+            "unassigned": 1,
+            "overdue": 1,
+            "by_status": {"todo": 1, "in_progress": 0, "done": 1, "cancelled": 0},
+            "by_priority": {"low": 0, "medium": 1, "high": 1, "critical": 0},
+        }
+
+    async def test_without_tasks(
+        self, authenticated_client: AsyncClient, test_project
+    ):
+        response = await authenticated_client.get(
+            f"/api/v1/projects/{test_project.id}/stats"
+        )
+        resp_data = response.json()
+
+        assert response.status_code == 200
+        assert resp_data["total"] == 0
+        assert resp_data["overdue"] == 0
+        assert set(resp_data["by_status"].values()) == {0}
+
+    async def test_not_member(
+        self, authenticated_client: AsyncClient, db_session: AsyncSession, other_user
+    ):
+        project = await ProjectModelFactory.create(
+            session=db_session, creator_id=other_user.id
+        )
+
+        response = await authenticated_client.get(
+            f"/api/v1/projects/{project.id}/stats"
+        )
+
+        assert response.status_code == 403
+
+    async def test_without_token(self, client: AsyncClient, test_project):
+        response = await client.get(f"/api/v1/projects/{test_project.id}/stats")
+
+        assert response.status_code == 401
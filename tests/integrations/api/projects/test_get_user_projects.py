@@ -1,12 +1,14 @@
 import pytest
+import time_machine
 from httpx import AsyncClient
 from datetime import datetime, timedelta, timezone
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from modules.project_members.model import ProjectMember as ProjectMemberModel
 from enums.project import ProjectRole, ProjectStatus
+from utils.datetime import utc_now
 
-from tests.factories.models import ProjectModelFactory
+from tests.factories.models import ProjectModelFactory, UserModelFactory
 
 
 @pytest.mark.integration
@@ -103,7 +105,7 @@ class TestGetUserProjects:
         assert project_data["title"] == "Target title"
 
         user_member = None
-        for member in project_data["members"]:
+        for member in project_data["members_preview"]:
             if member["user_id"] == test_user.id:
                 user_member = member
 
@@ -177,7 +179,105 @@ class TestGetUserProjects:
         assert resp_data["pagination"]["total"] == 5
         assert resp_data["pagination"]["page"] == 3
 
+    async def test_members_preview(
+        self,
+        authenticated_client: AsyncClient,
+        db_session: AsyncSession,
+        test_user,
+        record_statements,
+    ):
+        users = UserModelFactory.batch(size=7)
+        db_session.add_all(users)
+        await db_session.commit()
+
+        joined_at = datetime.now(timezone.utc)
+        members = [
+            ProjectMemberModel(
+                user_id=user.id,
+                role=ProjectRole.MEMBER,
+                joined_at=joined_at + timedelta(minutes=i),
+            )
+            for i, user in enumerate(users[:-1])
+        ]
+        # Joined last, but listed right after the owner
+        members.append(
+            ProjectMemberModel(
+                user_id=users[-1].id,
+                role=ProjectRole.ADMIN,
+                joined_at=joined_at + timedelta(hours=1),
+            )
+        )
+        big_project = await ProjectModelFactory.create(
+            session=db_session, creator_id=test_user.id, members=members
+        )
+        small_project = await ProjectModelFactory.create(
+            session=db_session, creator_id=test_user.id
+        )
+
+        with record_statements() as statements:
+            response = await authenticated_client.get("api/v1/projects")
+        resp_data = response.json()
+
+        assert response.status_code == 200
+        # User, page with creators and member counts, members preview
+        assert len(statements) == 3
+
+        items = {item["id"]: item for item in resp_data["items"]}
+        big_project_data = items[big_project.id]
+        assert big_project_data["member_count"] == 8
+        assert [m["user_id"] for m in big_project_data["members_preview"]] == [
+            test_user.id,
+            users[-1].id,
+            *[user.id for user in users[:3]],
+        ]
+        small_project_data = items[small_project.id]
+        assert small_project_data["member_count"] == 1
+        assert [m["user_id"] for m in small_project_data["members_preview"]] == [
+            test_user.id
+        ]
+
     async def test_without_token(self, client: AsyncClient):
         response = await client.get("api/v1/projects")
 
         assert response.status_code == 401
+
+
+@pytest.mark.integration
+class TestGetUserProjectsConditional:
+    """Tests for ETag / If-None-Match of GET /projects"""
+
+    async def test_overdue_changes_with_time(
+        self, authenticated_client: AsyncClient, db_session: AsyncSession, test_project
+    ):
+        test_project.status = ProjectStatus.ACTIVE
+        test_project.deadline = utc_now() + timedelta(minutes=1)
+        await db_session.commit()
+        url = "/api/v1/projects?overdue=true"
+        first = await authenticated_client.get(url)
+
+        # No project is written when the deadline passes
+        with time_machine.travel(utc_now() + timedelta(minutes=5)):
+            response = await authenticated_client.get(
+                url, headers={"If-None-Match": first.headers["etag"]}
+            )
+
+        assert first.json()["items"] == []
+        assert response.status_code == 200
+        assert [item["id"] for item in response.json()["items"]] == [test_project.id]
+
+    async def test_not_modified_until_changed(
+        self, authenticated_client: AsyncClient, test_project
+    ):
+        url = "/api/v1/projects"
+        etag = (await authenticated_client.get(url)).headers["etag"]
+
+        not_modified = await authenticated_client.get(
+            url, headers={"If-None-Match": etag}
+        )
+        await authenticated_client.post(url, json={"title": "Second project"})
+        modified = await authenticated_client.get(url, headers={"If-None-Match": etag})
+
+        assert not_modified.status_code == 304
+        assert modified.status_code == 200
+        assert modified.json()["pagination"]["total"] == 2
+        assert modified.headers["etag"] != etag
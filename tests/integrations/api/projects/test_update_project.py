@@ -167,3 +167,72 @@ class TestPatchProject:
         await db_session.refresh(test_project)
 
         assert test_project.title != "Test"
+
+    async def test_statement_count(
+        self,
+        authenticated_client: AsyncClient,
+        db_session: AsyncSession,
+        test_user,
+        other_user,
+        record_statements,
+    ):
+        project = await ProjectModelFactory.create(
+            session=db_session,
+            creator_id=test_user.id,
+            members=[
+                ProjectMemberModel(user_id=other_user.id, role=ProjectRole.MEMBER)
+            ],
+        )
+
+        with record_statements() as statements:
+            response = await authenticated_client.patch(
+                f"api/v1/projects/{project.id}", json={"title": "Test"}
+            )
+        resp_data = response.json()
+
+        assert response.status_code == 200
+        # User, membership, update with creator and member count, members preview
+        assert len(statements) == 4
+        assert resp_data["title"] == "Test"
+        assert resp_data["creator"]["username"] == test_user.username
+        assert resp_data["member_count"] == 2
+        assert {member["user_id"] for member in resp_data["members_preview"]} == {
+            test_user.id,
+            other_user.id,
+        }
+
+
+@pytest.mark.integration
+class TestPatchProjectConditional:
+    """Tests for If-Match of PATCH /projects/{project_id}"""
+
+    async def test_matching_version(
+        self, authenticated_client: AsyncClient, test_project
+    ):
+        url = f"/api/v1/projects/{test_project.id}"
+        etag = (await authenticated_client.get(url)).headers["etag"]
+
+        response = await authenticated_client.patch(
+            url, json={"title": "New title"}, headers={"If-Match": etag}
+        )
+
+        assert response.status_code == 200
+        assert response.json()["title"] == "New title"
+        assert response.headers["etag"] == (
+            (await authenticated_client.get(url)).headers["etag"]
+        )
+
+    async def test_stale_version(
+        self, authenticated_client: AsyncClient, db_session: AsyncSession, test_project
+    ):
+        url = f"/api/v1/projects/{test_project.id}"
+        etag = (await authenticated_client.get(url)).headers["etag"]
+        await authenticated_client.patch(url, json={"title": "First write"})
+
+        response = await authenticated_client.patch(
+            url, json={"title": "Second write"}, headers={"If-Match": etag}
+        )
+
+        assert response.status_code == 412
+        await db_session.refresh(test_project)
+        assert test_project.title == "First write"
@@ -0,0 +1,484 @@
+"""
+SQL statement budgets of every route of the v1 api.
+
+Each case is a request on cold caches, the way the first request of a user
+after a deploy runs. A change adding round-trips to a route fails its case;
+if the extra statement is intended, raise the budget in the same change.
+"""
+
+import pytest
+from dataclasses import dataclass, field
+from typing import Any, Callable
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from main import app
+from core.security.jwt_handler import JWTHandler
+from enums.project import ProjectRole
+from enums.project_task import ProjectTaskType
+from enums.token import TokenType
+from modules.project_members.model import ProjectMember as ProjectMemberModel
+from utils.datetime import utc_now
+
+from tests.factories.models import (
+    PersonalTaskModelFactory,
+    ProjectModelFactory,
+    ProjectTaskModelFactory,
+    UserModelFactory,
+)
+
+# Rows of every listed kind, more than the largest page or batch of the cases
+ITEMS = 25
+# Ids of the seeded rows, above the ones of the factories
+FIRST_ID = 100_000
+
+
+@dataclass(frozen=True)
+class Seeded:
+    user_id: int
+    member_id: int
+    # Not a member of the project
+    outsider_id: int
+    project_id: int
+    task_id: int
+    open_task_id: int
+    assigned_open_task_id: int
+    personal_task_id: int
+    # Tasks of the project besides the fixture ones, for batches
+    task_ids: list[int]
+
+
+@dataclass(frozen=True)
+class Case:
+    method: str
+    path: str
+    budget: int
+    status_code: int
+    # Keyword arguments of 'AsyncClient.request' but the url, 'n' is the page
+    # or batch size of the scaling cases
+    request: Callable[[Seeded, int], dict[str, Any]] = lambda seeded, n: {}
+    # Same number of statements for a page or batch of 1 and of 'ITEMS'
+    scales: bool = False
+    path_params: Callable[[Seeded], dict[str, int]] = field(
+        default=lambda seeded: {"project_id": seeded.project_id}
+    )
+
+    @property
+    def id(self) -> str:
+        return f"{self.method} {self.path}"
+
+    def url(self, seeded: Seeded) -> str:
+        return "/api/v1" + self.path.format(**self.path_params(seeded))
+
+
+def _task(seeded: Seeded) -> dict[str, int]:
+    return {"project_id": seeded.project_id, "task_id": seeded.task_id}
+
+
+def _open_task(seeded: Seeded) -> dict[str, int]:
+    return {"project_id": seeded.project_id, "task_id": seeded.open_task_id}
+
+
+def _assigned_open_task(seeded: Seeded) -> dict[str, int]:
+    return {"project_id": seeded.project_id, "task_id": seeded.assigned_open_task_id}
+
+
+def _member(seeded: Seeded) -> dict[str, int]:
+    return {"project_id": seeded.project_id, "user_id": seeded.member_id}
+
+
+def _page(seeded: Seeded, n: int) -> dict[str, Any]:
+    return {"params": {"size": n}}
+
+
+CASES = [
+    # Users
+    Case("GET", "/users/me", 1, 200),
+    # Renames and deletes also read the projects whose cached responses
+    # show the user
+    Case(
+        "PATCH",
+        "/users/me",
+        4,
+        200,
+        request=lambda seeded, n: {"json": {"username": "renamed_user"}},
+    ),
+    # As a member without tasks, an assignee of default tasks can't be deleted
+    Case(
+        "DELETE",
+        "/users/me",
+        3,
+        204,
+        request=lambda seeded, n: {
+            "headers": {
+                "Authorization": "Bearer "
+                + JWTHandler.create(
+                    user_id=seeded.member_id, token_type=TokenType.ACCESS
+                )
+            }
+        },
+    ),
+    # Auth
+    Case(
+        "POST",
+        "/auth/register",
+        2,
+        200,
+        request=lambda seeded, n: {
+            "json": {
+                "username": "new_user",
+                "email": "new_user@example.com",
+                "password": "NewPassword123!",
+            }
+        },
+    ),
+    Case(
+        "POST",
+        "/auth/login",
+        1,
+        200,
+        request=lambda seeded, n: {
+            "data": {"username": "test_user", "password": "TestPassword123!"}
+        },
+    ),
+    Case(
+        "POST",
+        "/auth/refresh",
+        1,
+        200,
+        request=lambda seeded, n: {
+            "json": {
+                "refresh_token": JWTHandler.create(
+                    user_id=seeded.user_id, token_type=TokenType.REFRESH
+                )
+            }
+        },
+    ),
+    # Personal tasks
+    Case("GET", "/personal_tasks", 2, 200, request=_page, scales=True),
+    Case(
+        "POST",
+        "/personal_tasks",
+        2,
+        201,
+        request=lambda seeded, n: {"json": {"title": "New task"}},
+    ),
+    Case(
+        "GET",
+        "/personal_tasks/{task_id}",
+        2,
+        200,
+        path_params=lambda seeded: {"task_id": seeded.personal_task_id},
+    ),
+    Case(
+        "PATCH",
+        "/personal_tasks/{task_id}",
+        3,
+        200,
+        request=lambda seeded, n: {"json": {"title": "Renamed"}},
+        path_params=lambda seeded: {"task_id": seeded.personal_task_id},
+    ),
+    Case(
+        "DELETE",
+        "/personal_tasks/{task_id}",
+        3,
+        204,
+        path_params=lambda seeded: {"task_id": seeded.personal_task_id},
+    ),
+    Case("GET", "/personal_tasks:export", 2, 200),
+    # Rows are copied on the raw connection, the recorder only sees the
+    # principal. Not a scaling case: a COPY is sent per 'importing.chunk_size'
+    # rows, which 'test_ndjson' of the import tests counts.
+    Case(
+        "POST",
+        "/personal_tasks:import",
+        1,
+        200,
+        request=lambda seeded, n: {
+            "content": "".join(f'{{"title": "Imported {i}"}}\n' for i in range(n)),
+            "headers": {"Content-Type": "application/x-ndjson"},
+        },
+    ),
+    # Projects
+    Case("GET", "/projects", 3, 200, request=_page, scales=True),
+    Case(
+        "POST",
+        "/projects",
+        3,
+        201,
+        request=lambda seeded, n: {"json": {"title": "New project"}},
+    ),
+    Case("GET", "/projects/{project_id}", 4, 200),
+    Case("GET", "/projects/{project_id}/stats", 3, 200),
+    Case(
+        "PATCH",
+        "/projects/{project_id}",
+        4,
+        200,
+        request=lambda seeded, n: {"json": {"title": "Renamed"}},
+    ),
+    Case("DELETE", "/projects/{project_id}", 3, 204),
+    # Project members
+    Case("GET", "/projects/{project_id}/members", 3, 200, request=_page, scales=True),
+    Case(
+        "POST",
+        "/projects/{project_id}/members",
+        5,
+        201,
+        request=lambda seeded, n: {
+            "json": {"user_id": seeded.outsider_id, "role": ProjectRole.MEMBER.value}
+        },
+    ),
+    Case(
+        "PATCH",
+        "/projects/{project_id}/members/{user_id}",
+        4,
+        200,
+        request=lambda seeded, n: {"json": {"role": ProjectRole.ADMIN.value}},
+        path_params=_member,
+    ),
+    Case(
+        "DELETE",
+        "/projects/{project_id}/members/{user_id}",
+        5,
+        204,
+        path_params=_member,
+    ),
+    # Project tasks
+    Case("GET", "/projects/{project_id}/tasks", 3, 200, request=_page, scales=True),
+    Case(
+        "POST",
+        "/projects/{project_id}/tasks",
+        4,
+        201,
+        request=lambda seeded, n: {
+            "json": {
+                "type": ProjectTaskType.DEFAULT.value,
+                "assignee_id": seeded.member_id,
+                "title": "New task",
+            }
+        },
+    ),
+    Case("GET", "/projects/{project_id}/tasks/{task_id}", 3, 200, path_params=_task),
+    Case(
+        "PATCH",
+        "/projects/{project_id}/tasks/{task_id}",
+        4,
+        200,
+        request=lambda seeded, n: {"json": {"title": "Renamed"}},
+        path_params=_task,
+    ),
+    Case(
+        "DELETE",
+        "/projects/{project_id}/tasks/{task_id}",
+        5,
+        204,
+        path_params=_task,
+    ),
+    Case(
+        "POST",
+        "/projects/{project_id}/tasks/{task_id}/assign",
+        4,
+        200,
+        path_params=_open_task,
+    ),
+    Case(
+        "DELETE",
+        "/projects/{project_id}/tasks/{task_id}/assign",
+        4,
+        200,
+        path_params=_assigned_open_task,
+    ),
+    Case(
+        "POST",
+        "/projects/{project_id}/tasks:batch",
+        4,
+        200,
+        request=lambda seeded, n: {
+            "json": {
+                "items": [
+                    {
+                        "type": ProjectTaskType.DEFAULT.value,
+                        "assignee_id": seeded.member_id,
+                        "title": f"Task {i}",
+                    }
+                    for i in range(n)
+                ]
+            }
+        },
+        scales=True,
+    ),
+    Case(
+        "PATCH",
+        "/projects/{project_id}/tasks:batch",
+        5,
+        200,
+        request=lambda seeded, n: {
+            "json": {
+                "items": [
+                    {"id": task_id, "title": "Renamed"}
+                    for task_id in seeded.task_ids[:n]
+                ]
+            }
+        },
+        scales=True,
+    ),
+    Case(
+        "DELETE",
+        "/projects/{project_id}/tasks:batch",
+        3,
+        200,
+        request=lambda seeded, n: {"json": {"ids": seeded.task_ids[:n]}},
+        scales=True,
+    ),
+    Case("GET", "/projects/{project_id}/tasks:export", 3, 200),
+]
+
+
+@pytest.fixture
+async def seeded(
+    db_session: AsyncSession,
+    test_user,
+    other_user,
+    test_project,
+) -> Seeded:
+    """
+    test_user owns test_project and 'ITEMS' more projects, has 'ITEMS'
+    personal tasks; test_project has 'ITEMS' members and tasks.
+    """
+    now = utc_now()
+
+    db_session.add(
+        ProjectMemberModel(
+            project_id=test_project.id, user_id=other_user.id, role=ProjectRole.MEMBER
+        )
+    )
+    users = [UserModelFactory.build(id=FIRST_ID + i) for i in range(ITEMS)]
+    db_session.add_all(users)
+    await db_session.flush()
+    # The last one is left out, the outsider
+    db_session.add_all(
+        ProjectMemberModel(
+            project_id=test_project.id, user_id=user.id, role=ProjectRole.MEMBER
+        )
+        for user in users[:-1]
+    )
+
+    for i in range(ITEMS):
+        project = ProjectModelFactory.build(id=FIRST_ID + i, creator_id=test_user.id)
+        project.members.append(
+            ProjectMemberModel(user_id=test_user.id, role=ProjectRole.OWNER)
+        )
+        db_session.add(project)
+
+    personal_tasks = [
+        PersonalTaskModelFactory.build(id=FIRST_ID + i, user_id=test_user.id)
+        for i in range(ITEMS)
+    ]
+    # Ids of the fixture tasks would be taken by the next created ones
+    task = ProjectTaskModelFactory.build(
+        id=FIRST_ID - 3,
+        type=ProjectTaskType.DEFAULT,
+        project_id=test_project.id,
+        assignee_id=test_user.id,
+        assigned_at=now,
+        created_by_id=test_user.id,
+    )
+    open_task = ProjectTaskModelFactory.build(
+        id=FIRST_ID - 2,
+        type=ProjectTaskType.OPEN,
+        project_id=test_project.id,
+        assignee_id=None,
+        assigned_at=None,
+        created_by_id=test_user.id,
+    )
+    assigned_open_task = ProjectTaskModelFactory.build(
+        id=FIRST_ID - 1,
+        type=ProjectTaskType.OPEN,
+        project_id=test_project.id,
+        assignee_id=test_user.id,
+        assigned_at=now,
+        created_by_id=test_user.id,
+    )
+    tasks = [
+        ProjectTaskModelFactory.build(
+            id=FIRST_ID + i,
+            type=ProjectTaskType.DEFAULT,
+            project_id=test_project.id,
+            assignee_id=other_user.id,
+            assigned_at=now,
+            created_by_id=test_user.id,
+        )
+        for i in range(ITEMS)
+    ]
+    db_session.add_all([*personal_tasks, task, open_task, assigned_open_task, *tasks])
+    await db_session.commit()
+
+    return Seeded(
+        user_id=test_user.id,
+        member_id=users[0].id,
+        outsider_id=users[-1].id,
+        project_id=test_project.id,
+        task_id=task.id,
+        open_task_id=open_task.id,
+        assigned_open_task_id=assigned_open_task.id,
+        personal_task_id=personal_tasks[0].id,
+        task_ids=[task.id for task in tasks],
+    )
+
+
+@pytest.mark.integration
+class TestQueryBudgets:
+    """Statements per request of every route"""
+
+    def test_every_route_has_a_budget(self):
+        routes = {
+            f"{method} {route.path.removeprefix('/api/v1')}"
+            for route in app.routes
+            if route.path.startswith("/api/v1/")
+            for method in route.methods
+        }
+
+        assert routes == {case.id for case in CASES}
+
+    @pytest.mark.parametrize("case", CASES, ids=lambda case: case.id)
+    async def test_budget(
+        self,
+        authenticated_client: AsyncClient,
+        seeded: Seeded,
+        query_budget,
+        case: Case,
+    ):
+        with query_budget(case.budget):
+            response = await authenticated_client.request(
+                case.method, case.url(seeded), **case.request(seeded, 5)
+            )
+
+        assert response.status_code == case.status_code, response.text
+
+    @pytest.mark.parametrize(
+        "case",
+        [case for case in CASES if case.scales],
+        ids=lambda case: case.id,
+    )
+    async def test_independent_of_size(
+        self,
+        authenticated_client: AsyncClient,
+        seeded: Seeded,
+        record_statements,
+        clear_caches,
+        case: Case,
+    ):
+        counts = []
+        for n in (1, ITEMS - 1):
+            # Both on cold caches
+            clear_caches()
+            with record_statements() as statements:
+                response = await authenticated_client.request(
+                    case.method, case.url(seeded), **case.request(seeded, n)
+                )
+
+            assert response.status_code == case.status_code, response.text
+            counts.append(len(statements))
+
+        assert counts[0] == counts[1]
@@ -22,6 +22,19 @@ class TestDeleteMe:
 
         assert deleted_user is None
 
+    async def test_token_rejected_after_delete(
+        self,
+        authenticated_client: AsyncClient,
+    ):
+        response = await authenticated_client.get("api/v1/users/me")
+        assert response.status_code == 200
+
+        response = await authenticated_client.delete("api/v1/users/me")
+        assert response.status_code == 204
+
+        response = await authenticated_client.get("api/v1/users/me")
+        assert response.status_code == 401
+
     async def test_invalid_token(
         self,
         client: AsyncClient,
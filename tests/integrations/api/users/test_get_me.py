@@ -1,6 +1,8 @@
 import pytest
 from httpx import AsyncClient
 
+from core.config import settings
+
 from modules.users.model import User as UserModel
 
 
@@ -20,6 +22,41 @@ class TestGetMe:
         assert "password" not in resp_data
         assert "hashed_password" not in resp_data
 
+    async def test_sql_statements_header(
+        self,
+        authenticated_client: AsyncClient,
+        monkeypatch,
+    ):
+        response = await authenticated_client.get("api/v1/users/me")
+
+        assert "x-sql-statements" not in response.headers
+
+        monkeypatch.setattr(settings.debug, "sql_statements_header", True)
+        response = await authenticated_client.get("api/v1/users/me")
+
+        assert response.status_code == 200
+        assert int(response.headers["x-sql-statements"]) >= 0
+
+    async def test_server_timing_header(
+        self,
+        authenticated_client: AsyncClient,
+        monkeypatch,
+    ):
+        response = await authenticated_client.get("api/v1/users/me")
+
+        assert "server-timing" not in response.headers
+
+        monkeypatch.setattr(settings.debug, "server_timing", True)
+        response = await authenticated_client.get("api/v1/users/me")
+        metrics = [
+            metric.split(";")[0]
+            for metric in response.headers["server-timing"].split(", ")
+        ]
+
+        assert response.status_code == 200
+        assert metrics[:2] == ["db", "pool"]
+        assert metrics[-1] == "app"
+
     async def test_without_token(self, client: AsyncClient):
         response = await client.get("api/v1/users/me")
 
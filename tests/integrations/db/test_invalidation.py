@@ -0,0 +1,178 @@
+import asyncio
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
+
+from core.config import settings
+from db.invalidation import InvalidationBus, cache_invalidations
+from db.unit_of_work import unit_of_work
+from enums.project import ProjectRole
+from modules.auth.service import PRINCIPAL
+from modules.project_members.cache import MEMBERSHIP
+from modules.project_members.model import ProjectMember
+from modules.users.model import User
+
+from tests.factories.models import ProjectModelFactory
+
+
+class Worker:
+    """Bus of a worker, with the keys its handler dropped and its clears"""
+
+    def __init__(self):
+        self.bus = InvalidationBus(
+            channel="test_cache_invalidation", reconnect_delay=0.05, ping_interval=0.1
+        )
+        self.bus.subscribe("thing", self.drop, self.clear)
+        self.dropped: asyncio.Queue[str] = asyncio.Queue()
+        self.clears = 0
+
+    def drop(self, key: str) -> None:
+        self.dropped.put_nowait(key)
+
+    def clear(self) -> None:
+        self.clears += 1
+
+    async def next_dropped(self) -> str:
+        return await asyncio.wait_for(self.dropped.get(), timeout=5)
+
+
+@pytest.fixture
+async def engine():
+    engine = create_async_engine(settings.db.test_db_url)
+    yield engine
+    await engine.dispose()
+
+
+@pytest.fixture
+async def workers(engine: AsyncEngine):
+    workers = [Worker(), Worker()]
+    for worker in workers:
+        await worker.bus.start(engine, settings.db.connect_args)
+
+    yield workers
+
+    for worker in workers:
+        await worker.bus.stop()
+
+
+@pytest.mark.integration
+class TestInvalidationBus:
+    async def test_request_invalidations_sent_on_flush(self, workers):
+        sender, receiver = workers
+
+        with unit_of_work() as uow:
+            sender.bus.publish("thing", "1")
+            sender.bus.publish("thing", "2")
+            sender.bus.publish("thing", "1")
+            assert receiver.dropped.empty()
+
+            await sender.bus.flush(uow)
+
+        assert await receiver.next_dropped() == "1"
+        assert await receiver.next_dropped() == "2"
+        await asyncio.sleep(0.1)
+        assert receiver.dropped.empty()
+        assert sender.dropped.empty()
+
+    async def test_sent_right_away_outside_of_request(self, workers):
+        sender, receiver = workers
+
+        sender.bus.publish("thing", "project:1")
+
+        assert await receiver.next_dropped() == "project:1"
+
+    async def test_unknown_kind_not_sent(self, workers):
+        sender, receiver = workers
+
+        sender.bus.publish("other", "1")
+        sender.bus.publish("thing", "2")
+
+        assert await receiver.next_dropped() == "2"
+        assert receiver.dropped.empty()
+
+    async def test_not_started_sends_nothing(self):
+        worker = Worker()
+
+        with unit_of_work() as uow:
+            worker.bus.publish("thing", "1")
+
+            assert uow.invalidations == []
+
+    async def test_clears_and_reconnects_when_connection_lost(
+        self, workers, engine: AsyncEngine
+    ):
+        sender, receiver = workers
+
+        async with engine.connect() as conn:
+            await conn.execute(
+                text(
+                    "SELECT pg_terminate_backend(pid) FROM pg_stat_activity"
+                    " WHERE query LIKE 'LISTEN%test_cache_invalidation%'"
+                )
+            )
+
+        # Cleared on the loss and again once reconnected
+        async def reconnected():
+            while receiver.clears < 2:
+                await asyncio.sleep(0.05)
+
+        await asyncio.wait_for(reconnected(), timeout=5)
+        sender.bus.publish("thing", "1")
+
+        assert await receiver.next_dropped() == "1"
+
+
+@pytest.fixture
+async def received(engine: AsyncEngine):
+    """Keys another worker is sent while the app publishes, by kind"""
+    received = {PRINCIPAL: asyncio.Queue(), MEMBERSHIP: asyncio.Queue()}
+    receiver = InvalidationBus()
+    for kind, queue in received.items():
+        receiver.subscribe(kind, queue.put_nowait, lambda: None)
+
+    await receiver.start(engine, settings.db.connect_args)
+    await cache_invalidations.start(engine, settings.db.connect_args)
+    yield received
+
+    await cache_invalidations.stop()
+    await receiver.stop()
+
+
+async def next_key(queue: asyncio.Queue[str]) -> str:
+    return await asyncio.wait_for(queue.get(), timeout=5)
+
+
+@pytest.mark.integration
+class TestRequestInvalidations:
+    async def test_user_change(
+        self, authenticated_client: AsyncClient, test_user: User, received
+    ):
+        response = await authenticated_client.patch(
+            "/api/v1/users/me", json={"username": "renamed"}
+        )
+
+        assert response.status_code == 200
+        assert await next_key(received[PRINCIPAL]) == str(test_user.id)
+
+    async def test_membership_revoked(
+        self,
+        authenticated_client: AsyncClient,
+        db_session: AsyncSession,
+        test_user: User,
+        other_user: User,
+        received,
+    ):
+        project = await ProjectModelFactory.create(
+            session=db_session,
+            creator_id=test_user.id,
+            members=[ProjectMember(user_id=other_user.id, role=ProjectRole.MEMBER)],
+        )
+
+        response = await authenticated_client.delete(
+            f"/api/v1/projects/{project.id}/members/{other_user.id}"
+        )
+
+        assert response.status_code == 204
+        assert await next_key(received[MEMBERSHIP]) == f"{other_user.id}:{project.id}"
@@ -0,0 +1,94 @@
+import pytest
+from fastapi import Request
+from httpx import AsyncClient
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+
+from api.v1.deps.db import get_read_session
+from db import session as db_session_module
+from db.session import WRITE_LSN_COOKIE
+
+
+def make_request(method: str, lsn: str | None = None) -> Request:
+    headers = []
+    if lsn is not None:
+        headers.append((b"cookie", f"{WRITE_LSN_COOKIE}={lsn}".encode()))
+
+    return Request({"type": "http", "method": method, "headers": headers})
+
+
+async def resolve(method: str, db: AsyncSession, lsn: str | None = None):
+    gen = get_read_session(request=make_request(method, lsn), db=db)
+    session = await anext(gen)
+    await gen.aclose()
+
+    return session
+
+
+async def current_lsn(db: AsyncSession) -> str:
+    return await db.scalar(text("SELECT pg_current_wal_lsn()::text"))
+
+
+@pytest.fixture
+def replica(monkeypatch, test_engine: AsyncEngine):
+    # The test server isn't a standby, it has replayed all of its WAL
+    fabric = async_sessionmaker(bind=test_engine, class_=AsyncSession)
+    monkeypatch.setattr(db_session_module, "replica_session_fabric", fabric)
+
+
+@pytest.mark.integration
+class TestGetReadSession:
+    async def test_primary_without_replica(self, db_session: AsyncSession):
+        assert await resolve("GET", db_session) is db_session
+
+    async def test_replica_for_reads(self, replica, db_session: AsyncSession):
+        session = await resolve("GET", db_session)
+
+        assert session is not db_session
+        assert isinstance(session, AsyncSession)
+
+    async def test_primary_for_writes(self, replica, db_session: AsyncSession):
+        for method in ("POST", "PATCH", "DELETE"):
+            assert await resolve(method, db_session) is db_session
+
+    async def test_replica_past_last_write(self, replica, db_session: AsyncSession):
+        lsn = await current_lsn(db_session)
+
+        assert await resolve("GET", db_session, lsn) is not db_session
+
+    @pytest.mark.parametrize("lsn", ["FFFFFFFF/FFFFFFFF", "not-a-position"])
+    async def test_primary_until_replayed(self, replica, db_session: AsyncSession, lsn):
+        assert await resolve("GET", db_session, lsn) is db_session
+
+
+@pytest.mark.integration
+class TestWritePosition:
+    async def test_sent_after_write(
+        self, replica, authenticated_client: AsyncClient, db_session: AsyncSession
+    ):
+        before = await current_lsn(db_session)
+
+        response = await authenticated_client.post(
+            "/api/v1/personal_tasks", json={"title": "Task"}
+        )
+        lsn = response.cookies[WRITE_LSN_COOKIE]
+
+        assert response.status_code == 201
+        assert await db_session.scalar(
+            text("SELECT CAST(:lsn AS text)::pg_lsn >= CAST(:before AS text)::pg_lsn"),
+            {"lsn": lsn, "before": before},
+        )
+
+    async def test_not_sent_by_reads(self, replica, authenticated_client: AsyncClient):
+        response = await authenticated_client.get("/api/v1/personal_tasks")
+
+        assert response.status_code == 200
+        assert WRITE_LSN_COOKIE not in response.cookies
+
+    async def test_not_sent_without_replica(self, authenticated_client: AsyncClient):
+        response = await authenticated_client.post(
+            "/api/v1/personal_tasks", json={"title": "Task"}
+        )
+
+        assert response.status_code == 201
+        assert WRITE_LSN_COOKIE not in response.cookies
@@ -0,0 +1,45 @@
+import pytest
+
+from core.config import settings
+from db.session import build_engine, pool_stats, warm_up
+
+
+@pytest.fixture
+async def engine():
+    config = settings.db.model_copy(update={"pool_size": 2, "max_overflow": 1})
+    engine = build_engine(config, url=settings.db.test_db_url)
+
+    yield engine
+
+    await engine.dispose()
+
+
+@pytest.mark.integration
+class TestWarmUp:
+    async def test_opens_connections(self, engine):
+        await warm_up(engine, 2)
+
+        stats = pool_stats(engine)
+
+        assert stats["checked_in"] == 2
+        assert stats["checked_out"] == 0
+        assert stats["checkouts"] == 2
+
+    async def test_limited_by_pool_size(self, engine):
+        await warm_up(engine, 10)
+
+        assert pool_stats(engine)["checked_in"] == 2
+
+
+@pytest.mark.integration
+class TestPoolStats:
+    async def test_checked_out_and_overflow(self, engine):
+        async with engine.connect(), engine.connect(), engine.connect():
+            stats = pool_stats(engine)
+
+            assert stats["checked_out"] == 3
+            assert stats["overflow"] == 1
+
+        stats = pool_stats(engine)
+        assert stats["checked_out"] == 0
+        assert stats["wait_time_total_ms"] >= stats["wait_time_max_ms"] > 0
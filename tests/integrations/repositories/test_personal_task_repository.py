@@ -277,6 +277,66 @@ class TestGetList:
         assert len(items) == 2
 
 
+    async def test_search_by_word_prefix(
+        self, repo, db_session: AsyncSession, test_user
+    ):
+        task = PersonalTaskModelFactory.build(
+            user_id=test_user.id, title="Quarterly report", description=None
+        )
+        other_task = PersonalTaskModelFactory.build(
+            user_id=test_user.id, title="Groceries", description="Milk"
+        )
+        db_session.add_all([task, other_task])
+        await db_session.commit()
+
+        items, total = await repo.get_list(
+            user_id=test_user.id,
+            filters=tasks_dto.PersonalTaskFilterDto(search="QUART rep"),
+            sorting=common_dto.SortingDto(sort_by="created_at", order="asc"),
+            pagination=common_dto.PaginationDto(size=10, offset=0),
+        )
+
+        assert total == 1
+        assert items[0].id == task.id
+
+    async def test_search_without_words(
+        self, repo, db_session: AsyncSession, test_user
+    ):
+        db_session.add(PersonalTaskModelFactory.build(user_id=test_user.id))
+        await db_session.commit()
+
+        items, total = await repo.get_list(
+            user_id=test_user.id,
+            filters=tasks_dto.PersonalTaskFilterDto(search="%%"),
+            sorting=common_dto.SortingDto(sort_by="created_at", order="asc"),
+            pagination=common_dto.PaginationDto(size=10, offset=0),
+        )
+
+        assert total == 0
+        assert items == []
+
+    async def test_sort_by_relevance(self, repo, db_session: AsyncSession, test_user):
+        in_description = PersonalTaskModelFactory.build(
+            user_id=test_user.id, title="Errands", description="Book dentist"
+        )
+        in_title = PersonalTaskModelFactory.build(
+            user_id=test_user.id, title="Dentist appointment", description=None
+        )
+        db_session.add_all([in_description, in_title])
+        await db_session.commit()
+
+        items, total = await repo.get_list(
+            user_id=test_user.id,
+            filters=tasks_dto.PersonalTaskFilterDto(search="dentist"),
+            sorting=common_dto.SortingDto(sort_by="relevance", order="desc"),
+            pagination=common_dto.PaginationDto(size=10, offset=0),
+        )
+
+        # Title matches weigh more than description matches
+        assert total == 2
+        assert [item.id for item in items] == [in_title.id, in_description.id]
+
+
 @pytest.mark.integration
 class TestGetByIdAndUser:
     async def test_success(self, repo, db_session: AsyncSession, test_user):
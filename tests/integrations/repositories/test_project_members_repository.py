@@ -1,10 +1,13 @@
 import pytest
 import time_machine
 from datetime import datetime, timedelta, timezone
+from sqlalchemy import delete
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from modules.project_members import repository, model, dto as member_dto
-from modules.projects import model as project_model
+from modules.project_members.cache import membership_cache
+from modules.projects import model as project_model, dto as project_dto
+from modules.projects.repository import ProjectRepository
 from common import dto as common_dto
 from enums.project import ProjectRole
 
@@ -226,6 +229,41 @@ class TestGetAll:
         assert len(items) == 0
 
 
+@pytest.mark.integration
+class TestCountCacheInvalidation:
+    async def test_membership_writes_invalidate_totals(
+        self, repo, db_session: AsyncSession, other_user, test_project
+    ):
+        project_repo = ProjectRepository(db_session)
+        sorting = common_dto.SortingDto(sort_by="joined_at")
+        pagination = common_dto.PaginationDto(size=10, offset=0)
+
+        async def totals() -> tuple[int, int]:
+            _, members_total = await repo.get_all(
+                project_id=test_project.id,
+                filters=member_dto.ProjectMemberFilterDto(),
+                sorting=sorting,
+                pagination=pagination,
+            )
+            _, projects_total = await project_repo.get_all(
+                user_id=other_user.id,
+                filters=project_dto.ProjectFilterDto(),
+                sorting=common_dto.SortingDto(sort_by="created_at"),
+                pagination=pagination,
+            )
+            return members_total, projects_total
+
+        assert await totals() == (1, 0)
+
+        membership = await repo.create(
+            project_id=test_project.id, user_id=other_user.id, role=ProjectRole.MEMBER
+        )
+        assert await totals() == (2, 1)
+
+        await repo.delete_by_membership(membership)
+        assert await totals() == (1, 0)
+
+
 @pytest.mark.integration
 class TestGetByUserIdAndProjectId:
     async def test_success(self, repo, test_user, test_project):
@@ -254,6 +292,106 @@ class TestGetByUserIdAndProjectId:
         assert not result
 
 
+@pytest.mark.integration
+class TestGetCachedMembership:
+    async def test_hit_after_first_lookup(self, repo, test_user, test_project):
+        stats = membership_cache.stats()
+
+        first = await repo.get_cached_membership(
+            user_id=test_user.id, project_id=test_project.id
+        )
+        second = await repo.get_cached_membership(
+            user_id=test_user.id, project_id=test_project.id
+        )
+
+        assert first.id == second.id
+        assert second.role == ProjectRole.OWNER
+        assert second.project_id == test_project.id
+        assert membership_cache.stats()["misses"] == stats["misses"] + 1
+        assert membership_cache.stats()["hits"] == stats["hits"] + 1
+
+    async def test_non_member_is_cached(self, repo, other_user, test_project):
+        stats = membership_cache.stats()
+
+        for _ in range(2):
+            result = await repo.get_cached_membership(
+                user_id=other_user.id, project_id=test_project.id
+            )
+            assert result is None
+
+        assert membership_cache.stats()["hits"] == stats["hits"] + 1
+
+    async def test_member_writes_invalidate(self, repo, other_user, test_project):
+        async def cached_role() -> ProjectRole | None:
+            membership = await repo.get_cached_membership(
+                user_id=other_user.id, project_id=test_project.id
+            )
+            return membership.role if membership else None
+
+        assert await cached_role() is None
+
+        membership = await repo.create(
+            project_id=test_project.id, user_id=other_user.id, role=ProjectRole.MEMBER
+        )
+        assert await cached_role() == ProjectRole.MEMBER
+
+        await repo.update_by_membership(
+            membership=membership, data={"role": ProjectRole.ADMIN}
+        )
+        assert await cached_role() == ProjectRole.ADMIN
+
+        await repo.delete_by_membership(membership)
+        assert await cached_role() is None
+
+    async def test_project_delete_invalidates(
+        self, repo, db_session: AsyncSession, test_user, test_project
+    ):
+        await repo.get_cached_membership(
+            user_id=test_user.id, project_id=test_project.id
+        )
+
+        await ProjectRepository(db_session).delete_by_id(test_project.id)
+
+        result = await repo.get_cached_membership(
+            user_id=test_user.id, project_id=test_project.id
+        )
+        assert result is None
+
+    async def test_replica_read_not_cached(
+        self, db_session: AsyncSession, test_user, test_project
+    ):
+        async with AsyncSession(
+            bind=db_session.bind,
+            join_transaction_mode="create_savepoint",
+            info={"replica": True},
+        ) as replica:
+            replica_repo = repository.ProjectMemberRepository(replica)
+
+            membership = await replica_repo.get_cached_membership(
+                user_id=test_user.id, project_id=test_project.id
+            )
+
+        assert membership.role == ProjectRole.OWNER
+        assert not membership_cache.get(test_user.id, test_project.id)[0]
+
+    async def test_dropped_by_other_worker(
+        self, repo, test_user, other_user, test_project
+    ):
+        for user in (test_user, other_user):
+            await repo.get_cached_membership(
+                user_id=user.id, project_id=test_project.id
+            )
+
+        membership_cache.drop(f"{other_user.id}:{test_project.id}")
+
+        assert membership_cache.get(test_user.id, test_project.id)[0]
+        assert not membership_cache.get(other_user.id, test_project.id)[0]
+
+        membership_cache.drop(f"*:{test_project.id}")
+
+        assert not membership_cache.get(test_user.id, test_project.id)[0]
+
+
 @pytest.mark.integration
 class TestUpdateByMembership:
     async def test_success(
@@ -275,6 +413,30 @@ class TestUpdateByMembership:
 
         assert membership.role == ProjectRole.ADMIN
 
+    async def test_deleted_membership(
+        self, repo, db_session: AsyncSession, other_user, test_project
+    ):
+        membership = model.ProjectMember(
+            project_id=test_project.id,
+            user_id=other_user.id,
+            role=ProjectRole.MEMBER,
+        )
+        db_session.add(membership)
+        await db_session.commit()
+        key = (other_user.id, test_project.id)
+        # Deleted by another request after it was read
+        await db_session.execute(
+            delete(model.ProjectMember).where(model.ProjectMember.id == membership.id)
+        )
+
+        result = await repo.update_by_membership(
+            membership=membership, data={"role": ProjectRole.ADMIN}
+        )
+
+        assert result is None
+        # Nothing was cached for the membership that is gone
+        assert not membership_cache.get(*key)[0]
+
 
 @pytest.mark.integration
 class TestDeleteByMembership:
@@ -0,0 +1,263 @@
+import pytest
+from datetime import timedelta
+from sqlalchemy import delete, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from modules.project_tasks.repository import ProjectTaskRepository
+from modules.projects.model import Project as ProjectModel
+from modules.project_task_stats.model import ProjectTaskStats as ProjectTaskStatsModel
+from modules.project_task_stats.repository import ProjectTaskStatsRepository
+from modules.users.model import User as UserModel
+from enums.task import TaskStatus, TaskPriority
+from enums.project_task import ProjectTaskType
+from utils.datetime import utc_now
+
+from tests.factories.models import ProjectModelFactory, ProjectTaskModelFactory
+
+
+@pytest.fixture
+async def repo(db_session: AsyncSession) -> ProjectTaskStatsRepository:
+    return ProjectTaskStatsRepository(db_session)
+
+
+@pytest.fixture
+async def task_repo(db_session: AsyncSession) -> ProjectTaskRepository:
+    return ProjectTaskRepository(db_session)
+
+
+async def get_counts(db_session: AsyncSession, project_id: int) -> dict:
+    result = await db_session.execute(
+        select(ProjectTaskStatsModel).where(
+            ProjectTaskStatsModel.project_id == project_id,
+            ProjectTaskStatsModel.task_count != 0,
+        )
+    )
+
+    return {
+        (row.status, row.priority, row.assigned): row.task_count
+        for row in result.scalars()
+    }
+
+
+@pytest.mark.integration
+class TestKeptByTriggers:
+    async def test_create(self, task_repo, db_session, test_project, test_user):
+        for _ in range(2):
+            await task_repo.create(
+                project_id=test_project.id,
+                created_by_id=test_user.id,
+                data={"type": ProjectTaskType.OPEN, "title": "Task"},
+            )
+
+        assert await get_counts(db_session, test_project.id) == {
+            (TaskStatus.TODO, TaskPriority.MEDIUM, False): 2
+        }
+
+    async def test_update_and_assign(
+        self, task_repo, db_session, test_project, test_user
+    ):
+        task = await task_repo.create(
+            project_id=test_project.id,
+            created_by_id=test_user.id,
+            data={"type": ProjectTaskType.OPEN, "title": "Task"},
+        )
+
+        await task_repo.update_by_task(
+            task, {"status": TaskStatus.DONE, "priority": TaskPriority.HIGH}
+        )
+        assert await get_counts(db_session, test_project.id) == {
+            (TaskStatus.DONE, TaskPriority.HIGH, False): 1
+        }
+
+        await task_repo.update_by_task(
+            task, {"assignee_id": test_user.id, "assigned_at": utc_now()}
+        )
+        assert await get_counts(db_session, test_project.id) == {
+            (TaskStatus.DONE, TaskPriority.HIGH, True): 1
+        }
+
+        # Title changes keep the task in its group
+        await task_repo.update_by_task(task, {"title": "Renamed"})
+        assert await get_counts(db_session, test_project.id) == {
+            (TaskStatus.DONE, TaskPriority.HIGH, True): 1
+        }
+
+    async def test_delete(self, task_repo, db_session, test_project, test_user):
+        task = await task_repo.create(
+            project_id=test_project.id,
+            created_by_id=test_user.id,
+            data={"type": ProjectTaskType.OPEN, "title": "Task"},
+        )
+
+        await task_repo.delete_by_task(task)
+
+        assert await get_counts(db_session, test_project.id) == {}
+
+    async def test_update_and_delete_many(
+        self, task_repo, db_session, test_project, test_user
+    ):
+        tasks = await task_repo.create_many(
+            project_id=test_project.id,
+            created_by_id=test_user.id,
+            items=[{"type": ProjectTaskType.OPEN, "title": "Task"} for _ in range(3)],
+        )
+
+        await task_repo.update_many(
+            test_project.id,
+            [(task, {"status": TaskStatus.DONE}) for task in tasks[:2]],
+        )
+        assert await get_counts(db_session, test_project.id) == {
+            (TaskStatus.TODO, TaskPriority.MEDIUM, False): 1,
+            (TaskStatus.DONE, TaskPriority.MEDIUM, False): 2,
+        }
+
+        await task_repo.delete_many(test_project.id, [task.id for task in tasks[1:]])
+        assert await get_counts(db_session, test_project.id) == {
+            (TaskStatus.DONE, TaskPriority.MEDIUM, False): 1
+        }
+
+    async def test_written_without_repository(
+        self, db_session, test_project, test_user
+    ):
+        await ProjectTaskModelFactory.create(
+            session=db_session,
+            type=ProjectTaskType.OPEN,
+            project_id=test_project.id,
+            created_by_id=test_user.id,
+            status=TaskStatus.TODO,
+            priority=TaskPriority.LOW,
+        )
+
+        assert await get_counts(db_session, test_project.id) == {
+            (TaskStatus.TODO, TaskPriority.LOW, False): 1
+        }
+
+    async def test_assignee_deleted(
+        self, task_repo, db_session, test_project, test_user, other_user
+    ):
+        task = await task_repo.create(
+            project_id=test_project.id,
+            created_by_id=test_user.id,
+            data={
+                "type": ProjectTaskType.OPEN,
+                "title": "Task",
+                "assignee_id": other_user.id,
+                "assigned_at": utc_now(),
+            },
+        )
+
+        # The assignee is set to NULL by the foreign key, not by the repository
+        await db_session.execute(delete(UserModel).where(UserModel.id == other_user.id))
+
+        assert await get_counts(db_session, test_project.id) == {
+            (task.status, task.priority, False): 1
+        }
+
+    async def test_project_deleted(
+        self, task_repo, db_session, test_project, test_user
+    ):
+        await task_repo.create(
+            project_id=test_project.id,
+            created_by_id=test_user.id,
+            data={"type": ProjectTaskType.OPEN, "title": "Task"},
+        )
+
+        # Tasks and stats are removed by the same cascade
+        await db_session.execute(
+            delete(ProjectModel).where(ProjectModel.id == test_project.id)
+        )
+
+        assert await get_counts(db_session, test_project.id) == {}
+
+
+@pytest.mark.integration
+class TestGetByProjectId:
+    async def test_groups_and_overdue(
+        self, repo, task_repo, db_session, test_project, test_user
+    ):
+        past = utc_now() - timedelta(days=1)
+        for status in (TaskStatus.TODO, TaskStatus.DONE):
+            await task_repo.create(
+                project_id=test_project.id,
+                created_by_id=test_user.id,
+                data={
+                    "type": ProjectTaskType.OPEN,
+                    "title": "Task",
+                    "status": status,
+                    "deadline": past,
+                },
+            )
+
+        groups, overdue = await repo.get_by_project_id(test_project.id)
+
+        assert {(group.status, group.task_count) for group in groups} == {
+            (TaskStatus.TODO, 1),
+            (TaskStatus.DONE, 1),
+        }
+        # Done tasks are never overdue
+        assert overdue == 1
+
+    async def test_without_tasks(self, repo, test_project):
+        groups, overdue = await repo.get_by_project_id(test_project.id)
+
+        assert groups == []
+        assert overdue == 0
+
+
+@pytest.mark.integration
+class TestRebuild:
+    async def test_recounts_tasks(
+        self, repo, db_session: AsyncSession, test_project, test_user
+    ):
+        for priority in (TaskPriority.LOW, TaskPriority.LOW, TaskPriority.HIGH):
+            await ProjectTaskModelFactory.create(
+                session=db_session,
+                type=ProjectTaskType.OPEN,
+                project_id=test_project.id,
+                created_by_id=test_user.id,
+                status=TaskStatus.TODO,
+                priority=priority,
+            )
+        # Stats drifted from the tasks, e.g. written with the triggers disabled
+        await db_session.execute(delete(ProjectTaskStatsModel))
+        db_session.add(
+            ProjectTaskStatsModel(
+                project_id=test_project.id,
+                status=TaskStatus.DONE,
+                priority=TaskPriority.LOW,
+                assigned=False,
+                task_count=5,
+            )
+        )
+        await db_session.commit()
+
+        await repo.rebuild(project_id=test_project.id)
+
+        assert await get_counts(db_session, test_project.id) == {
+            (TaskStatus.TODO, TaskPriority.LOW, False): 2,
+            (TaskStatus.TODO, TaskPriority.HIGH, False): 1,
+        }
+
+    async def test_project_scope(
+        self, repo, db_session: AsyncSession, test_project, test_user
+    ):
+        other_project = await ProjectModelFactory.create(
+            session=db_session, creator_id=test_user.id
+        )
+        for project in (test_project, other_project):
+            await ProjectTaskModelFactory.create(
+                session=db_session,
+                type=ProjectTaskType.OPEN,
+                project_id=project.id,
+                created_by_id=test_user.id,
+            )
+        await db_session.execute(delete(ProjectTaskStatsModel))
+
+        await repo.rebuild(project_id=test_project.id)
+
+        assert sum((await get_counts(db_session, test_project.id)).values()) == 1
+        assert await get_counts(db_session, other_project.id) == {}
+
+        await repo.rebuild()
+
+        assert sum((await get_counts(db_session, other_project.id)).values()) == 1
@@ -1,11 +1,13 @@
 import pytest
 from datetime import timedelta
+from sqlalchemy import event, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from modules.project_tasks.repository import ProjectTaskRepository
 from modules.project_tasks.model import ProjectTask as ProjectTaskModel
 from modules.project_tasks.dto import ProjectTaskFilterDto
-from common.dto import PaginationDto, SortingDto
+from modules.project_task_stats.model import ProjectTaskStats
+from common.dto import PaginationDto, SortingDto, CursorPaginationDto
 from enums.task import TaskStatus, TaskPriority
 from enums.project_task import ProjectTaskType
 from utils.datetime import utc_now
@@ -480,6 +482,173 @@ class TestGetAll:
         assert total == 0
         assert len(items) == 0
 
+    async def test_sort_by_relevance(
+        self, repo, db_session: AsyncSession, test_project, test_user
+    ):
+        in_description = await ProjectTaskModelFactory.create(
+            session=db_session,
+            type=ProjectTaskType.OPEN,
+            project_id=test_project.id,
+            title="Release",
+            description="Update the changelog",
+            created_by_id=test_user.id,
+        )
+        in_title = await ProjectTaskModelFactory.create(
+            session=db_session,
+            type=ProjectTaskType.OPEN,
+            project_id=test_project.id,
+            title="Changelog for the next version",
+            description=None,
+            created_by_id=test_user.id,
+        )
+
+        items, total = await repo.get_all(
+            project_id=test_project.id,
+            filters=ProjectTaskFilterDto(search="changelog"),
+            sorting=SortingDto(sort_by="relevance", order="desc"),
+            pagination=PaginationDto(size=10, offset=0),
+        )
+
+        assert total == 2
+        assert [item.id for item in items] == [in_title.id, in_description.id]
+
+    async def test_sort_by_relevance_without_search(
+        self, repo, test_project, test_multiple_project_tasks
+    ):
+        items, _ = await repo.get_all(
+            project_id=test_project.id,
+            filters=ProjectTaskFilterDto(),
+            sorting=SortingDto(sort_by="relevance", order="asc"),
+            pagination=PaginationDto(size=10, offset=0),
+        )
+
+        # Falls back to creation order
+        assert [item.id for item in items] == [
+            task.id
+            for task in sorted(test_multiple_project_tasks, key=lambda t: t.created_at)
+        ]
+
+
+@pytest.mark.integration
+class TestGetAllByCursor:
+    @staticmethod
+    def _expected_ids(tasks, sort_by: str, order: str) -> list[int]:
+        def sort_value(task):
+            value = getattr(task, sort_by)
+            if sort_by in ("priority", "status"):
+                return value.sort_order
+            return value
+
+        # Postgres: NULLs last for asc, first for desc
+        ordered = sorted(
+            tasks,
+            key=lambda t: (sort_value(t) is None, sort_value(t), t.id),
+            reverse=order == "desc",
+        )
+        return [t.id for t in ordered]
+
+    async def _collect_ids(self, repo, project_id, filters, sorting, size):
+        ids = []
+        cursor = None
+        while True:
+            items, cursor = await repo.get_all_by_cursor(
+                project_id=project_id,
+                filters=filters,
+                sorting=sorting,
+                pagination=CursorPaginationDto(size=size, cursor=cursor),
+            )
+            ids.extend(item.id for item in items)
+            if cursor is None:
+                return ids
+
+    @pytest.mark.parametrize(
+        "sort_by",
+        ["deadline", "status", "priority", "assigned_at", "created_at", "updated_at"],
+    )
+    @pytest.mark.parametrize("order", ["asc", "desc"])
+    async def test_walks_all_pages_in_order(
+        self, repo, test_project, test_multiple_project_tasks, sort_by, order
+    ):
+        sorting = SortingDto(sort_by=sort_by, order=order)
+
+        ids = await self._collect_ids(
+            repo, test_project.id, ProjectTaskFilterDto(), sorting, size=2
+        )
+
+        assert ids == self._expected_ids(test_multiple_project_tasks, sort_by, order)
+
+    async def test_ties_are_broken_by_id(
+        self, repo, db_session: AsyncSession, test_project, test_user
+    ):
+        deadline = utc_now() + timedelta(days=1)
+        tasks = [
+            await ProjectTaskModelFactory.create(
+                session=db_session,
+                type=ProjectTaskType.OPEN,
+                project_id=test_project.id,
+                created_by_id=test_user.id,
+                assignee_id=None,
+                assigned_at=None,
+                deadline=deadline if i % 2 else None,
+                priority=TaskPriority.HIGH,
+            )
+            for i in range(5)
+        ]
+
+        for sort_by in ("priority", "deadline", "assigned_at"):
+            for order in ("asc", "desc"):
+                sorting = SortingDto(sort_by=sort_by, order=order)
+                ids = await self._collect_ids(
+                    repo, test_project.id, ProjectTaskFilterDto(), sorting, size=2
+                )
+
+                assert ids == self._expected_ids(tasks, sort_by, order)
+
+    async def test_with_filters(
+        self, repo, test_project, test_user, test_multiple_project_tasks
+    ):
+        filters = ProjectTaskFilterDto(assignee_id=test_user.id)
+        sorting = SortingDto(sort_by="created_at", order="asc")
+
+        items, next_cursor = await repo.get_all_by_cursor(
+            project_id=test_project.id,
+            filters=filters,
+            sorting=sorting,
+            pagination=CursorPaginationDto(size=10),
+        )
+
+        assert next_cursor is None
+        assert len(items) == 2  # task1 and task5
+        for item in items:
+            assert item.assignee_id == test_user.id
+
+    async def test_next_cursor_points_to_last_item(
+        self, repo, test_project, test_multiple_project_tasks
+    ):
+        sorting = SortingDto(sort_by="priority", order="desc")
+
+        items, next_cursor = await repo.get_all_by_cursor(
+            project_id=test_project.id,
+            filters=ProjectTaskFilterDto(),
+            sorting=sorting,
+            pagination=CursorPaginationDto(size=2),
+        )
+
+        assert len(items) == 2
+        assert next_cursor.id == items[-1].id
+        assert next_cursor.value == items[-1].priority.sort_order
+
+    async def test_not_found(self, repo, test_project):
+        items, next_cursor = await repo.get_all_by_cursor(
+            project_id=test_project.id,
+            filters=ProjectTaskFilterDto(),
+            sorting=SortingDto(sort_by="created_at", order="asc"),
+            pagination=CursorPaginationDto(size=10),
+        )
+
+        assert items == []
+        assert next_cursor is None
+
 
 @pytest.mark.integration
 class TestGetById:
@@ -496,6 +665,28 @@ class TestGetById:
         assert task is None
 
 
+@pytest.mark.integration
+class TestGetMany:
+    async def test_other_projects_left_out(self, repo, test_project, test_project_task):
+        tasks = await repo.get_many(test_project.id, [test_project_task.id, 99999])
+        other = await repo.get_many(test_project.id + 1, [test_project_task.id])
+
+        assert list(tasks) == [test_project_task.id]
+        assert other == {}
+
+    async def test_for_update_locks_tasks_only(
+        self, repo, record_statements, test_project, test_project_task
+    ):
+        with record_statements() as statements:
+            tasks = await repo.get_many(
+                test_project.id, [test_project_task.id], for_update=True
+            )
+
+        assert list(tasks) == [test_project_task.id]
+        # Joined relations are outer joins, which can't be locked
+        assert statements[0].endswith("FOR UPDATE OF project_tasks")
+
+
 @pytest.mark.integration
 class TestUpdateByTask:
     async def test_all_fields_success(
@@ -556,6 +747,25 @@ class TestUpdateByTask:
         assert test_project_task.description == original_description
         assert test_project_task.priority == original_priority
 
+    async def test_changed_since_read(
+        self, repo, db_session: AsyncSession, test_project_task
+    ):
+        project_id = test_project_task.project_id
+        read_at = test_project_task.updated_at
+        await repo.update_by_task(test_project_task, {"status": TaskStatus.DONE})
+
+        updated_task = await repo.update_by_task(
+            test_project_task,
+            {"status": TaskStatus.CANCELLED},
+            expected_updated_at=read_at,
+        )
+
+        assert updated_task is None
+        stats = await db_session.scalars(
+            select(ProjectTaskStats).where(ProjectTaskStats.project_id == project_id)
+        )
+        assert all(row.status != TaskStatus.CANCELLED for row in stats)
+
 
 @pytest.mark.integration
 class TestDeleteByTask:
@@ -567,3 +777,184 @@ class TestDeleteByTask:
         deleted_task = await db_session.get(ProjectTaskModel, task_id)
 
         assert deleted_task is None
+
+
+@pytest.mark.integration
+class TestGetAllTotalModes:
+    async def test_none_skips_count(
+        self, repo, test_project, test_multiple_project_tasks
+    ):
+        items, total = await repo.get_all(
+            project_id=test_project.id,
+            filters=ProjectTaskFilterDto(),
+            sorting=SortingDto(sort_by="created_at", order="asc"),
+            pagination=PaginationDto(size=2, offset=0, include_total="none"),
+        )
+
+        assert total is None
+        assert len(items) == 2
+
+    async def test_estimated(self, repo, test_project, test_multiple_project_tasks):
+        items, total = await repo.get_all(
+            project_id=test_project.id,
+            filters=ProjectTaskFilterDto(),
+            sorting=SortingDto(sort_by="created_at", order="asc"),
+            pagination=PaginationDto(size=2, offset=0, include_total="estimated"),
+        )
+
+        assert isinstance(total, int)
+        assert total >= 0
+        assert len(items) == 2
+
+    async def test_exact_is_cached_per_filters(
+        self, repo, db_session: AsyncSession, test_project, test_multiple_project_tasks
+    ):
+        sorting = SortingDto(sort_by="created_at", order="asc")
+        pagination = PaginationDto(size=10, offset=0)
+
+        _, total = await repo.get_all(
+            project_id=test_project.id,
+            filters=ProjectTaskFilterDto(),
+            sorting=sorting,
+            pagination=pagination,
+        )
+        assert total == 5
+
+        # Written around the repository, so the cache is not invalidated
+        await ProjectTaskModelFactory.create(
+            session=db_session,
+            type=ProjectTaskType.OPEN,
+            project_id=test_project.id,
+            created_by_id=test_project.creator_id,
+            assignee_id=None,
+            assigned_at=None,
+        )
+
+        items, total = await repo.get_all(
+            project_id=test_project.id,
+            filters=ProjectTaskFilterDto(),
+            sorting=sorting,
+            pagination=pagination,
+        )
+        assert total == 5
+        assert len(items) == 6
+
+        # Other filters are a separate cache entry
+        _, total = await repo.get_all(
+            project_id=test_project.id,
+            filters=ProjectTaskFilterDto(type=ProjectTaskType.OPEN),
+            sorting=sorting,
+            pagination=pagination,
+        )
+        assert total == 2
+
+    async def test_write_invalidates_cache(
+        self, repo, test_project, test_user, test_multiple_project_tasks
+    ):
+        sorting = SortingDto(sort_by="created_at", order="asc")
+        pagination = PaginationDto(size=10, offset=0)
+
+        _, total = await repo.get_all(
+            project_id=test_project.id,
+            filters=ProjectTaskFilterDto(),
+            sorting=sorting,
+            pagination=pagination,
+        )
+        assert total == 5
+
+        await repo.create(
+            project_id=test_project.id,
+            created_by_id=test_user.id,
+            data={"type": ProjectTaskType.OPEN, "title": "New task"},
+        )
+
+        _, total = await repo.get_all(
+            project_id=test_project.id,
+            filters=ProjectTaskFilterDto(),
+            sorting=sorting,
+            pagination=pagination,
+        )
+        assert total == 6
+
+        await repo.delete_by_task(test_multiple_project_tasks[0])
+
+        _, total = await repo.get_all(
+            project_id=test_project.id,
+            filters=ProjectTaskFilterDto(),
+            sorting=sorting,
+            pagination=pagination,
+        )
+        assert total == 5
+
+
+@pytest.mark.integration
+class TestGetAllSingleStatement:
+    @pytest.fixture
+    def statements(self, db_session: AsyncSession):
+        executed = []
+
+        def on_execute(conn, cursor, statement, parameters, context, executemany):
+            # Savepoints belong to the test transaction, not to the repository
+            if not statement.startswith(("SAVEPOINT", "RELEASE")):
+                executed.append(statement)
+
+        engine = db_session.bind.sync_engine
+        event.listen(engine, "before_cursor_execute", on_execute)
+        yield executed
+        event.remove(engine, "before_cursor_execute", on_execute)
+
+    async def test_page_and_total_in_one_statement(
+        self, repo, test_project, test_multiple_project_tasks, statements
+    ):
+        items, total = await repo.get_all(
+            project_id=test_project.id,
+            filters=ProjectTaskFilterDto(),
+            sorting=SortingDto(sort_by="created_at", order="asc"),
+            pagination=PaginationDto(size=2, offset=0),
+        )
+
+        assert total == 5
+        assert len(items) == 2
+        assert len(statements) == 1
+        # Many-to-one relations are joined into the same statement
+        assert items[0].project.id == test_project.id
+        assert items[0].creator.id == items[0].created_by_id
+        assert items[0].assignee is None or items[0].assignee.id == items[0].assignee_id
+
+    async def test_offset_past_last_row(
+        self, repo, test_project, test_multiple_project_tasks, statements
+    ):
+        items, total = await repo.get_all(
+            project_id=test_project.id,
+            filters=ProjectTaskFilterDto(),
+            sorting=SortingDto(sort_by="created_at", order="asc"),
+            pagination=PaginationDto(size=10, offset=20),
+        )
+
+        assert items == []
+        assert total == 5
+        assert len(statements) == 2
+
+    async def test_cached_total_skips_window(
+        self, repo, test_project, test_multiple_project_tasks, statements
+    ):
+        sorting = SortingDto(sort_by="created_at", order="asc")
+        pagination = PaginationDto(size=2, offset=0)
+
+        await repo.get_all(
+            project_id=test_project.id,
+            filters=ProjectTaskFilterDto(),
+            sorting=sorting,
+            pagination=pagination,
+        )
+        items, total = await repo.get_all(
+            project_id=test_project.id,
+            filters=ProjectTaskFilterDto(),
+            sorting=sorting,
+            pagination=pagination,
+        )
+
+        assert total == 5
+        assert len(items) == 2
+        assert len(statements) == 2
+        assert "OVER" not in statements[1]
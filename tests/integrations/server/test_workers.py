@@ -0,0 +1,106 @@
+import httpx
+import os
+import pytest
+import signal
+import socket
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+SERVER = Path(__file__).parents[3] / "src" / "server.py"
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def workers(pid: int) -> set[int]:
+    children = Path(f"/proc/{pid}/task/{pid}/children").read_text()
+    return {int(child) for child in children.split()}
+
+
+def wait_for(condition, timeout: float = 20) -> None:
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            raise TimeoutError
+        time.sleep(0.1)
+
+
+def is_serving(url: str) -> bool:
+    try:
+        return httpx.get(url).status_code == 200
+    except httpx.TransportError:
+        return False
+
+
+@pytest.fixture
+def server():
+    port = free_port()
+    process = subprocess.Popen(
+        [
+            sys.executable,
+            str(SERVER),
+            "--host=127.0.0.1",
+            f"--port={port}",
+            "--workers=2",
+            "--graceful-timeout=5",
+        ],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+    )
+    url = f"http://127.0.0.1:{port}/openapi.json"
+    try:
+        wait_for(lambda: process.poll() is not None or is_serving(url))
+        assert process.poll() is None, process.stdout.read()
+        wait_for(lambda: len(workers(process.pid)) == 2)
+        yield process, url
+    finally:
+        if process.poll() is None:
+            process.kill()
+        process.wait()
+        process.stdout.close()
+
+
+@pytest.mark.integration
+class TestServer:
+    def test_drains_workers_on_sigterm(self, server):
+        process, url = server
+
+        assert is_serving(url)
+
+        process.send_signal(signal.SIGTERM)
+
+        assert process.wait(timeout=15) == 0
+        output = process.stdout.read()
+        assert "Draining 2 workers" in output
+        assert output.count("Application shutdown complete") == 2
+
+    def test_restarts_dead_worker(self, server):
+        process, url = server
+        started = workers(process.pid)
+        dead = min(started)
+
+        os.kill(dead, signal.SIGKILL)
+        wait_for(lambda: len(workers(process.pid) - started) == 1)
+
+        assert dead not in workers(process.pid)
+        assert is_serving(url)
+
+    def test_refuses_workers_with_unshared_caches(self):
+        env = {**os.environ, "APP_CONFIG__CACHE__SHARED_INVALIDATION": "false"}
+
+        result = subprocess.run(
+            [sys.executable, str(SERVER), "--workers=2"],
+            env=env,
+            capture_output=True,
+            text=True,
+            timeout=30,
+        )
+
+        assert result.returncode == 1
+        assert "CACHE__PRINCIPAL_TTL" in result.stderr
@@ -0,0 +1,55 @@
+import json
+import pytest
+from fastapi import FastAPI
+
+from api.openapi import use_openapi_cache, write_openapi
+
+
+def make_app() -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/items")
+    async def get_items() -> list[int]:
+        return []
+
+    return app
+
+
+@pytest.mark.unit
+class TestOpenAPICache:
+    def test_reads_written_schema(self, tmp_path):
+        path = tmp_path / "openapi.json"
+        write_openapi(make_app(), path)
+
+        app = make_app()
+        use_openapi_cache(app, str(path))
+
+        assert app.openapi() == json.loads(path.read_text())
+        assert "/items" in app.openapi()["paths"]
+
+    def test_schema_of_the_file_is_served(self, tmp_path):
+        path = tmp_path / "openapi.json"
+        path.write_text('{"openapi": "3.1.0", "paths": {}}')
+
+        app = make_app()
+        use_openapi_cache(app, str(path))
+
+        assert app.openapi() == {"openapi": "3.1.0", "paths": {}}
+
+    def test_built_without_file(self, tmp_path):
+        app = make_app()
+        use_openapi_cache(app, str(tmp_path / "missing.json"))
+
+        assert "/items" in app.openapi()["paths"]
+
+    def test_write_ignores_cached_schema(self, tmp_path):
+        stale = tmp_path / "stale.json"
+        stale.write_text('{"paths": {}}')
+        app = make_app()
+        use_openapi_cache(app, str(stale))
+        app.openapi()
+
+        path = tmp_path / "openapi.json"
+        write_openapi(app, path)
+
+        assert "/items" in json.loads(path.read_text())["paths"]
@@ -0,0 +1,104 @@
+import json
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+import pytest
+from fastapi import APIRouter, FastAPI, Response, status
+from fastapi.routing import APIRoute
+from httpx import ASGITransport, AsyncClient
+from pydantic import BaseModel, ConfigDict
+
+from api import responses
+from api.responses import PydanticJSONRoute
+
+
+class OwnerRead(BaseModel):
+    id: int
+    name: str
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class ItemRead(BaseModel):
+    id: int
+    created_at: datetime
+    owner: OwnerRead | None
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class PageRead(BaseModel):
+    items: list[ItemRead]
+
+
+ROWS = [
+    SimpleNamespace(
+        id=i,
+        created_at=datetime(2026, 1, 1, tzinfo=timezone.utc),
+        owner=SimpleNamespace(id=7, name="Ann") if i % 2 else None,
+    )
+    for i in range(3)
+]
+
+
+def build_app(route_class) -> FastAPI:
+    router = APIRouter(route_class=route_class)
+
+    @router.get("/items", response_model=PageRead)
+    async def get_items():
+        return {"items": ROWS}
+
+    @router.post("/items", response_model=ItemRead, status_code=status.HTTP_201_CREATED)
+    async def create_item():
+        return ItemRead.model_validate(ROWS[1])
+
+    @router.patch("/items", response_model=ItemRead)
+    async def update_item(response: Response):
+        response.headers["ETag"] = 'W/"1"'
+        response.status_code = status.HTTP_202_ACCEPTED
+        return ROWS[1]
+
+    @router.delete("/items")
+    async def delete_items():
+        return Response(status_code=status.HTTP_204_NO_CONTENT)
+
+    app = FastAPI()
+    app.include_router(router, prefix="/api")
+
+    return app
+
+
+async def request(app: FastAPI, method: str):
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        return await client.request(method, "/api/items")
+
+
+@pytest.mark.unit
+class TestPydanticJSONRoute:
+    @pytest.mark.parametrize("method", ["GET", "POST", "PATCH", "DELETE"])
+    async def test_same_response_as_default_route(self, method):
+        fast = await request(build_app(PydanticJSONRoute), method)
+        default = await request(build_app(APIRoute), method)
+
+        assert fast.status_code == default.status_code
+        assert fast.headers.get("content-type") == default.headers.get("content-type")
+        assert fast.headers.get("etag") == default.headers.get("etag")
+        if default.content:
+            assert json.loads(fast.content) == json.loads(default.content)
+
+    def test_models_are_not_validated_again(self):
+        item = ItemRead.model_validate(ROWS[1])
+
+        adapter = responses._adapter(ItemRead)
+
+        assert adapter.validate_python(item, from_attributes=True) is item
+
+    def test_openapi_keeps_response_model(self):
+        app = build_app(PydanticJSONRoute)
+
+        schema = app.openapi()["paths"]["/api/items"]["get"]["responses"]["200"]
+
+        assert schema["content"]["application/json"]["schema"] == {
+            "$ref": "#/components/schemas/PageRead"
+        }
@@ -1,5 +1,8 @@
+import asyncio
+import threading
 import pytest
-from core.security.password import PasswordHasher
+from core.config import settings
+from core.security.password import PasswordHasher, HashingPool, _hash
 
 
 @pytest.mark.unit
@@ -39,3 +42,56 @@ class TestVerify:
         incorrect_hash = "invalid_bcrypt_hash"
 
         assert PasswordHasher.verify(password, incorrect_hash) is False
+
+
+@pytest.mark.unit
+class TestAsync:
+    async def test_hash_and_verify(self):
+        password = "MyPassword123"
+        hashed = await PasswordHasher.ahash(password)
+
+        assert await PasswordHasher.averify(password, hashed) is True
+        assert await PasswordHasher.averify("WrongPassword", hashed) is False
+        assert PasswordHasher.verify(password, hashed) is True
+
+
+@pytest.mark.unit
+class TestNeedsRehash:
+    def test_configured_cost(self):
+        hashed = _hash("Password321", settings.password.rounds)
+
+        assert PasswordHasher.needs_rehash(hashed) is False
+
+    def test_other_cost(self):
+        hashed = _hash("Password321", 4)
+
+        assert PasswordHasher.needs_rehash(hashed) is True
+
+    def test_incorrect_hash(self):
+        assert PasswordHasher.needs_rehash("invalid_bcrypt_hash") is False
+
+
+@pytest.mark.unit
+class TestHashingPool:
+    async def test_concurrency_limit(self):
+        pool = HashingPool(executor="thread", max_workers=4, max_concurrency=1)
+        release = threading.Event()
+
+        try:
+            calls = [asyncio.create_task(pool.run(release.wait, 5)) for _ in range(3)]
+            await asyncio.sleep(0.05)
+
+            stats = pool.stats()
+            assert stats["in_flight"] == 1
+            assert stats["queued"] == 2
+
+            release.set()
+            assert await asyncio.gather(*calls) == [True, True, True]
+
+            stats = pool.stats()
+            assert stats["in_flight"] == 0
+            assert stats["queued"] == 0
+            assert stats["completed"] == 3
+        finally:
+            release.set()
+            pool.shutdown()
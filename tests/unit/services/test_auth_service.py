@@ -6,6 +6,7 @@ from unittest.mock import AsyncMock, patch
 
 from core.security.password import PasswordHasher
 from core.security.jwt_handler import JWTHandler
+from core.config import settings
 from modules.users.repository import UserRepository
 from modules.auth.service import AuthService
 from modules.auth.schemas import RefreshTokenRequest
@@ -85,9 +86,63 @@ class TestGetUserFromToken:
         assert exc_info.value.detail == expected_details
 
 
+@pytest.mark.unit
+class TestGetPrincipalFromToken:
+    async def test_cached_after_first_call(self, auth_svc, mock_user_repo):
+        db_user = UserModelFactory.build()
+        token = JWTHandler.create(user_id=db_user.id, token_type=TokenType.ACCESS)
+
+        mock_user_repo.get_by_id.return_value = db_user
+
+        first = await auth_svc.get_principal_from_token(token=token)
+        second = await auth_svc.get_principal_from_token(token=token)
+
+        mock_user_repo.get_by_id.assert_called_once_with(user_id=db_user.id)
+        assert first == second
+        assert first.id == db_user.id
+        assert first.username == db_user.username
+        assert first.email == db_user.email
+
+    async def test_invalidate_principal(self, auth_svc, mock_user_repo):
+        db_user = UserModelFactory.build()
+        token = JWTHandler.create(user_id=db_user.id, token_type=TokenType.ACCESS)
+
+        mock_user_repo.get_by_id.return_value = db_user
+
+        await auth_svc.get_principal_from_token(token=token)
+        AuthService.invalidate_principal(db_user.id)
+        await auth_svc.get_principal_from_token(token=token)
+
+        assert mock_user_repo.get_by_id.call_count == 2
+
+    async def test_trust_token_claims(self, auth_svc, mock_user_repo, monkeypatch):
+        monkeypatch.setattr(settings.jwt, "trust_token_claims", True)
+        token = JWTHandler.create(
+            user_id=123,
+            token_type=TokenType.ACCESS,
+            claims={"username": "test_user", "email": "test@example.com"},
+        )
+
+        principal = await auth_svc.get_principal_from_token(token=token)
+
+        mock_user_repo.get_by_id.assert_not_called()
+        assert principal.id == 123
+        assert principal.username == "test_user"
+        assert principal.email == "test@example.com"
+
+    async def test_refresh_token(self, auth_svc, mock_user_repo):
+        token = JWTHandler.create(user_id=123, token_type=TokenType.REFRESH)
+
+        with pytest.raises(HTTPException) as exc_info:
+            await auth_svc.get_principal_from_token(token=token)
+
+        assert exc_info.value.status_code == status.HTTP_401_UNAUTHORIZED
+        mock_user_repo.get_by_id.assert_not_called()
+
+
 @pytest.mark.unit
 class TestRegister:
-    @patch.object(PasswordHasher, "hash", return_value="fake-hashed-password")
+    @patch.object(PasswordHasher, "ahash", return_value="fake-hashed-password")
     async def test_success(self, mock_hash, auth_svc, mock_user_repo):
         data_to_register = UserRegisterFactory.build()
         db_user_mock = UserModelFactory.build()
@@ -121,7 +176,7 @@ class TestRegister:
 class TestLogin:
     @pytest.mark.unit
     @patch.object(JWTHandler, "create")
-    @patch.object(PasswordHasher, "verify")
+    @patch.object(PasswordHasher, "averify")
     async def test_success(
         self, mock_password_verify, mock_jwt_create, auth_svc, mock_user_repo
     ):
@@ -148,7 +203,7 @@ class TestLogin:
 
     @pytest.mark.unit
     @patch.object(JWTHandler, "create")
-    @patch.object(PasswordHasher, "verify")
+    @patch.object(PasswordHasher, "averify")
     async def test_not_found(
         self, mock_password_verify, mock_jwt_create, auth_svc, mock_user_repo
     ):
@@ -168,7 +223,7 @@ class TestLogin:
 
     @pytest.mark.unit
     @patch.object(JWTHandler, "create")
-    @patch.object(PasswordHasher, "verify")
+    @patch.object(PasswordHasher, "averify")
     async def test_wrong_password(
         self, mock_password_verify, mock_jwt_create, auth_svc, mock_user_repo
     ):
@@ -193,6 +248,37 @@ class TestLogin:
         assert exc_info.value.status_code == status.HTTP_401_UNAUTHORIZED
         assert exc_info.value.detail == "Incorrect username or password."
 
+    @pytest.mark.unit
+    @patch.object(JWTHandler, "create")
+    @patch.object(PasswordHasher, "needs_rehash", return_value=True)
+    @patch.object(PasswordHasher, "ahash", return_value="rehashed-password")
+    @patch.object(PasswordHasher, "averify", return_value=True)
+    async def test_rehash_on_other_cost(
+        self,
+        mock_password_verify,
+        mock_hash,
+        mock_needs_rehash,
+        mock_jwt_create,
+        auth_svc,
+        mock_user_repo,
+    ):
+        login_data = OAuth2PasswordRequestForm(
+            username="test_user", password="password123"
+        )
+        db_user = UserModelFactory.build(username="test_user")
+
+        mock_user_repo.get_by_username.return_value = db_user
+        mock_user_repo.update_by_id.return_value = db_user
+        mock_jwt_create.side_effect = ["access.token.123", "refresh.token.456"]
+
+        await auth_svc.login(login_data)
+
+        mock_needs_rehash.assert_called_once_with(db_user.hashed_password)
+        mock_hash.assert_called_once_with(login_data.password)
+        mock_user_repo.update_by_id.assert_called_once_with(
+            user_id=db_user.id, update_data={"hashed_password": "rehashed-password"}
+        )
+
 
 @pytest.mark.unit
 class TestRefresh:
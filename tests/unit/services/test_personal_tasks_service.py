@@ -1,5 +1,6 @@
 import pytest
 import time_machine
+from fastapi import HTTPException, status
 from unittest.mock import AsyncMock
 from datetime import datetime, timedelta, timezone
 
@@ -261,3 +262,28 @@ class TestDelete:
         await service.delete(task=task)
 
         mock_repo.delete_by_id.assert_called_once_with(task.id)
+
+
+async def body(*chunks: bytes):
+    for chunk in chunks:
+        yield chunk
+
+
+@pytest.mark.unit
+class TestImportTasks:
+    async def test_unreadable_body(self, service):
+        with pytest.raises(HTTPException) as exc_info:
+            await service.import_tasks(
+                user_id=1, chunks=body(b"x" * 100_000), import_format="csv"
+            )
+
+        assert exc_info.value.status_code == status.HTTP_400_BAD_REQUEST
+
+    async def test_write_errors_are_not_body_errors(self, service, mock_repo):
+        # asyncpg's DataError of a rejected COPY is a ValueError too
+        mock_repo.copy_many.side_effect = ValueError("invalid input value")
+
+        with pytest.raises(ValueError):
+            await service.import_tasks(
+                user_id=1, chunks=body(b'{"title": "A"}\n'), import_format="ndjson"
+            )
@@ -286,6 +286,34 @@ class TestUpdate:
         )
         mock_member_repo.update_by_membership.assert_called_once()
 
+    @patch.object(PermissionChecker, "validate_role_assignment")
+    @patch.object(PermissionChecker, "validate_member_operation")
+    async def test_deleted_while_updating(
+        self,
+        mock_operation_validate,
+        mock_assignment_validate,
+        service,
+        mock_member_repo,
+    ):
+        project = ProjectModelFactory.build()
+        actor = ProjectMemberModelFactory.build()
+        membership = ProjectMemberModelFactory.build()
+        update_data = ProjectMemberPatchFactory.build()
+
+        mock_member_repo.get_by_user_id_and_project_id.return_value = membership
+        mock_member_repo.update_by_membership.return_value = None
+
+        with pytest.raises(HTTPException) as exc_info:
+            await service.update(
+                project_id=project.id,
+                user_id=membership.user_id,
+                actor=actor,
+                update_data=update_data,
+            )
+
+        assert exc_info.value.status_code == status.HTTP_404_NOT_FOUND
+        assert exc_info.value.detail == "Member not found."
+
     @patch.object(PermissionChecker, "validate_role_assignment")
     @patch.object(PermissionChecker, "validate_member_operation")
     async def test_with_no_data(
@@ -1,4 +1,5 @@
 import pytest
+from datetime import datetime, timezone
 from unittest.mock import AsyncMock
 from fastapi import HTTPException, status
 
@@ -175,6 +176,7 @@ class TestUpdate:
         mock_repo.update_by_id.assert_called_once_with(
             project_id=updated_project.id,
             data=update_data.model_dump(exclude_unset=True),
+            expected_updated_at=None,
         )
 
     async def test_with_no_data(self, service, mock_repo):
@@ -187,6 +189,18 @@ class TestUpdate:
         assert exc_info.value.detail == "No data to update"
         mock_repo.update_by_id.assert_not_called()
 
+    async def test_modified_since_read(self, service, mock_repo):
+        mock_repo.update_by_id.return_value = None
+
+        with pytest.raises(HTTPException) as exc_info:
+            await service.update(
+                project_id=1,
+                update_data=project_schemas.ProjectPatch(title="test"),
+                expected_updated_at=datetime.now(timezone.utc),
+            )
+
+        assert exc_info.value.status_code == status.HTTP_412_PRECONDITION_FAILED
+
 
 @pytest.mark.unit
 class TestDelete:
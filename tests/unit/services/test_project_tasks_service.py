@@ -9,11 +9,12 @@ from modules.project_tasks import (
     schemas as tasks_schemas,
 )
 from modules.project_members import repository as members_repository
-from common import schemas as common_schemas
+from common import schemas as common_schemas, dto as common_dto
 from core.security.permissions import PermissionChecker
 from enums.project_task import ProjectTaskType
 from enums.project import ProjectRole, ProjectPermission
 from enums.task import TaskStatus
+from utils.cursor import encode_cursor, decode_cursor
 
 from tests.factories.models import (
     ProjectTaskModelFactory,
@@ -29,7 +30,12 @@ from tests.factories.schemas import (
 @pytest.fixture
 def mock_repo():
     """Mock project task repository"""
-    return AsyncMock(spec=tasks_repository.ProjectTaskRepository)
+    repo = AsyncMock(spec=tasks_repository.ProjectTaskRepository)
+    repo.sort_key_type.side_effect = (
+        tasks_repository.ProjectTaskRepository.sort_key_type
+    )
+
+    return repo
 
 
 @pytest.fixture
@@ -126,6 +132,97 @@ class TestGetAll:
         assert not result.pagination.has_previous
 
 
+@pytest.mark.unit
+class TestGetAllByCursor:
+    async def test_first_page(self, service, mock_repo):
+        project = ProjectModelFactory.build()
+        tasks = [ProjectTaskModelFactory.build() for _ in range(5)]
+
+        mock_repo.get_all_by_cursor.return_value = [
+            tasks,
+            common_dto.CursorDto(value=3, id=tasks[-1].id),
+        ]
+
+        filters = tasks_schemas.ProjectTasksFiltersParams(status=TaskStatus.TODO)
+        sorting = tasks_schemas.ProjectTasksSortingParams(
+            sort_by="priority", order="desc"
+        )
+        pagination = common_schemas.CursorPaginationParams(mode="cursor", size=5)
+
+        result = await service.get_all_by_cursor(
+            project_id=project.id,
+            filters=filters,
+            sorting=sorting,
+            pagination=pagination,
+        )
+
+        kwargs = mock_repo.get_all_by_cursor.call_args.kwargs
+        assert kwargs["project_id"] == project.id
+        assert kwargs["filters"].status == TaskStatus.TODO
+        assert kwargs["sorting"].sort_by == "priority"
+        assert kwargs["pagination"].size == 5
+        assert kwargs["pagination"].cursor is None
+
+        assert len(result.items) == 5
+        assert result.pagination.total is None
+        assert result.pagination.pages is None
+        assert result.pagination.has_next
+        assert decode_cursor(
+            result.pagination.next_cursor,
+            sorting=common_dto.SortingDto(sort_by="priority", order="desc"),
+            value_type=int,
+        ) == common_dto.CursorDto(value=3, id=tasks[-1].id)
+
+    async def test_passes_decoded_cursor(self, service, mock_repo):
+        project = ProjectModelFactory.build()
+        sorting_dto = common_dto.SortingDto(sort_by="deadline", order="asc")
+        cursor_dto = common_dto.CursorDto(value=None, id=7)
+
+        mock_repo.get_all_by_cursor.return_value = [[], None]
+
+        result = await service.get_all_by_cursor(
+            project_id=project.id,
+            filters=tasks_schemas.ProjectTasksFiltersParams(),
+            sorting=tasks_schemas.ProjectTasksSortingParams(
+                sort_by="deadline", order="asc"
+            ),
+            pagination=common_schemas.CursorPaginationParams(
+                cursor=encode_cursor(cursor_dto, sorting=sorting_dto)
+            ),
+        )
+
+        kwargs = mock_repo.get_all_by_cursor.call_args.kwargs
+        assert kwargs["pagination"].cursor == cursor_dto
+
+        assert result.pagination.next_cursor is None
+        assert not result.pagination.has_next
+
+    async def test_invalid_cursor(self, service, mock_repo):
+        with pytest.raises(HTTPException) as exc_info:
+            await service.get_all_by_cursor(
+                project_id=1,
+                filters=tasks_schemas.ProjectTasksFiltersParams(),
+                sorting=tasks_schemas.ProjectTasksSortingParams(sort_by="created_at"),
+                pagination=common_schemas.CursorPaginationParams(cursor="invalid"),
+            )
+
+        assert exc_info.value.status_code == status.HTTP_400_BAD_REQUEST
+        assert exc_info.value.detail == "Invalid cursor."
+        mock_repo.get_all_by_cursor.assert_not_called()
+
+    async def test_relevance_sorting_not_supported(self, service, mock_repo):
+        with pytest.raises(HTTPException) as exc_info:
+            await service.get_all_by_cursor(
+                project_id=1,
+                filters=tasks_schemas.ProjectTasksFiltersParams(search="task"),
+                sorting=tasks_schemas.ProjectTasksSortingParams(sort_by="relevance"),
+                pagination=common_schemas.CursorPaginationParams(mode="cursor"),
+            )
+
+        assert exc_info.value.status_code == status.HTTP_400_BAD_REQUEST
+        mock_repo.get_all_by_cursor.assert_not_called()
+
+
 @pytest.mark.unit
 class TestCreate:
     async def test_success_with_open_task(self, service, mock_repo):
@@ -220,7 +317,9 @@ class TestUpdate:
     ):
         project = ProjectModelFactory.build()
         actor = ProjectMemberModelFactory.build(user_id=1, role=ProjectRole.ADMIN)
-        task = ProjectTaskModelFactory.build(type=ProjectTaskType.DEFAULT, assignee_id=2)
+        task = ProjectTaskModelFactory.build(
+            type=ProjectTaskType.DEFAULT, assignee_id=2
+        )
         update_data = ProjectTaskPatchFactory.build(title="Updated Title")
         updated_task = ProjectTaskModelFactory.build()
 
@@ -267,9 +366,7 @@ class TestUpdate:
         mock_repo.update_by_task.assert_called_once()
 
     @patch.object(PermissionChecker, "require_permission")
-    async def test_with_no_data(
-        self, mock_require_permission, service, mock_repo
-    ):
+    async def test_with_no_data(self, mock_require_permission, service, mock_repo):
         project = ProjectModelFactory.build()
         actor = ProjectMemberModelFactory.build()
         task = ProjectTaskModelFactory.build()
@@ -6,6 +6,7 @@ from modules.users import (
     repository as user_repository,
     service as user_service,
     schemas as user_schemas,
+    dto as user_dto,
 )
 from core.security.password import PasswordHasher
 
@@ -24,6 +25,32 @@ def user_svc(mock_user_repo):
     return user_service.UserService(user_repo=mock_user_repo)
 
 
+@pytest.mark.unit
+class TestGetMe:
+    async def test_success(self, user_svc, mock_user_repo):
+        user = UserModelFactory.build()
+        principal = user_dto.UserPrincipalDto(
+            id=user.id, username=user.username, email=user.email
+        )
+
+        mock_user_repo.get_by_id.return_value = user
+
+        result = await user_svc.get_me(principal)
+
+        assert result == user
+        mock_user_repo.get_by_id.assert_called_once_with(user_id=user.id)
+
+    async def test_not_found(self, user_svc, mock_user_repo):
+        user = UserModelFactory.build()
+
+        mock_user_repo.get_by_id.return_value = None
+
+        with pytest.raises(HTTPException) as exc_info:
+            await user_svc.get_me(user)
+
+        assert exc_info.value.status_code == status.HTTP_404_NOT_FOUND
+
+
 @pytest.mark.unit
 class TestUpdateMe:
     async def test_one_field_success(self, user_svc, mock_user_repo):
@@ -57,7 +84,7 @@ class TestUpdateMe:
         mock_user_repo.get_by_email.assert_called_once_with(update_data.email)
         mock_user_repo.update_by_id.assert_called_once()
 
-    @patch.object(PasswordHasher, "hash", return_value="hashed-password")
+    @patch.object(PasswordHasher, "ahash", return_value="hashed-password")
     async def test_password_hashed(self, mock_hash, user_svc, mock_user_repo):
         user = UserModelFactory.build()
         update_data = user_schemas.UserPatch(password="newpassword123")
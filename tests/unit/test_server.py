@@ -0,0 +1,75 @@
+import pytest
+
+from core.config import settings
+from server import unshared_state, worker_pool_sizes
+
+
+@pytest.mark.unit
+class TestWorkerPoolSizes:
+    def test_without_budget_keeps_configured_sizes(self):
+        config = settings.db.model_copy(update={"pool_size": 5, "max_overflow": 10})
+
+        assert worker_pool_sizes(config, workers=8, budget=None) == (5, 10)
+
+    @pytest.mark.parametrize(
+        "workers, budget, expected",
+        [
+            (2, 100, (5, 10)),
+            (4, 40, (5, 5)),
+            (4, 20, (5, 0)),
+            (8, 20, (2, 0)),
+            (3, 10, (3, 0)),
+        ],
+    )
+    def test_workers_stay_under_budget(self, workers, budget, expected):
+        config = settings.db.model_copy(update={"pool_size": 5, "max_overflow": 10})
+
+        pool_size, max_overflow = worker_pool_sizes(config, workers, budget)
+
+        assert (pool_size, max_overflow) == expected
+        assert workers * (pool_size + max_overflow) <= budget
+
+    def test_budget_smaller_than_workers(self):
+        with pytest.raises(ValueError):
+            worker_pool_sizes(settings.db, workers=4, budget=3)
+
+    def test_reserved_connections_are_left_out(self):
+        config = settings.db.model_copy(update={"pool_size": 5, "max_overflow": 10})
+
+        assert worker_pool_sizes(config, workers=4, budget=20, reserved=1) == (4, 0)
+
+    def test_budget_taken_by_reserved_connections(self):
+        with pytest.raises(ValueError):
+            worker_pool_sizes(settings.db, workers=4, budget=4, reserved=1)
+
+
+@pytest.mark.unit
+class TestUnsharedState:
+    @pytest.fixture
+    def cache(self, monkeypatch):
+        cache = settings.cache.model_copy()
+        monkeypatch.setattr(settings, "cache", cache)
+        monkeypatch.setattr(settings.metrics, "enabled", False)
+        return cache
+
+    def test_shared_invalidation(self, cache):
+        cache.shared_invalidation = True
+
+        assert unshared_state() == []
+
+    def test_caches_without_shared_invalidation(self, cache):
+        cache.shared_invalidation = False
+        cache.principal_ttl = 0
+
+        assert unshared_state() == ["CACHE__MEMBERSHIP_TTL", "CACHE__RESPONSE_TTL"]
+
+    def test_disabled_caches(self, cache):
+        cache.shared_invalidation = False
+        cache.principal_ttl = cache.membership_ttl = cache.response_ttl = 0
+
+        assert unshared_state() == []
+
+    def test_metrics(self, cache, monkeypatch):
+        monkeypatch.setattr(settings.metrics, "enabled", True)
+
+        assert unshared_state() == ["METRICS__ENABLED"]
@@ -0,0 +1,90 @@
+import pytest
+
+from utils.cache import TTLCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    def shift(self, seconds: float) -> None:
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch) -> FakeClock:
+    fake = FakeClock()
+    monkeypatch.setattr("utils.cache.time.monotonic", fake)
+    return fake
+
+
+@pytest.mark.unit
+class TestTTLCache:
+    def test_get_and_set(self):
+        cache = TTLCache(maxsize=10, ttl=60)
+
+        cache.set("key", "value")
+
+        assert cache.get("key") == "value"
+        assert cache.get("missing") is None
+        assert cache.get("missing", default=0) == 0
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 2
+
+    def test_expiration(self, clock):
+        cache = TTLCache(maxsize=10, ttl=60)
+
+        cache.set("key", "value")
+        cache.set("short", "value", ttl=10)
+
+        clock.shift(30)
+        assert cache.get("key") == "value"
+        assert cache.get("short") is None
+
+        clock.shift(31)
+        assert cache.get("key") is None
+        assert len(cache) == 0
+
+    def test_ttl_cannot_extend_lifetime(self, clock):
+        cache = TTLCache(maxsize=10, ttl=60)
+
+        cache.set("key", "value", ttl=600)
+
+        clock.shift(61)
+        assert cache.get("key") is None
+
+    def test_lru_eviction(self):
+        cache = TTLCache(maxsize=2, ttl=60)
+
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.get("c") == 3
+
+    def test_invalidate_where(self):
+        cache = TTLCache(maxsize=10, ttl=60)
+        cache.set((1, "x"), 1)
+        cache.set((1, "y"), 2)
+        cache.set((2, "x"), 3)
+
+        dropped = cache.invalidate_where(lambda key, _: key[0] == 1)
+
+        assert dropped == 2
+        assert len(cache) == 1
+        assert cache.get((2, "x")) == 3
+
+    @pytest.mark.parametrize("maxsize, ttl", [(0, 60), (10, 0)])
+    def test_disabled(self, maxsize, ttl):
+        cache = TTLCache(maxsize=maxsize, ttl=ttl)
+
+        cache.set("key", "value")
+
+        assert not cache.enabled
+        assert cache.get("key") is None
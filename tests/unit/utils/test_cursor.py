@@ -0,0 +1,95 @@
+import base64
+import json
+import pytest
+from datetime import datetime, timezone
+
+from common.dto import CursorDto, SortingDto
+from utils.cursor import encode_cursor, decode_cursor
+
+
+@pytest.mark.unit
+class TestEncodeDecode:
+    @pytest.mark.parametrize(
+        "value, value_type",
+        [
+            (datetime(2025, 12, 30, 10, 15, 30, 123456, tzinfo=timezone.utc), datetime),
+            (3, int),
+            (None, datetime),
+        ],
+        ids=["datetime", "int", "null"],
+    )
+    def test_round_trip(self, value, value_type):
+        sorting = SortingDto(sort_by="deadline", order="desc")
+        cursor = CursorDto(value=value, id=42)
+
+        token = encode_cursor(cursor, sorting=sorting)
+
+        assert isinstance(token, str)
+        assert "=" not in token
+        assert decode_cursor(token, sorting=sorting, value_type=value_type) == cursor
+
+    def test_other_sorting(self):
+        token = encode_cursor(
+            CursorDto(value=1, id=1), sorting=SortingDto(sort_by="priority")
+        )
+
+        with pytest.raises(ValueError):
+            decode_cursor(token, sorting=SortingDto(sort_by="status"), value_type=int)
+        with pytest.raises(ValueError):
+            decode_cursor(
+                token,
+                sorting=SortingDto(sort_by="priority", order="desc"),
+                value_type=int,
+            )
+
+    @pytest.mark.parametrize(
+        "token",
+        ["not-a-cursor", "e30", "W10", "!!!"],
+        ids=["garbage", "empty_object", "list", "invalid_base64"],
+    )
+    def test_malformed(self, token):
+        with pytest.raises(ValueError):
+            decode_cursor(
+                token, sorting=SortingDto(sort_by="created_at"), value_type=datetime
+            )
+
+    @pytest.mark.parametrize(
+        "value, is_datetime, cursor_id, value_type",
+        [
+            ("high", False, 1, int),
+            ({"a": 1}, False, 1, int),
+            (1.5, False, 1, int),
+            (True, False, 1, int),
+            (2**31, False, 1, int),
+            ("2025-12-30T10:15:30+00:00", True, 1, int),
+            (3, False, 1, datetime),
+            ("yesterday", True, 1, datetime),
+            ("2025-12-30T10:15:30", True, 1, datetime),
+            (3, False, "1", int),
+            (3, False, None, int),
+            (3, False, 2**40, int),
+        ],
+        ids=[
+            "string_for_int",
+            "object_for_int",
+            "float_for_int",
+            "bool_for_int",
+            "int_out_of_range",
+            "datetime_for_int",
+            "int_for_datetime",
+            "invalid_datetime",
+            "naive_datetime",
+            "string_id",
+            "null_id",
+            "id_out_of_range",
+        ],
+    )
+    def test_tampered_values(self, value, is_datetime, cursor_id, value_type):
+        payload = {"s": "priority", "o": "asc", "v": value, "d": is_datetime}
+        payload["i"] = cursor_id
+        token = base64.urlsafe_b64encode(json.dumps(payload).encode()).decode()
+
+        with pytest.raises(ValueError):
+            decode_cursor(
+                token, sorting=SortingDto(sort_by="priority"), value_type=value_type
+            )
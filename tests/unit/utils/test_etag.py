@@ -0,0 +1,61 @@
+import pytest
+from datetime import datetime, timedelta, timezone
+
+from utils.etag import etag_matches, make_etag
+
+UPDATED_AT = datetime(2026, 1, 1, 12, 30, 0, 123456, tzinfo=timezone.utc)
+
+
+@pytest.mark.unit
+class TestMakeEtag:
+    def test_weak_and_stable(self):
+        etag = make_etag("project_task", 1, UPDATED_AT)
+
+        assert etag.startswith('W/"') and etag.endswith('"')
+        assert etag == make_etag("project_task", 1, UPDATED_AT)
+
+    def test_strong(self):
+        etag = make_etag("project_task", 1, UPDATED_AT, weak=False)
+
+        assert etag == make_etag("project_task", 1, UPDATED_AT)[2:]
+
+    def test_changes_with_version(self):
+        etag = make_etag("project_task", 1, UPDATED_AT)
+
+        assert etag != make_etag("project_task", 2, UPDATED_AT)
+        assert etag != make_etag("personal_task", 1, UPDATED_AT)
+        assert etag != make_etag(
+            "project_task", 1, UPDATED_AT + timedelta(microseconds=1)
+        )
+
+    def test_same_instant_in_other_timezone(self):
+        local = UPDATED_AT.astimezone(timezone(timedelta(hours=3)))
+
+        assert make_etag(1, local) == make_etag(1, UPDATED_AT)
+
+
+@pytest.mark.unit
+class TestEtagMatches:
+    ETAG = 'W/"abc"'
+
+    @pytest.mark.parametrize(
+        "header",
+        ['W/"abc"', '"abc"', '"x", W/"abc"', ' W/"x" ,W/"abc" ', "*"],
+    )
+    def test_matches(self, header):
+        assert etag_matches(header, self.ETAG)
+
+    @pytest.mark.parametrize("header", [None, "", 'W/"abcd"', '"x", "y"', "abc"])
+    def test_not_matches(self, header):
+        assert not etag_matches(header, self.ETAG)
+
+    @pytest.mark.parametrize("header", ['"abc"', '"x", "abc"', ' "x" ,"abc" ', "*"])
+    def test_strong_matches(self, header):
+        assert etag_matches(header, '"abc"', weak=False)
+
+    @pytest.mark.parametrize("header", ['W/"abc"', '"x", W/"abc"', '"abcd"'])
+    def test_strong_not_matches(self, header):
+        assert not etag_matches(header, '"abc"', weak=False)
+
+    def test_strong_never_matches_weak_tag(self):
+        assert not etag_matches('W/"abc"', 'W/"abc"', weak=False)
@@ -0,0 +1,64 @@
+import json
+
+import pytest
+from pydantic import BaseModel
+
+from utils.export import csv_columns, encode_rows
+
+
+class Owner(BaseModel):
+    id: int
+    name: str
+
+
+class Row(BaseModel):
+    id: int
+    title: str
+    owner: Owner | None
+
+
+async def rows(items):
+    for item in items:
+        yield item
+
+
+async def collect(chunks) -> list[bytes]:
+    return [chunk async for chunk in chunks]
+
+
+ITEMS = [
+    {"id": 1, "title": "First", "owner": {"id": 7, "name": "Ann"}},
+    {"id": 2, "title": 'Comma, "quoted"', "owner": None},
+    {"id": 3, "title": "Third", "owner": None},
+]
+
+
+@pytest.mark.unit
+class TestExport:
+    def test_csv_columns(self):
+        assert csv_columns(Row) == ["id", "title", "owner.id", "owner.name"]
+
+    async def test_ndjson(self):
+        chunks = await collect(encode_rows(rows(ITEMS), Row, "ndjson", chunk_size=2))
+
+        assert len(chunks) == 2
+        lines = b"".join(chunks).decode().splitlines()
+        assert [json.loads(line) for line in lines] == ITEMS
+
+    async def test_csv(self):
+        chunks = await collect(encode_rows(rows(ITEMS), Row, "csv", chunk_size=2))
+
+        # Header and two chunks of rows
+        assert len(chunks) == 3
+        assert b"".join(chunks).decode().splitlines() == [
+            "id,title,owner.id,owner.name",
+            "1,First,7,Ann",
+            '2,"Comma, ""quoted""",,',
+            "3,Third,,",
+        ]
+
+    async def test_without_rows(self):
+        assert await collect(encode_rows(rows([]), Row, "ndjson", chunk_size=2)) == []
+        assert await collect(encode_rows(rows([]), Row, "csv", chunk_size=2)) == [
+            b"id,title,owner.id,owner.name\r\n"
+        ]
@@ -0,0 +1,95 @@
+import pytest
+
+from utils.importing import decode_rows
+
+
+async def chunks(body: bytes, size: int):
+    for start in range(0, len(body), size):
+        yield body[start : start + size]
+
+
+async def decode(body: bytes, import_format: str, size: int = 3, max_row_size=100):
+    rows = decode_rows(chunks(body, size), import_format, max_row_size=max_row_size)
+
+    return [
+        (number, str(data) if isinstance(data, ValueError) else data)
+        async for number, data in rows
+    ]
+
+
+@pytest.mark.unit
+class TestDecodeRows:
+    @pytest.mark.parametrize("size", [1, 3, 1000])
+    async def test_ndjson(self, size):
+        body = b'{"title": "A"}\n\n{"title": "B", "status": "done"}\r\n{"title": "C"}'
+
+        assert await decode(body, "ndjson", size=size) == [
+            (1, {"title": "A"}),
+            (2, {"title": "B", "status": "done"}),
+            (3, {"title": "C"}),
+        ]
+
+    async def test_ndjson_invalid_rows(self):
+        body = b'{"title": "A"}\nnot json\n[1, 2]\n{"title": "B"}\n'
+
+        rows = await decode(body, "ndjson")
+
+        assert rows[0] == (1, {"title": "A"})
+        assert rows[1][0] == 2 and isinstance(rows[1][1], str)
+        assert rows[2] == (3, "Row is not a JSON object")
+        assert rows[3] == (4, {"title": "B"})
+
+    @pytest.mark.parametrize("size", [1, 3, 1000])
+    async def test_csv(self, size):
+        body = (
+            "﻿title,description,priority\r\n"
+            'A,"multi\nline, ""quoted""",high\r\n'
+            "B,,\r\n"
+        ).encode()
+
+        assert await decode(body, "csv", size=size) == [
+            (
+                1,
+                {
+                    "title": "A",
+                    "description": 'multi\nline, "quoted"',
+                    "priority": "high",
+                },
+            ),
+            (2, {"title": "B"}),
+        ]
+
+    async def test_csv_too_many_values(self):
+        rows = await decode(b"title\nA,B\nC\n", "csv")
+
+        assert rows == [(1, "Row has more values than the header"), (2, {"title": "C"})]
+
+    @pytest.mark.parametrize("import_format", ["ndjson", "csv"])
+    async def test_oversized_row(self, import_format):
+        header = b"title\n" if import_format == "csv" else b""
+        long_row = b'{"title": "' + b"x" * 50 + b'"}'
+        if import_format == "csv":
+            long_row = b"x" * 50
+        short_row = b'{"title": "A"}' if import_format == "ndjson" else b"A"
+
+        body = header + long_row + b"\n" + short_row + b"\n" + long_row
+
+        rows = await decode(body, import_format, max_row_size=20)
+
+        assert rows[0] == (1, "Row is longer than 20 bytes")
+        assert rows[1] == (2, {"title": "A"})
+        assert rows[2] == (3, "Row is longer than 20 bytes")
+
+    @pytest.mark.parametrize("size", [1, 3, 1000])
+    async def test_oversized_quoted_csv_row(self, size):
+        # Newlines of the long quoted value don't start new rows
+        long_value = b'"' + b"x" * 30 + b"\nB,\n" + b"x" * 30 + b'"'
+        body = b"title,description\nA," + long_value + b"\nC,\n"
+
+        rows = await decode(body, "csv", size=size, max_row_size=20)
+
+        assert rows == [(1, "Row is longer than 20 bytes"), (2, {"title": "C"})]
+
+    async def test_csv_header_too_long(self):
+        with pytest.raises(ValueError):
+            await decode(b"x" * 50 + b"\nA\n", "csv", max_row_size=20)
@@ -0,0 +1,21 @@
+import pytest
+from pathlib import Path
+
+import modules
+from db.base import Base
+from utils.model_loader import MODELS
+
+
+@pytest.mark.unit
+class TestModelRegistry:
+    def test_every_model_module_is_listed(self):
+        model_files = Path(modules.__path__[0]).glob("*/model.py")
+
+        assert {f"modules.{path.parent.name}.model" for path in model_files} == {
+            model.__module__ for model in MODELS
+        }
+
+    def test_every_mapped_model_is_listed(self):
+        mapped = {mapper.class_ for mapper in Base.registry.mappers}
+
+        assert mapped == set(MODELS)
@@ -0,0 +1,91 @@
+import json
+import pytest
+import threading
+import time
+
+from core.security.password import _hash
+from utils.profiler import SamplingProfiler
+
+
+def run_in_thread(name: str, target) -> tuple[threading.Thread, threading.Event]:
+    done = threading.Event()
+    thread = threading.Thread(target=target, args=(done,), name=name, daemon=True)
+    thread.start()
+
+    return thread, done
+
+
+def hashing(done: threading.Event) -> None:
+    while not done.is_set():
+        _hash("password", 4)
+
+
+@pytest.mark.unit
+class TestSamplingProfiler:
+    def test_labels_and_categories(self, tmp_path):
+        thread, done = run_in_thread("busy", hashing)
+        profiler = SamplingProfiler(
+            label=lambda thread, frame: "hashing" if thread.name == "busy" else None
+        )
+
+        profiler.start(interval=0.001, duration=5, output_dir=tmp_path)
+        time.sleep(0.2)
+        profiler.stop()
+        profiler.join()
+        done.set()
+        thread.join()
+
+        summary = profiler.summary()
+        assert not profiler.running
+        assert profiler.samples > 0
+        # Only the labeled thread is sampled, bcrypt time shows in its caller
+        assert summary["routes"] == {
+            "hashing": {
+                "samples": profiler.samples,
+                "categories": {"bcrypt": profiler.samples},
+            }
+        }
+
+        folded = profiler.path.read_text().splitlines()
+        assert sum(int(line.rsplit(" ", 1)[1]) for line in folded) == profiler.samples
+        assert all(line.startswith("hashing;") for line in folded)
+        assert all("_hash_(core/security/password.py:" in line for line in folded)
+        written = json.loads(profiler.path.with_suffix(".json").read_text())
+        assert written["samples"] == profiler.samples
+
+    def test_idle_threads_only_counted(self, tmp_path):
+        thread, done = run_in_thread("waiting", lambda done: done.wait())
+        profiler = SamplingProfiler(
+            label=lambda thread, frame: "waiting" if thread.name == "waiting" else None
+        )
+
+        profiler.start(interval=0.001, duration=5, output_dir=tmp_path)
+        time.sleep(0.05)
+        profiler.stop()
+        profiler.join()
+        done.set()
+        thread.join()
+
+        assert profiler.samples == 0
+        assert profiler.idle > 0
+        assert profiler.path.read_text() == ""
+
+    def test_stops_after_duration(self, tmp_path):
+        profiler = SamplingProfiler(label=lambda thread, frame: None)
+
+        profiler.start(interval=0.001, duration=0.05, output_dir=tmp_path)
+        profiler.join()
+
+        assert not profiler.running
+        assert profiler.path.exists()
+
+    def test_already_running(self, tmp_path):
+        profiler = SamplingProfiler(label=lambda thread, frame: None)
+        profiler.start(interval=0.001, duration=5, output_dir=tmp_path)
+
+        try:
+            with pytest.raises(RuntimeError):
+                profiler.start(interval=0.001, duration=5, output_dir=tmp_path)
+        finally:
+            profiler.stop()
+            profiler.join()
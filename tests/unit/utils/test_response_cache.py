@@ -0,0 +1,81 @@
+import pytest
+
+from utils.response_cache import (
+    CacheBackend,
+    CachedResponse,
+    MemoryCacheBackend,
+    ResponseCache,
+)
+
+ENTRY = CachedResponse(etag='W/"abc"', body=b'{"id": 1}\n')
+
+
+class DictBackend(CacheBackend):
+    """Store with only the calls of the interface, like a wrapped Redis client"""
+
+    def __init__(self):
+        self.values: dict[str, bytes] = {}
+
+    async def get(self, key: str) -> bytes | None:
+        return self.values.get(key)
+
+    async def set(self, key: str, value: bytes, ttl: float) -> None:
+        self.values[key] = value
+
+    async def delete(self, key: str) -> None:
+        self.values.pop(key, None)
+
+
+@pytest.fixture
+def cache() -> ResponseCache:
+    return ResponseCache(backend=MemoryCacheBackend(maxsize=100, ttl=60), ttl=60)
+
+
+@pytest.mark.unit
+class TestResponseCache:
+    async def test_miss_then_hit(self, cache):
+        lookup = await cache.get("project:1", "key")
+        await cache.set(lookup, ENTRY)
+
+        assert lookup.entry is None
+        assert (await cache.get("project:1", "key")).entry == ENTRY
+        assert (await cache.get("project:1", "other")).entry is None
+        assert (await cache.get("project:2", "key")).entry is None
+
+    async def test_invalidate_scope(self, cache):
+        await cache.set(await cache.get("project:1", "key"), ENTRY)
+        await cache.set(await cache.get("project:2", "key"), ENTRY)
+
+        await cache.invalidate("project:1")
+
+        assert (await cache.get("project:1", "key")).entry is None
+        assert (await cache.get("project:2", "key")).entry == ENTRY
+
+    async def test_read_before_invalidation_not_stored(self, cache):
+        # Response loaded before a write is stored after it
+        lookup = await cache.get("project:1", "key")
+        await cache.invalidate("project:1")
+        await cache.set(lookup, ENTRY)
+
+        assert (await cache.get("project:1", "key")).entry is None
+
+
+@pytest.mark.unit
+class TestPluggableBackend:
+    async def test_interface_calls_only(self):
+        cache = ResponseCache(backend=DictBackend(), ttl=60)
+        await cache.set(await cache.get("project:1", "key"), ENTRY)
+
+        # Shared stores miss no invalidation and keep no counters
+        cache.clear()
+
+        assert (await cache.get("project:1", "key")).entry == ENTRY
+        assert cache.stats() == {}
+
+    async def test_memory_backend_cleared(self, cache):
+        await cache.set(await cache.get("project:1", "key"), ENTRY)
+
+        cache.clear()
+
+        assert (await cache.get("project:1", "key")).entry is None
+        assert cache.stats()["size"] == 1
@@ -0,0 +1,51 @@
+import pytest
+from datetime import datetime
+
+from utils.slow_statements import SlowStatementLog, parameter_shape
+
+
+@pytest.mark.unit
+class TestSlowStatementLog:
+    def test_keeps_slowest(self):
+        log = SlowStatementLog(size=2)
+
+        for duration, statement in [(0.1, "a"), (0.3, "b"), (0.2, "c"), (0.05, "d")]:
+            log.record(duration, statement, (1,), executemany=False)
+
+        assert [entry.statement for entry in log.slowest()] == ["b", "c"]
+
+    def test_statement_kept_once(self):
+        log = SlowStatementLog(size=2)
+
+        log.record(0.1, "a", (1,), executemany=False)
+        log.record(0.3, "a", (1,), executemany=False)
+        log.record(0.2, "a", (1,), executemany=False)
+        log.record(0.15, "b", (1,), executemany=False)
+
+        assert [(e.statement, e.duration) for e in log.slowest()] == [
+            ("a", 0.3),
+            ("b", 0.15),
+        ]
+
+    def test_disabled(self):
+        log = SlowStatementLog(size=0)
+
+        log.record(1.0, "a", (), executemany=False)
+
+        assert log.slowest() == []
+
+
+@pytest.mark.unit
+class TestParameterShape:
+    def test_values_are_not_shown(self):
+        shape = parameter_shape((1, "secret", None, [1, 2, 3], datetime(2026, 1, 1)))
+
+        assert shape == "(int, str, None, list[3], datetime)"
+
+    def test_named(self):
+        assert parameter_shape({"id": 1, "title": "x"}) == "{id: int, title: str}"
+
+    def test_executemany(self):
+        shape = parameter_shape([(1, "a"), (2, "b")], executemany=True)
+
+        assert shape == "2 x (int, str)"